@@ -0,0 +1,402 @@
+"""
+BTC Fair Value Fits
+===================
+Cached and walk-forward model fits for the BTC fair value models in
+data_pipeline.py (calculate_btc_fair_value, calculate_btc_fair_value_v2).
+
+- LinearFit: fitted scaler + linear model as plain arrays; predicts with
+  numpy, so a cache hit needs no sklearn at all
+- fit_linear_cached: fits keyed by a hash of the training data and the
+  hyperparameters, kept in memory and in data/btc_model_fits.npz
+- walk_forward_elasticnet: expanding-window weekly refits, each one
+  warm-started from the previous week's coefficients (hyperparameters
+  re-tuned by cross-validation once a year). Fitted features (the GLI PCA
+  factor, gli_factor_lags) are refitted inside each window, so every
+  prediction is point-in-time. Out-of-sample predictions are persisted in
+  data/btc_fair_value_oos.npz with a fingerprint of the training data of
+  each week: a run only scores the weeks added since the last one, plus
+  the weeks whose inputs were revised.
+
+Both files hold arrays only (np.load(allow_pickle=False)), no pickled estimators.
+"""
+
+import hashlib
+import io
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+FIT_CACHE_FILE = os.path.join(DATA_DIR, 'btc_model_fits.npz')
+OOS_FILE = os.path.join(DATA_DIR, 'btc_fair_value_oos.npz')
+
+FIT_CACHE_VERSION = 1
+FIT_CACHE_SIZE = 16
+OOS_VERSION = 2
+
+# Quant V2 return model (calculate_btc_fair_value_v2)
+ELASTICNET_CV_PARAMS = {
+    'l1_ratio': [0.1, 0.5, 0.7, 0.9, 0.95],
+    'alphas': np.logspace(-4, 0, 20).tolist(),
+    'cv': 5,
+    'max_iter': 5000,
+    'random_state': 42,
+}
+
+# Walk-forward: first OOS week after two years of history, yearly re-tuning
+WALK_FORWARD_MIN_WEEKS = 104
+WALK_FORWARD_RETUNE_WEEKS = 52
+
+
+@dataclass
+class LinearFit:
+    """Scaler + linear model: predict(X) = ((X - center) / scale) @ coef + intercept."""
+    center: np.ndarray
+    scale: np.ndarray
+    coef: np.ndarray
+    intercept: float
+    params: Dict[str, float] = field(default_factory=dict)  # selected hyperparameters (CV)
+
+    def predict(self, X) -> np.ndarray:
+        return ((np.asarray(X, dtype=float) - self.center) / self.scale) @ self.coef + self.intercept
+
+    def r2(self, X, y) -> float:
+        y = np.asarray(y, dtype=float)
+        residual = ((y - self.predict(X)) ** 2).sum()
+        total = ((y - y.mean()) ** 2).sum()
+        return float(1 - residual / total) if total > 0 else 0.0
+
+
+def _fit_linear(kind: str, X: pd.DataFrame, y: pd.Series, params: Dict, warm_coef: Optional[np.ndarray] = None) -> LinearFit:
+    """
+    Fit one model kind:
+    - 'ols': StandardScaler + LinearRegression
+    - 'ridge': StandardScaler + Ridge(**params)
+    - 'elasticnet_cv': RobustScaler + ElasticNetCV(**params)
+    - 'elasticnet': RobustScaler + ElasticNet(**params), warm-started from warm_coef
+    """
+    from sklearn.preprocessing import RobustScaler, StandardScaler
+    from sklearn.linear_model import ElasticNet, ElasticNetCV, LinearRegression, Ridge
+
+    if kind == 'ols':
+        scaler, model = StandardScaler(), LinearRegression(**params)
+    elif kind == 'ridge':
+        scaler, model = StandardScaler(), Ridge(**params)
+    elif kind == 'elasticnet_cv':
+        scaler, model = RobustScaler(), ElasticNetCV(**params)
+    elif kind == 'elasticnet':
+        scaler, model = RobustScaler(), ElasticNet(warm_start=warm_coef is not None, **params)
+        if warm_coef is not None:
+            model.coef_ = np.array(warm_coef, dtype=float)
+    else:
+        raise ValueError(f"Unknown model kind: {kind}")
+
+    X_scaled = scaler.fit_transform(X)
+    model.fit(X_scaled, np.asarray(y, dtype=float))
+
+    if isinstance(scaler, StandardScaler):
+        center, scale = scaler.mean_, scaler.scale_
+    else:
+        center, scale = scaler.center_, scaler.scale_
+    selected = {'alpha': float(model.alpha_), 'l1_ratio': float(model.l1_ratio_)} if kind == 'elasticnet_cv' else {}
+    return LinearFit(
+        center=np.asarray(center, dtype=float),
+        scale=np.asarray(scale, dtype=float),
+        coef=np.asarray(model.coef_, dtype=float).ravel(),
+        intercept=float(np.ravel(model.intercept_)[0]),
+        params=selected,
+    )
+
+
+def _params_key(params: Dict) -> str:
+    return json.dumps({k: np.asarray(v).tolist() for k, v in params.items()}, sort_keys=True)
+
+
+def fit_fingerprint(kind: str, X: pd.DataFrame, y: pd.Series, params: Dict) -> str:
+    """Content hash of the training data (values, index, columns) and the hyperparameters."""
+    digest = hashlib.sha256()
+    digest.update(kind.encode())
+    digest.update(_params_key(params).encode())
+    digest.update(repr(list(X.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=True).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+# ============================================================
+# FIT CACHE
+# ============================================================
+
+# fingerprint -> LinearFit, most recently used last; None until loaded from disk
+_fit_cache: Optional['OrderedDict[str, LinearFit]'] = None
+
+
+def _load_fit_cache() -> 'OrderedDict[str, LinearFit]':
+    cache = OrderedDict()
+    if not os.path.exists(FIT_CACHE_FILE):
+        return cache
+    try:
+        with np.load(FIT_CACHE_FILE, allow_pickle=False) as npz:
+            if int(npz['__version__']) != FIT_CACHE_VERSION:
+                return cache
+            for key in npz['__keys__']:
+                key = str(key)
+                cache[key] = LinearFit(
+                    center=npz[f'{key}__center'],
+                    scale=npz[f'{key}__scale'],
+                    coef=npz[f'{key}__coef'],
+                    intercept=float(npz[f'{key}__intercept']),
+                    params=json.loads(str(npz[f'{key}__params'])),
+                )
+    except Exception as e:
+        print(f"  -> Warning: Ignoring unreadable model fit cache: {e}")
+        return OrderedDict()
+    return cache
+
+
+def _save_fit_cache(cache: 'OrderedDict[str, LinearFit]') -> None:
+    from utils.publisher import atomic_write_bytes
+
+    arrays = {'__version__': np.array(FIT_CACHE_VERSION), '__keys__': np.array(list(cache), dtype=str)}
+    for key, fit in cache.items():
+        arrays[f'{key}__center'] = fit.center
+        arrays[f'{key}__scale'] = fit.scale
+        arrays[f'{key}__coef'] = fit.coef
+        arrays[f'{key}__intercept'] = np.array(fit.intercept)
+        arrays[f'{key}__params'] = np.array(json.dumps(fit.params))
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    try:
+        atomic_write_bytes(FIT_CACHE_FILE, buffer.getvalue())
+    except OSError as e:
+        print(f"  -> Warning: Could not save model fit cache: {e}")
+
+
+def fit_linear_cached(kind: str, X: pd.DataFrame, y: pd.Series, params: Optional[Dict] = None) -> LinearFit:
+    """
+    _fit_linear, reusing an earlier fit of the same kind, hyperparameters and
+    training data (in this process or a previous run).
+    """
+    global _fit_cache
+    params = params or {}
+    if _fit_cache is None:
+        _fit_cache = _load_fit_cache()
+
+    key = fit_fingerprint(kind, X, y, params)
+    if key in _fit_cache:
+        _fit_cache.move_to_end(key)
+        return _fit_cache[key]
+
+    fit = _fit_linear(kind, X, y, params)
+    _fit_cache[key] = fit
+    while len(_fit_cache) > FIT_CACHE_SIZE:
+        _fit_cache.popitem(last=False)
+    _save_fit_cache(_fit_cache)
+    return fit
+
+
+# ============================================================
+# FEATURES
+# ============================================================
+
+def gli_factor_lags(gli_dlog: pd.DataFrame, weeks: Optional[pd.DatetimeIndex] = None, lags=range(1, 9)) -> pd.DataFrame:
+    """
+    GLI_L<lag> features: lags of the first principal component of the central
+    banks' weekly Δlog (RobustScaler + PCA fitted on `gli_dlog` only), signed
+    so its loadings sum positive and refits on different windows agree on
+    the direction. No columns with 50 rows of history or fewer.
+
+    Rows are for `weeks` (default: the rows of gli_dlog); weeks after its last
+    row follow it in the lags, so the week after a window gets its lags from
+    the window's fit.
+    """
+    from sklearn.preprocessing import RobustScaler
+    from sklearn.decomposition import PCA
+
+    if weeks is None:
+        weeks = gli_dlog.index
+    if len(gli_dlog) <= 50:
+        return pd.DataFrame(index=weeks)
+    gli_scaled = RobustScaler().fit_transform(gli_dlog)
+    pca = PCA(n_components=2)
+    factor = pca.fit_transform(gli_scaled)[:, 0]
+    if pca.components_[0].sum() < 0:
+        factor = -factor
+    later = weeks[weeks > gli_dlog.index[-1]]
+    factor = pd.Series(factor, index=gli_dlog.index, name='GLI_FACTOR').reindex(gli_dlog.index.append(later))
+    return pd.DataFrame({f'GLI_L{lag}': factor.shift(lag) for lag in lags}).reindex(weeks)
+
+
+# ============================================================
+# WALK-FORWARD
+# ============================================================
+
+def _walk_forward_config(columns, cv_params: Dict, min_weeks: int, retune_weeks: int,
+                         refit_features: Optional[Callable] = None, refit_inputs: Optional[pd.DataFrame] = None) -> str:
+    """Stored predictions are only reused for the same features and settings."""
+    return hashlib.sha256(json.dumps({
+        'columns': list(columns),
+        'cv_params': _params_key(cv_params),
+        'min_weeks': min_weeks,
+        'retune_weeks': retune_weeks,
+        'refit_features': getattr(refit_features, '__qualname__', None),
+        'refit_inputs': None if refit_inputs is None else list(refit_inputs.columns),
+    }, sort_keys=True).encode()).hexdigest()
+
+
+def _input_digests(X: pd.DataFrame, y: pd.Series, refit_inputs: Optional[pd.DataFrame], weeks) -> np.ndarray:
+    """
+    Training-data fingerprint of each week i in `weeks`: the data its
+    prediction was made from (feature rows up to i, targets and refit
+    inputs before it).
+    """
+    rows_X = pd.util.hash_pandas_object(X, index=True).values
+    rows_y = pd.util.hash_pandas_object(y, index=True).values
+    if refit_inputs is not None:
+        rows_refit = pd.util.hash_pandas_object(refit_inputs, index=True).values
+        refit_end = np.searchsorted(refit_inputs.index.values, X.index.values, side='left')
+
+    digests = []
+    for i in weeks:
+        digest = hashlib.sha256(rows_X[:i + 1].tobytes())
+        digest.update(rows_y[:i].tobytes())
+        if refit_inputs is not None:
+            digest.update(rows_refit[:refit_end[i]].tobytes())
+        digests.append(digest.hexdigest())
+    return np.array(digests, dtype='<U64')
+
+
+def _load_oos(config: str) -> Optional[Dict]:
+    if not os.path.exists(OOS_FILE):
+        return None
+    try:
+        with np.load(OOS_FILE, allow_pickle=False) as npz:
+            if int(npz['__version__']) != OOS_VERSION or str(npz['config']) != config:
+                return None
+            return {key: npz[key] for key in npz.files}
+    except Exception as e:
+        print(f"  -> Warning: Ignoring unreadable walk-forward store: {e}")
+        return None
+
+
+def _save_oos(store: Dict) -> None:
+    from utils.publisher import atomic_write_bytes
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, __version__=np.array(OOS_VERSION), **store)
+    try:
+        atomic_write_bytes(OOS_FILE, buffer.getvalue())
+    except OSError as e:
+        print(f"  -> Warning: Could not save walk-forward predictions: {e}")
+
+
+def walk_forward_elasticnet(
+    X: pd.DataFrame,
+    y: pd.Series,
+    cv_params: Dict = ELASTICNET_CV_PARAMS,
+    min_weeks: int = WALK_FORWARD_MIN_WEEKS,
+    retune_weeks: int = WALK_FORWARD_RETUNE_WEEKS,
+    refit_features: Optional[Callable[[pd.DataFrame, pd.DatetimeIndex], pd.DataFrame]] = None,
+    refit_inputs: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Out-of-sample ElasticNet predictions, one per week.
+
+    The prediction for week i comes from a model fitted on weeks [0, i)
+    only: ElasticNet with the hyperparameters of the last ElasticNetCV
+    tuning (re-run every `retune_weeks` on the same expanding window),
+    warm-started from the previous week's coefficients. Features that are
+    fitted themselves (the GLI PCA factor) come from `refit_features`,
+    called every week with the `refit_inputs` rows before week i and the
+    weeks [0, i].
+
+    Stored weeks are not re-scored unless the data they were made from
+    changed (fingerprints per week, see _input_digests): a revision
+    re-scores from the first week that used it.
+
+    Args:
+        X: Weekly features (rows without NaN)
+        y: Weekly target aligned with X
+        refit_features: (inputs, weeks) -> extra feature columns for those
+            weeks, fitted on the inputs it is given; no NaN for rows of X
+        refit_inputs: Data behind refit_features (index sorted by week)
+
+    Returns:
+        DataFrame indexed by week with columns predicted, alpha, l1_ratio
+        (every stored week, empty before min_weeks of history)
+    """
+    config = _walk_forward_config(X.columns, cv_params, min_weeks, retune_weeks, refit_features, refit_inputs)
+    store = _load_oos(config)
+    fit_params = {'max_iter': cv_params.get('max_iter', 1000)}
+
+    # Keep the stored weeks up to the first one whose training data changed
+    keep = 0
+    if store is not None:
+        stored = store['digest'][:max(0, len(X) - min_weeks)]
+        current = _input_digests(X, y, refit_inputs, range(min_weeks, min_weeks + len(stored)))
+        keep = int(np.argmin(current == stored)) if (current != stored).any() else len(stored)
+        if keep < len(store['digest']):
+            print(f"  -> Walk-forward: training data changed, re-scoring from week {min_weeks + keep}")
+
+    if keep:
+        dates = list(store['dates'][:keep])
+        predicted, alphas, l1_ratios = list(store['predicted'][:keep]), list(store['alpha'][:keep]), list(store['l1_ratio'][:keep])
+        coefs, tuned = list(store['coef'][:keep]), list(store['tuned'][:keep])
+        digests = list(store['digest'][:keep])
+    else:
+        dates, predicted, alphas, l1_ratios, coefs, tuned, digests = [], [], [], [], [], [], []
+
+    week_dates = X.index.values.astype('datetime64[D]')
+    start = min_weeks + len(dates)
+    coef = coefs[-1] if coefs else None
+    tuned_week = min_weeks + int(np.flatnonzero(tuned)[-1]) if tuned else None
+
+    for i in range(start, len(X)):
+        X_i = X.iloc[:i + 1]
+        if refit_features is not None:
+            extra = refit_features(refit_inputs[refit_inputs.index < X.index[i]], X_i.index)
+            X_i = pd.concat([X_i, extra], axis=1)
+        X_train, y_train = X_i.iloc[:i], y.iloc[:i]
+
+        retune = tuned_week is None or i - tuned_week >= retune_weeks
+        if retune:
+            fit = _fit_linear('elasticnet_cv', X_train, y_train, cv_params)
+            alpha, l1_ratio, coef = fit.params['alpha'], fit.params['l1_ratio'], fit.coef
+            tuned_week = i
+        else:
+            alpha, l1_ratio = alphas[-1], l1_ratios[-1]
+
+        fit = _fit_linear('elasticnet', X_train, y_train,
+                          {'alpha': alpha, 'l1_ratio': l1_ratio, **fit_params}, warm_coef=coef)
+        coef = fit.coef
+        dates.append(week_dates[i])
+        predicted.append(float(fit.predict(X_i.iloc[[i]])[0]))
+        alphas.append(alpha)
+        l1_ratios.append(l1_ratio)
+        coefs.append(coef)
+        tuned.append(retune)
+
+    if len(X) > start:
+        digests.extend(_input_digests(X, y, refit_inputs, range(start, len(X))))
+        _save_oos({
+            'config': np.array(config),
+            'dates': np.array(dates, dtype='datetime64[D]'),
+            'predicted': np.array(predicted, dtype=float),
+            'alpha': np.array(alphas, dtype=float),
+            'l1_ratio': np.array(l1_ratios, dtype=float),
+            'coef': np.array(coefs, dtype=float),
+            'tuned': np.array(tuned, dtype=bool),
+            'digest': np.array(digests, dtype='<U64'),
+        })
+
+    return pd.DataFrame({
+        'predicted': predicted,
+        'alpha': alphas,
+        'l1_ratio': l1_ratios,
+    }, index=pd.DatetimeIndex(np.array(dates, dtype='datetime64[ns]'), name=X.index.name))
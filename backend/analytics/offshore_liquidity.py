@@ -23,10 +23,11 @@ Author: Quantitative Analysis Module
 Date: January 2026
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 
@@ -125,6 +126,17 @@ CURRENCY_PAIRS = {
     ),
 }
 
+# Explicit inputs of the offshore stage (get_offshore_liquidity_output):
+# FRED columns for chart 1, the USD leg and the rate fallbacks...
+OFFSHORE_FRED_COLUMNS = ['OBFR', 'EFFR', 'FED_CB_SWAPS', 'SOFR', 'SOFR_90D_AVG',
+                         'SOFR_INDEX', 'SONIA_INDEX', 'ESTR']
+
+# ...and TradingView spot/futures columns for chart 2 (both spot spellings)
+OFFSHORE_TV_COLUMNS = [
+    col for config in CURRENCY_PAIRS.values()
+    for col in (config.spot_key, f"{config.spot_key}_SPOT", config.futures_key)
+]
+
 
 def get_next_delivery_date(reference_date: datetime, roll_buffer_days: int = 10) -> datetime:
     """
@@ -896,6 +908,58 @@ def calculate_series_statistics(
     return stats
 
 
+# Columns of calculate_rolling_statistics(), with their JSON rounding
+ROLLING_STAT_DECIMALS = {'percentile': 1, 'zscore': 2, 'p10': 2, 'p25': 2, 'p75': 2, 'p90': 2}
+
+
+def calculate_rolling_statistics(
+    series: pd.Series,
+    lookback_years: int = 5,
+    frequency: str = 'daily'
+) -> pd.DataFrame:
+    """
+    calculate_series_statistics() for every date instead of the last one.
+    
+    Each row uses the same lookback (the previous lookback_periods valid
+    points) and minimum length as the snapshot, so the last row matches
+    it. Computed with the vectorized rolling kernels in utils/rolling.py.
+    
+    Args:
+        series: Pandas Series with datetime index
+        lookback_years: Years of history for percentile/z-score calculation
+        frequency: 'daily' or 'weekly' - adjusts lookback and minimum length
+        
+    Returns:
+        DataFrame on the series' valid dates with columns percentile
+        (0-100), zscore, p10, p25, p75, p90; NaN before enough history
+    """
+    from utils.rolling import rolling_percentile_rank, rolling_quantiles, rolling_zscore
+    
+    columns = list(ROLLING_STAT_DECIMALS)
+    if series is None or series.empty:
+        return pd.DataFrame(columns=columns, dtype=float)
+    
+    valid = series.dropna().astype(float)
+    min_points = 10 if frequency == 'weekly' else 20
+    lookback_periods = lookback_years * (52 if frequency == 'weekly' else 252)
+    
+    stats = rolling_quantiles(valid, lookback_periods, min_points, quantiles=(0.10, 0.25, 0.75, 0.90))
+    stats.columns = ['p10', 'p25', 'p75', 'p90']
+    stats['percentile'] = rolling_percentile_rank(valid, lookback_periods, min_points, include_current=True)
+    # The snapshot reports 0 for a flat window
+    stats['zscore'] = rolling_zscore(valid, lookback_periods, min_points, zero_std=0.0)
+    return stats[columns]
+
+
+def rolling_statistics_for_json(stats: pd.DataFrame) -> Dict[str, List]:
+    """{'dates': [...], column: [...]} for a calculate_rolling_statistics() result."""
+    output = {'dates': stats.index.strftime('%Y-%m-%d').tolist()}
+    for column, decimals in ROLLING_STAT_DECIMALS.items():
+        values = stats[column].round(decimals).astype(object)
+        output[column] = values.where(np.isfinite(stats[column]), None).tolist()
+    return output
+
+
 def generate_stress_analysis(spread_stats: Dict, swaps_stats: Dict, 
                             xccy_stats: Dict = None) -> Dict[str, List[Dict[str, str]]]:
     """
@@ -1044,20 +1108,141 @@ def debug_xccy_snapshot(date_str: str, pair: str, df_tv: pd.DataFrame,
     }
 
 
+def select_offshore_inputs(df: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    """
+    Split a pipeline frame into the offshore stage inputs.
+    
+    Returns:
+        (df_fred, df_tv) with only the OFFSHORE_FRED_COLUMNS /
+        OFFSHORE_TV_COLUMNS present in df; df_tv is None without TV columns
+    """
+    fred_cols = [c for c in OFFSHORE_FRED_COLUMNS if c in df.columns]
+    tv_cols = [c for c in OFFSHORE_TV_COLUMNS if c in df.columns]
+    return df[fred_cols], (df[tv_cols] if tv_cols else None)
+
+
+def resolve_foreign_rates(df_fred: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    Resolve the 3M rates of both XCCY legs.
+    
+    The USD/EUR/GBP/JPY fetches run concurrently (ForeignRateFetcher.fetch_all);
+    call this once per run and pass the result to get_offshore_liquidity_output.
+    
+    Args:
+        df_fred: DataFrame with SOFR_INDEX, SONIA_INDEX, ESTR (and SOFR /
+                 SOFR_90D_AVG for the USD fallbacks)
+        
+    Returns:
+        Dict of currency -> 3M rate series (%), only currencies with data.
+        Missing foreign legs fall back to constants in get_chart2_data.
+    """
+    rates = {}
+    
+    try:
+        from config.rates_sources import ForeignRateFetcher
+        rate_fetcher = ForeignRateFetcher(df_fred)
+        
+        # P0 FIX: USD 3M from SOFR Index (term-aligned with foreign rates)
+        # instead of SOFR overnight
+        for currency, rate in rate_fetcher.fetch_all().items():
+            if rate is not None and not rate.dropna().empty:
+                rates[currency] = rate
+        if 'USD' in rates:
+            print(f"  -> USD 3M from SOFR Index: {rates['USD'].dropna().iloc[-1]:.3f}%")
+        
+        # Sanity check USD (optional)
+        passes, diff_bp = rate_fetcher.sanity_check_usd()
+        if passes:
+            print(f"  -> USD sanity check passed (diff: {diff_bp:.1f}bp)")
+        elif not np.isnan(diff_bp):
+            print(f"  -> USD sanity check warning: {diff_bp:.1f}bp difference")
+            
+    except ImportError as e:
+        print(f"  -> rates_sources not available: {e}, using fallback")
+    except Exception as e:
+        print(f"  -> Error fetching dynamic rates: {e}, using fallback")
+    
+    # Fallback chain for USD rate
+    if 'USD' not in rates:
+        for col, label in (('SOFR_90D_AVG', 'SOFR_90D_AVG (fallback)'), ('SOFR', 'SOFR overnight (last resort)')):
+            usd_3m = df_fred.get(col, pd.Series(dtype=float))
+            if not usd_3m.empty:
+                print(f"  -> USD rate from {label}")
+                rates['USD'] = usd_3m
+                break
+    
+    return rates
+
+
+def _fingerprint(df_fred: pd.DataFrame, df_tv: Optional[pd.DataFrame], foreign_rates: Dict[str, pd.Series]) -> str:
+    """Content hash of the stage inputs (values, index and column names)."""
+    digest = hashlib.sha256()
+    parts = [('fred', df_fred), ('tv', df_tv)] + [(ccy, foreign_rates[ccy]) for ccy in sorted(foreign_rates)]
+    for label, obj in parts:
+        digest.update(label.encode())
+        if obj is None:
+            continue
+        if isinstance(obj, pd.DataFrame):
+            digest.update(repr(list(obj.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+# (input fingerprint, output) of the last get_offshore_liquidity_output call
+_last_output: Optional[Tuple[str, Dict]] = None
+
+
 def get_offshore_liquidity_output(
     df_fred: pd.DataFrame,
-    df_tv: pd.DataFrame = None
+    df_tv: pd.DataFrame = None,
+    foreign_rates: Dict[str, pd.Series] = None
 ) -> Dict:
     """
     Generate complete offshore liquidity output for dashboard.
     
+    Only the OFFSHORE_FRED_COLUMNS / OFFSHORE_TV_COLUMNS of the frames and
+    the rate series are read; called again with the same inputs it returns
+    the previous output object (shared, don't modify it).
+    
     Args:
         df_fred: DataFrame with FRED data (must have OBFR, EFFR, FED_CB_SWAPS, SOFR)
         df_tv: DataFrame with TradingView FX data (optional)
+        foreign_rates: Result of resolve_foreign_rates(); resolved here
+                       when omitted
         
     Returns:
         Dict ready for JSON serialization
     """
+    global _last_output
+    
+    df_fred, _ = select_offshore_inputs(df_fred)
+    if df_tv is not None:
+        df_tv = select_offshore_inputs(df_tv)[1]
+    if df_tv is not None and df_tv.empty:
+        df_tv = None
+    
+    # Rates only matter for chart 2
+    if df_tv is None:
+        foreign_rates = {}
+    elif foreign_rates is None:
+        foreign_rates = resolve_foreign_rates(df_fred)
+    
+    key = _fingerprint(df_fred, df_tv, foreign_rates)
+    if _last_output is not None and _last_output[0] == key:
+        print("Offshore Dollar Liquidity: inputs unchanged, reusing output")
+        return _last_output[1]
+    
+    output = _compute_offshore_liquidity_output(df_fred, df_tv, foreign_rates)
+    _last_output = (key, output)
+    return output
+
+
+def _compute_offshore_liquidity_output(
+    df_fred: pd.DataFrame,
+    df_tv: Optional[pd.DataFrame],
+    foreign_rates: Dict[str, pd.Series]
+) -> Dict:
+    """get_offshore_liquidity_output() without the input selection and cache."""
     print("Calculating Offshore Dollar Liquidity...")
     
     # Chart 1: FRED Proxy
@@ -1066,59 +1251,14 @@ def get_offshore_liquidity_output(
     
     # Chart 2: XCCY DIY (if TV data available)
     chart2 = None
-    if df_tv is not None and not df_tv.empty:
+    if df_tv is not None:
         print("  Chart 2: XCCY DIY...")
-        
-        # P0 FIX: Use USD 3M rate (term-aligned with foreign rates)
-        # instead of SOFR overnight
-        usd_3m = None
-        foreign_rates = {}
-        
-        try:
-            from config.rates_sources import ForeignRateFetcher
-            rate_fetcher = ForeignRateFetcher(df_fred)
-            
-            # USD 3M from SOFR Index (preferred - term aligned)
-            usd_3m = rate_fetcher.get_usd_3m_rate()
-            if usd_3m is not None and not usd_3m.empty:
-                print(f"  -> USD 3M from SOFR Index: {usd_3m.dropna().iloc[-1]:.3f}%")
-            
-            # Get dynamic rates for each foreign currency
-            eur_3m = rate_fetcher.get_eur_3m_rate()
-            gbp_3m = rate_fetcher.get_gbp_3m_rate()
-            jpy_3m = rate_fetcher.get_jpy_3m_rate()
-            
-            if not eur_3m.empty:
-                foreign_rates['EUR'] = eur_3m
-            if not gbp_3m.empty:
-                foreign_rates['GBP'] = gbp_3m
-            if not jpy_3m.empty:
-                foreign_rates['JPY'] = jpy_3m
-            
-            # Sanity check USD (optional)
-            passes, diff_bp = rate_fetcher.sanity_check_usd()
-            if passes:
-                print(f"  -> USD sanity check passed (diff: {diff_bp:.1f}bp)")
-            elif not np.isnan(diff_bp):
-                print(f"  -> USD sanity check warning: {diff_bp:.1f}bp difference")
-                
-        except ImportError as e:
-            print(f"  -> rates_sources not available: {e}, using fallback")
-        except Exception as e:
-            print(f"  -> Error fetching dynamic rates: {e}, using fallback")
-        
-        # Fallback chain for USD rate
-        if usd_3m is None or usd_3m.empty:
-            usd_3m = df_fred.get('SOFR_90D_AVG', pd.Series(dtype=float))
-            if not usd_3m.empty:
-                print("  -> USD rate from SOFR_90D_AVG (fallback)")
-        if usd_3m is None or usd_3m.empty:
-            usd_3m = df_fred.get('SOFR', pd.Series(dtype=float))
-            if not usd_3m.empty:
-                print("  -> USD rate from SOFR overnight (last resort)")
-        
+        usd_3m = foreign_rates.get('USD')
         if usd_3m is not None and not usd_3m.empty:
-            chart2 = get_chart2_data(df_tv, usd_3m, foreign_rates=foreign_rates)
+            chart2 = get_chart2_data(
+                df_tv, usd_3m,
+                foreign_rates={ccy: rate for ccy, rate in foreign_rates.items() if ccy != 'USD'}
+            )
         else:
             print("  -> Warning: No USD rate available, skipping Chart 2")
     
@@ -1136,6 +1276,13 @@ def get_offshore_liquidity_output(
     
     analysis = generate_stress_analysis(spread_stats, swaps_stats, xccy_stats)
     
+    # Same statistics for every date, for charting their history
+    stats_history = {
+        'spread': calculate_rolling_statistics(chart1['series']['obfr_effr_spread'], frequency='daily'),
+        'swaps': calculate_rolling_statistics(chart1['series']['cb_swaps_b'], frequency='weekly'),
+        'xccy': calculate_rolling_statistics(chart2['series']['xccy_composite_stress']) if chart2 else None,
+    }
+    
     output = {
         'offshore_liquidity': {
             'analysis': analysis,
@@ -1144,6 +1291,10 @@ def get_offshore_liquidity_output(
                 'swaps': swaps_stats,
                 'xccy': xccy_stats
             },
+            'stats_history': {
+                name: rolling_statistics_for_json(stats) if stats is not None else None
+                for name, stats in stats_history.items()
+            },
             # Chart 1: FRED Proxy
             'chart1_fred_proxy': {
                 'obfr': clean_series_for_json(chart1['series']['obfr']),
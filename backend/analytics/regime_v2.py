@@ -659,16 +659,44 @@ def calculate_macro_regime_v2b(
 # MARKET STRESS DASHBOARD - HISTÓRICO
 # ============================================================
 
+# Columnas que lee calculate_stress_historical
+STRESS_INPUT_COLUMNS = (
+    'TIPS_BREAKEVEN', 'TIPS_5Y5Y_FORWARD', 'CLEV_EXPINF_10Y',
+    'SOFR', 'IORB', 'BANK_RESERVES', 'RRP_USD', 'TGA_USD', 'FED_USD',
+    'HY_SPREAD', 'IG_SPREAD', 'NFCI', 'VIX', 'MOVE',
+)
+
+# ROC más largo (3M) usado en los scores
+STRESS_MAX_ROC_PERIODS = 63
+
+
+def _stress_trailing_window(df: pd.DataFrame, as_of, rows: int) -> pd.DataFrame:
+    """
+    Ventana final de `rows` filas hasta `as_of` (inclusive).
+    
+    El ffill se hace antes de recortar, así los datos publicados antes de la
+    ventana (semanales, mensuales) siguen vigentes en ella.
+    """
+    columns = [c for c in STRESS_INPUT_COLUMNS if c in df.columns]
+    history = df.loc[:as_of, columns]
+    return _safe_ffill_only(history).iloc[-rows:]
+
+
 def calculate_stress_historical(
     df: pd.DataFrame,
     z_window: int = 252,
     min_periods: int = 100,
+    as_of=None,
 ) -> Dict[str, pd.Series]:
     """
     Market Stress Dashboard HISTÓRICO - SIN LOOKAHEAD
     
     Calcula scores de stress para cada día en el histórico.
     
+    Con `as_of` (fecha) solo se calcula la ventana final que necesitan los
+    z-scores y ROCs hasta esa fecha: la última fila es idéntica a la del
+    histórico completo en `as_of`, a una fracción del coste (snapshots).
+    
     DIMENSIONES:
     1. Inflation Stress (max 7 puntos)
     2. Liquidity Stress (max 7 puntos)  
@@ -683,8 +711,11 @@ def calculate_stress_historical(
     - HIGH: 10-14
     - CRITICAL: 15+
     
-    Returns Dict con series históricas para cada dimensión.
+    Returns Dict con series históricas para cada dimensión, incluyendo los
+    inputs de cada regla (para explicar el score de una fecha).
     """
+    if as_of is not None:
+        df = _stress_trailing_window(df, as_of, max(z_window, STRESS_MAX_ROC_PERIODS + 1))
     idx = df.index
     out: Dict[str, pd.Series] = {}
     
@@ -716,6 +747,7 @@ def calculate_stress_historical(
     out['inflation_stress'] = inflation_score.clip(0, 7)
     out['tips_be_zscore'] = tips_be_z
     out['tips_clev_divergence'] = tips_clev_div
+    out['tips_be_roc_3m'] = tips_be_roc_3m
     
     # ================================================================
     # 2. LIQUIDITY STRESS (max 7)
@@ -790,6 +822,8 @@ def calculate_stress_historical(
     out['credit_stress'] = credit_score.clip(0, 7)
     out['hy_spread_zscore'] = hy_z
     out['ig_spread_zscore'] = ig_z
+    out['hy_spread_bps'] = hy_bps
+    out['ig_spread_bps'] = ig_bps
     
     # ================================================================
     # 4. VOLATILITY STRESS (max 6)
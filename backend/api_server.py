@@ -0,0 +1,672 @@
+"""
+api_server.py
+Local HTTP API serving slices of the domain outputs.
+
+The dashboard fetches whole artifacts (domains/*.json, dashboard_data.json,
+commodities_data.json) even when a tab shows one series over the last
+year. This server sits on top of the published outputs and returns only
+the requested series and date range:
+
+    GET /domains                  -> {"domains": [...]} published domain names
+    GET /domains/{name}?series=total,rocs.1M&start=2025-01-01&end=&resolution=weekly
+    GET /domains/{name}/deltas?since=V -> delta records V+1..current (domains/delta.py)
+    GET /events[?domains=a,b]     -> server-sent events: each new delta record
+    GET /{path}.json              -> published artifact as is (domains/gli.json, ...)
+
+Slice parameters:
+    series      comma separated dot paths ('rocs.1M') or path prefixes ('rocs');
+                default: every series on the daily axis
+    start, end  inclusive ISO dates; default: the whole axis (timestamps with
+                an offset, e.g. 2020-01-01T00:00Z, count as their UTC date)
+    resolution  daily (default), weekly, monthly (last value per period,
+                as in domains/pyramid.py) or lttb (downsampled to `points`)
+    points      LTTB point budget per series (default 1000)
+
+Response: {"domain", "version", "resolution", "start", "end", "dates": [...],
+"series": {path: [...]}} with null for missing values.
+
+Series are read from the binary output (<domain>.manifest.json + .bin,
+memory-mapped, only the sliced rows are touched) when it is at least as
+new as <domain>.json, otherwise from the JSON once per file version.
+Domains without their own axis use (the tail of) the shared one from
+metadata.json.
+Tables are reloaded when the files change on disk.
+
+Responses carry weak ETags (content hash of the domain version plus the
+normalized query) and are gzip/brotli compressed per Accept-Encoding;
+brotli is used when the `brotli` package is installed.
+
+Usage:
+    python api_server.py [--host 127.0.0.1] [--port 8765] [--data-dir DIR] [--static-dir DIR ...]
+"""
+import os
+import sys
+import json
+import gzip
+import argparse
+import time
+import threading
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from domains.axis import AXES_KEY
+from domains.binary import FORMAT_NAME as BINARY_FORMAT, SUPPORTED_DTYPES, _is_numeric_list
+from domains.delta import load_versions, versions_filename
+from domains.pyramid import CALENDAR_LEVELS, lttb_indices, resample_last, _collect_series, _daily_index, _to_json_values
+from utils.publisher import sha256_bytes, sha256_file
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = int(os.environ.get('API_PORT', 8765))
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_STATIC_DIRS = [os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'frontend', 'public')]
+
+RESOLUTIONS = ('daily', *CALENDAR_LEVELS, 'lttb')
+DEFAULT_LTTB_POINTS = 1000
+
+# /events: how often version indexes are checked, and the keep-alive interval
+EVENT_POLL_SECONDS = 1.0
+EVENT_KEEPALIVE_SECONDS = 15.0
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+class ApiError(Exception):
+    """Request error carrying the HTTP status to answer with."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================
+# DOMAIN TABLES
+# ============================================================
+
+@dataclass
+class DomainTable:
+    """Daily-axis series of one domain output."""
+    name: str
+    index: pd.DatetimeIndex
+    columns: Dict[str, np.ndarray]     # dot path -> values on index
+    version: str                       # content hash of the files read
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _shared_index(domains_dir: str) -> Optional[pd.DatetimeIndex]:
+    """Daily axis from metadata.json, for domain files without their own axes table."""
+    path = os.path.join(domains_dir, 'metadata.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return _daily_index(json.loads(f.read()), None)
+
+
+def _load_binary(name: str, manifest_path: str) -> Optional[DomainTable]:
+    with open(manifest_path, 'rb') as f:
+        raw = f.read()
+    manifest = json.loads(raw)
+    if manifest.get('format') != BINARY_FORMAT:
+        return None
+    index = _daily_index({AXES_KEY: manifest.get('axes') or {}}, None)
+    if index is None:
+        return None
+
+    blob_path = os.path.join(os.path.dirname(manifest_path), manifest.get('blob', f'{name}.bin'))
+    columns: Dict[str, np.ndarray] = {}
+    if manifest.get('byte_length'):
+        blob = np.memmap(blob_path, dtype=np.uint8, mode='r')
+        for entry in manifest['series']:
+            if entry['length'] != len(index):
+                continue
+            dtype = np.dtype(SUPPORTED_DTYPES[entry['dtype']])
+            end = entry['offset'] + entry['length'] * dtype.itemsize
+            columns['.'.join(entry['path'])] = blob[entry['offset']:end].view(dtype)
+
+    version = sha256_bytes(raw + sha256_file(blob_path).encode() if os.path.exists(blob_path) else raw)
+    return DomainTable(name, index, columns, version)
+
+
+def _longest_series(node: Any) -> int:
+    if isinstance(node, dict):
+        return max((_longest_series(v) for k, v in node.items() if k != AXES_KEY), default=0)
+    if isinstance(node, list) and node:
+        if isinstance(node[0], (dict, list)):
+            return max(_longest_series(x) for x in node)
+        if _is_numeric_list(node):
+            return len(node)
+    return 0
+
+
+def _load_json(name: str, json_path: str, domains_dir: str) -> Optional[DomainTable]:
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw)
+    index = _daily_index(data, None)
+    if index is None:
+        # Series without an axis table end on the last shared date (as in
+        # alignToSharedDates in the frontend), so they may cover only its tail
+        shared = _shared_index(domains_dir)
+        length = _longest_series(data)
+        if shared is None or not length or length > len(shared):
+            return None
+        index = shared[len(shared) - length:]
+
+    columns = {
+        '.'.join(path): np.array(values, dtype=float)     # None -> NaN
+        for path, values in _collect_series(data, len(index))
+    }
+    return DomainTable(name, index, columns, sha256_bytes(raw))
+
+
+def load_domain_table(domains_dir: str, name: str) -> Optional[DomainTable]:
+    """
+    Read a domain's daily series, preferring the binary output.
+
+    The binary pair is used when its manifest is at least as new as the
+    JSON file (a later json-only run leaves a stale pair behind).
+    Returns None if the domain has no output or no daily axis.
+    """
+    json_path = os.path.join(domains_dir, f'{name}.json')
+    manifest_path = os.path.join(domains_dir, f'{name}.manifest.json')
+    json_stat = _stat(json_path)
+    manifest_stat = _stat(manifest_path)
+
+    if manifest_stat and (not json_stat or manifest_stat[0] >= json_stat[0]):
+        table = _load_binary(name, manifest_path)
+        if table is not None:
+            return table
+    if json_stat:
+        return _load_json(name, json_path, domains_dir)
+    return None
+
+
+class DomainStore:
+    """Domain tables by name, reloaded when their files change."""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = os.path.abspath(data_dir)
+        self.domains_dir = os.path.join(self.data_dir, 'domains')
+        self._tables: Dict[str, Tuple[Tuple, DomainTable]] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        if not os.path.isdir(self.domains_dir):
+            return []
+        return sorted(
+            f[:-len('.json')] for f in os.listdir(self.domains_dir)
+            if f.endswith('.json') and f.count('.') == 1
+        )
+
+    def _stamp(self, name: str) -> Tuple:
+        """File versions a table for `name` depends on; any change triggers a reload."""
+        files = (f'{name}.json', f'{name}.manifest.json', f'{name}.bin', 'metadata.json')
+        return tuple(_stat(os.path.join(self.domains_dir, f)) for f in files)
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        if not name.replace('_', '').isalnum():
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown domain {name!r}")
+
+    def get(self, name: str) -> DomainTable:
+        """Current table for a domain; raises ApiError(404) if there is none."""
+        self._check_name(name)
+        with self._lock:
+            stamp = self._stamp(name)
+            cached = self._tables.get(name)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            table = load_domain_table(self.domains_dir, name)
+            if table is None:
+                self._tables.pop(name, None)
+                raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown domain {name!r}")
+            self._tables[name] = (stamp, table)
+            return table
+
+
+    def versions(self) -> Dict[str, int]:
+        """Current delta version per domain that has a version index."""
+        if not os.path.isdir(self.domains_dir):
+            return {}
+        suffix = '.versions.json'
+        return {
+            f[:-len(suffix)]: load_versions(self.domains_dir, f[:-len(suffix)]).get('current', 0)
+            for f in sorted(os.listdir(self.domains_dir)) if f.endswith(suffix)
+        }
+
+    def deltas(self, name: str, since: int) -> Dict[str, Any]:
+        """
+        Delta records taking a client from version `since` to the current one.
+
+        Returns {"domain", "current", "deltas": [...]}, or {"domain",
+        "current", "full": true} when a needed record is no longer kept or
+        is itself a full record.
+        """
+        self._check_name(name)
+        index = load_versions(self.domains_dir, name)
+        current = index.get('current', 0)
+        if not current:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No delta records for {name!r}")
+        if since >= current:
+            return {'domain': name, 'current': current, 'deltas': []}
+
+        entries = {e['version']: e for e in index.get('deltas') or []}
+        needed = [entries.get(v) for v in range(since + 1, current + 1)]
+        if since < 1 or any(e is None or e.get('full') for e in needed):
+            return {'domain': name, 'current': current, 'full': True}
+        records = []
+        for entry in needed:
+            with open(os.path.join(self.domains_dir, entry['file']), 'rb') as f:
+                records.append(json.loads(f.read()))
+        return {'domain': name, 'current': current, 'deltas': records}
+
+
+# ============================================================
+# SLICING
+# ============================================================
+
+def _select_series(table: DomainTable, series: Optional[Sequence[str]]) -> List[str]:
+    if not series:
+        return list(table.columns)
+    selected: List[str] = []
+    for requested in series:
+        matches = [p for p in table.columns if p == requested or p.startswith(requested + '.')]
+        if not matches:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Unknown series {requested!r} in {table.name}")
+        selected.extend(p for p in matches if p not in selected)
+    return selected
+
+
+def _parse_date(value: Optional[str], param: str) -> Optional[pd.Timestamp]:
+    if not value:
+        return None
+    try:
+        ts = pd.Timestamp(value)
+    except (ValueError, OverflowError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Invalid {param} date {value!r}")
+    if ts.tz is not None:
+        # The axis is naive (UTC dates): '2020-01-01T00:00Z' means 2020-01-01
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return ts.normalize()
+
+
+def slice_domain(
+    table: DomainTable,
+    series: Optional[Sequence[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    resolution: str = 'daily',
+    points: int = DEFAULT_LTTB_POINTS
+) -> Dict[str, Any]:
+    """
+    Project and slice one domain table.
+
+    Only the rows in [start, end] of the selected series are read. For
+    'lttb' every series is downsampled on its own and the response carries
+    the union of the selected rows, so all series share one date list.
+    """
+    if resolution not in RESOLUTIONS:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Unknown resolution {resolution!r}, expected one of {list(RESOLUTIONS)}")
+    if resolution == 'lttb' and points < 3:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "points must be at least 3")
+
+    paths = _select_series(table, series)
+    start_ts, end_ts = _parse_date(start, 'start'), _parse_date(end, 'end')
+    lo = table.index.searchsorted(start_ts, 'left') if start_ts is not None else 0
+    hi = table.index.searchsorted(end_ts, 'right') if end_ts is not None else len(table.index)
+    hi = max(lo, hi)
+
+    index = table.index[lo:hi]
+    matrix = np.empty((hi - lo, len(paths)), dtype=float)
+    for j, path in enumerate(paths):
+        matrix[:, j] = table.columns[path][lo:hi]
+
+    if resolution in CALENDAR_LEVELS and len(index):
+        matrix, index = resample_last(matrix, index, CALENDAR_LEVELS[resolution])
+    elif resolution == 'lttb' and len(paths):
+        rows = np.unique(np.concatenate(lttb_indices(matrix, points)))
+        matrix, index = matrix[rows], index[rows]
+
+    dates = index.strftime('%Y-%m-%d').tolist()
+    return {
+        'domain': table.name,
+        'version': table.version,
+        'resolution': resolution,
+        'start': dates[0] if dates else None,
+        'end': dates[-1] if dates else None,
+        'dates': dates,
+        'series': {path: _to_json_values(matrix[:, j]) for j, path in enumerate(paths)},
+    }
+
+
+def parse_slice_query(query: str) -> Dict[str, Any]:
+    """Slice keyword arguments from a query string, normalized (usable as a cache key)."""
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    series = [s.strip() for s in params.get('series', '').split(',') if s.strip()]
+    resolution = params.get('resolution') or 'daily'
+    try:
+        points = int(params.get('points') or DEFAULT_LTTB_POINTS)
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Invalid points {params['points']!r}")
+    return {
+        'series': series,
+        'start': params.get('start') or None,
+        'end': params.get('end') or None,
+        'resolution': resolution,
+        'points': points if resolution == 'lttb' else DEFAULT_LTTB_POINTS,
+    }
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """'br' or 'gzip' if the client accepts it (q > 0), else None."""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = q
+    if BROTLI_AVAILABLE and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    # Weak comparison (RFC 9110): ignore W/ prefixes
+    tags = {t.strip().removeprefix('W/') for t in if_none_match.split(',')}
+    return etag.removeprefix('W/') in tags
+
+
+class ApiServer(ThreadingHTTPServer):
+    """HTTP server holding the domain store and the static file caches."""
+
+    daemon_threads = True
+
+    def __init__(self, address, data_dir: str = DEFAULT_DATA_DIR, static_dirs: Optional[Sequence[str]] = None):
+        self.store = DomainStore(data_dir)
+        roots = [data_dir] + list(DEFAULT_STATIC_DIRS if static_dirs is None else static_dirs)
+        self.static_roots = [os.path.abspath(r) for r in roots]
+        # (path, accepted encoding) -> (file stamp, static_body result)
+        self._static_cache: Dict[Tuple[str, Optional[str]], Tuple[Any, Tuple[str, bytes, Optional[str]]]] = {}
+        self._static_lock = threading.Lock()
+        super().__init__(address, ApiRequestHandler)
+
+    def resolve_static(self, url_path: str) -> Optional[str]:
+        """File for a URL path under one of the static roots (first match wins)."""
+        relative = unquote(url_path).lstrip('/')
+        if not relative.endswith('.json'):
+            return None
+        for root in self.static_roots:
+            path = os.path.abspath(os.path.join(root, relative))
+            if os.path.commonpath([root, path]) == root and os.path.isfile(path):
+                return path
+        return None
+
+    def static_body(self, path: str, encoding: Optional[str]) -> Tuple[str, bytes, Optional[str]]:
+        """(etag, body, content encoding) of a static file, cached per file version."""
+        stamp = _stat(path)
+        key = (path, encoding)
+        with self._static_lock:
+            cached = self._static_cache.get(key)
+            if cached and cached[0] == stamp:
+                return cached[1]
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if len(raw) < MIN_COMPRESS_BYTES:
+            encoding = None
+        result = (f'W/"{sha256_bytes(raw)[:32]}"', compress(raw, encoding), encoding)
+        with self._static_lock:
+            self._static_cache[key] = (stamp, result)
+        return result
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    server: ApiServer
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def do_OPTIONS(self):
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self._common_headers()
+        self.send_header('Access-Control-Allow-Methods', 'GET, HEAD, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'If-None-Match')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        if os.environ.get('API_ACCESS_LOG'):
+            super().log_message(format, *args)
+
+    def _common_headers(self):
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
+
+    def _handle(self, send_body: bool):
+        url = urlsplit(self.path)
+        encoding = choose_encoding(self.headers.get('Accept-Encoding', ''))
+        try:
+            parts = [p for p in url.path.split('/') if p]
+            if parts == ['domains']:
+                body = json.dumps({'domains': self.server.store.names()}).encode('utf-8')
+                etag = f'W/"{sha256_bytes(body)[:32]}"'
+                self._respond(etag, body, encoding, send_body)
+            elif len(parts) == 2 and parts[0] == 'domains' and '.' not in parts[1]:
+                self._slice(parts[1], url.query, encoding, send_body)
+            elif len(parts) == 3 and parts[0] == 'domains' and parts[2] == 'deltas':
+                self._deltas(parts[1], url.query, encoding, send_body)
+            elif parts == ['events'] and send_body:
+                self._events(url.query)
+            else:
+                path = self.server.resolve_static(url.path)
+                if path is None:
+                    raise ApiError(HTTPStatus.NOT_FOUND, f"Not found: {url.path}")
+                etag, body, encoding = self.server.static_body(path, encoding)
+                self._send(etag, body, encoding, send_body)
+        except ApiError as e:
+            self._error(e.status, str(e), send_body)
+        except Exception as e:
+            self.log_error("Error serving %s: %r", self.path, e)
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, 'Internal error', send_body)
+
+    def _slice(self, name: str, query: str, encoding: Optional[str], send_body: bool):
+        table = self.server.store.get(name)
+        params = parse_slice_query(query)
+        key = json.dumps(params, sort_keys=True)
+        etag = f'W/"{table.version[:16]}-{sha256_bytes(key.encode())[:16]}"'
+        # Revalidation is answered before any slicing happens
+        if _etag_matches(self.headers.get('If-None-Match'), etag):
+            self._not_modified(etag)
+            return
+        body = json.dumps(slice_domain(table, **params), separators=(',', ':')).encode('utf-8')
+        self._respond(etag, body, encoding, send_body)
+
+    def _deltas(self, name: str, query: str, encoding: Optional[str], send_body: bool):
+        params = parse_qs(query)
+        try:
+            since = int(params.get('since', ['0'])[-1])
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Invalid since {params['since'][-1]!r}")
+        body = json.dumps(self.server.store.deltas(name, since), separators=(',', ':')).encode('utf-8')
+        self._respond(f'W/"{sha256_bytes(body)[:32]}"', body, encoding, send_body)
+
+    def _events(self, query: str):
+        """
+        Server-sent events: one `versions` event with the current version of
+        every domain, then each new delta record as a `delta` event.
+
+        Clients patch their cached domains with the records and reload a
+        domain when a record is full or a version was missed.
+        """
+        wanted = {n for n in ','.join(parse_qs(query).get('domains', [])).split(',') if n}
+        store = self.server.store
+        index_dir = store.domains_dir
+
+        def stamps() -> Dict[str, Any]:
+            names = wanted or set(store.versions())
+            return {n: _stat(os.path.join(index_dir, versions_filename(n))) for n in names}
+
+        self.close_connection = True
+        self.send_response(HTTPStatus.OK)
+        self._common_headers()
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+
+        seen = {n: v for n, v in store.versions().items() if not wanted or n in wanted}
+        last_stamps = stamps()
+        try:
+            self._send_event('versions', seen)
+            last_write = time.monotonic()
+            while True:
+                time.sleep(EVENT_POLL_SECONDS)
+                current = stamps()
+                for name, stamp in current.items():
+                    if stamp == last_stamps.get(name) or stamp is None:
+                        continue
+                    since = seen.get(name, 0)
+                    update = store.deltas(name, since)
+                    records = update.get('deltas') or []
+                    if update.get('full'):
+                        records = [{'domain': name, 'version': update['current'], 'base_version': since, 'full': True}]
+                    for record in records:
+                        self._send_event('delta', record, event_id=f"{name}:{record['version']}")
+                        last_write = time.monotonic()
+                    seen[name] = update['current']
+                last_stamps = current
+                if time.monotonic() - last_write >= EVENT_KEEPALIVE_SECONDS:
+                    self.wfile.write(b': keep-alive\n\n')
+                    self.wfile.flush()
+                    last_write = time.monotonic()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            # Headers are sent, so _handle can't answer with an error response:
+            # tell the client and end the stream (EventSource reconnects)
+            self.log_error("Event stream %s failed: %r", self.path, e)
+            try:
+                self._send_event('error', {'error': 'Internal error'})
+            except OSError:
+                pass
+
+    def _send_event(self, event: str, data: Any, event_id: Optional[str] = None):
+        lines = [f'event: {event}']
+        if event_id:
+            lines.append(f'id: {event_id}')
+        lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+        self.wfile.write(('\n'.join(lines) + '\n\n').encode('utf-8'))
+        self.wfile.flush()
+
+    def _respond(self, etag: str, body: bytes, encoding: Optional[str], send_body: bool):
+        if len(body) < MIN_COMPRESS_BYTES:
+            encoding = None
+        self._send(etag, compress(body, encoding), encoding, send_body)
+
+    def _send(self, etag: str, body: bytes, encoding: Optional[str], send_body: bool):
+        if _etag_matches(self.headers.get('If-None-Match'), etag):
+            self._not_modified(etag)
+            return
+        self.send_response(HTTPStatus.OK)
+        self._common_headers()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _not_modified(self, etag: str):
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self._common_headers()
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+
+    def _error(self, status: HTTPStatus, message: str, send_body: bool):
+        body = json.dumps({'error': message}).encode('utf-8')
+        self.send_response(status)
+        self._common_headers()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve domain slices and published artifacts over HTTP.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help='Pipeline output directory (default: backend/data)')
+    parser.add_argument('--static-dir', action='append', dest='static_dirs',
+                        help='Extra directory for static JSON files (default: frontend/public)')
+    args = parser.parse_args()
+
+    server = ApiServer((args.host, args.port), data_dir=args.data_dir, static_dirs=args.static_dirs)
+    print(f"[api] Serving {os.path.abspath(args.data_dir)} on http://{args.host}:{args.port} "
+          f"(compression: {'br, gzip' if BROTLI_AVAILABLE else 'gzip'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[api] Stopping")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
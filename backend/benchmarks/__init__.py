@@ -0,0 +1,8 @@
+# Benchmarks Package
+
+"""
+Offline performance benchmarks.
+
+Run from backend/, e.g.:
+    python -m benchmarks.bench_serialization
+"""
@@ -0,0 +1,263 @@
+"""
+bench_pipeline.py
+End-to-end pipeline benchmark on synthetic FRED/TV data, fully offline.
+
+Synthetic raw series (benchmarks/synthetic.py, same names as FRED_CONFIG /
+TV_CONFIG) are fed through data_pipeline.run_pipeline(inputs=...), which runs
+DataOrchestrator.run and the legacy process_and_save_final. Network access is
+stubbed out (remote fetchers return empty results, any other HTTP request
+fails immediately) and all output goes to a temporary directory, so it runs
+on a plain Linux box without credentials.
+
+Per-stage wall/CPU time comes from the utils/tracing.py spans; --memory adds
+a second pass with tracemalloc for peak allocation per stage (kept separate
+so it doesn't distort the timings). Results are written as JSON and can be
+compared across commits with --compare.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pipeline [--years 10 25 50] [--extra-columns 0] [--memory]
+                                        [--output benchmarks/results/pipeline.json]
+    python -m benchmarks.bench_pipeline --compare OLD.json NEW.json [--threshold 0.1]
+"""
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import resource
+import tempfile
+import contextlib
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.tracing as tracing
+from benchmarks.synthetic import make_synthetic_inputs, count_points
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Stages shown in the console table (everything is kept in the results file)
+HEADLINE_STAGES = [
+    'run_pipeline', 'orchestrator.run', 'process_and_save_final',
+    'calculate_btc_fair_value_v2', 'calculate_stress_historical', 'get_offshore_liquidity_output',
+]
+
+
+def _fear_greed(index: pd.DatetimeIndex, seed: int) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    values = np.clip(50 + np.cumsum(rng.normal(scale=3, size=len(index))), 0, 100)
+    return pd.Series(values, index=index, name='FEAR_GREED')
+
+
+@contextlib.contextmanager
+def offline_pipeline(output_dir: str, fear_greed: pd.Series):
+    """
+    Point data_pipeline at output_dir and stub out every remote call.
+
+    Fetchers with retries or on-disk caches return their empty results;
+    anything else that tries HTTP gets a ConnectionError straight away.
+    """
+    import requests
+    import urllib.request
+    import data_pipeline
+    import analytics.btc_fair_value as btc_fair_value
+    import analytics.crypto_analytics as crypto_analytics
+
+    def no_network(*args, **kwargs):
+        raise requests.ConnectionError('network disabled for offline benchmark')
+
+    def no_urlopen(*args, **kwargs):
+        raise urllib.error.URLError('network disabled for offline benchmark')
+
+    patches = [
+        (data_pipeline, 'OUTPUT_DIR', output_dir),
+        (data_pipeline, 'CACHE_FILE', os.path.join(output_dir, 'data_cache_info.json')),
+        (btc_fair_value, 'FIT_CACHE_FILE', os.path.join(output_dir, 'btc_model_fits.npz')),
+        (btc_fair_value, 'OOS_FILE', os.path.join(output_dir, 'btc_fair_value_oos.npz')),
+        (btc_fair_value, '_fit_cache', None),           # no fits from earlier runs
+        (data_pipeline, 'TV_AVAILABLE', False),
+        (data_pipeline, 'get_fred_client', lambda: None),
+        (data_pipeline, 'fetch_treasury_settlements', lambda *a, **k: []),
+        (data_pipeline, 'get_treasury_maturity_data', lambda *a, **k: {}),
+        (data_pipeline, 'fetch_treasury_auction_demand', lambda *a, **k: {}),
+        (data_pipeline, 'fetch_etf_data', lambda *a, **k: {}),
+        (data_pipeline, 'fetch_fear_and_greed', lambda: fear_greed.copy()),
+        (crypto_analytics, 'fetch_fear_and_greed', lambda: fear_greed.copy()),
+        (requests.sessions.Session, 'request', no_network),
+        (urllib.request, 'urlopen', no_urlopen),      # pd.read_csv(url)
+    ]
+    saved = [(obj, name, getattr(obj, name)) for obj, name, _ in patches]
+    try:
+        for obj, name, value in patches:
+            setattr(obj, name, value)
+        yield
+    finally:
+        for obj, name, value in saved:
+            setattr(obj, name, value)
+
+
+def _run_once(inputs: Dict[str, Any], fear_greed: pd.Series, memory: bool) -> Dict[str, Any]:
+    """One traced run_pipeline pass in a scratch directory."""
+    import data_pipeline
+
+    tracer = tracing.Tracer(memory=memory)
+    previous = tracing._tracer
+    tracing._tracer = tracer
+    output_dir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    os.makedirs(os.path.join(output_dir, 'domains'), exist_ok=True)
+    try:
+        with offline_pipeline(output_dir, fear_greed), contextlib.redirect_stdout(io.StringIO()):
+            tracer.start()
+            start = time.perf_counter()
+            data_pipeline.run_pipeline(inputs={k: dict(v) for k, v in inputs.items()})
+            total = time.perf_counter() - start
+            tracer.stop()
+    finally:
+        tracing._tracer = previous
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {'total_s': total, 'stages': tracer.summary()}
+
+
+def bench_history(years: int, extra_columns: int = 0, seed: int = 0, memory: bool = False) -> Dict[str, Any]:
+    inputs = make_synthetic_inputs(years=years, seed=seed, extra_columns=extra_columns)
+    all_dates = pd.concat([s for source in inputs.values() for s in source.values()]).index
+    fear_greed = _fear_greed(pd.date_range(all_dates.min(), all_dates.max(), freq='D'), seed)
+
+    timed = _run_once(inputs, fear_greed, memory=False)
+    stages = {s['name']: {k: v for k, v in s.items() if k != 'peak_mb'} for s in timed['stages']}
+
+    if memory:
+        for s in _run_once(inputs, fear_greed, memory=True)['stages']:
+            if s['name'] in stages:
+                stages[s['name']]['peak_mb'] = s['peak_mb']
+
+    return {
+        'years': years,
+        'extra_columns': extra_columns,
+        'seed': seed,
+        'fred_series': len(inputs['fred']),
+        'tv_series': len(inputs['tv']),
+        'raw_points': count_points(inputs),
+        'total_s': round(timed['total_s'], 3),
+        'stages': stages,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        'commit': _git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def print_run(run: Dict[str, Any]) -> None:
+    print(f"\n{run['years']}y, {run['fred_series']} FRED + {run['tv_series']} TV series "
+          f"({run['raw_points']:,} points): {run['total_s']:.2f}s")
+    print(f"  {'stage':<34}{'wall s':>9}{'cpu s':>9}{'peak MB':>9}")
+    for name in HEADLINE_STAGES:
+        s = run['stages'].get(name)
+        if s:
+            peak = f"{s['peak_mb']:.1f}" if s.get('peak_mb') is not None else '-'
+            print(f"  {name:<34}{s['wall_s']:>9.2f}{s['cpu_s']:>9.2f}{peak:>9}")
+    domains = sorted((s for s in run['stages'].values() if s['cat'] == 'domain' and '.' not in s['name']),
+                     key=lambda s: s['wall_s'], reverse=True)
+    for s in domains[:5]:
+        print(f"  {'domain ' + s['name']:<34}{s['wall_s']:>9.2f}{s['cpu_s']:>9.2f}")
+
+
+def compare(old_path: str, new_path: str, threshold: float = 0.10, min_seconds: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    Per-stage wall time change between two result files.
+
+    Returns the stages slower by more than `threshold` (fractional), for
+    stages taking at least `min_seconds` in either run.
+    """
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    old_runs = {(r['years'], r['extra_columns']): r for r in old['runs']}
+    regressions = []
+    print(f"{old['environment'].get('commit')} -> {new['environment'].get('commit')}")
+    for run in new['runs']:
+        key = (run['years'], run['extra_columns'])
+        base = old_runs.get(key)
+        if base is None:
+            continue
+        print(f"\n{run['years']}y (+{run['extra_columns']} cols): total {base['total_s']:.2f}s -> {run['total_s']:.2f}s")
+        for name, stage in run['stages'].items():
+            before = base['stages'].get(name, {}).get('wall_s')
+            after = stage['wall_s']
+            if before is None or max(before, after) < min_seconds:
+                continue
+            change = (after - before) / before if before else float('inf')
+            if abs(change) >= threshold:
+                flag = 'SLOWER' if change > 0 else 'faster'
+                print(f"  {name:<40}{before:>8.2f}s ->{after:>8.2f}s  {change:+7.1%}  {flag}")
+                if change > 0:
+                    regressions.append({'years': run['years'], 'stage': name, 'before_s': before,
+                                        'after_s': after, 'change': change})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--years', type=int, nargs='+', default=[10, 25, 50])
+    parser.add_argument('--extra-columns', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true', help='Second pass with tracemalloc peaks')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/pipeline-<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    parser.add_argument('--threshold', type=float, default=0.10)
+    args = parser.parse_args()
+
+    if args.compare:
+        regressions = compare(*args.compare, threshold=args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    env = _environment()
+    runs = []
+    for years in args.years:
+        run = bench_history(years, args.extra_columns, args.seed, args.memory)
+        print_run(run)
+        runs.append(run)
+
+    results = {
+        'benchmark': 'pipeline',
+        'environment': env,
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'runs': runs,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"pipeline-{env['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+bench_serialization.py
+Domain save-path serialization: single serialize() pass vs the old
+clean-in-process + clean-again-on-save path.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization [--years 22] [--repeat 3]
+"""
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import contextlib
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains.base import DomainResult
+from domains.macro_regime import MacroRegimeDomain
+from domains.stablecoins import StablecoinsDomain
+from benchmarks.synthetic import make_synthetic_frame
+
+
+def legacy_clean_for_json(obj):
+    """Pre-DomainResult clean_for_json: per-element recursion, no fast path."""
+    if obj is None:
+        return None
+    if isinstance(obj, (pd.Series, np.ndarray)):
+        return [legacy_clean_for_json(x) for x in obj.tolist()]
+    if isinstance(obj, (np.integer,)):
+        return int(obj)
+    if isinstance(obj, (np.floating, float)):
+        return None if (np.isnan(obj) or np.isinf(obj)) else float(obj)
+    if isinstance(obj, dict):
+        return {k: legacy_clean_for_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [legacy_clean_for_json(x) for x in obj]
+    return obj
+
+
+# Old MacroRegimeDomain cleaned v2a/v2b/stress once up front and again in
+# align_to_df, then save_json cleaned the whole tree: 3 passes. The old
+# StablecoinsDomain cleaned each series in process(), then save_json: 2 passes.
+LEGACY_PASSES = {
+    'macro_regime': 3,
+    'stablecoins': 2,
+}
+
+
+def _best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_domain(domain, df, repeat):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        raw = domain.process(df.copy())
+        process_s = time.perf_counter() - start
+
+    def legacy():
+        data = raw
+        for _ in range(LEGACY_PASSES[domain.name]):
+            data = legacy_clean_for_json(data)
+        return data
+
+    def single():
+        # Fresh container so the cached serialization isn't reused
+        return domain.serialize(DomainResult(raw))
+
+    legacy_s = _best_of(legacy, repeat)
+    single_s = _best_of(single, repeat)
+    payload_bytes = len(json.dumps(domain.serialize(raw)))
+
+    return {
+        'domain': domain.name,
+        'process_s': process_s,
+        'legacy_clean_s': legacy_s,
+        'serialize_s': single_s,
+        'speedup': legacy_s / single_s if single_s else float('inf'),
+        'payload_mb': payload_bytes / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--years', type=int, default=22)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = make_synthetic_frame(years=args.years)
+    print(f"Synthetic frame: {len(df)} rows x {len(df.columns)} cols ({args.years}y)")
+    print(f"{'domain':<14}{'process':>10}{'legacy':>10}{'single':>10}{'speedup':>9}{'MB':>8}")
+
+    for domain in (MacroRegimeDomain(), StablecoinsDomain()):
+        r = bench_domain(domain, df, args.repeat)
+        print(f"{r['domain']:<14}{r['process_s']:>9.2f}s{r['legacy_clean_s']:>9.3f}s"
+              f"{r['serialize_s']:>9.3f}s{r['speedup']:>8.1f}x{r['payload_mb']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+synthetic.py
+Deterministic synthetic input frames for offline benchmarks.
+
+make_synthetic_frame() builds a ready-made daily frame for single domains;
+make_synthetic_inputs() builds raw FRED/TV series under the FRED_CONFIG /
+TV_CONFIG names, in the shape fetch_pipeline_inputs() returns, so the whole
+pipeline can run without credentials or network.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Columns read by the domains being benchmarked (level-like random walks)
+LEVEL_COLUMNS = [
+    'GLI_TOTAL', 'CLI', 'BTC', 'FED_USD', 'ECB_USD', 'BOJ_USD', 'RRP_USD', 'TGA_USD',
+    'BANK_RESERVES', 'NFCI', 'NFCI_CREDIT', 'NFCI_RISK', 'HY_SPREAD', 'IG_SPREAD',
+    'VIX', 'MOVE', 'FX_VOL', 'LENDING_STD', 'SOFR', 'IORB', 'YIELD_CURVE',
+    'TREASURY_10Y_YIELD', 'TREASURY_2Y_YIELD', 'TIPS_BREAKEVEN', 'TIPS_REAL_RATE',
+    'TIPS_5Y5Y_FORWARD', 'CLEV_EXPINF_10Y', 'DXY', 'EURUSD', 'JPYUSD', 'GBPUSD',
+    'USDT_MCAP', 'USDC_MCAP', 'DAI_MCAP', 'TOTAL_MCAP', 'STABLE_INDEX_MCAP',
+    'STABLE_INDEX_DOM',
+]
+
+PEG_COLUMNS = ['USDT_PRICE', 'USDC_PRICE', 'DAI_PRICE']
+
+
+def make_synthetic_frame(years: int = 22, seed: int = 0, end: str = '2025-01-01') -> pd.DataFrame:
+    """Calendar-day frame with `years` of positive random walks and $1 pegs."""
+    end_ts = pd.Timestamp(end)
+    index = pd.date_range(end=end_ts, periods=int(years * 365.25), freq='D')
+    rng = np.random.default_rng(seed)
+    n = len(index)
+
+    data = {
+        col: 100 + np.abs(np.cumsum(rng.normal(size=n)))
+        for col in LEVEL_COLUMNS
+    }
+    for col in PEG_COLUMNS:
+        data[col] = 1.0 + rng.normal(scale=0.002, size=n)
+
+    df = pd.DataFrame(data, index=index)
+    # Some leading gaps, as in real FRED/TV data
+    df.iloc[:90, df.columns.get_loc('CLI')] = np.nan
+    df.iloc[:365, df.columns.get_loc('USDC_MCAP')] = np.nan
+    return df
+
+
+# ------------------------------------------------------------
+# Raw pipeline inputs
+# ------------------------------------------------------------
+
+# FRED publication frequency by internal name (default: business daily)
+FRED_WEEKLY = {
+    'FED', 'ECB', 'TGA', 'BANK_RESERVES', 'NFCI', 'NFCI_CREDIT', 'NFCI_RISK',
+    'CB_LIQ_SWAPS', 'ST_LOUIS_STRESS',
+}
+FRED_MONTHLY = {
+    'BOJ', 'CPI', 'CORE_CPI', 'PCE', 'CORE_PCE', 'UNEMPLOYMENT', 'FED_FUNDS_RATE',
+    'INFLATION_EXPECT_5Y', 'INFLATION_EXPECT_10Y', 'INFLATION_EXPECT_1Y',
+    'CLEV_EXPINF_2Y', 'CLEV_EXPINF_5Y', 'CLEV_EXPINF_10Y', 'UMICH_INFL_EXP',
+    'NFP', 'JOLTS', 'KANSAS_CITY_STRESS', 'BAA_YIELD', 'AAA_YIELD',
+}
+FRED_QUARTERLY = {'LENDING_STD'}
+
+# Series that start well after the rest (first year of data)
+LATE_START_YEAR = {
+    'SOFR': 2018, 'SOFR_VOLUME': 2018, 'SOFR_INDEX': 2018, 'SOFR_90D_AVG': 2018,
+    'IORB': 2021, 'SRF_RATE': 2021, 'OBFR': 2016, 'ESTR': 2019, 'RRP_AWARD': 2013,
+}
+CRYPTO_EXCHANGES = {'CRYPTOCAP', 'BITSTAMP', 'KRAKEN', 'COINBASE', 'BINANCE', 'BYBIT', 'HTX'}
+CRYPTO_START_YEAR = 2013
+
+# Typical level of each series in its raw units (default 100)
+LEVELS = {
+    # FRED (millions / billions as published)
+    'FED': 7e6, 'ECB': 7e6, 'BOJ': 7e5, 'TGA': 7e5, 'RRP': 500.0, 'BANK_RESERVES': 3e6,
+    'CB_LIQ_SWAPS': 1e3, 'SRF_USAGE': 1.0, 'SOFR_VOLUME': 1500.0, 'NFP': 1.5e5, 'JOLTS': 8e3,
+    'EURUSD': 1.1, 'USDJPY': 140.0, 'GBPUSD': 1.3, 'USDCNY': 7.0,
+    'HY_SPREAD': 4.0, 'IG_SPREAD': 1.2, 'VIX': 18.0, 'LENDING_STD': 10.0,
+    'SOFR_INDEX': 1.1, 'SONIA_INDEX': 1.2,
+    # TradingView FX
+    'JPYUSD': 0.007, 'CNYUSD': 0.14, 'CADUSD': 0.74, 'AUDUSD': 0.65, 'INRUSD': 0.012,
+    'CHFUSD': 1.1, 'RUBUSD': 0.011, 'BRLUSD': 0.17, 'KRWUSD': 0.00075, 'NZDUSD': 0.6,
+    'SEKUSD': 0.095, 'MYRUSD': 0.22, 'MXNUSD': 0.055, 'IDRUSD': 6e-5, 'ZARUSD': 0.055,
+    'EURUSD_FUT': 1.1, 'JPYUSD_FUT': 0.007, 'GBPUSD_FUT': 1.3,
+    'BTC': 30000.0, 'ISM_MFG': 50.0, 'ISM_SVC': 52.0,
+}
+RATE_LEVEL = 3.0
+CB_LEVEL = 5e12      # TV ECONOMICS balance sheets, local currency
+M2_LEVEL = 2e13
+MCAP_LEVEL = 1e10
+DOM_LEVEL = 5.0
+
+# Mean-reverting series that can go negative (indices, real rates)
+SIGNED = {'NFCI', 'NFCI_CREDIT', 'NFCI_RISK', 'ST_LOUIS_STRESS', 'KANSAS_CITY_STRESS', 'TIPS_REAL_RATE'}
+
+
+def _index(freq: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex:
+    if freq == 'B':
+        # Weekday filter; freq='B' is generated element by element
+        days = pd.date_range(start=start, end=end, freq='D')
+        return days[days.dayofweek < 5]
+    rule = {'D': 'D', 'W': 'W-WED', 'M': 'MS', 'Q': 'QS'}[freq]
+    return pd.date_range(start=start, end=end, freq=rule)
+
+
+def _level(name: str, exchange: Optional[str] = None) -> float:
+    if name in LEVELS:
+        return LEVELS[name]
+    if name.endswith('_MCAP'):
+        return MCAP_LEVEL
+    if name.endswith('_DOM'):
+        return DOM_LEVEL
+    if exchange == 'ECONOMICS':
+        return M2_LEVEL if 'M2' in name or 'M3' in name else CB_LEVEL
+    if any(k in name for k in ('YIELD', 'RATE', 'EXPECT', 'EXPINF', 'BREAKEVEN', 'FORWARD', 'SOFR',
+                               'IORB', 'OBFR', 'EFFR', 'ESTR', 'RRP_AWARD', 'CPI', 'PCE', 'UNEMPLOYMENT')):
+        return RATE_LEVEL
+    return 100.0
+
+
+def _walk(rng: np.random.Generator, n: int, level: float, signed: bool, vol: float = 0.01) -> np.ndarray:
+    if signed:
+        # AR(1) around zero
+        shocks = rng.normal(scale=0.1, size=n)
+        out = np.empty(n)
+        out[0] = shocks[0]
+        for i in range(1, n):
+            out[i] = 0.98 * out[i - 1] + shocks[i]
+        return out
+    return level * np.exp(np.cumsum(rng.normal(scale=vol, size=n)))
+
+
+def _series(rng, name, freq, start, end, level, signed=False) -> pd.Series:
+    index = _index(freq, start, end)
+    return pd.Series(_walk(rng, len(index), level, signed), index=index, name=name)
+
+
+def make_synthetic_inputs(
+    years: int = 25,
+    seed: int = 0,
+    end: Optional[str] = None,
+    extra_columns: int = 0,
+    fred_config: Optional[Dict[str, str]] = None,
+    tv_config: Optional[Dict[str, Tuple[str, str]]] = None,
+) -> Dict[str, Dict[str, pd.Series]]:
+    """
+    Raw FRED/TV series in the form fetch_pipeline_inputs() returns.
+
+    Args:
+        years: History length
+        seed: RNG seed (same seed + arguments -> identical inputs)
+        end: Last date (default: today, so the orchestrator calendar is covered)
+        extra_columns: Additional daily TV series (SYNTH_<i>) to widen the frames
+        fred_config / tv_config: Defaults to data_pipeline.FRED_CONFIG / TV_CONFIG
+
+    Returns:
+        {'fred': {name: Series}, 'tv': {name: Series}}
+    """
+    if fred_config is None or tv_config is None:
+        import data_pipeline
+        fred_config = data_pipeline.FRED_CONFIG if fred_config is None else fred_config
+        tv_config = data_pipeline.TV_CONFIG if tv_config is None else tv_config
+
+    end_ts = pd.Timestamp(end) if end else pd.Timestamp.today().normalize()
+    start_ts = end_ts - pd.DateOffset(years=years)
+    rng = np.random.default_rng(seed)
+
+    def start_for(name: str, exchange: Optional[str] = None) -> pd.Timestamp:
+        year = LATE_START_YEAR.get(name)
+        if exchange in CRYPTO_EXCHANGES:
+            # Crypto history is always shorter than the macro history it is
+            # regressed on (lagged GLI/CLI features must exist at BTC start)
+            return max(start_ts + pd.DateOffset(years=1), pd.Timestamp(year=CRYPTO_START_YEAR, month=1, day=1))
+        return max(start_ts, pd.Timestamp(year=year, month=1, day=1)) if year else start_ts
+
+    fred = {}
+    for name in fred_config.values():
+        freq = 'W' if name in FRED_WEEKLY else 'M' if name in FRED_MONTHLY else 'Q' if name in FRED_QUARTERLY else 'B'
+        fred[name] = _series(rng, name, freq, start_for(name), end_ts, _level(name), name in SIGNED)
+
+    tv = {}
+    for exchange, name in tv_config.values():
+        if exchange == 'ECONOMICS':
+            freq = 'M'
+        elif exchange in CRYPTO_EXCHANGES:
+            freq = 'D'
+        else:
+            freq = 'B'
+        start = start_for(name, exchange)
+        if name.endswith('_PRICE'):
+            index = _index(freq, start, end_ts)
+            close = 1.0 + rng.normal(scale=0.002, size=len(index))
+            spread = np.abs(rng.normal(scale=0.002, size=len(index)))
+            tv[name] = pd.Series(close, index=index, name=name)
+            tv[f'{name}_HIGH'] = pd.Series(close + spread, index=index, name=f'{name}_HIGH')
+            tv[f'{name}_LOW'] = pd.Series(close - spread, index=index, name=f'{name}_LOW')
+        else:
+            tv[name] = _series(rng, name, freq, start, end_ts, _level(name, exchange))
+
+    for i in range(extra_columns):
+        name = f'SYNTH_{i}'
+        tv[name] = _series(rng, name, 'D', start_ts, end_ts, 100.0)
+
+    return {'fred': fred, 'tv': tv}
+
+
+def count_points(inputs: Dict[str, Dict[str, pd.Series]], sources: Iterable[str] = ('fred', 'tv')) -> int:
+    """Total number of raw observations in make_synthetic_inputs() output."""
+    return sum(len(s) for source in sources for s in inputs[source].values())
@@ -15,5 +15,7 @@ from .signal_config import (
     STATE_SCORES,
     STANCE_KEYS, 
     aggregate_signal_score, 
-    validate_weights
+    validate_weights,
+    compute_signal_series,
+    aggregate_signal_series
 )
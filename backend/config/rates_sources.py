@@ -18,10 +18,11 @@ import numpy as np
 import requests
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from io import BytesIO
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -627,6 +628,30 @@ class ForeignRateFetcher:
         
         return fetchers[currency]()
     
+    def fetch_all(self, currencies: Sequence[str] = ('USD', 'EUR', 'GBP', 'JPY')) -> Dict[str, pd.Series]:
+        """
+        Get the 3M rates for several currencies at once.
+        
+        The fetches run concurrently (EUR and JPY go to the ECB / BoJ and
+        their on-disk caches); results land in the fetcher's cache. A
+        currency whose fetch fails maps to an empty series.
+        
+        Args:
+            currencies: Currency codes, see get_rate_for_currency()
+            
+        Returns:
+            Dict of currency -> 3M rate series (%)
+        """
+        def fetch(currency: str) -> pd.Series:
+            try:
+                return self.get_rate_for_currency(currency)
+            except Exception as e:
+                logger.warning(f"{currency} 3M rate fetch failed: {e}")
+                return pd.Series(dtype=float)
+        
+        with ThreadPoolExecutor(max_workers=max(1, len(currencies))) as pool:
+            return dict(zip(currencies, pool.map(fetch, currencies)))
+    
     def sanity_check_usd(self) -> Tuple[bool, float]:
         """
         Sanity check: Compare computed USD 3M vs FRED's SOFR90DAYAVG.
@@ -12,12 +12,17 @@ Architecture:
     - Thresholds define state boundaries (bullish/warning/bearish)
     - Reasons provide human-readable explanations
     - compute_signal() returns {state, value, reason, confidence}
+    - compute_signal_series() / aggregate_signal_series() apply the same
+      rules to whole Series (one state per date) for signal history
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Mapping
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
 
 class SignalState(Enum):
     """Unified signal states across all indicators."""
@@ -633,3 +638,230 @@ def aggregate_signal_score(signals: Dict[str, Dict]) -> Dict:
         "missing_keys": missing,
         "confidence": round(avg_confidence, 3)
     }
+
+
+# =============================================================================
+# VECTORIZED EVALUATION (signal history)
+# =============================================================================
+# Same rules as compute_signal / aggregate_signal_score, applied to whole
+# Series with numpy masks instead of one scalar per call. Dates whose inputs
+# are missing get state "unknown" (the scalar path leaves such indicators
+# out of the signals dict), which the aggregate treats as missing data.
+
+def _signal_index(*values) -> pd.Index:
+    """Index of the first Series input (RangeIndex for plain arrays)."""
+    for v in values:
+        if isinstance(v, pd.Series):
+            return v.index
+    length = next(len(v) for v in values if v is not None)
+    return pd.RangeIndex(length)
+
+
+def _float_array(values, length: int) -> np.ndarray:
+    if values is None:
+        return np.full(length, np.nan)
+    return np.asarray(values, dtype=float)
+
+
+def compute_signal_series(
+    indicator: str,
+    values=None,
+    momentum=None,
+    srf_usage=None,
+    be_values=None,  # For TIPS
+    rr_values=None,  # For TIPS
+) -> pd.DataFrame:
+    """
+    Compute signal states for every date of an indicator.
+    
+    Args:
+        indicator: Key from SIGNAL_CONFIG (e.g., 'repo', 'hy_spread')
+        values: Series/array of values or Z-scores (unused for TIPS)
+        momentum: Optional Series/array of momentum for confirmation
+        srf_usage: Optional boolean Series/array, True where SRF is in use (repo only)
+        be_values: Breakeven inflation Series/array (TIPS only)
+        rr_values: Real rate Series/array (TIPS only)
+    
+    Returns:
+        DataFrame (index of the inputs) with columns state, value,
+        confidence and label, matching compute_signal at every date
+    """
+    index = _signal_index(values, be_values, rr_values)
+    n = len(index)
+    label = np.full(n, None, dtype=object)
+
+    if indicator not in SIGNAL_CONFIG:
+        state = np.full(n, SignalState.NEUTRAL.value, dtype=object)
+        value = _float_array(values, n)
+        confidence = np.zeros(n)
+    elif indicator == "tips":
+        value = _float_array(be_values, n)
+        state, confidence, label = _tips_signal_arrays(SIGNAL_CONFIG["tips"], value, _float_array(rr_values, n))
+    else:
+        value = _float_array(values, n)
+        if indicator in ("repo", "repo_stress"):
+            srf = np.zeros(n, dtype=bool) if srf_usage is None else np.asarray(srf_usage, dtype=bool)
+            state, confidence = _repo_signal_arrays(SIGNAL_CONFIG["repo"], value, srf)
+            label[srf & ~np.isnan(value)] = "SRF Active"
+        else:
+            state, confidence = _standard_signal_arrays(SIGNAL_CONFIG[indicator], value, _float_array(momentum, n))
+
+    return pd.DataFrame({
+        'state': state,
+        'value': value,
+        'confidence': confidence,
+        'label': label,
+    }, index=index)
+
+
+def _tips_signal_arrays(config: Dict, be: np.ndarray, rr: np.ndarray):
+    """Vectorized _compute_tips_signal."""
+    thresholds = config["thresholds"]
+
+    def levels(x, high, low):
+        return np.select([x >= high, x <= low], ["high", "low"], "normal")
+
+    be_level = levels(be, thresholds["be_high"], thresholds["be_low"])
+    rr_level = levels(rr, thresholds["rr_high"], thresholds["rr_low"])
+
+    state = np.full(len(be), SignalState.NEUTRAL.value, dtype=object)
+    label = np.full(len(be), "Mixed", dtype=object)
+    for (be_key, rr_key), (grid_state, grid_label) in config["grid"].items():
+        cell = (be_level == be_key) & (rr_level == rr_key)
+        state[cell] = grid_state.value
+        label[cell] = grid_label
+
+    be_dist = np.minimum(np.abs(be - thresholds["be_high"]), np.abs(be - thresholds["be_low"]))
+    rr_dist = np.minimum(np.abs(rr - thresholds["rr_high"]), np.abs(rr - thresholds["rr_low"]))
+    confidence = np.minimum(1.0, (be_dist + rr_dist) / 2.0)
+
+    missing = np.isnan(be) | np.isnan(rr)
+    state[missing] = SignalState.UNKNOWN.value
+    label[missing] = None
+    confidence[missing] = 0.0
+    return state, confidence, label
+
+
+def _repo_signal_arrays(config: Dict, spread: np.ndarray, srf: np.ndarray):
+    """Vectorized _compute_repo_signal."""
+    thresholds = config["thresholds"]
+    bullish = spread <= thresholds["bullish_max"]
+    warning = ~bullish & (spread <= thresholds["warning_max"])
+
+    state = np.select(
+        [srf, bullish, warning],
+        [SignalState.DANGER.value, SignalState.BULLISH.value, SignalState.WARNING.value],
+        SignalState.BEARISH.value
+    ).astype(object)
+    confidence = np.select(
+        [srf, bullish, warning],
+        [1.0, np.minimum(1.0, np.abs(spread) / 5.0), 1.0 - spread / thresholds["warning_max"]],
+        np.minimum(1.0, (spread - thresholds["bearish_min"]) / 10.0)
+    )
+
+    missing = np.isnan(spread)
+    state[missing] = SignalState.UNKNOWN.value
+    confidence[missing] = 0.0
+    return state, confidence
+
+
+def _standard_signal_arrays(config: Dict, value: np.ndarray, momentum: np.ndarray):
+    """Vectorized _compute_standard_signal."""
+    thresholds = config["thresholds"]
+    direction = config["direction"]
+    needs_momentum = config.get("momentum_required", False)
+    no_zone = np.zeros(len(value), dtype=bool)
+
+    if direction == SignalDirection.HIGHER_IS_BETTER:
+        bullish_min = thresholds.get("bullish_min")
+        bearish_max = thresholds.get("bearish_max")
+        bullish_zone = value >= bullish_min if bullish_min is not None else no_zone
+        bearish_zone = ~bullish_zone & (value <= bearish_max) if bearish_max is not None else no_zone
+        if needs_momentum:
+            bullish = bullish_zone & (momentum > 0)
+            bearish = bearish_zone & (momentum < 0)
+        else:
+            bullish, bearish = bullish_zone, bearish_zone
+        bullish_conf = (value - thresholds.get("bullish_min", 0)) / 2.0
+        bearish_conf = (thresholds.get("bearish_max", 0) - value) / 2.0
+    elif direction == SignalDirection.LOWER_IS_BETTER:
+        bullish_max = thresholds.get("bullish_max")
+        bearish_min = thresholds.get("bearish_min")
+        bullish = value <= bullish_max if bullish_max is not None else no_zone
+        bearish = ~bullish & (value >= bearish_min) if bearish_min is not None else no_zone
+        bullish_conf = (thresholds.get("bullish_max", 0) - value) / 2.0
+        bearish_conf = (value - thresholds.get("bearish_min", 0)) / 2.0
+    else:
+        bullish = bearish = no_zone
+        bullish_conf = bearish_conf = 0.5
+
+    state = np.select(
+        [bullish, bearish],
+        [SignalState.BULLISH.value, SignalState.BEARISH.value],
+        SignalState.NEUTRAL.value
+    ).astype(object)
+    confidence = np.abs(np.select(
+        [bullish, bearish],
+        [np.minimum(1.0, bullish_conf), np.minimum(1.0, bearish_conf)],
+        0.5
+    ))
+
+    missing = np.isnan(value)
+    state[missing] = SignalState.UNKNOWN.value
+    confidence[missing] = 0.0
+    return state, confidence
+
+
+def aggregate_signal_series(signals: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Compute the weighted aggregate score for every date.
+    
+    Args:
+        signals: Dict of signal_key -> frame from compute_signal_series
+            (state and confidence columns, shared index)
+    
+    Returns:
+        DataFrame with columns score, state, coverage, confidence, matching
+        aggregate_signal_score at every date
+    """
+    index = next(iter(signals.values())).index if signals else pd.RangeIndex(0)
+    n = len(index)
+    score = np.zeros(n)
+    coverage = np.zeros(n)
+    confidence_sum = np.zeros(n)
+
+    # Same key order and accumulation as aggregate_signal_score, so the
+    # floating-point sums (and the < 1.0 renormalization) agree exactly
+    for key in STANCE_KEYS:
+        cfg = SIGNAL_CONFIG.get(key)
+        if not cfg or "weight" not in cfg or key not in signals:
+            continue
+
+        weight = cfg["weight"]
+        states = signals[key]["state"].to_numpy(dtype=object)
+        valid = pd.notna(states) & (states != SignalState.UNKNOWN.value)
+        state_score = pd.Series(states).map(STATE_SCORES).fillna(0.0).to_numpy(dtype=float)
+        sig_conf = signals[key]["confidence"].fillna(0.5).to_numpy(dtype=float)
+
+        score = np.where(valid, score + weight * state_score, score)
+        coverage = np.where(valid, coverage + weight, coverage)
+        confidence_sum = np.where(valid, confidence_sum + weight * sig_conf, confidence_sum)
+
+    # Renormalize if coverage < 1 (missing data)
+    partial = (coverage > 0) & (coverage < 1.0)
+    score = np.where(partial, score / np.where(partial, coverage, 1.0), score)
+
+    agg_state = np.select(
+        [score >= 0.3, score >= 0.1, score <= -0.5, score <= -0.2],
+        ["bullish", "leaning_bullish", "bearish", "leaning_bearish"],
+        "neutral"
+    ).astype(object)
+    covered = coverage > 0
+    avg_confidence = np.where(covered, confidence_sum / np.where(covered, coverage, 1.0), 0.0)
+
+    return pd.DataFrame({
+        'score': np.round(score, 3),
+        'state': agg_state,
+        'coverage': np.round(coverage, 3),
+        'confidence': np.round(avg_confidence, 3),
+    }, index=index)
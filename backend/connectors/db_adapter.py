@@ -3,11 +3,19 @@ Supabase/PostgreSQL Database Adapter
 
 Provides connection management and CRUD operations for Supabase.
 This adapter will be used when migrating from JSON files to database.
+
+Large pushes are split into batches (SUPABASE_BATCH_SIZE rows) sent by up
+to SUPABASE_MAX_WORKERS threads, each retried with exponential backoff on
+transient failures. Reads are paged (SUPABASE_PAGE_SIZE rows per request),
+since PostgREST silently caps a single response at its max-rows setting;
+pages are ordered by the table's full key so offsets are stable.
 """
 
 import os
+import time
 import logging
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -15,21 +23,93 @@ logger = logging.getLogger(__name__)
 # Will be imported when ready to use
 # from supabase import create_client, Client
 
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5  # seconds, doubled on every attempt
+
+# HTTP statuses worth retrying besides 5xx
+RETRYABLE_STATUSES = {429}
+
+# Postgres SQLSTATE classes that are transient: connection exception,
+# transaction rollback (deadlock/serialization), insufficient resources,
+# operator intervention (statement timeout)
+RETRYABLE_SQLSTATE_CLASSES = ('08', '40', '53', '57')
+
+# Transport failures of the HTTP client (httpx.TransportError covers timeouts,
+# connection and protocol errors), matched by name to avoid importing httpx
+NETWORK_ERROR_TYPES = {('httpx', 'TransportError')}
+
+
+def _is_network_error(exc: Exception) -> bool:
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return any((cls.__module__.split('.')[0], cls.__name__) in NETWORK_ERROR_TYPES for cls in type(exc).__mro__)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """
+    Whether a failed request may succeed on retry.
+
+    Only network errors, 5xx/429 responses and transient Postgres errors
+    are retried. Client errors (bad payload, missing table, auth) and any
+    other exception (e.g. a bug in the calling code) are raised at once.
+    """
+    if _is_network_error(exc):
+        return True
+    code = getattr(exc, 'code', None) or getattr(exc, 'status_code', None)
+    if code is None:
+        response = getattr(exc, 'response', None)
+        code = getattr(response, 'status_code', None)
+    if code is None:
+        return False
+    code = str(code)
+    if len(code) == 5:
+        # Postgres SQLSTATE, as relayed by PostgREST
+        return code.startswith(RETRYABLE_SQLSTATE_CLASSES)
+    if not code.isdigit():
+        # PostgREST's own errors (PGRSTxxx) are request errors
+        return False
+    status = int(code)
+    return status in RETRYABLE_STATUSES or 500 <= status < 600
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int) -> List[List[Dict[str, Any]]]:
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
 
 class SupabaseAdapter:
     """
     Database adapter for Supabase PostgreSQL.
-    
+
     Uses environment variables for connection:
     - SUPABASE_URL: Project URL
     - SUPABASE_KEY: Service role key (for server-side operations)
+    - SUPABASE_BATCH_SIZE / SUPABASE_MAX_WORKERS / SUPABASE_PAGE_SIZE (optional)
+
+    A pre-built client (or a test double with the same query-builder
+    interface) can be passed as `client`.
     """
-    
-    def __init__(self):
+
+    def __init__(
+        self,
+        client=None,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        page_size: Optional[int] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    ):
         self.url = os.environ.get('SUPABASE_URL')
         self.key = os.environ.get('SUPABASE_KEY')
-        self._client = None
-    
+        self._client = client
+        self.batch_size = batch_size or int(os.environ.get('SUPABASE_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+        self.max_workers = max_workers or int(os.environ.get('SUPABASE_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+        self.page_size = page_size or int(os.environ.get('SUPABASE_PAGE_SIZE', DEFAULT_PAGE_SIZE))
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
     @property
     def client(self):
         """Lazy initialization of Supabase client."""
@@ -43,100 +123,205 @@ class SupabaseAdapter:
             from supabase import create_client
             self._client = create_client(self.url, self.key)
         return self._client
-    
+
+    def _execute_with_retry(self, make_request: Callable[[], Any], description: str):
+        """
+        Run make_request() (builds and executes one query), retrying transient errors.
+
+        The request is rebuilt on every attempt since query builders are
+        not reusable after execute().
+        """
+        attempt = 0
+        while True:
+            try:
+                return make_request()
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries or not _is_transient(e):
+                    raise
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                logger.warning(f"{description} failed ({e}), retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+
     def upsert_domain_data(
-        self, 
-        table_name: str, 
+        self,
+        table_name: str,
         data: List[Dict[str, Any]],
-        on_conflict: str = 'date'
+        on_conflict: str = 'date',
+        batch_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Upsert domain data to database table.
-        
+
+        Rows are sent in batches of `batch_size` (default: adapter setting)
+        with up to `max_workers` batches in flight.
+
         Args:
             table_name: Target table name
             data: List of row dictionaries
             on_conflict: Column for conflict resolution
-        
+            batch_size: Rows per request
+
         Returns:
-            Supabase response with count of affected rows
+            Dict with count of upserted rows and number of batches
         """
         if not data:
             logger.warning(f"No data to upsert for {table_name}")
-            return {'count': 0}
-        
-        try:
-            response = (
-                self.client.table(table_name)
-                .upsert(data, on_conflict=on_conflict)
-                .execute()
+            return {'count': 0, 'batches': 0}
+
+        batches = _chunks(data, batch_size or self.batch_size)
+
+        def send(index_batch):
+            index, batch = index_batch
+            self._execute_with_retry(
+                lambda: self.client.table(table_name).upsert(batch, on_conflict=on_conflict).execute(),
+                f"Upsert batch {index + 1}/{len(batches)} to {table_name}",
             )
-            logger.info(f"Upserted {len(data)} rows to {table_name}")
-            return {'count': len(data), 'data': response.data}
+            return len(batch)
+
+        try:
+            if len(batches) == 1 or self.max_workers <= 1:
+                count = sum(map(send, enumerate(batches)))
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                    count = sum(executor.map(send, enumerate(batches)))
+            logger.info(f"Upserted {count} rows to {table_name} in {len(batches)} batches")
+            return {'count': count, 'batches': len(batches)}
         except Exception as e:
             logger.error(f"Error upserting to {table_name}: {e}")
             raise
-    
-    def get_latest_date(self, table_name: str, date_column: str = 'date') -> Optional[str]:
+
+    def fetch_latest_date(self, table_name: str, date_column: str = 'date') -> Optional[str]:
         """
-        Get the most recent date in a table.
-        
-        Useful for incremental updates.
+        Get the most recent date in a table, None if it has no rows.
+
+        Raises if the query fails (after retries), so callers can tell an
+        empty table from an unreachable or missing one.
         """
-        try:
-            response = (
+        response = self._execute_with_retry(
+            lambda: (
                 self.client.table(table_name)
                 .select(date_column)
                 .order(date_column, desc=True)
                 .limit(1)
                 .execute()
-            )
-            if response.data:
-                return response.data[0][date_column]
-            return None
+            ),
+            f"Latest date query on {table_name}",
+        )
+        if response.data:
+            return response.data[0][date_column]
+        return None
+
+    def get_latest_date(self, table_name: str, date_column: str = 'date') -> Optional[str]:
+        """
+        Get the most recent date in a table.
+
+        Useful for incremental updates. Errors are logged and return None,
+        like an empty table; use fetch_latest_date() to tell them apart.
+        """
+        try:
+            return self.fetch_latest_date(table_name, date_column)
         except Exception as e:
             logger.error(f"Error getting latest date from {table_name}: {e}")
             return None
-    
+
+    def iter_domain(
+        self,
+        table_name: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through domain data ordered by its key.
+
+        `order_by` must be the table's full primary key (default: date) so
+        the order is total and no row moves between pages. Yields one list
+        of row dictionaries per non-empty page and stops at the first empty
+        one: a page can be shorter than `page_size` when the server caps
+        responses at fewer rows (PostgREST max-rows), so a short page does
+        not mean the end of the table.
+        """
+        page_size = page_size or self.page_size
+        order_by = order_by or ['date']
+        offset = 0
+
+        def fetch_page(first: int):
+            query = self.client.table(table_name).select(','.join(columns) if columns else '*')
+            if start_date:
+                query = query.gte('date', start_date)
+            if end_date:
+                query = query.lte('date', end_date)
+            for column in order_by:
+                query = query.order(column, desc=False)
+            return query.range(first, first + page_size - 1).execute()
+
+        while True:
+            try:
+                response = self._execute_with_retry(
+                    lambda: fetch_page(offset), f"Query {table_name} rows {offset}+"
+                )
+            except Exception as e:
+                logger.error(f"Error querying {table_name}: {e}")
+                raise
+            rows = response.data or []
+            if not rows:
+                return
+            yield rows
+            offset += len(rows)
+
     def query_domain(
-        self, 
-        table_name: str, 
+        self,
+        table_name: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        columns: Optional[List[str]] = None
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Query domain data from database.
-        
+
         Args:
             table_name: Source table name
             start_date: Filter start date (inclusive)
             end_date: Filter end date (inclusive)
             columns: Specific columns to select
-        
+            order_by: The table's key columns (default: date)
+
         Returns:
-            List of row dictionaries
+            List of row dictionaries (all pages)
         """
-        try:
-            query = self.client.table(table_name)
-            
-            if columns:
-                query = query.select(','.join(columns))
-            else:
-                query = query.select('*')
-            
-            if start_date:
-                query = query.gte('date', start_date)
-            if end_date:
-                query = query.lte('date', end_date)
-            
-            query = query.order('date', desc=False)
-            
-            response = query.execute()
-            return response.data
-        except Exception as e:
-            logger.error(f"Error querying {table_name}: {e}")
-            raise
+        rows = []
+        for page in self.iter_domain(table_name, start_date, end_date, columns, order_by=order_by):
+            rows.extend(page)
+        return rows
+
+    def query_domain_frame(
+        self,
+        table_name: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+    ):
+        """
+        Query domain data into a DataFrame indexed by date.
+
+        Built page by page, so only one page of row dicts is alive at a time.
+        """
+        import pandas as pd
+
+        pages = self.iter_domain(table_name, start_date, end_date, columns, order_by=order_by)
+        frames = [pd.DataFrame(page) for page in pages]
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        df = pd.concat(frames, ignore_index=True)
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+            df = df.set_index('date')
+        return df
 
 
 # Singleton instance for convenience
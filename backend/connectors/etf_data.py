@@ -1,13 +1,100 @@
 import os
+import threading
 import pandas as pd
 import numpy as np
-import psycopg2
+from contextlib import contextmanager
+from pathlib import Path
 from dotenv import load_dotenv
 import logging
 from datetime import date, datetime
 
 load_dotenv()
 
+# Number of ETFs (by AUM) with individual daily tracks
+TOP_N_ETFS = 15
+
+# Rolling normalization window for premium/discount (trading days)
+NORM_WINDOW = 252
+NORM_MIN_PERIODS = 30
+
+# Summary fields that fall back to the most recent non-null, non-zero value
+SUMMARY_FALLBACK_FIELDS = ['nav', 'premium_discount', 'market_price', 'shares_outstanding', 'holdings_btc', 'aum_usd']
+
+# Incremental aggregate cache (backend/connectors/cache/etf_flows_agg.csv)
+AGG_CACHE_FILENAME = 'etf_flows_agg.csv'
+# Recent days re-read on every refresh: issuers report/revise flows late
+INCREMENTAL_OVERLAP_DAYS = 7
+# Trailing rows needed to extend the rolling metrics (longest window: 252d)
+AGG_CONTEXT_ROWS = NORM_WINDOW
+
+# Columns returned by AGG_QUERY
+AGG_RAW_COLUMNS = ['date', 'total_flow_btc', 'total_flow_usd', 'total_aum_usd', 'avg_premium_discount', 'btc_price']
+
+# Fill-forward columns of the individual ETF tracks
+INDIVIDUAL_FFILL_COLUMNS = ['nav', 'shares_outstanding', 'holdings_btc', 'premium_discount']
+
+# ============================================================
+# SQL (parameterised, psycopg2 pyformat style)
+# ============================================================
+
+# Latest date and the previous ones, to fill holes in the latest record
+SUMMARY_QUERY = """
+    SELECT *
+    FROM v_etf_summary
+    WHERE date >= (SELECT MAX(date) FROM v_etf_summary) - INTERVAL '10 days'
+    ORDER BY date DESC
+"""
+
+# Daily flows & AUM history, joined with etf_daily_data for holdings.
+# btc_price comes from the same join, so btc_prices is read only once.
+# since=None reads the full history; otherwise only dates >= since.
+AGG_QUERY = """
+    SELECT
+        f.date,
+        SUM(f.flow_btc) as total_flow_btc,
+        SUM(f.flow_btc * COALESCE(p.price_usd, 0)) as total_flow_usd,
+        SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) as total_aum_usd,
+        CASE
+            WHEN SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) > 0
+            THEN SUM(COALESCE(d.premium_discount, 0) * COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) / SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0))
+            ELSE 0
+        END as avg_premium_discount,
+        MAX(p.price_usd) as btc_price
+    FROM etf_flows f
+    LEFT JOIN btc_prices p ON f.date = p.date
+    LEFT JOIN etf_daily_data d ON f.etf_id = d.etf_id AND f.date = d.date
+    WHERE %(since)s::date IS NULL OR f.date >= %(since)s::date
+    GROUP BY f.date
+    ORDER BY f.date ASC
+"""
+
+# Daily rows for all requested tickers in one round-trip
+INDIVIDUAL_QUERY = """
+    SELECT
+        e.ticker,
+        f.date,
+        f.flow_btc,
+        f.flow_btc * COALESCE(p.price_usd, 0) as flow_usd,
+        d.nav,
+        d.shares_outstanding,
+        d.holdings_btc,
+        d.premium_discount
+    FROM etf_flows f
+    JOIN etfs e ON f.etf_id = e.id
+    LEFT JOIN btc_prices p ON f.date = p.date
+    LEFT JOIN etf_daily_data d ON f.etf_id = d.etf_id AND f.date = d.date
+    WHERE e.ticker = ANY(%(tickers)s)
+    ORDER BY e.ticker ASC, f.date ASC
+"""
+
+# ============================================================
+# CONNECTIONS
+# ============================================================
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
 def get_db_connection():
     """Create a database connection using DATABASE_URL_ETF from .env."""
     db_url = os.getenv('DATABASE_URL_ETF')
@@ -15,21 +102,329 @@ def get_db_connection():
         logging.error("DATABASE_URL_ETF not found in environment variables.")
         return None
     try:
+        import psycopg2  # Imported lazily: only needed when ETF data is refreshed
         conn = psycopg2.connect(db_url)
         return conn
     except Exception as e:
         logging.error(f"Error connecting to database: {e}")
         return None
 
-def fetch_etf_data():
+
+def get_connection_pool():
+    """
+    Shared psycopg2 connection pool (created on first use).
+
+    Size is capped by ETF_DB_POOL_MAX (default 4). Returns None if the
+    database URL is missing or the pool can't be created.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            db_url = os.getenv('DATABASE_URL_ETF')
+            if not db_url:
+                logging.error("DATABASE_URL_ETF not found in environment variables.")
+                return None
+            try:
+                from psycopg2.pool import ThreadedConnectionPool
+                _pool = ThreadedConnectionPool(1, int(os.getenv('ETF_DB_POOL_MAX', 4)), db_url)
+            except Exception as e:
+                logging.error(f"Error creating database pool: {e}")
+                return None
+        return _pool
+
+
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the pool (yields None if unavailable)."""
+    pool = get_connection_pool()
+    if pool is None:
+        yield None
+        return
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        # putconn rolls back any open transaction; broken connections are discarded
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+# ============================================================
+# TRANSFORMS (pure pandas, no database access)
+# ============================================================
+
+def _latest_summary(df_summary_raw: pd.DataFrame) -> list:
+    """
+    Latest record per ticker, sorted by AUM.
+
+    If NAV/discount etc. are null or zero on the latest date (D-1 fallback),
+    the most recent non-null, non-zero value from the lookback is used.
+    """
+    if df_summary_raw.empty:
+        return []
+
+    # Rows arrive ordered by date DESC; keep first-appearance ticker order
+    ordered = df_summary_raw.sort_values('date', ascending=False, kind='stable')
+    by_ticker = ordered.groupby('ticker', sort=False)
+
+    latest = by_ticker.head(1).set_index('ticker')
+    fields = [f for f in SUMMARY_FALLBACK_FIELDS if f in ordered.columns]
+    fallback = ordered[fields].where(ordered[fields] != 0).groupby(ordered['ticker'], sort=False).first()
+    latest[fields] = fallback.combine_first(latest[fields])[fields]
+
+    summary_list = latest.reset_index()[df_summary_raw.columns].to_dict(orient='records')
+    for rec in summary_list:
+        # Ensure date is string
+        if isinstance(rec['date'], (date, datetime)):
+            rec['date'] = rec['date'].isoformat()
+
+    # Sort by AUM
+    return sorted(summary_list, key=lambda x: x['aum_usd'] or 0, reverse=True)
+
+
+def _wash_premium_outliers(df: pd.DataFrame, column: str, threshold: float, by: str = None) -> pd.Series:
+    """
+    Null out |premium| > threshold during Jan 2025 (bad source data), then ffill.
+
+    With `by`, the forward fill stays within each group.
+    """
+    dates = pd.to_datetime(df['date'])
+    jan_2025 = (dates >= '2025-01-01') & (dates < '2025-02-01')
+    outliers = (df[column] > threshold) | (df[column] < -threshold)
+    washed = df[column].mask(outliers & jan_2025)
+    washed = washed.groupby(df[by]).ffill() if by else washed.ffill()
+    return washed.fillna(0)
+
+
+def _add_rolling_normalization(df: pd.DataFrame, column: str, by: str = None) -> pd.DataFrame:
+    """Add pd_zscore_1y / pd_percentile_1y (252d rolling), per group when `by` is given."""
+    source = df.groupby(by)[column] if by else df[column]
+    rolling = source.rolling(window=NORM_WINDOW, min_periods=NORM_MIN_PERIODS)
+
+    def _align(result):
+        # groupby().rolling() prepends the group key to the index
+        return result.reset_index(level=0, drop=True) if by else result
+
+    mean = _align(rolling.mean())
+    std = _align(rolling.std())
+    df['pd_zscore_1y'] = (df[column] - mean) / std
+    df['pd_percentile_1y'] = _align(rolling.rank(pct=True)) * 100
+    return df
+
+
+def _cumsum_from(series: pd.Series, base: float = 0.0) -> pd.Series:
+    """Cumulative sum continuing from `base` (same summation order as a full cumsum)."""
+    if not base:
+        return series.cumsum()
+    seeded = pd.concat([pd.Series([base]), series], ignore_index=True).cumsum()
+    return pd.Series(seeded.iloc[1:].values, index=series.index)
+
+
+def _derive_flows_agg(df_agg: pd.DataFrame, cum_base: dict = None) -> pd.DataFrame:
+    """
+    Cumulative/rolling flows, AUM ROCs and flow-vs-BTC correlations.
+
+    Returns the un-cleaned frame (NaNs kept, btc_price still present) so it
+    can be cached and extended by update_flows_agg(). `cum_base` seeds the
+    cumulative flows when df_agg starts mid-history.
+    """
+    cum_base = cum_base or {}
+    df_agg = df_agg.copy()
+    df_agg['date'] = df_agg['date'].astype(str)
+    df_agg['cum_flow_btc'] = _cumsum_from(df_agg['total_flow_btc'], cum_base.get('cum_flow_btc', 0.0))
+    df_agg['cum_flow_usd'] = _cumsum_from(df_agg['total_flow_usd'], cum_base.get('cum_flow_usd', 0.0))
+
+    # --- Data Cleaning: Wash Outliers in Premium/Discount (Jan 2025) ---
+    # A 2% threshold is usually safe for Spot BTC ETFs
+    df_agg['avg_premium_discount'] = _wash_premium_outliers(df_agg, 'avg_premium_discount', 2)
+
+    # Normalization: Rolling Z-Score and Percentile (252 days)
+    _add_rolling_normalization(df_agg, 'avg_premium_discount')
+
+    # Rolling Flows (7d, 30d, 90d)
+    df_agg['flow_usd_7d'] = df_agg['total_flow_usd'].rolling(window=7, min_periods=1).sum()
+    df_agg['flow_usd_30d'] = df_agg['total_flow_usd'].rolling(window=30, min_periods=1).sum()
+    df_agg['flow_usd_90d'] = df_agg['total_flow_usd'].rolling(window=90, min_periods=1).sum()
+
+    # ROC Calculation for Total AUM
+    # 7d -> 5 (1 trading week), 30d -> 21 (1 month), 90d -> 63 (1 quarter)
+    for label, days in [('7d', 5), ('30d', 21), ('90d', 63)]:
+        df_agg[f'aum_roc_{label}'] = df_agg['total_aum_usd'].pct_change(periods=days) * 100
+
+    # ROC Calculation for Flows (more volatile, useful for trading signals)
+    # Uses cumulative flow as base to avoid division by zero issues with daily flows
+    df_agg['flow_roc_7d'] = df_agg['cum_flow_usd'].pct_change(periods=5) * 100
+    df_agg['flow_roc_30d'] = df_agg['cum_flow_usd'].pct_change(periods=21) * 100
+    df_agg['flow_roc_90d'] = df_agg['cum_flow_usd'].pct_change(periods=63) * 100
+
+    # Moving Average for charts (e.g., 20d SMA)
+    df_agg['flow_usd_ma20'] = df_agg['total_flow_usd'].rolling(window=20, min_periods=5).mean()
+
+    # BTC daily returns (price forward-filled over minor gaps) for correlation
+    btc_return = df_agg['btc_price'].ffill().pct_change() * 100
+
+    # Rolling Correlation: ETF Flows vs BTC Returns
+    # This shows if flows are leading, lagging, or uncorrelated with price
+    df_agg['flow_btc_corr_30d'] = df_agg['total_flow_usd'].rolling(window=30, min_periods=20).corr(btc_return)
+    df_agg['flow_btc_corr_60d'] = df_agg['total_flow_usd'].rolling(window=60, min_periods=30).corr(btc_return)
+
+    return df_agg
+
+
+def update_flows_agg(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extend a derived aggregate frame with freshly queried rows.
+
+    Rows of `cached` on or after the first fresh date are replaced. Only the
+    last AGG_CONTEXT_ROWS cached rows are re-processed together with the new
+    ones (enough history for every rolling window), and cumulative flows
+    continue from the last kept value, so the cost is O(new days).
+    """
+    if cached is None or cached.empty:
+        return _derive_flows_agg(fresh)
+    if fresh.empty:
+        return cached
+
+    fresh = fresh.copy()
+    fresh['date'] = fresh['date'].astype(str)
+    keep = cached[cached['date'] < fresh['date'].min()]
+    context = keep.tail(AGG_CONTEXT_ROWS)
+    before = keep.iloc[:len(keep) - len(context)]
+
+    # Running totals up to the row before the context window
+    cum_base = {
+        col: float(before[col].dropna().iloc[-1]) if before[col].notna().any() else 0.0
+        for col in ('cum_flow_btc', 'cum_flow_usd')
+    }
+
+    window = pd.concat([context[AGG_RAW_COLUMNS], fresh[AGG_RAW_COLUMNS]], ignore_index=True)
+    extended = _derive_flows_agg(window, cum_base=cum_base)
+    return pd.concat([keep, extended.iloc[len(context):]], ignore_index=True)
+
+
+def _finalize_flows_agg(df_agg: pd.DataFrame) -> pd.DataFrame:
+    """Drop helper columns and clean a derived aggregate frame for JSON."""
+    df_agg = df_agg.drop(columns=['btc_price'])
+    # Thorough cleaning for JSON
+    return df_agg.fillna(0).replace([np.inf, -np.inf], 0)
+
+
+def _build_flows_agg(df_agg: pd.DataFrame) -> pd.DataFrame:
+    """Full-history flows_agg frame, ready for JSON."""
+    return _finalize_flows_agg(_derive_flows_agg(df_agg))
+
+
+# ============================================================
+# INCREMENTAL AGGREGATE CACHE
+# ============================================================
+
+def _get_agg_cache_path() -> Path:
+    """Get path to the aggregate cache (backend/connectors/cache/etf_flows_agg.csv)."""
+    cache_dir = Path(__file__).resolve().parent / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / AGG_CACHE_FILENAME
+
+
+def _load_agg_cache() -> pd.DataFrame:
+    """Load the derived aggregate frame from the last run (None if missing/unreadable)."""
+    cache_path = _get_agg_cache_path()
+    if not cache_path.exists():
+        return None
+    try:
+        df = pd.read_csv(cache_path, dtype={'date': str})
+        if set(AGG_RAW_COLUMNS).issubset(df.columns):
+            return df
+    except Exception as e:
+        logging.warning(f"Failed to load ETF aggregate cache: {e}")
+    return None
+
+
+def _save_agg_cache(df: pd.DataFrame) -> None:
+    """Persist the derived aggregate frame (atomically)."""
+    if df.empty:
+        return
+    from utils.publisher import atomic_write_bytes
+    try:
+        atomic_write_bytes(str(_get_agg_cache_path()), df.to_csv(index=False).encode('utf-8'))
+    except Exception as e:
+        logging.warning(f"Failed to save ETF aggregate cache: {e}")
+
+
+def _incremental_since(cached: pd.DataFrame):
+    """First date to re-query: last cached date minus the revision overlap."""
+    if cached is None or cached.empty:
+        return None
+    last = pd.Timestamp(cached['date'].iloc[-1])
+    return (last - pd.Timedelta(days=INCREMENTAL_OVERLAP_DAYS)).strftime('%Y-%m-%d')
+
+
+def _load_flows_agg(conn, incremental: bool) -> pd.DataFrame:
+    """Query (only new days when incremental) and derive the flows_agg frame."""
+    cached = _load_agg_cache() if incremental else None
+    since = _incremental_since(cached)
+    fresh = pd.read_sql(AGG_QUERY, conn, params={'since': since})
+    if since:
+        logging.info(f"ETF aggregates: {len(fresh)} rows since {since} (cached {len(cached)})")
+
+    derived = update_flows_agg(cached, fresh)
+    _save_agg_cache(derived)
+    return _finalize_flows_agg(derived)
+
+
+def _build_individual_daily(df_ind: pd.DataFrame) -> dict:
+    """Per-ticker daily tracks from the combined query, normalized per group."""
+    if df_ind.empty:
+        return {}
+
+    df_ind = df_ind.sort_values(['ticker', 'date'], kind='stable').reset_index(drop=True)
+    df_ind['date'] = df_ind['date'].astype(str)
+    by_ticker = df_ind.groupby('ticker')
+
+    # Forward fill NAV and other metrics to avoid zeros/gaps in charts
+    df_ind[INDIVIDUAL_FFILL_COLUMNS] = by_ticker[INDIVIDUAL_FFILL_COLUMNS].ffill()
+
+    # --- Individual Data Cleaning: Wash Outliers in Premium/Discount (Jan 2025) ---
+    df_ind['premium_discount'] = _wash_premium_outliers(df_ind, 'premium_discount', 3, by='ticker')
+
+    # Individual Normalization: Rolling Z-Score and Percentile (252 days)
+    _add_rolling_normalization(df_ind, 'premium_discount', by='ticker')
+
+    # Finalize for JSON
+    df_ind = df_ind.fillna(0).replace([np.inf, -np.inf], 0)
+    return {
+        ticker: group.drop(columns=['ticker']).to_dict(orient='list')
+        for ticker, group in df_ind.groupby('ticker', sort=False)
+    }
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+def fetch_etf_data(conn=None, incremental=None):
     """
     Fetch ETF data from Supabase and format it for the dashboard.
     Returns a dictionary with summary, flows, and daily data.
+
+    Three queries in total (summary, aggregate, all top-N tickers) over a
+    pooled connection; pass `conn` to use an existing connection instead.
+
+    With `incremental` (default: ETF_AGG_INCREMENTAL env, on) the aggregate
+    query only reads days after the cached history; set it to False to
+    rebuild the cache from the full history.
     """
-    conn = get_db_connection()
-    if not conn:
-        return {}
+    if incremental is None:
+        incremental = os.getenv('ETF_AGG_INCREMENTAL', '1').lower() not in ('0', 'false', 'no')
+
+    if conn is not None:
+        return _fetch_etf_data(conn, incremental)
 
+    with pooled_connection() as pooled:
+        if not pooled:
+            return {}
+        return _fetch_etf_data(pooled, incremental)
+
+
+def _fetch_etf_data(conn, incremental=True):
     data = {
         'summary': [],
         'daily': {},
@@ -38,185 +433,28 @@ def fetch_etf_data():
     }
 
     try:
-        # 1. Fetch Summary Data for the last few days to handle fallbacks
-        # We fetch the latest date and the previous ones to fill holes
-        summary_query = """
-            SELECT *
-            FROM v_etf_summary 
-            WHERE date >= (SELECT MAX(date) FROM v_etf_summary) - INTERVAL '10 days'
-            ORDER BY date DESC
-        """
-        df_summary_raw = pd.read_sql(summary_query, conn)
-        # logging.info(f"Summary columns: {df_summary_raw.columns.tolist()}")
-        
-        # Fallback logic: For each ticker, get the latest record, 
-        # but if NAV/Discount is null, find the most recent non-null
-        latest_date = df_summary_raw['date'].max()
-        tickers = df_summary_raw['ticker'].unique()
-        summary_list = []
-        
-        for ticker in tickers:
-            ticker_data = df_summary_raw[df_summary_raw['ticker'] == ticker].sort_values('date', ascending=False)
-            latest_rec = ticker_data.iloc[0].to_dict()
-            
-            # If latest is not the actual latest global date, it might be an inactive ETF or missing record
-            # But the user specifically wants the D-1 fallback if TODAY is null.
-            
-            fields_to_fix = ['nav', 'premium_discount', 'market_price', 'shares_outstanding', 'holdings_btc', 'aum_usd']
-            for field in fields_to_fix:
-                if pd.isna(latest_rec[field]) or latest_rec[field] == 0:
-                    # Look back for non-null
-                    non_null_vals = ticker_data[ticker_data[field].notnull() & (ticker_data[field] != 0)][field]
-                    if not non_null_vals.empty:
-                        latest_rec[field] = non_null_vals.iloc[0]
-            
-            # Ensure date is string
-            if isinstance(latest_rec['date'], (date, datetime)):
-                latest_rec['date'] = latest_rec['date'].isoformat()
-                
-            summary_list.append(latest_rec)
-        
-        # Sort by AUM
-        summary_list = sorted(summary_list, key=lambda x: x['aum_usd'] or 0, reverse=True)
+        # 1. Summary Data for the last few days to handle fallbacks
+        df_summary_raw = pd.read_sql(SUMMARY_QUERY, conn)
+        summary_list = _latest_summary(df_summary_raw)
         data['summary'] = summary_list
 
-        # 3. Fetch Daily Flows & AUM history
-        # We join with etf_daily_data to get holdings for total AUM calculation
-        agg_query = """
-            SELECT 
-                f.date, 
-                SUM(f.flow_btc) as total_flow_btc, 
-                SUM(f.flow_btc * COALESCE(p.price_usd, 0)) as total_flow_usd,
-                SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) as total_aum_usd,
-                CASE 
-                    WHEN SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) > 0 
-                    THEN SUM(COALESCE(d.premium_discount, 0) * COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0)) / SUM(COALESCE(d.holdings_btc, 0) * COALESCE(p.price_usd, 0))
-                    ELSE 0 
-                END as avg_premium_discount
-            FROM etf_flows f
-            LEFT JOIN btc_prices p ON f.date = p.date
-            LEFT JOIN etf_daily_data d ON f.etf_id = d.etf_id AND f.date = d.date
-            GROUP BY f.date
-            ORDER BY f.date ASC
-        """
-        df_agg = pd.read_sql(agg_query, conn)
-        df_agg['cum_flow_btc'] = df_agg['total_flow_btc'].cumsum()
-        df_agg['cum_flow_usd'] = df_agg['total_flow_usd'].cumsum()
-        
-        # --- Data Cleaning: Wash Outliers in Premium/Discount (Jan 2025) ---
-        # A 2% threshold is usually safe for Spot BTC ETFs
-        outlier_mask = (df_agg['avg_premium_discount'] > 2) | (df_agg['avg_premium_discount'] < -2)
-        # Handle date type comparison safely
-        df_agg['date_dt'] = pd.to_datetime(df_agg['date']).dt.date
-        jan_2025_mask = (df_agg['date_dt'] >= date(2025, 1, 1)) & (df_agg['date_dt'] < date(2025, 2, 1))
-        df_agg.loc[outlier_mask & jan_2025_mask, 'avg_premium_discount'] = np.nan
-        df_agg['avg_premium_discount'] = df_agg['avg_premium_discount'].ffill().fillna(0)
-
-        # Normalization: Rolling Z-Score and Percentile (252 days)
-        window_norm = 252
-        df_agg['pd_zscore_1y'] = (df_agg['avg_premium_discount'] - df_agg['avg_premium_discount'].rolling(window=window_norm, min_periods=30).mean()) / df_agg['avg_premium_discount'].rolling(window=window_norm, min_periods=30).std()
-        df_agg['pd_percentile_1y'] = df_agg['avg_premium_discount'].rolling(window=window_norm, min_periods=30).rank(pct=True) * 100
-
-        # Rolling Flows (7d, 30d, 90d)
-        df_agg['flow_usd_7d'] = df_agg['total_flow_usd'].rolling(window=7, min_periods=1).sum()
-        df_agg['flow_usd_30d'] = df_agg['total_flow_usd'].rolling(window=30, min_periods=1).sum()
-        df_agg['flow_usd_90d'] = df_agg['total_flow_usd'].rolling(window=90, min_periods=1).sum()
-        
-        # ROC Calculation for Total AUM
-        # 7d -> 5 (1 trading week), 30d -> 21 (1 month), 90d -> 63 (1 quarter)
-        for label, days in [('7d', 5), ('30d', 21), ('90d', 63)]:
-            df_agg[f'aum_roc_{label}'] = df_agg['total_aum_usd'].pct_change(periods=days) * 100
-
-        # ROC Calculation for Flows (more volatile, useful for trading signals)
-        # Uses cumulative flow as base to avoid division by zero issues with daily flows
-        df_agg['flow_roc_7d'] = df_agg['cum_flow_usd'].pct_change(periods=5) * 100
-        df_agg['flow_roc_30d'] = df_agg['cum_flow_usd'].pct_change(periods=21) * 100
-        df_agg['flow_roc_90d'] = df_agg['cum_flow_usd'].pct_change(periods=63) * 100
-
-        # Moving Average for charts (e.g., 20d SMA)
-        df_agg['flow_usd_ma20'] = df_agg['total_flow_usd'].rolling(window=20, min_periods=5).mean()
-
-        # Fetch BTC prices for correlation calculation
-        btc_query = """
-            SELECT date, price_usd as btc_price
-            FROM btc_prices
-            ORDER BY date ASC
-        """
-        df_btc = pd.read_sql(btc_query, conn)
-        
-        # Ensure consistent date types for merge (standardizing to YYYY-MM-DD string)
-        df_btc['date_merge'] = pd.to_datetime(df_btc['date']).dt.strftime('%Y-%m-%d')
-        df_agg['date_merge'] = pd.to_datetime(df_agg['date']).dt.strftime('%Y-%m-%d')
-
-        # Merge BTC prices with aggregated data
-        df_agg_with_btc = df_agg.merge(df_btc, on='date_merge', how='left')
-        
-        # Forward fill BTC prices to handle any minor gaps in price data
-        df_agg_with_btc['btc_price'] = df_agg_with_btc['btc_price'].ffill()
-
-        # Calculate BTC daily returns for correlation
-        df_agg_with_btc['btc_return'] = df_agg_with_btc['btc_price'].pct_change() * 100
-
-        # Rolling Correlation: ETF Flows vs BTC Returns (30-day window)
-        # This shows if flows are leading, lagging, or uncorrelated with price
-        df_agg['flow_btc_corr_30d'] = df_agg_with_btc['total_flow_usd'].rolling(window=30, min_periods=20).corr(df_agg_with_btc['btc_return'])
-        df_agg['flow_btc_corr_60d'] = df_agg_with_btc['total_flow_usd'].rolling(window=60, min_periods=30).corr(df_agg_with_btc['btc_return'])
-
-        # Convert date to string for JSON compatibility
-        df_agg['date'] = df_agg['date'].astype(str)
-        # Thorough cleaning for JSON
-        df_agg = df_agg.drop(columns=['date_dt']).fillna(0).replace([np.inf, -np.inf], 0)
+        # 2. Daily Flows & AUM history
+        df_agg = _load_flows_agg(conn, incremental)
         data['flows_agg'] = df_agg.to_dict(orient='list')
         data['dates'] = df_agg['date'].tolist()
 
-        # 4. Fetch Daily Data for each individual ETF (top ones)
-        top_etfs = [s['ticker'] for s in summary_list[:15]]
-        individual_daily = {}
-        for ticker in top_etfs:
-            ind_query = f"""
-                SELECT 
-                    f.date, 
-                    f.flow_btc, 
-                    f.flow_btc * COALESCE(p.price_usd, 0) as flow_usd,
-                    d.nav, 
-                    d.shares_outstanding, 
-                    d.holdings_btc,
-                    d.premium_discount
-                FROM etf_flows f
-                JOIN etfs e ON f.etf_id = e.id
-                LEFT JOIN btc_prices p ON f.date = p.date
-                LEFT JOIN etf_daily_data d ON f.etf_id = d.etf_id AND f.date = d.date
-                WHERE e.ticker = '{ticker}'
-                ORDER BY f.date ASC
-            """
-            df_ind = pd.read_sql(ind_query, conn)
-            df_ind['date'] = df_ind['date'].astype(str)
-            
-            # Forward fill NAV and other metrics to avoid zeros/gaps in charts
-            cols_to_fill = ['nav', 'shares_outstanding', 'holdings_btc', 'premium_discount']
-            df_ind[cols_to_fill] = df_ind[cols_to_fill].ffill()
-
-            # --- Individual Data Cleaning: Wash Outliers in Premium/Discount (Jan 2025) ---
-            outlier_mask_ind = (df_ind['premium_discount'] > 3) | (df_ind['premium_discount'] < -3)
-            df_ind['date_dt'] = pd.to_datetime(df_ind['date']).dt.date
-            jan_2025_mask_ind = (df_ind['date_dt'] >= date(2025, 1, 1)) & (df_ind['date_dt'] < date(2025, 2, 1))
-            df_ind.loc[outlier_mask_ind & jan_2025_mask_ind, 'premium_discount'] = np.nan
-            df_ind['premium_discount'] = df_ind['premium_discount'].ffill().fillna(0)
-
-            # Individual Normalization: Rolling Z-Score and Percentile (252 days)
-            df_ind['pd_zscore_1y'] = (df_ind['premium_discount'] - df_ind['premium_discount'].rolling(window=window_norm, min_periods=30).mean()) / df_ind['premium_discount'].rolling(window=window_norm, min_periods=30).std()
-            df_ind['pd_percentile_1y'] = df_ind['premium_discount'].rolling(window=window_norm, min_periods=30).rank(pct=True) * 100
-            
-            # Clean up internal column and finalize for JSON
-            df_ind = df_ind.drop(columns=['date_dt']).fillna(0).replace([np.inf, -np.inf], 0)
-            individual_daily[ticker] = df_ind.to_dict(orient='list')
-        
-        data['individual_daily'] = individual_daily
+        # 3. Daily Data for the top individual ETFs, one query for all tickers
+        top_etfs = [s['ticker'] for s in summary_list[:TOP_N_ETFS]]
+        if top_etfs:
+            df_ind = pd.read_sql(INDIVIDUAL_QUERY, conn, params={'tickers': top_etfs})
+            individual_daily = _build_individual_daily(df_ind)
+            # Keep AUM order of the summary
+            data['individual_daily'] = {t: individual_daily[t] for t in top_etfs if t in individual_daily}
+        else:
+            data['individual_daily'] = {}
 
     except Exception as e:
         logging.error(f"Error fetching ETF data: {e}")
-    finally:
-        conn.close()
 
     return data
 
@@ -3,12 +3,12 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, date
-from fredapi import Fred
 from dotenv import load_dotenv
 import json
 import time
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 import calendar
 
 # Import Regime V2 module for CLI V2 and advanced regime calculations
@@ -23,7 +23,8 @@ from analytics.regime_v2 import (
 # Import unified signal configuration
 from config.signal_config import (
     compute_signal, SIGNAL_CONFIG, SignalState, STATE_SCORES,
-    STANCE_KEYS, aggregate_signal_score, validate_weights
+    STANCE_KEYS, aggregate_signal_score, validate_weights,
+    compute_signal_series, aggregate_signal_series
 )
 
 # Import Treasury maturity data module
@@ -36,10 +37,20 @@ from treasury.treasury_auction_demand import fetch_treasury_auction_demand
 from treasury.treasury_refinancing_signal import get_treasury_refinancing_signal
 
 # Import Offshore Dollar Liquidity module
-from analytics.offshore_liquidity import get_offshore_liquidity_output
+from analytics.offshore_liquidity import (
+    OFFSHORE_FRED_COLUMNS,
+    OFFSHORE_TV_COLUMNS,
+    get_offshore_liquidity_output,
+    resolve_foreign_rates,
+    select_offshore_inputs
+)
 
 # Import Macro Regime Domain
 from domains.macro_regime import MacroRegimeDomain
+from domains.axis import DateAxis, attach_axes, json_default
+from utils.publisher import atomic_write_bytes, get_publisher
+from utils.symbol_cache import get_symbol_store
+from utils.tracing import span, traced, finish_trace
 
 # Import ETF Data module
 from connectors.etf_data import fetch_etf_data
@@ -52,11 +63,30 @@ from analytics.crypto_analytics import (
     calculate_fng_analytics
 )
 
+# Spans for the analytics imported from other modules (the local
+# calculate_* functions are decorated where they are defined)
+calculate_cli_v2 = traced(cat='analytics')(calculate_cli_v2)
+calculate_macro_regime_v2a = traced(cat='analytics')(calculate_macro_regime_v2a)
+calculate_macro_regime_v2b = traced(cat='analytics')(calculate_macro_regime_v2b)
+calculate_stress_historical = traced(cat='analytics')(calculate_stress_historical)
+calculate_crypto_regimes = traced(cat='analytics')(calculate_crypto_regimes)
+calculate_narratives = traced(cat='analytics')(calculate_narratives)
+calculate_fng_analytics = traced(cat='analytics')(calculate_fng_analytics)
+get_offshore_liquidity_output = traced(cat='analytics')(get_offshore_liquidity_output)
+resolve_foreign_rates = traced(cat='fetch')(resolve_foreign_rates)
+get_treasury_maturity_data = traced(cat='fetch')(get_treasury_maturity_data)
+fetch_treasury_auction_demand = traced(cat='fetch')(fetch_treasury_auction_demand)
+get_treasury_refinancing_signal = traced(cat='fetch')(get_treasury_refinancing_signal)
+fetch_etf_data = traced(cat='fetch')(fetch_etf_data)
+fetch_fear_and_greed = traced(cat='fetch')(fetch_fear_and_greed)
+
 # Helper functions for JSON serialization and date handling
 def clean_for_json(obj):
-    if isinstance(obj, pd.Series):
-        # Handle string/object series separately
-        if obj.dtype == object:
+    if isinstance(obj, DateAxis):
+        return obj.ref()
+    elif isinstance(obj, pd.Series):
+        # Handle string/object series separately (pandas 3 infers a str dtype)
+        if obj.dtype == object or pd.api.types.is_string_dtype(obj.dtype):
             return [x if pd.notnull(x) else None for x in obj.tolist()]
         # Return None (null in JSON) instead of 0 for NaN/Inf to avoid invalid JSON for numeric series
         return [float(x) if pd.notnull(x) and np.isfinite(x) else None for x in obj.tolist()]
@@ -87,7 +117,9 @@ def get_current_fed_rate() -> float:
     This provides the real baseline used by CME FedWatch.
     """
     try:
-        fred_client = Fred(api_key=os.getenv('FRED_API_KEY'))
+        fred_client = get_fred_client()
+        if fred_client is None:
+            raise RuntimeError("FRED client not configured")
         # Get latest Effective Fed Funds Rate
         # Series 'DFF' is the Daily Effective Fed Funds Rate
         s = fred_client.get_series('DFF')
@@ -99,6 +131,7 @@ def get_current_fed_rate() -> float:
         
     return 3.58  # Current EFFR as of late Dec 2025 (hard fallback)
 
+@traced(cat='analytics')
 def calculate_projections(price: float, meeting: Dict, current_rate: float) -> Dict:
     """Helper to calculate probabilities for a specific futures price."""
     m_date = datetime.strptime(meeting['date'], '%Y-%m-%d')
@@ -140,6 +173,7 @@ def calculate_projections(price: float, meeting: Dict, current_rate: float) -> D
         'cumulative_cuts': round(max(0, cuts_implied), 2)
     }
 
+@traced(cat='analytics')
 def calculate_fed_probabilities(futures_data: Dict[str, Dict], meetings: List[Dict], current_rate: float) -> List[Dict]:
     """
     Calculate probabilities using CME FedWatch-style methodology:
@@ -228,6 +262,7 @@ def calculate_fed_probabilities(futures_data: Dict[str, Dict], meetings: List[Di
         
     return meetings
 
+@traced(cat='fetch')
 def fetch_fed_funds_futures(meetings: List[Dict] = None) -> Dict[str, Dict]:
     """
     Fetch Fed Funds Futures (price vs 1D, 5D, 1M ago).
@@ -236,11 +271,8 @@ def fetch_fed_funds_futures(meetings: List[Dict] = None) -> Dict[str, Dict]:
     results = {}
     
     try:
-        if not tv:
+        if not TV_AVAILABLE:
             return results
-            
-        from tvDatafeed import Interval
-        tv_client = tv
         
         today = datetime.now()
         month_codes = {
@@ -269,7 +301,7 @@ def fetch_fed_funds_futures(meetings: List[Dict] = None) -> Dict[str, Dict]:
             
             try:
                 # Get historical daily data
-                data = tv_client.get_hist(symbol=symbol, exchange='CBOT', interval=Interval.in_daily, n_bars=45)
+                data = get_tv_hist(symbol, 'CBOT', Interval.in_daily, 45)
                 
                 if data is not None and not data.empty:
                     curr_price = float(data['close'].iloc[-1])
@@ -291,7 +323,7 @@ def fetch_fed_funds_futures(meetings: List[Dict] = None) -> Dict[str, Dict]:
             except:
                 # Fallback to continuous front month ZQ1! if specific month fails
                 try:
-                    front = tv_client.get_hist(symbol='ZQ1!', exchange='CBOT', interval=Interval.in_daily, n_bars=45)
+                    front = get_tv_hist('ZQ1!', 'CBOT', Interval.in_daily, 45)
                     if front is not None and not front.empty:
                         c_p = float(front['close'].iloc[-1])
                         p1f = float(front['close'].iloc[-2]) if len(front) > 1 else c_p
@@ -316,6 +348,7 @@ def fetch_fed_funds_futures(meetings: List[Dict] = None) -> Dict[str, Dict]:
         
     return results
 
+@traced(cat='fetch')
 def fetch_treasury_settlements() -> List[Dict]:
     """
     Fetch Treasury auction settlements from US Treasury Fiscal Data API.
@@ -609,6 +642,7 @@ def get_rrp_history() -> Dict[str, float]:
     
     return {}
 
+@traced(cat='fetch')
 def fetch_fomc_calendar():
     """
     Fetch upcoming FOMC meeting dates from the Federal Reserve's official calendar.
@@ -707,6 +741,7 @@ def fetch_fomc_calendar():
             {'date': '2025-12-10', 'label': 'Dec 9-10', 'hasSEP': True},
         ]
 
+@traced(cat='fetch')
 def fetch_dot_plot_data():
     """
     Fetch latest Dot Plot data from palewire/fed-dot-plot-scraper GitHub repo.
@@ -795,348 +830,287 @@ def fetch_dot_plot_data():
         print(f"  -> Warning: Could not fetch Dot Plot: {e}")
         return FALLBACK_DOT_PLOT
 
-def calculate_market_stress_analysis(df, silent=False):
+@traced(cat='analytics')
+def calculate_market_stress_analysis(df, silent=False, stress_historical=None):
     """
     Calculates comprehensive market stress analysis based on multiple indicators.
     Returns dict with stress scores for inflation, liquidity, credit, and volatility.
+    
+    Scores and rule inputs are the last row of calculate_stress_historical
+    (pass the run's `stress_historical` to reuse it; otherwise only the
+    trailing window up to the last date is computed). This function adds the
+    explanations for the rules that fired and the raw latest values.
     """
     import numpy as np
     
-    def safe_get_last(series, default=0):
+    def hist_last(key):
+        """Last row of a stress_historical series (None if missing/NaN)"""
+        series = stress_historical.get(key)
+        if series is None or len(series) == 0:
+            return None
+        val = series.iloc[-1]
+        return float(val) if pd.notna(val) and np.isfinite(val) else None
+    
+    def safe_get_last(series):
         """Get last valid value from series"""
         if series is None or len(series) == 0:
-            return default
+            return None
         valid = series.dropna()
-        return float(valid.iloc[-1]) if len(valid) > 0 else default
+        return float(valid.iloc[-1]) if len(valid) > 0 else None
     
-    def calculate_zscore(series, window=252):
-        """Calculate rolling Z-score"""
-        if series is None or len(series) < window:
-            return pd.Series(dtype=float)
-        mean = series.rolling(window=window, min_periods=window//2).mean()
-        std = series.rolling(window=window, min_periods=window//2).std()
-        return (series - mean) / (std + 1e-10)
+    def rnd(val, digits):
+        return round(val, digits) if val is not None else None
     
-    def calculate_roc(series, periods):
-        """Calculate Rate of Change"""
-        if series is None or len(series) < periods:
-            return pd.Series(dtype=float)
-        return (series / series.shift(periods) - 1) * 100
+    def fmt(val, spec):
+        return format(val, spec) if val is not None else 'N/A'
+    
+    def level_color(score):
+        if score >= 4:
+            return 'HIGH', 'red'
+        return ('MODERATE', 'yellow') if score >= 2 else ('LOW', 'green')
     
     analysis = {
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'inflation_stress': {'score': 0, 'max_score': 7, 'level': 'LOW', 'color': 'green', 'signals': [], 'metrics': {}},
         'liquidity_stress': {'score': 0, 'max_score': 7, 'level': 'LOW', 'color': 'green', 'signals': [], 'metrics': {}},
         'credit_stress': {'score': 0, 'max_score': 7, 'level': 'LOW', 'color': 'green', 'signals': [], 'metrics': {}},
-        'volatility_stress': {'score': 0, 'max_score': 4, 'level': 'LOW', 'color': 'green', 'signals': [], 'metrics': {}},
-        'global_stress': {'total_score': 0, 'max_score': 25, 'percentage': 0, 'level': 'LOW', 'color': '#16a34a', 'assessment': ''},
+        'volatility_stress': {'score': 0, 'max_score': 6, 'level': 'LOW', 'color': 'green', 'signals': [], 'metrics': {}},
+        'global_stress': {'total_score': 0, 'max_score': 27, 'percentage': 0, 'level': 'LOW', 'color': '#16a34a', 'assessment': ''},
         'chart_analyses': {},
         'overall_assessment': {'headline': '', 'key_risks': [], 'key_positives': [], 'recommendation': ''}
     }
     
     try:
+        if stress_historical is None:
+            stress_historical = calculate_stress_historical(df, as_of=df.index[-1]) if len(df) else {}
+        if len(df):
+            analysis['as_of'] = df.index[-1].strftime('%Y-%m-%d')
+        
         # ============================================================
         # 1. INFLATION STRESS ANALYSIS
         # ============================================================
-        tips_be = df.get('TIPS_BREAKEVEN', pd.Series(dtype=float))
-        tips_5y5y = df.get('TIPS_5Y5Y_FORWARD', pd.Series(dtype=float))
-        tips_real = df.get('TIPS_REAL_RATE', pd.Series(dtype=float))
-        clev_10y = df.get('CLEV_EXPINF_10Y', pd.Series(dtype=float))
-        clev_5y = df.get('CLEV_EXPINF_5Y', pd.Series(dtype=float))
-        inf_risk_prem = df.get('INF_RISK_PREM_10Y', pd.Series(dtype=float))
-        umich = df.get('UMICH_INFL_EXP', pd.Series(dtype=float))
-        
-        last_tips_be = safe_get_last(tips_be, 2.2)
-        last_clev_10y = safe_get_last(clev_10y, 2.3)
-        last_clev_5y = safe_get_last(clev_5y, 2.2)
-        last_5y5y = safe_get_last(tips_5y5y, 2.3)
-        last_real = safe_get_last(tips_real, 1.5)
-        last_inf_risk = safe_get_last(inf_risk_prem, 0.1)
-        last_umich = safe_get_last(umich, 3.0)
-        
-        tips_clev_divergence = abs(last_tips_be - last_clev_10y)
-        tips_be_zscore = safe_get_last(calculate_zscore(tips_be), 0)
-        tips_be_roc_1m = safe_get_last(calculate_roc(tips_be, 21), 0)
-        tips_be_roc_3m = safe_get_last(calculate_roc(tips_be, 63), 0)
-        
-        inflation_score = 0
+        last_tips_be = safe_get_last(df.get('TIPS_BREAKEVEN'))
+        last_5y5y = safe_get_last(df.get('TIPS_5Y5Y_FORWARD'))
+        last_real = safe_get_last(df.get('TIPS_REAL_RATE'))
+        last_clev_10y = safe_get_last(df.get('CLEV_EXPINF_10Y'))
+        last_clev_5y = safe_get_last(df.get('CLEV_EXPINF_5Y'))
+        last_inf_risk = safe_get_last(df.get('INF_RISK_PREM_10Y'))
+        last_umich = safe_get_last(df.get('UMICH_INFL_EXP'))
+        
+        tips_clev_divergence = hist_last('tips_clev_divergence')
+        tips_be_roc_3m = hist_last('tips_be_roc_3m')
+        inflation_score = int(hist_last('inflation_stress') or 0)
         inflation_signals = []
         
-        if last_tips_be > 2.5:
-            inflation_score += 2
-            inflation_signals.append({"text": "⚠️ Breakeven inflation above 2.5% - hawkish Fed pressure", "key": "ms_infl_be_high"})
-        elif last_tips_be > 2.2:
-            inflation_score += 1
-            inflation_signals.append({"text": "🔶 Breakeven inflation slightly elevated (2.2-2.5%)", "key": "ms_infl_be_elevated"})
-        elif last_tips_be < 1.8:
-            inflation_score -= 1
-            inflation_signals.append({"text": "🔵 Breakeven inflation below target - potential easing", "key": "ms_infl_be_low"})
-        else:
-            inflation_signals.append({"text": "✅ Breakeven inflation near 2% target", "key": "ms_infl_be_normal"})
+        if last_tips_be is not None:
+            if last_tips_be > 2.5:
+                inflation_signals.append({"text": "⚠️ Breakeven inflation above 2.5% - hawkish Fed pressure", "key": "ms_infl_be_high"})
+            elif last_tips_be > 2.2:
+                inflation_signals.append({"text": "🔶 Breakeven inflation slightly elevated (2.2-2.5%)", "key": "ms_infl_be_elevated"})
+            elif last_tips_be < 1.8:
+                inflation_signals.append({"text": "🔵 Breakeven inflation below target - potential easing", "key": "ms_infl_be_low"})
+            else:
+                inflation_signals.append({"text": "✅ Breakeven inflation near 2% target", "key": "ms_infl_be_normal"})
         
-        if tips_clev_divergence > 0.3:
-            inflation_score += 1
+        if tips_clev_divergence is not None and tips_clev_divergence > 0.3:
             inflation_signals.append({"text": f"⚠️ High TIPS/Swap divergence ({tips_clev_divergence:.2f}pp)", "key": "ms_infl_div_high"})
         
-        if last_5y5y > 2.5:
-            inflation_score += 1
+        if last_5y5y is not None and last_5y5y > 2.5:
             inflation_signals.append({"text": "⚠️ Long-term inflation expectations elevated (>2.5%)", "key": "ms_infl_5y5y_high"})
         
-        if last_inf_risk > 0.3:
-            inflation_score += 1
-            inflation_signals.append({"text": "⚠️ Elevated inflation risk premium", "key": "ms_infl_risk_high"})
-        
-        if tips_be_roc_3m > 20:
-            inflation_score += 2
+        if tips_be_roc_3m is not None and tips_be_roc_3m > 20:
             inflation_signals.append({"text": "🔴 Rapid rise in inflation expectations (>20% 3M)", "key": "ms_infl_roc_high"})
+        elif tips_be_roc_3m is not None and tips_be_roc_3m > 10:
+            inflation_signals.append({"text": "🔶 Inflation expectations rising (>10% 3M)", "key": "ms_infl_roc_elevated"})
         
-        inf_level = 'HIGH' if inflation_score >= 4 else 'MODERATE' if inflation_score >= 2 else 'LOW'
-        inf_color = 'red' if inflation_score >= 4 else 'yellow' if inflation_score >= 2 else 'green'
+        inf_level, inf_color = level_color(inflation_score)
         
         analysis['inflation_stress'] = {
-            'score': max(0, inflation_score),
+            'score': inflation_score,
             'max_score': 7,
             'level': inf_level,
             'color': inf_color,
             'signals': inflation_signals,
             'metrics': {
-                'tips_breakeven_10y': round(last_tips_be, 3),
-                'tips_breakeven_10y_zscore': round(tips_be_zscore, 2),
-                'cleveland_10y': round(last_clev_10y, 3),
-                'cleveland_5y': round(last_clev_5y, 3),
-                'tips_clev_divergence': round(tips_clev_divergence, 3),
-                '5y5y_forward': round(last_5y5y, 3),
-                'real_rate_10y': round(last_real, 3),
-                'inflation_risk_premium': round(last_inf_risk, 3),
-                'umich_expectations': round(last_umich, 2),
-                'breakeven_roc_1m': round(tips_be_roc_1m, 2),
-                'breakeven_roc_3m': round(tips_be_roc_3m, 2)
+                'tips_breakeven_10y': rnd(last_tips_be, 3),
+                'tips_breakeven_10y_zscore': rnd(hist_last('tips_be_zscore'), 2),
+                'cleveland_10y': rnd(last_clev_10y, 3),
+                'cleveland_5y': rnd(last_clev_5y, 3),
+                'tips_clev_divergence': rnd(tips_clev_divergence, 3),
+                '5y5y_forward': rnd(last_5y5y, 3),
+                'real_rate_10y': rnd(last_real, 3),
+                'inflation_risk_premium': rnd(last_inf_risk, 3),
+                'umich_expectations': rnd(last_umich, 2),
+                'breakeven_roc_3m': rnd(tips_be_roc_3m, 2)
             }
         }
         
         # ============================================================
         # 2. LIQUIDITY STRESS ANALYSIS
         # ============================================================
-        sofr = df.get('SOFR', pd.Series(dtype=float))
-        iorb = df.get('IORB', pd.Series(dtype=float))
-        reserves = df.get('BANK_RESERVES', pd.Series(dtype=float))
-        rrp = df.get('RRP_USD', pd.Series(dtype=float))
-        tga = df.get('TGA_USD', pd.Series(dtype=float))
-        fed_assets = df.get('FED_USD', pd.Series(dtype=float))
-        
-        last_sofr = safe_get_last(sofr, 5.0)
-        last_iorb = safe_get_last(iorb, 5.0)
-        last_reserves = safe_get_last(reserves, 3.0)
-        last_rrp = safe_get_last(rrp, 0.5)
-        last_tga = safe_get_last(tga, 0.7)
-        last_fed = safe_get_last(fed_assets, 7.0)
-        
-        sofr_iorb_spread = (last_sofr - last_iorb) * 100
-        net_liquidity = last_fed - last_tga - last_rrp
-        reserves_roc_3m = safe_get_last(calculate_roc(reserves, 63), 0)
-        
-        liquidity_score = 0
+        last_sofr = safe_get_last(df.get('SOFR'))
+        last_iorb = safe_get_last(df.get('IORB'))
+        last_reserves = safe_get_last(df.get('BANK_RESERVES'))
+        last_rrp = safe_get_last(df.get('RRP_USD'))
+        last_tga = safe_get_last(df.get('TGA_USD'))
+        
+        sofr_iorb_spread = hist_last('sofr_iorb_spread_bps')
+        net_liquidity = hist_last('net_liquidity')
+        reserves_roc_3m = hist_last('reserves_roc_3m')
+        liquidity_score = int(hist_last('liquidity_stress') or 0)
         liquidity_signals = []
         
-        if sofr_iorb_spread > 5:
-            liquidity_score += 2
-            liquidity_signals.append({"text": f"🔴 SOFR trading {sofr_iorb_spread:.0f}bps above IORB - funding stress", "key": "ms_liq_sofr_high"})
-        elif sofr_iorb_spread > 2:
-            liquidity_score += 1
-            liquidity_signals.append({"text": f"🔶 SOFR slightly above IORB (+{sofr_iorb_spread:.0f}bps)", "key": "ms_liq_sofr_elevated"})
-        else:
-            liquidity_signals.append({"text": f"✅ SOFR-IORB spread normal ({sofr_iorb_spread:.0f}bps)", "key": "ms_liq_sofr_normal"})
-        
-        if last_reserves < 2.8:
-            liquidity_score += 2
-            liquidity_signals.append({"text": f"🔴 Bank reserves critically low (${last_reserves:.2f}T)", "key": "ms_liq_reserves_critical"})
-        elif last_reserves < 3.2:
-            liquidity_score += 1
-            liquidity_signals.append({"text": "🔶 Bank reserves approaching stress zone", "key": "ms_liq_reserves_low"})
-        else:
-            liquidity_signals.append({"text": f"✅ Bank reserves adequate (${last_reserves:.2f}T)", "key": "ms_liq_reserves_adequate"})
+        if sofr_iorb_spread is not None:
+            if sofr_iorb_spread > 5:
+                liquidity_signals.append({"text": f"🔴 SOFR trading {sofr_iorb_spread:.0f}bps above IORB - funding stress", "key": "ms_liq_sofr_high"})
+            elif sofr_iorb_spread > 2:
+                liquidity_signals.append({"text": f"🔶 SOFR slightly above IORB (+{sofr_iorb_spread:.0f}bps)", "key": "ms_liq_sofr_elevated"})
+            else:
+                liquidity_signals.append({"text": f"✅ SOFR-IORB spread normal ({sofr_iorb_spread:.0f}bps)", "key": "ms_liq_sofr_normal"})
+        
+        if last_reserves is not None:
+            if last_reserves < 2.8:
+                liquidity_signals.append({"text": f"🔴 Bank reserves critically low (${last_reserves:.2f}T)", "key": "ms_liq_reserves_critical"})
+            elif last_reserves < 3.2:
+                liquidity_signals.append({"text": "🔶 Bank reserves approaching stress zone", "key": "ms_liq_reserves_low"})
+            else:
+                liquidity_signals.append({"text": f"✅ Bank reserves adequate (${last_reserves:.2f}T)", "key": "ms_liq_reserves_adequate"})
         
-        if last_rrp < 0.1:
-            liquidity_score += 1
+        if last_rrp is not None and last_rrp < 0.1:
             liquidity_signals.append({"text": "⚠️ RRP nearly depleted", "key": "ms_liq_rrp_depleted"})
         
-        if net_liquidity < 5.5:
-            liquidity_score += 1
+        if net_liquidity is not None and net_liquidity < 5.5:
             liquidity_signals.append({"text": f"⚠️ Net liquidity contracting (${net_liquidity:.2f}T)", "key": "ms_liq_net_contracting"})
         
-        liq_level = 'HIGH' if liquidity_score >= 4 else 'MODERATE' if liquidity_score >= 2 else 'LOW'
-        liq_color = 'red' if liquidity_score >= 4 else 'yellow' if liquidity_score >= 2 else 'green'
+        if reserves_roc_3m is not None and reserves_roc_3m < -5:
+            liquidity_signals.append({"text": f"⚠️ Bank reserves falling ({reserves_roc_3m:.1f}% 3M)", "key": "ms_liq_reserves_falling"})
+        
+        liq_level, liq_color = level_color(liquidity_score)
         
         analysis['liquidity_stress'] = {
-            'score': max(0, liquidity_score),
+            'score': liquidity_score,
             'max_score': 7,
             'level': liq_level,
             'color': liq_color,
             'signals': liquidity_signals,
             'metrics': {
-                'sofr': round(last_sofr, 3),
-                'iorb': round(last_iorb, 3),
-                'sofr_iorb_spread_bps': round(sofr_iorb_spread, 1),
-                'bank_reserves_t': round(last_reserves, 3),
-                'rrp_t': round(last_rrp, 3),
-                'tga_t': round(last_tga, 3),
-                'net_liquidity_t': round(net_liquidity, 3),
-                'reserves_roc_3m': round(reserves_roc_3m, 2)
+                'sofr': rnd(last_sofr, 3),
+                'iorb': rnd(last_iorb, 3),
+                'sofr_iorb_spread_bps': rnd(sofr_iorb_spread, 1),
+                'bank_reserves_t': rnd(last_reserves, 3),
+                'rrp_t': rnd(last_rrp, 3),
+                'tga_t': rnd(last_tga, 3),
+                'net_liquidity_t': rnd(net_liquidity, 3),
+                'reserves_roc_3m': rnd(reserves_roc_3m, 2)
             }
         }
         
         # ============================================================
         # 3. CREDIT STRESS ANALYSIS
         # ============================================================
-        hy_spread = df.get('HY_SPREAD', pd.Series(dtype=float))
-        ig_spread = df.get('IG_SPREAD', pd.Series(dtype=float))
-        nfci = df.get('NFCI', pd.Series(dtype=float))
-        nfci_credit = df.get('NFCI_CREDIT', pd.Series(dtype=float))
-        nfci_risk = df.get('NFCI_RISK', pd.Series(dtype=float))
-        lending_std = df.get('LENDING_STD', pd.Series(dtype=float))
-        
-        last_hy = safe_get_last(hy_spread, 400)
-        last_ig = safe_get_last(ig_spread, 100)
-        last_nfci = safe_get_last(nfci, 0)
-        last_nfci_credit = safe_get_last(nfci_credit, 0)
-        last_nfci_risk = safe_get_last(nfci_risk, 0)
-        last_lending = safe_get_last(lending_std, 0)
-        hy_zscore = safe_get_last(calculate_zscore(hy_spread), 0)
-        ig_zscore = safe_get_last(calculate_zscore(ig_spread), 0)
-        
-        credit_score = 0
+        last_nfci = safe_get_last(df.get('NFCI'))
+        last_hy = hist_last('hy_spread_bps')
+        last_ig = hist_last('ig_spread_bps')
+        hy_zscore = hist_last('hy_spread_zscore')
+        credit_score = int(hist_last('credit_stress') or 0)
         credit_signals = []
         
-        if last_hy > 500:
-            credit_score += 2
-            credit_signals.append({"text": f"🔴 HY spreads elevated ({last_hy:.0f}bps)", "key": "ms_cred_hy_high"})
-        elif last_hy > 400:
-            credit_score += 1
-            credit_signals.append({"text": f"🔶 HY spreads above average ({last_hy:.0f}bps)", "key": "ms_cred_hy_elevated"})
-        elif last_hy < 300:
-            credit_signals.append({"text": f"🟢 HY spreads tight ({last_hy:.0f}bps)", "key": "ms_cred_hy_tight"})
-        else:
-            credit_signals.append({"text": f"✅ HY spreads normal ({last_hy:.0f}bps)", "key": "ms_cred_hy_normal"})
+        if last_hy is not None:
+            if last_hy > 500:
+                credit_signals.append({"text": f"🔴 HY spreads elevated ({last_hy:.0f}bps)", "key": "ms_cred_hy_high"})
+            elif last_hy > 400:
+                credit_signals.append({"text": f"🔶 HY spreads above average ({last_hy:.0f}bps)", "key": "ms_cred_hy_elevated"})
+            elif last_hy < 300:
+                credit_signals.append({"text": f"🟢 HY spreads tight ({last_hy:.0f}bps)", "key": "ms_cred_hy_tight"})
+            else:
+                credit_signals.append({"text": f"✅ HY spreads normal ({last_hy:.0f}bps)", "key": "ms_cred_hy_normal"})
         
-        if last_ig > 150:
-            credit_score += 1
+        if last_ig is not None and last_ig > 150:
             credit_signals.append({"text": f"⚠️ IG spreads elevated ({last_ig:.0f}bps)", "key": "ms_cred_ig_high"})
         
-        if last_nfci > 0.5:
-            credit_score += 2
-            credit_signals.append({"text": f"🔴 NFCI signals tight conditions ({last_nfci:.2f})", "key": "ms_cred_nfci_tight"})
-        elif last_nfci > 0:
-            credit_score += 1
-            credit_signals.append({"text": f"🔶 NFCI slightly tight ({last_nfci:.2f})", "key": "ms_cred_nfci_elevated"})
-        else:
-            credit_signals.append({"text": f"✅ NFCI neutral/loose ({last_nfci:.2f})", "key": "ms_cred_nfci_normal"})
+        if last_nfci is not None:
+            if last_nfci > 0.5:
+                credit_signals.append({"text": f"🔴 NFCI signals tight conditions ({last_nfci:.2f})", "key": "ms_cred_nfci_tight"})
+            elif last_nfci > 0:
+                credit_signals.append({"text": f"🔶 NFCI slightly tight ({last_nfci:.2f})", "key": "ms_cred_nfci_elevated"})
+            else:
+                credit_signals.append({"text": f"✅ NFCI neutral/loose ({last_nfci:.2f})", "key": "ms_cred_nfci_normal"})
+        
+        if hy_zscore is not None and hy_zscore > 1.5:
+            credit_signals.append({"text": f"⚠️ HY spread Z-score elevated ({hy_zscore:.2f})", "key": "ms_cred_hy_z_high"})
         
-        cred_level = 'HIGH' if credit_score >= 4 else 'MODERATE' if credit_score >= 2 else 'LOW'
-        cred_color = 'red' if credit_score >= 4 else 'yellow' if credit_score >= 2 else 'green'
+        cred_level, cred_color = level_color(credit_score)
         
         analysis['credit_stress'] = {
-            'score': max(0, credit_score),
+            'score': credit_score,
             'max_score': 7,
             'level': cred_level,
             'color': cred_color,
             'signals': credit_signals,
             'metrics': {
-                'hy_spread_bps': round(last_hy, 1),
-                'hy_zscore': round(hy_zscore, 2),
-                'ig_spread_bps': round(last_ig, 1),
-                'ig_zscore': round(ig_zscore, 2),
-                'nfci': round(last_nfci, 3),
-                'nfci_credit': round(last_nfci_credit, 3),
-                'nfci_risk': round(last_nfci_risk, 3),
-                'lending_standards': round(last_lending, 1)
+                'hy_spread_bps': rnd(last_hy, 1),
+                'hy_zscore': rnd(hy_zscore, 2),
+                'ig_spread_bps': rnd(last_ig, 1),
+                'ig_zscore': rnd(hist_last('ig_spread_zscore'), 2),
+                'nfci': rnd(last_nfci, 3),
+                'nfci_credit': rnd(safe_get_last(df.get('NFCI_CREDIT')), 3),
+                'nfci_risk': rnd(safe_get_last(df.get('NFCI_RISK')), 3),
+                'lending_standards': rnd(safe_get_last(df.get('LENDING_STD')), 1)
             }
         }
         
         # ============================================================
         # 4. VOLATILITY STRESS ANALYSIS
         # ============================================================
-        vix = df.get('VIX', pd.Series(dtype=float))
-        treasury_10y = df.get('TREASURY_10Y_YIELD', pd.Series(dtype=float))
-        
-        last_vix = safe_get_last(vix, 18)
-        vix_zscore = safe_get_last(calculate_zscore(vix), 0)
-        vix_roc_1w = safe_get_last(calculate_roc(vix, 5), 0)
-        
-        # Calculate 10Y yield volatility (20-day rolling std of yield changes in bps)
-        if treasury_10y is not None and len(treasury_10y) > 20:
-            yield_changes = treasury_10y.diff() * 100  # Convert to bps
-            yield_vol_20d = yield_changes.rolling(window=20, min_periods=10).std()
-            last_yield_vol = safe_get_last(yield_vol_20d, 5)
-            yield_vol_zscore = safe_get_last(calculate_zscore(yield_vol_20d), 0)
-        else:
-            last_yield_vol = 5.0  # Default ~5bps daily vol
-            yield_vol_zscore = 0
-        
-        last_10y_yield = safe_get_last(treasury_10y, 4.0)
-        
-        vol_score = 0
+        last_vix = safe_get_last(df.get('VIX'))
+        last_move = safe_get_last(df.get('MOVE'))
+        vix_zscore = hist_last('vix_zscore')
+        move_zscore = hist_last('move_zscore')
+        vix_roc_1w = hist_last('vix_roc_1w')
+        vol_score = int(hist_last('volatility_stress') or 0)
         vol_signals = []
         
         # VIX signals
-        if last_vix > 30:
-            vol_score += 2
-            vol_signals.append({"text": f"🔴 VIX elevated ({last_vix:.1f}) - high fear", "key": "ms_vol_vix_high"})
-        elif last_vix > 20:
-            vol_score += 1
-            vol_signals.append({"text": f"🔶 VIX above average ({last_vix:.1f})", "key": "ms_vol_vix_elevated"})
-        elif last_vix < 12:
-            vol_signals.append({"text": f"⚠️ VIX very low ({last_vix:.1f}) - complacency", "key": "ms_vol_vix_complacency"})
-        else:
-            vol_signals.append({"text": f"✅ VIX normal ({last_vix:.1f})", "key": "ms_vol_vix_normal"})
+        if last_vix is not None:
+            if last_vix > 30:
+                vol_signals.append({"text": f"🔴 VIX elevated ({last_vix:.1f}) - high fear", "key": "ms_vol_vix_high"})
+            elif last_vix > 20:
+                vol_signals.append({"text": f"🔶 VIX above average ({last_vix:.1f})", "key": "ms_vol_vix_elevated"})
+            elif last_vix < 12:
+                vol_signals.append({"text": f"⚠️ VIX very low ({last_vix:.1f}) - complacency", "key": "ms_vol_vix_complacency"})
+            else:
+                vol_signals.append({"text": f"✅ VIX normal ({last_vix:.1f})", "key": "ms_vol_vix_normal"})
         
-        if vix_zscore > 2:
-            vol_score += 1
-            vol_signals.append({"text": f"🔴 VIX Z-score extreme ({vix_zscore:.2f})", "key": "ms_vol_vix_z_extreme"})
+        if move_zscore is not None and move_zscore > 1.5:
+            vol_signals.append({"text": f"🔴 MOVE Z-score elevated ({move_zscore:.2f}) - bond market stress", "key": "ms_vol_move_z_high"})
         
-        if vix_roc_1w > 30:
-            vol_score += 1
+        if vix_roc_1w is not None and vix_roc_1w > 20:
             vol_signals.append({"text": f"⚠️ VIX spiking ({vix_roc_1w:.0f}% weekly)", "key": "ms_vol_vix_spike"})
+        elif vix_roc_1w is not None and vix_roc_1w > 10:
+            vol_signals.append({"text": f"🔶 VIX rising ({vix_roc_1w:.0f}% weekly)", "key": "ms_vol_vix_rising"})
         
-        # Treasury yield volatility signals (MOVE proxy)
-        if last_yield_vol > 10:
-            vol_score += 2
-            vol_signals.append({"text": f"🔴 10Y yield volatility HIGH ({last_yield_vol:.1f}bps/day)", "key": "ms_vol_yield_high"})
-        elif last_yield_vol > 7:
-            vol_score += 1
-            vol_signals.append({"text": f"🔶 10Y yield volatility elevated ({last_yield_vol:.1f}bps/day)", "key": "ms_vol_yield_elevated"})
-        else:
-            vol_signals.append({"text": f"✅ 10Y yield volatility normal ({last_yield_vol:.1f}bps/day)", "key": "ms_vol_yield_normal"})
-        
-        # Update max score to account for new yield vol signals
-        vol_max_score = 6  # VIX (4) + Yield Vol (2)
-        vol_level = 'HIGH' if vol_score >= 4 else 'MODERATE' if vol_score >= 2 else 'LOW'
-        vol_color = 'red' if vol_score >= 4 else 'yellow' if vol_score >= 2 else 'green'
+        vol_level, vol_color = level_color(vol_score)
         
         analysis['volatility_stress'] = {
-            'score': max(0, vol_score),
-            'max_score': vol_max_score,
+            'score': vol_score,
+            'max_score': 6,
             'level': vol_level,
             'color': vol_color,
             'signals': vol_signals,
             'metrics': {
-                'vix': round(last_vix, 2),
-                'vix_zscore': round(vix_zscore, 2),
-                'vix_roc_1w': round(vix_roc_1w, 1),
-                'yield_10y': round(last_10y_yield, 3),
-                'yield_vol_20d': round(last_yield_vol, 2),
-                'yield_vol_zscore': round(yield_vol_zscore, 2)
+                'vix': rnd(last_vix, 2),
+                'vix_zscore': rnd(vix_zscore, 2),
+                'vix_roc_1w': rnd(vix_roc_1w, 1),
+                'move': rnd(last_move, 2),
+                'move_zscore': rnd(move_zscore, 2),
+                'yield_10y': rnd(safe_get_last(df.get('TREASURY_10Y_YIELD')), 3)
             }
         }
         
         # ============================================================
         # 5. GLOBAL STRESS SCORE
         # ============================================================
-        total_score = (
-            analysis['inflation_stress']['score'] +
-            analysis['liquidity_stress']['score'] +
-            analysis['credit_stress']['score'] +
-            analysis['volatility_stress']['score']
-        )
+        total_score = inflation_score + liquidity_score + credit_score + vol_score
         max_total = 27  # 7+7+7+6 (inflation, liquidity, credit, volatility)
         
         if total_score >= 15:
@@ -1164,64 +1138,72 @@ def calculate_market_stress_analysis(df, silent=False):
             'color': global_color,
             'assessment': global_assessment,
             'breakdown': {
-                'inflation': analysis['inflation_stress']['score'],
-                'liquidity': analysis['liquidity_stress']['score'],
-                'credit': analysis['credit_stress']['score'],
-                'volatility': analysis['volatility_stress']['score']
+                'inflation': inflation_score,
+                'liquidity': liquidity_score,
+                'credit': credit_score,
+                'volatility': vol_score
             }
         }
         
         # ============================================================
         # 6. CHART ANALYSES
         # ============================================================
+        be_caution = last_tips_be is not None and (last_tips_be > 2.5 or last_tips_be < 1.5)
+        diverging = tips_clev_divergence is not None and tips_clev_divergence > 0.3
+        reserves_stress = last_reserves is not None and last_reserves < 3.0
+        repo_stress = sofr_iorb_spread is not None and sofr_iorb_spread > 5
+        nfci_tight = last_nfci is not None and last_nfci > 0
+        vix_fear = last_vix is not None and last_vix > 25
+        vix_complacent = last_vix is not None and last_vix < 12
+        
         analysis['chart_analyses'] = {
             'tips_market': {
                 'title': 'Inflation Expectations (TIPS Market)',
-                'summary': f"10Y Breakeven at {last_tips_be:.2f}%. 5Y5Y Forward at {last_5y5y:.2f}%. Real rates at {last_real:.2f}%.",
+                'summary': f"10Y Breakeven at {fmt(last_tips_be, '.2f')}%. 5Y5Y Forward at {fmt(last_5y5y, '.2f')}%. Real rates at {fmt(last_real, '.2f')}%.",
                 'summary_key': 'ms_chart_tips_summary',
-                'signal': 'CAUTION' if last_tips_be > 2.5 or last_tips_be < 1.5 else 'NEUTRAL',
-                'signal_key': 'ms_signal_caution' if last_tips_be > 2.5 or last_tips_be < 1.5 else 'ms_signal_neutral',
-                'signal_color': 'yellow' if last_tips_be > 2.5 or last_tips_be < 1.5 else 'green'
+                'signal': 'CAUTION' if be_caution else 'NEUTRAL',
+                'signal_key': 'ms_signal_caution' if be_caution else 'ms_signal_neutral',
+                'signal_color': 'yellow' if be_caution else 'green'
             },
             'tips_vs_swaps': {
                 'title': 'TIPS vs Cleveland Fed (Inflation Swaps)',
-                'summary': f"TIPS ({last_tips_be:.2f}%) vs Cleveland Fed ({last_clev_10y:.2f}%). Divergence: {tips_clev_divergence:.2f}pp.",
+                'summary': f"TIPS ({fmt(last_tips_be, '.2f')}%) vs Cleveland Fed ({fmt(last_clev_10y, '.2f')}%). Divergence: {fmt(tips_clev_divergence, '.2f')}pp.",
                 'summary_key': 'ms_chart_tips_swaps_summary',
-                'signal': 'DIVERGENCE' if tips_clev_divergence > 0.3 else 'ALIGNED',
-                'signal_key': 'ms_signal_divergence' if tips_clev_divergence > 0.3 else 'ms_signal_aligned',
-                'signal_color': 'yellow' if tips_clev_divergence > 0.3 else 'green'
+                'signal': 'DIVERGENCE' if diverging else 'ALIGNED',
+                'signal_key': 'ms_signal_divergence' if diverging else 'ms_signal_aligned',
+                'signal_color': 'yellow' if diverging else 'green'
             },
             'bank_reserves': {
                 'title': 'Bank Reserves vs Net Liquidity',
-                'summary': f"Reserves at ${last_reserves:.2f}T. Net Liquidity: ${net_liquidity:.2f}T.",
+                'summary': f"Reserves at ${fmt(last_reserves, '.2f')}T. Net Liquidity: ${fmt(net_liquidity, '.2f')}T.",
                 'summary_key': 'ms_chart_reserves_summary',
-                'signal': 'STRESS' if last_reserves < 3.0 else 'OK',
-                'signal_key': 'ms_signal_stress' if last_reserves < 3.0 else 'ms_signal_ok',
-                'signal_color': 'red' if last_reserves < 3.0 else 'green'
+                'signal': 'STRESS' if reserves_stress else 'OK',
+                'signal_key': 'ms_signal_stress' if reserves_stress else 'ms_signal_ok',
+                'signal_color': 'red' if reserves_stress else 'green'
             },
             'repo_stress': {
                 'title': 'Repo Market Stress (SOFR vs IORB)',
-                'summary': f"SOFR at {last_sofr:.3f}%, IORB at {last_iorb:.3f}%. Spread: {sofr_iorb_spread:.1f}bps.",
+                'summary': f"SOFR at {fmt(last_sofr, '.3f')}%, IORB at {fmt(last_iorb, '.3f')}%. Spread: {fmt(sofr_iorb_spread, '.1f')}bps.",
                 'summary_key': 'ms_chart_repo_summary',
-                'signal': 'STRESS' if sofr_iorb_spread > 5 else 'NORMAL',
-                'signal_key': 'ms_signal_stress' if sofr_iorb_spread > 5 else 'ms_signal_normal',
-                'signal_color': 'red' if sofr_iorb_spread > 5 else 'green'
+                'signal': 'STRESS' if repo_stress else 'NORMAL',
+                'signal_key': 'ms_signal_stress' if repo_stress else 'ms_signal_normal',
+                'signal_color': 'red' if repo_stress else 'green'
             },
             'credit_conditions': {
                 'title': 'Credit Conditions (CLI)',
-                'summary': f"HY spread: {last_hy:.0f}bps. NFCI: {last_nfci:.2f}.",
+                'summary': f"HY spread: {fmt(last_hy, '.0f')}bps. NFCI: {fmt(last_nfci, '.2f')}.",
                 'summary_key': 'ms_chart_credit_summary',
-                'signal': 'TIGHT' if last_nfci > 0 else 'NORMAL',
-                'signal_key': 'ms_signal_tight' if last_nfci > 0 else 'ms_signal_normal',
-                'signal_color': 'yellow' if last_nfci > 0 else 'green'
+                'signal': 'TIGHT' if nfci_tight else 'NORMAL',
+                'signal_key': 'ms_signal_tight' if nfci_tight else 'ms_signal_normal',
+                'signal_color': 'yellow' if nfci_tight else 'green'
             },
             'volatility': {
                 'title': 'Volatility (VIX)',
-                'summary': f"VIX at {last_vix:.1f} (Z: {vix_zscore:.1f}).",
+                'summary': f"VIX at {fmt(last_vix, '.1f')} (Z: {fmt(vix_zscore, '.1f')}).",
                 'summary_key': 'ms_chart_vol_summary',
-                'signal': 'FEAR' if last_vix > 25 else 'COMPLACENT' if last_vix < 12 else 'NEUTRAL',
-                'signal_key': 'ms_signal_fear' if last_vix > 25 else 'ms_signal_complacent' if last_vix < 12 else 'ms_signal_neutral',
-                'signal_color': 'red' if last_vix > 25 else 'yellow' if last_vix < 12 else 'green'
+                'signal': 'FEAR' if vix_fear else 'COMPLACENT' if vix_complacent else 'NEUTRAL',
+                'signal_key': 'ms_signal_fear' if vix_fear else 'ms_signal_complacent' if vix_complacent else 'ms_signal_neutral',
+                'signal_color': 'red' if vix_fear else 'yellow' if vix_complacent else 'green'
             }
         }
         
@@ -1268,6 +1250,7 @@ def calculate_market_stress_analysis(df, silent=False):
     
     return analysis
 
+@traced(cat='analytics')
 def calculate_net_repo_operations(df: pd.DataFrame) -> Dict[str, pd.Series]:
     """
     Calculates the net repo operations of the Fed.
@@ -1314,7 +1297,7 @@ def calculate_net_repo_operations(df: pd.DataFrame) -> Dict[str, pd.Series]:
 
 # tvDatafeed - use shared singleton from tv_client to prevent double login
 try:
-    from utils.tv_client import get_tv_session, TV_AVAILABLE, Interval
+    from utils.tv_client import get_tv_session, rate_limited_get_hist, TV_AVAILABLE, Interval
 except ImportError:
     # Fallback to direct import if tv_client not available
     try:
@@ -1326,6 +1309,7 @@ except ImportError:
         Interval = None
         TV_AVAILABLE = False
     get_tv_session = None
+    rate_limited_get_hist = None
 
 # Load environment variables
 load_dotenv()
@@ -1343,81 +1327,142 @@ DATA_SOURCE = os.environ.get('DATA_SOURCE', 'FRED') # Default to FRED
 if not FRED_API_KEY:
     print("WARNING: FRED_API_KEY not found in environment. Please add it to your .env file.")
 
-fred = Fred(api_key=FRED_API_KEY) if FRED_API_KEY else None
+# ============================================================
+# NETWORK CLIENTS (created lazily on first use)
+# ============================================================
+# Importing this module must not log into TradingView or build the FRED
+# client: tests, diagnostics and the orchestrator only need the functions.
+_fred_client = None
+_local_tv = None
+
+
+def get_fred_client():
+    """FRED client singleton, or None if FRED_API_KEY is not set."""
+    global _fred_client
+    if _fred_client is None and FRED_API_KEY:
+        from fredapi import Fred
+        _fred_client = Fred(api_key=FRED_API_KEY)
+    return _fred_client
+
+
+def try_tv_login(username, password, max_retries=10, delay=3):
+    """Local fallback for TV login (only used if utils.tv_client is unavailable)."""
+    if not TV_AVAILABLE:
+        return None
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            print(f"Attempting TV Login ({attempt})...")
+            if username and password:
+                tv_instance = TvDatafeed(username, password)
+            else:
+                tv_instance = TvDatafeed()
+            
+            test = tv_instance.get_hist("BTCUSD", "BITSTAMP", Interval.in_daily, n_bars=5)
+            if test is not None and len(test) > 0:
+                print("TV Login Successful!")
+                return tv_instance
+            else:
+                raise Exception("Login succeeded but test fetch failed")
+        except Exception as e:
+            print(f"TV Login failed (Attempt {attempt}): {e}")
+            if attempt >= max_retries:
+                print("Max retries reached. Falling back to Guest mode...")
+                try:
+                    return TvDatafeed()
+                except:
+                    return None
+            wait_time = min(delay * (1.5 ** (attempt - 1)), 30)
+            time.sleep(wait_time)
+
 
-# Use shared TV session singleton (defined in utils/tv_client.py)
-# This prevents double login - scrapers and data_pipeline share the same session
-if get_tv_session is not None:
-    tv = get_tv_session()
-elif TV_AVAILABLE:
-    # Fallback: create local session if tv_client not available
-    def try_tv_login(username, password, max_retries=10, delay=3):
-        """Local fallback for TV login."""
-        if not TV_AVAILABLE:
+def get_tv():
+    """
+    TradingView session, logging in on first call.
+
+    Uses the shared singleton from utils/tv_client.py so scrapers and
+    data_pipeline share the same session (prevents double login).
+    """
+    global _local_tv
+    if get_tv_session is not None:
+        return get_tv_session()
+    if _local_tv is None and TV_AVAILABLE:
+        _local_tv = try_tv_login(TV_USERNAME, TV_PASSWORD)
+    return _local_tv
+
+
+def get_tv_hist(symbol, exchange, interval, n_bars, ttl_hours=None):
+    """
+    tv.get_hist through the shared symbol store (utils/symbol_cache.py).
+
+    Cached bars are reused for up to ttl_hours (default TV_CACHE_HOURS, the
+    pipeline's own staleness budget). The TV session is only opened on a
+    cache miss; returns None if no session is available. Request errors
+    propagate to the caller's retries.
+    """
+    def download():
+        tv = get_tv()
+        if not tv:
             return None
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                print(f"Attempting TV Login ({attempt})...")
-                if username and password:
-                    tv_instance = TvDatafeed(username, password)
-                else:
-                    tv_instance = TvDatafeed()
-                
-                test = tv_instance.get_hist("BTCUSD", "BITSTAMP", Interval.in_daily, n_bars=5)
-                if test is not None and len(test) > 0:
-                    print("TV Login Successful!")
-                    return tv_instance
-                else:
-                    raise Exception("Login succeeded but test fetch failed")
-            except Exception as e:
-                print(f"TV Login failed (Attempt {attempt}): {e}")
-                if attempt >= max_retries:
-                    print("Max retries reached. Falling back to Guest mode...")
-                    try:
-                        return TvDatafeed()
-                    except:
-                        return None
-                wait_time = min(delay * (1.5 ** (attempt - 1)), 30)
-                time.sleep(wait_time)
-    tv = try_tv_login(TV_USERNAME, TV_PASSWORD)
-else:
-    tv = None
+        if rate_limited_get_hist is None:
+            return tv.get_hist(symbol=symbol, exchange=exchange, interval=interval, n_bars=n_bars)
+        return rate_limited_get_hist(tv, symbol, exchange, interval, n_bars)
+
+    if ttl_hours is None:
+        ttl_hours = TV_CACHE_HOURS
+    return get_symbol_store().get(symbol, exchange, interval, n_bars, download, ttl_hours=ttl_hours)
 
 # Output directory and cache setup
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'data')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 CACHE_FILE = os.path.join(OUTPUT_DIR, 'data_cache_info.json')
 
+# How long fetched inputs stay fresh (hours); refresh_daemon.py schedules on these
+FRED_CACHE_HOURS = 24          # FRED updates daily
+TV_CACHE_HOURS = 1             # FX, crypto, futures
+TV_ECONOMICS_CACHE_HOURS = 12  # TV ECONOMICS (balance sheets, M2)
+
+# Raw series caches in OUTPUT_DIR, by source
+INPUT_CACHE_FILES = {'fred': 'fred_cache_data.json', 'tv': 'tv_cache_data.json'}
+
+# FRED and TV inputs are fetched concurrently; both read and update CACHE_FILE
+_cache_info_lock = threading.Lock()
+
 def check_data_freshness(symbol_name, cache_hours=12):
     """
     Checks if cached data for a symbol is still fresh (within cache_hours).
     Returns True if data needs refresh, False if cache is still valid.
     """
     try:
-        if os.path.exists(CACHE_FILE):
+        with _cache_info_lock:
+            if not os.path.exists(CACHE_FILE):
+                return True
             with open(CACHE_FILE, 'r') as f:
                 cache_info = json.load(f)
-            if symbol_name in cache_info:
-                last_update = datetime.fromisoformat(cache_info[symbol_name])
-                hours_elapsed = (datetime.now() - last_update).total_seconds() / 3600
-                if hours_elapsed < cache_hours:
-                    return False  # Cache is still fresh
+        if symbol_name in cache_info:
+            last_update = datetime.fromisoformat(cache_info[symbol_name])
+            hours_elapsed = (datetime.now() - last_update).total_seconds() / 3600
+            if hours_elapsed < cache_hours:
+                return False  # Cache is still fresh
     except Exception:
         pass
     return True  # Needs refresh
 
 def update_cache_timestamp(symbol_name):
     """Updates the cache timestamp for a symbol."""
+    with _cache_info_lock:
+        _update_cache_timestamp(symbol_name)
+
+def _update_cache_timestamp(symbol_name):
     try:
         cache_info = {}
         if os.path.exists(CACHE_FILE):
             with open(CACHE_FILE, 'r') as f:
                 cache_info = json.load(f)
         cache_info[symbol_name] = datetime.now().isoformat()
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_info, f)
+        # Replaced atomically so no reader (e.g. another pipeline process) sees a partial file
+        atomic_write_bytes(CACHE_FILE, json.dumps(cache_info).encode('utf-8'))
     except Exception:
         pass
 
@@ -1697,6 +1742,7 @@ TV_CONFIG = {
 # DATA FETCHING
 # ============================================================
 def fetch_fred_series(series_id, name):
+    fred = get_fred_client()
     if not fred:
         return pd.Series(dtype=float, name=name)
     try:
@@ -1715,7 +1761,7 @@ def fetch_tv_series(symbol, exchange, name, n_bars=1500, max_retries=3, return_o
     Caps n_bars to avoid pre-1970 timestamps which cause OSError on Windows.
     If return_ohlc is True, returns a DataFrame with OHLC columns.
     """
-    if not tv:
+    if not TV_AVAILABLE:
         return pd.DataFrame() if return_ohlc else pd.Series(dtype=float, name=name)
 
     if exchange == 'ECONOMICS':
@@ -1737,7 +1783,8 @@ def fetch_tv_series(symbol, exchange, name, n_bars=1500, max_retries=3, return_o
 
         for attempt in range(1, max_retries + 1):
             try:
-                df = tv.get_hist(symbol=symbol, exchange=exchange, interval=interval, n_bars=effective_n)
+                df = get_tv_hist(symbol, exchange, interval, effective_n,
+                                 ttl_hours=TV_ECONOMICS_CACHE_HOURS if exchange == 'ECONOMICS' else TV_CACHE_HOURS)
                 
                 if df is not None and len(df) > 0:
                     if return_ohlc:
@@ -1819,6 +1866,7 @@ def weighted_sum_with_renorm(components: list, index: pd.Index):
     total_weight_safe = total_weight.replace(0, np.nan)
     return result / total_weight_safe
 
+@traced(cat='analytics')
 def calculate_gli_from_trillions(df):
     """
     Summarizes GLI components that are already in Trillions USD.
@@ -1846,6 +1894,7 @@ def calculate_gli_from_trillions(df):
     return res
 
 
+@traced(cat='analytics')
 def calculate_gli_constant_fx(df):
     """
     Calculates GLI with FX rates frozen at a base date (2019-12-31).
@@ -1886,6 +1935,7 @@ def calculate_gli_constant_fx(df):
     return res
 
 
+@traced(cat='analytics')
 def calculate_us_net_liq_from_trillions(df):
     """Calculates Net Liq from Trillion-scale components."""
     res = pd.DataFrame(index=df.index)
@@ -1893,6 +1943,7 @@ def calculate_us_net_liq_from_trillions(df):
     res['NET_LIQUIDITY'] = df.get('FED_USD', 0) - df.get('TGA_USD', 0) - df.get('RRP_USD', 0)
     return res
 
+@traced(cat='analytics')
 def calculate_cli(df):
     """
     Calculates Credit Liquidity Index.
@@ -1950,6 +2001,7 @@ def calculate_cli(df):
     return res
 
 
+@traced(cat='analytics')
 def calculate_gli(df, source='FRED'):
     """
     Calculates Global Liquidity Index in Trillions USD.
@@ -2012,6 +2064,7 @@ def calculate_gli(df, source='FRED'):
         res['CB_COUNT'] = 0
     return res
 
+@traced(cat='analytics')
 def calculate_global_m2(df):
     """
     Calculates Global M2 Money Supply in Trillions USD.
@@ -2069,6 +2122,7 @@ def calculate_global_m2(df):
     
     return res
 
+@traced(cat='analytics')
 def calculate_rocs(df, windows={'1M': 21, '3M': 63, '6M': 126, '1Y': 252}):
     """
     Calculates Rate of Change for specified windows.
@@ -2082,6 +2136,7 @@ def calculate_rocs(df, windows={'1M': 21, '3M': 63, '6M': 126, '1Y': 252}):
         rocs[label] = roc  # Keep NaN, don't fillna(0)
     return rocs
 
+@traced(cat='analytics')
 def calculate_cross_correlation(series1, series2, max_lag=90):
     """
     Calculates cross-correlation between two series with different lags.
@@ -2104,6 +2159,7 @@ def calculate_cross_correlation(series1, series2, max_lag=90):
             correlations[lag] = None
     return correlations
 
+@traced(cat='analytics')
 def calculate_lag_correlation_analysis(df, max_lag=30):
     """
     Calculates multi-window ROCs for CLI and BTC, then computes lag correlations.
@@ -2111,7 +2167,7 @@ def calculate_lag_correlation_analysis(df, max_lag=30):
     """
     results = {
         'rocs': {
-            'dates': df.index.strftime('%Y-%m-%d').tolist(),
+            'dates': DateAxis(df.index, axis_id='lag_rocs'),
         },
         'lag_correlations': {}
     }
@@ -2177,6 +2233,7 @@ def calculate_lag_correlation_analysis(df, max_lag=30):
     return results
 
 
+@traced(cat='analytics')
 def calculate_reserves_metrics(df):
     """
     Calculates derived metrics for Bank Reserves analysis:
@@ -2222,6 +2279,7 @@ def calculate_reserves_metrics(df):
     return result
 
 
+@traced(cat='analytics')
 def calculate_us_system_metrics(df):
     """
     Calculates derived metrics for US System components:
@@ -2290,6 +2348,7 @@ def calculate_us_system_metrics(df):
     return result
 
 
+@traced(cat='analytics')
 def calculate_flow_metrics(df):
     """
     Calculates flow/impulse-based metrics (more useful for trading than levels):
@@ -2345,6 +2404,7 @@ def calculate_flow_metrics(df):
 # STABLECOIN ANALYTICS
 # ============================================
 
+@traced(cat='analytics')
 def calculate_stablecoins(df: pd.DataFrame) -> dict:
     """
     Calculates stablecoin market caps, aggregate supply, growth metrics and depeg detection.
@@ -2589,7 +2649,7 @@ def calculate_stablecoins(df: pd.DataFrame) -> dict:
     
     # Use common dates from the available data
     if available_mcaps:
-        result['dates'] = df.index.strftime('%Y-%m-%d').tolist()
+        result['dates'] = DateAxis(df.index)
     
     # Sort depeg events by date (ascending - natural order for time series)
     result['depeg_events'].sort(key=lambda x: x['date'], reverse=False)
@@ -2744,6 +2804,7 @@ def calculate_stablecoins(df: pd.DataFrame) -> dict:
     return result
 
 
+@traced(cat='analytics')
 def calculate_currencies(df: pd.DataFrame) -> dict:
     """
     Calculates DXY and major currency pair metrics, including ROCs and Volatility.
@@ -2841,7 +2902,7 @@ def calculate_currencies(df: pd.DataFrame) -> dict:
         result['btc']['roc_180d'] = calc_roc(btc, 180).tolist()
         result['btc']['roc_yoy'] = calc_roc(btc, 365).tolist()
 
-    result['dates'] = df.index.strftime('%Y-%m-%d').tolist()
+    result['dates'] = DateAxis(df.index)
     
     return result
 
@@ -3191,6 +3252,7 @@ def compute_signal_metrics(df: pd.DataFrame, cli_df: pd.DataFrame, window: int =
     return metrics
 
 
+@traced(cat='analytics')
 def calculate_signals(df, cli_df):
     """
     Calculates operational signals using unified signal_config.
@@ -3381,8 +3443,69 @@ def calculate_signals(df, cli_df):
     return signals
 
 
+@traced(cat='analytics')
+def calculate_signal_history(df, cli_df):
+    """
+    Signal states and aggregate score for every date.
+    
+    Applies the calculate_signals inputs as of each date (latest valid value,
+    20-observation momentum, SRF threshold) through the vectorized
+    compute_signal_series; the last row reproduces calculate_signals and
+    aggregate_signal_score.
+    
+    Returns:
+        (states, aggregate): dict of signal_key -> compute_signal_series
+        frame, and the aggregate_signal_series frame
+    """
+    index = df.index
+
+    def latest(series):
+        # get_latest at each date: last valid value, None if it isn't finite
+        if series is None:
+            return pd.Series(np.nan, index=index)
+        filled = series.reindex(index).ffill()
+        return filled.where(np.isfinite(filled))
+
+    def momentum(series, window=20):
+        # get_momentum at each date: change over the last `window` valid values, 0 if too short
+        valid = series.dropna()
+        return valid.diff(window).reindex(index).ffill().fillna(0)
+
+    def confidence_2dp(frame):
+        # calculate_signals rounds confidence before aggregating
+        return frame.assign(confidence=frame['confidence'].round(2))
+
+    states = {}
+    states['cli'] = compute_signal_series('cli', latest(cli_df['CLI']), momentum=momentum(cli_df['CLI']))
+    for key, col in [('hy_spread', 'HY_SPREAD_Z'), ('ig_spread', 'IG_SPREAD_Z'),
+                     ('nfci_credit', 'NFCI_CREDIT_Z'), ('nfci_risk', 'NFCI_RISK_Z'),
+                     ('lending', 'LENDING_STD_Z'), ('vix', 'VIX_Z')]:
+        states[key] = compute_signal_series(key, latest(cli_df.get(col)))
+
+    states['tips'] = compute_signal_series(
+        'tips', be_values=latest(df.get('TIPS_BREAKEVEN')), rr_values=latest(df.get('TIPS_REAL_RATE'))
+    )
+
+    if 'SOFR' in df.columns and 'IORB' in df.columns:
+        spread = latest(df['SOFR'] - df['IORB'])
+        spread_bps = spread.where(spread.abs() >= 1, spread * 100)
+        srf_threshold = SIGNAL_CONFIG['repo']['thresholds'].get('srf_usage_threshold', 1.0)
+        srf_active = latest(df.get('SRF_USAGE')) > srf_threshold
+        states['repo'] = compute_signal_series('repo', spread_bps, srf_usage=srf_active)
+
+    states['move'] = compute_signal_series('move', latest(df.get('MOVE')))
+    states['fx_vol'] = compute_signal_series('fx_vol', latest(df.get('FX_VOL')))
+    states['yield_curve'] = compute_signal_series(
+        'yield_curve', (latest(df.get('TREASURY_10Y_YIELD')) - latest(df.get('TREASURY_2Y_YIELD'))) * 100
+    )
+
+    states = {key: confidence_2dp(frame) for key, frame in states.items()}
+    return states, aggregate_signal_series(states)
+
+
 
 
+@traced(cat='analytics')
 def calculate_macro_regime(
     df: pd.DataFrame,
     impulse_days: int = 65,      # ~13 weeks (trading days)
@@ -3564,6 +3687,7 @@ def calculate_macro_regime(
     return out
 
 
+@traced(cat='analytics')
 def calculate_macro_regime_weekly(df: pd.DataFrame, **kwargs):
     """
     Calculates macro regime on weekly frequency (Friday close) 
@@ -3592,14 +3716,17 @@ def calculate_macro_regime_weekly(df: pd.DataFrame, **kwargs):
     return res
 
 
+@traced(cat='analytics')
 def calculate_btc_fair_value(df_t):
     """
     Calculates dual Bitcoin fair value models:
     1. Standard Quant (Macro Only)
     2. Adoption-Adjusted (Macro + Power Law/Log-Time)
+    
+    Fits are cached by training data and hyperparameters
+    (analytics/btc_fair_value.py), so unchanged inputs are not refitted.
     """
-    from sklearn.linear_model import LinearRegression, Ridge
-    from sklearn.preprocessing import StandardScaler
+    from analytics.btc_fair_value import fit_linear_cached
     import numpy as np
 
     result = pd.DataFrame(index=df_t.index)
@@ -3637,28 +3764,21 @@ def calculate_btc_fair_value(df_t):
         return result
         
     y_train = train_data['BTC'] # log_btc
-    scaler = StandardScaler()
 
     # --- MODEL 1: MACRO ONLY ---
     X_m_train = train_data[['GLI_TOTAL', 'CLI', 'NET_LIQ']]
-    X_m_scaled = scaler.fit_transform(X_m_train)
-    model_m = LinearRegression()
-    model_m.fit(X_m_scaled, y_train.values)
+    model_m = fit_linear_cached('ols', X_m_train, y_train)
     
     X_m_full = raw_features[['GLI_TOTAL', 'CLI', 'NET_LIQ']].loc[valid_mask].ffill()
-    X_m_full_scaled = scaler.transform(X_m_full)
-    log_pred_m = pd.Series(model_m.predict(X_m_full_scaled), index=X_m_full.index)
+    log_pred_m = pd.Series(model_m.predict(X_m_full), index=X_m_full.index)
     
     # --- MODEL 2: ADOPTION ADJUSTED (Macro + Time) ---
     X_a_train = train_data[['GLI_TOTAL', 'CLI', 'NET_LIQ', 'ADOPTION']]
-    X_a_scaled = scaler.fit_transform(X_a_train)
     # Use Ridge to prevent multicollinearity between Time and Liquidity
-    model_a = Ridge(alpha=1.0)
-    model_a.fit(X_a_scaled, y_train.values)
+    model_a = fit_linear_cached('ridge', X_a_train, y_train, {'alpha': 1.0})
     
     X_a_full = raw_features[['GLI_TOTAL', 'CLI', 'NET_LIQ', 'ADOPTION']].loc[valid_mask].ffill()
-    X_a_full_scaled = scaler.transform(X_a_full)
-    log_pred_a = pd.Series(model_a.predict(X_a_full_scaled), index=X_a_full.index)
+    log_pred_a = pd.Series(model_a.predict(X_a_full), index=X_a_full.index)
 
     # Helper to calculate bands and metrics
     def build_model_df(log_pred, btc_actual):
@@ -3685,6 +3805,7 @@ def calculate_btc_fair_value(df_t):
     
     return result.join(result_btc, how='left')
 
+@traced(cat='analytics')
 def calculate_btc_fair_value_v2(df_t):
     """
     QUANT V2: Enhanced Bitcoin Fair Value Model
@@ -3695,11 +3816,14 @@ def calculate_btc_fair_value_v2(df_t):
     3. ElasticNet with multiple lags (1-8 weeks) for automatic feature selection
     4. GLI as PCA factor (not sum) to handle colinearity
     5. Rolling 52-week volatility for adaptive bands
-    6. Walk-forward cross-validation metrics
+    6. Walk-forward out-of-sample predictions and metrics
+    
+    The full-sample fit is cached by training data and hyperparameters; the
+    walk-forward history refits weekly with warm starts (the GLI factor
+    included) and only scores the weeks added or revised since the last run
+    (analytics/btc_fair_value.py).
     """
-    from sklearn.linear_model import ElasticNetCV
-    from sklearn.preprocessing import StandardScaler, RobustScaler
-    from sklearn.decomposition import PCA
+    from analytics.btc_fair_value import ELASTICNET_CV_PARAMS, fit_linear_cached, gli_factor_lags, walk_forward_elasticnet
     import numpy as np
     import warnings
     warnings.filterwarnings('ignore', category=UserWarning)
@@ -3719,7 +3843,7 @@ def calculate_btc_fair_value_v2(df_t):
     # 2. Calculate Δlog returns (weekly)
     btc_log_ret = np.log(btc_series).diff()
     
-    # 3. Build GLI PCA Factor
+    # 3. Build GLI PCA Factor inputs (the factor is fitted in gli_factor_lags)
     gli_cols = ['FED_USD', 'ECB_USD', 'BOJ_USD', 'BOE_USD', 'PBOC_USD']
     gli_available = [c for c in gli_cols if c in df_weekly.columns]
     
@@ -3729,17 +3853,9 @@ def calculate_btc_fair_value_v2(df_t):
         gli_dlog = np.log(gli_df.replace(0, np.nan)).diff()
         gli_dlog = gli_dlog.replace([np.inf, -np.inf], np.nan)
         gli_dlog_clean = gli_dlog.dropna()
-        
-        if len(gli_dlog_clean) > 50:
-            scaler_pca = RobustScaler()
-            gli_scaled = scaler_pca.fit_transform(gli_dlog_clean)
-            pca = PCA(n_components=2)
-            pca_result = pca.fit_transform(gli_scaled)
-            gli_factor = pd.Series(pca_result[:, 0], index=gli_dlog_clean.index, name='GLI_FACTOR')
-        else:
-            gli_factor = pd.Series(dtype=float)
     else:
-        gli_factor = pd.Series(dtype=float)
+        gli_dlog_clean = pd.DataFrame(index=df_weekly.index[:0])
+    gli_lags = gli_factor_lags(gli_dlog_clean)
     
     # 4. Prepare Features with Multiple Lags (1-8 weeks)
     feature_df = pd.DataFrame(index=df_weekly.index)
@@ -3752,9 +3868,8 @@ def calculate_btc_fair_value_v2(df_t):
             feature_df[f'CLI_L{lag}'] = cli_dlog.shift(lag)
     
     # GLI Factor lags
-    if not gli_factor.empty:
-        for lag in range(1, 9):
-            feature_df[f'GLI_L{lag}'] = gli_factor.shift(lag)
+    for col in gli_lags.columns:
+        feature_df[col] = gli_lags[col]
     
     # VIX changes
     if 'VIX' in df_weekly.columns:
@@ -3788,22 +3903,11 @@ def calculate_btc_fair_value_v2(df_t):
     X_train = train_data.drop('TARGET', axis=1)
     
     # 6. ElasticNet with CV for automatic lag selection
-    scaler = RobustScaler()
-    X_scaled = scaler.fit_transform(X_train)
-    
-    model = ElasticNetCV(
-        l1_ratio=[0.1, 0.5, 0.7, 0.9, 0.95],
-        alphas=np.logspace(-4, 0, 20),
-        cv=5,
-        max_iter=5000,
-        random_state=42
-    )
-    model.fit(X_scaled, y_train)
+    model = fit_linear_cached('elasticnet_cv', X_train, y_train, ELASTICNET_CV_PARAMS)
     
     # 7. Generate predictions using the same common index
     X_full = feature_df.loc[common_idx].ffill().bfill()
-    X_full_scaled = scaler.transform(X_full)
-    pred_returns = pd.Series(model.predict(X_full_scaled), index=X_full.index)
+    pred_returns = pd.Series(model.predict(X_full), index=X_full.index)
     
     # 8. Reconstruct log price from cumulative returns
     log_btc_actual = np.log(btc_series)
@@ -3828,18 +3932,34 @@ def calculate_btc_fair_value_v2(df_t):
     deviation_pct = (btc_series - fair_value) / fair_value * 100
     deviation_zscore = residuals / rolling_std
     
-    # 11. Walk-forward OOS metrics (simplified)
+    # 11. Walk-forward OOS metrics (holdout of the full-sample fit if history is too short).
+    # The GLI factor above is fitted on the full history, so the walk-forward
+    # refits it on each expanding window instead of reusing those columns
+    walk_forward = walk_forward_elasticnet(
+        X_train.drop(columns=gli_lags.columns), y_train,
+        refit_features=gli_factor_lags if len(gli_lags.columns) else None,
+        refit_inputs=gli_dlog_clean if len(gli_lags.columns) else None,
+    )
+    oos = walk_forward.join(y_train.rename('actual'), how='inner')
     oos_start = int(len(train_data) * 0.7)
-    if oos_start > 50:
-        oos_resid = y_train.iloc[oos_start:] - model.predict(X_scaled[oos_start:])
+    if len(oos) >= 26:
+        oos_method = 'walk_forward'
+        oos_actual, oos_pred = oos['actual'], oos['predicted']
+    elif oos_start > 50:
+        oos_method = 'holdout'
+        oos_actual, oos_pred = y_train.iloc[oos_start:], model.predict(X_train.iloc[oos_start:])
+    else:
+        oos_method = None
+    if oos_method:
+        oos_resid = oos_actual - oos_pred
         oos_rmse = np.sqrt((oos_resid ** 2).mean())
         oos_mae = np.abs(oos_resid).mean()
-        hit_rate = (np.sign(y_train.iloc[oos_start:]) == np.sign(model.predict(X_scaled[oos_start:]))).mean()
+        hit_rate = (np.sign(oos_actual) == np.sign(oos_pred)).mean()
     else:
         oos_rmse, oos_mae, hit_rate = np.nan, np.nan, np.nan
     
     # 12. Feature importance (non-zero coefficients)
-    feature_importance = dict(zip(X_train.columns, model.coef_))
+    feature_importance = dict(zip(X_train.columns, model.coef))
     active_features = {k: v for k, v in feature_importance.items() if abs(v) > 1e-6}
     
     # 13. Predicted vs Actual Returns (for returns comparison chart)
@@ -3883,13 +4003,21 @@ def calculate_btc_fair_value_v2(df_t):
         },
         # New: Rebalanced fair value
         'rebalanced_fv': [float(x) if pd.notnull(x) else None for x in rebalanced_fv.tolist()],
+        # Out-of-sample weekly returns (%), each predicted from the weeks before it
+        'walk_forward': {
+            'dates': oos.index.strftime('%Y-%m-%d').tolist(),
+            'predicted': [float(x) * 100 for x in oos['predicted']],
+            'actual': [float(x) * 100 for x in oos['actual']],
+        },
         'metrics': {
             'oos_rmse': round(oos_rmse, 6) if pd.notnull(oos_rmse) else None,
             'oos_mae': round(oos_mae, 6) if pd.notnull(oos_mae) else None,
             'hit_rate': round(hit_rate, 4) if pd.notnull(hit_rate) else None,
-            'r2_insample': round(model.score(X_scaled, y_train), 4),
-            'alpha': round(model.alpha_, 6),
-            'l1_ratio': round(model.l1_ratio_, 2),
+            'oos_method': oos_method,
+            'oos_weeks': len(oos),
+            'r2_insample': round(model.r2(X_train, y_train), 4),
+            'alpha': round(model.params['alpha'], 6),
+            'l1_ratio': round(model.params['l1_ratio'], 2),
             'n_active_features': len(active_features),
         },
         'active_features': active_features,
@@ -3898,6 +4026,7 @@ def calculate_btc_fair_value_v2(df_t):
     
     return result
 
+@traced(cat='analytics')
 def calculate_us_net_liq(df, source='FRED'):
     """Calculates US Net Liquidity in Trillions USD."""
     res = pd.DataFrame(index=df.index)
@@ -3919,21 +4048,71 @@ def calculate_us_net_liq(df, source='FRED'):
 # ============================================================
 # MAIN PIPELINE
 # ============================================================
-def run_pipeline():
-    print("Starting Data Pipeline...")
-    
-    # 1. Fetch FRED Baseline and Normalize to Trillions
+# ============================================================
+# PIPELINE INPUTS (network fetch stage)
+# ============================================================
+def cache_entry(s: pd.Series) -> Dict[str, list]:
+    """JSON cache form of a raw series (fred_cache_data.json / tv_cache_data.json)."""
+    return {
+        'dates': s.index.strftime('%Y-%m-%d').tolist(),
+        'values': s.tolist()
+    }
+
+
+def save_input_cache(source: str, raw: Dict[str, pd.Series]) -> None:
+    """
+    Rewrite the JSON cache of one source ('fred' or 'tv') from in-memory
+    series, e.g. after refresh_daemon.py updated them.
+    """
+    sids = {name: sid for sid, name in FRED_CONFIG.items()}
+    cached = {}
+    for name, s in raw.items():
+        cached[name] = cache_entry(s)
+        if source == 'fred' and name in sids:
+            cached[name]['sid'] = sids[name]
+    try:
+        with span(f"{source}_cache_save", cat='serialize'), open(os.path.join(OUTPUT_DIR, INPUT_CACHE_FILES[source]), 'w') as f:
+            json.dump(cached, f)
+    except Exception as e:
+        print(f"Warning: Could not save {source} cache: {e}")
+
+
+def fetch_tv_symbol(symbol: str, exchange: str, name: str) -> Dict[str, pd.Series]:
+    """
+    One TradingView symbol as {column name: Series}; empty if the fetch failed.
+
+    Stablecoin prices (*_PRICE) are fetched as OHLC to detect intra-day
+    depegs and stored as NAME (close), NAME_HIGH and NAME_LOW.
+    """
+    is_price = name.endswith("_PRICE")
+    with span(f"tv:{name}", cat='fetch') as sp:
+        s = fetch_tv_series(symbol, exchange, name, n_bars=5000, return_ohlc=is_price)
+        if sp is not None:
+            sp.rows = len(s)
+    
+    if isinstance(s, pd.DataFrame) and not s.empty:
+        # Store OHLC components separately for cache/pipeline
+        return {(f"{name}_{col.upper()}" if col != "close" else name): s[col] for col in ["high", "low", "close"]}
+    if not s.empty:
+        return {name: s}
+    return {}
+
+
+@traced(cat='fetch')
+def fetch_fred_inputs() -> Dict[str, pd.Series]:
+    """Raw FRED series by name (24h cache in fred_cache_data.json)."""
     print("Fetching FRED Baseline Data (Trillions)...")
-    dfs_fred_t = {}
     raw_fred = {}
-    cached_fred_file = os.path.join(OUTPUT_DIR, 'fred_cache_data.json')
+    cached_fred_file = os.path.join(OUTPUT_DIR, INPUT_CACHE_FILES['fred'])
     
     # Load cached FRED data if exists
     cached_fred = {}
     if os.path.exists(cached_fred_file):
         try:
-            with open(cached_fred_file, 'r') as f:
+            with span('fred_cache_load', cat='cache') as sp, open(cached_fred_file, 'r') as f:
                 cached_fred = json.load(f)
+                if sp is not None:
+                    sp.rows = len(cached_fred)
         except Exception:
             cached_fred = {}
     
@@ -3943,7 +4122,7 @@ def run_pipeline():
         # FRED updates daily, use 24 hour cache
         # Also check if the SID in cache matches the current SID to handle config changes
         cached_sid = cached_fred.get(name, {}).get('sid')
-        if not check_data_freshness(f"FRED_{name}", cache_hours=24) and name in cached_fred and cached_sid == sid:
+        if not check_data_freshness(f"FRED_{name}", cache_hours=FRED_CACHE_HOURS) and name in cached_fred and cached_sid == sid:
             # Use cached data
             raw_fred[name] = pd.Series(cached_fred[name]['values'], 
                                        index=pd.to_datetime(cached_fred[name]['dates']), 
@@ -3951,27 +4130,109 @@ def run_pipeline():
             fred_cached += 1
         else:
             # Fetch fresh data
-            s = fetch_fred_series(sid, name)
+            with span(f"fred:{name}", cat='fetch') as sp:
+                s = fetch_fred_series(sid, name)
+                if sp is not None:
+                    sp.rows = len(s)
             if not s.empty:
                 raw_fred[name] = s
                 update_cache_timestamp(f"FRED_{name}")
                 # Cache the data including the SID
-                cached_fred[name] = {
-                    'sid': sid,
-                    'dates': s.index.strftime('%Y-%m-%d').tolist(),
-                    'values': s.tolist()
-                }
+                cached_fred[name] = dict(cache_entry(s), sid=sid)
                 fred_fetched += 1
     
     # Save updated FRED cache
     try:
-        with open(cached_fred_file, 'w') as f:
+        with span('fred_cache_save', cat='serialize'), open(cached_fred_file, 'w') as f:
             json.dump(cached_fred, f)
     except Exception as e:
         print(f"Warning: Could not save FRED cache: {e}")
     
     print(f"  -> Fetched {fred_fetched} FRED symbols, used cache for {fred_cached} symbols")
+    return raw_fred
+
+
+@traced(cat='fetch')
+def fetch_tv_inputs() -> Dict[str, pd.Series]:
+    """
+    Raw TradingView series by name (cache in tv_cache_data.json).
+
+    Requests are spaced out by the shared TV rate limiter (utils/tv_client.py).
+    """
+    print("Fetching TradingView Update Data (Trillions)...")
+    raw_tv = {}
+    cached_data_file = os.path.join(OUTPUT_DIR, INPUT_CACHE_FILES['tv'])
+    
+    # Load cached TV data if exists
+    cached_tv = {}
+    if os.path.exists(cached_data_file):
+        try:
+            with span('tv_cache_load', cat='cache') as sp, open(cached_data_file, 'r') as f:
+                cached_tv = json.load(f)
+                if sp is not None:
+                    sp.rows = len(cached_tv)
+        except Exception:
+            cached_tv = {}
     
+    # Session is only opened by fetch_tv_series if something is actually stale
+    if TV_AVAILABLE:
+        symbols_fetched = 0
+        symbols_cached = 0
+        for symbol, (exchange, name) in TV_CONFIG.items():
+            # Check if cache is still fresh (12 hours for most data)
+            cache_hours = TV_ECONOMICS_CACHE_HOURS if exchange == "ECONOMICS" else TV_CACHE_HOURS  # FX updates more frequently
+            if not check_data_freshness(name, cache_hours=cache_hours) and name in cached_tv:
+                # Use cached data
+                raw_tv[name] = pd.Series(cached_tv[name]['values'], 
+                                         index=pd.to_datetime(cached_tv[name]['dates']), 
+                                         name=name)
+                symbols_cached += 1
+            else:
+                # Fetch fresh data
+                fetched = fetch_tv_symbol(symbol, exchange, name)
+                for col_name, series in fetched.items():
+                    raw_tv[col_name] = series
+                    update_cache_timestamp(col_name)
+                    cached_tv[col_name] = cache_entry(series)
+                if fetched:
+                    symbols_fetched += 1
+
+        
+        # Save updated cache
+        try:
+            with span('tv_cache_save', cat='serialize'), open(cached_data_file, 'w') as f:
+                json.dump(cached_tv, f)
+        except Exception as e:
+            print(f"Warning: Could not save cache: {e}")
+        
+        print(f"  -> Fetched {symbols_fetched} symbols, used cache for {symbols_cached} symbols")
+    return raw_tv
+
+
+@traced(cat='fetch')
+def fetch_pipeline_inputs() -> Dict[str, Dict[str, pd.Series]]:
+    """
+    Network stage of run_pipeline: FRED and TradingView fetched concurrently.
+
+    Returns {'fred': raw FRED series, 'tv': raw TV series}; pass it to
+    run_pipeline(inputs=...) to run the processing stage.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fred = executor.submit(fetch_fred_inputs)
+        tv = executor.submit(fetch_tv_inputs)
+        return {'fred': fred.result(), 'tv': tv.result()}
+
+
+@traced()
+def build_fred_frame(raw_fred: Dict[str, pd.Series]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Daily FRED frame (raw units, forward-filled) and its derived columns in
+    trillions / display units (incl. CLI).
+
+    Returns (df_fred, df_fred_t); both go into build_hybrid_frame().
+    """
     # Unit Logic for FRED -> Trillions
     df_fred = pd.DataFrame(index=pd.concat(raw_fred.values()).index.unique()).sort_index()
     for name, s in raw_fred.items():
@@ -4045,71 +4306,16 @@ def run_pipeline():
     df_fred_t['SOFR_INDEX'] = df_fred.get('SOFR_INDEX', pd.Series(dtype=float))
     df_fred_t['SONIA_INDEX'] = df_fred.get('SONIA_INDEX', pd.Series(dtype=float))
     df_fred_t['ESTR'] = df_fred.get('ESTR', pd.Series(dtype=float))
-    # 2. Fetch TV and Normalize to Trillions
-    print("Fetching TradingView Update Data (Trillions)...")
-    raw_tv = {}
-    cached_data_file = os.path.join(OUTPUT_DIR, 'tv_cache_data.json')
-    
-    # Load cached TV data if exists
-    cached_tv = {}
-    if os.path.exists(cached_data_file):
-        try:
-            with open(cached_data_file, 'r') as f:
-                cached_tv = json.load(f)
-        except Exception:
-            cached_tv = {}
-    
-    if tv:
-        symbols_fetched = 0
-        symbols_cached = 0
-        for symbol, (exchange, name) in TV_CONFIG.items():
-            # Check if cache is still fresh (12 hours for most data)
-            cache_hours = 12 if exchange == "ECONOMICS" else 1  # FX updates more frequently
-            if not check_data_freshness(name, cache_hours=cache_hours) and name in cached_tv:
-                # Use cached data
-                raw_tv[name] = pd.Series(cached_tv[name]['values'], 
-                                         index=pd.to_datetime(cached_tv[name]['dates']), 
-                                         name=name)
-                symbols_cached += 1
-            else:
-                # Fetch fresh data
-                # Use OHLC for stablecoin prices to detect intra-day depegs
-                is_price = name.endswith("_PRICE")
-                s = fetch_tv_series(symbol, exchange, name, n_bars=5000, return_ohlc=is_price)
-                
-                if isinstance(s, pd.DataFrame) and not s.empty:
-                    # Store OHLC components separately for cache/pipeline
-                    for col in ["high", "low", "close"]:
-                        col_name = f"{name}_{col.upper()}" if col != "close" else name
-                        raw_tv[col_name] = s[col]
-                        update_cache_timestamp(col_name)
-                        cached_tv[col_name] = {
-                            'dates': s.index.strftime('%Y-%m-%d').tolist(),
-                            'values': s[col].tolist()
-                        }
-                    symbols_fetched += 1
-                elif not s.empty:
-                    raw_tv[name] = s
-                    update_cache_timestamp(name)
-                    # Cache the data
-                    cached_tv[name] = {
-                        'dates': s.index.strftime('%Y-%m-%d').tolist(),
-                        'values': s.tolist()
-                    }
-                    symbols_fetched += 1
-                
-                # Add small delay between TV requests to avoid rate limiting
-                time.sleep(0.5)
-        
-        # Save updated cache
-        try:
-            with open(cached_data_file, 'w') as f:
-                json.dump(cached_tv, f)
-        except Exception as e:
-            print(f"Warning: Could not save cache: {e}")
-        
-        print(f"  -> Fetched {symbols_fetched} symbols, used cache for {symbols_cached} symbols")
-    
+    return df_fred, df_fred_t
+
+
+@traced()
+def build_hybrid_frame(df_fred: pd.DataFrame, df_fred_t: pd.DataFrame, raw_tv: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Hybrid TV+FRED frame: TradingView series normalized to trillions where
+    available, FRED baseline for the rest, clipped to the FRED start.
+    """
+    # 2. Normalize TV to Trillions
     df_tv_t = pd.DataFrame(raw_tv).sort_index() if raw_tv else pd.DataFrame()
     if not df_tv_t.empty:
         
@@ -4231,30 +4437,104 @@ def run_pipeline():
         df_hybrid_t = df_hybrid_t[df_hybrid_t.index >= fred_start]
     else:
         df_hybrid_t = df_fred_t
+    return df_hybrid_t
+
+
+def add_domain_columns(df_hybrid_t: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the columns domains need on top of the hybrid frame (in place):
+    FEAR_GREED for CryptoDomain and FX_VOL realized from DXY.
+    """
+    # Add FEAR_GREED to df_hybrid_t so CryptoDomain can access it
+    # (normally added inside process_and_save_final, but orchestrator runs before that)
+    if 'FEAR_GREED' not in df_hybrid_t.columns:
+        from analytics.crypto_analytics import fetch_fear_and_greed
+        fng_series = fetch_fear_and_greed()
+        if not fng_series.empty:
+            df_hybrid_t['FEAR_GREED'] = fng_series.reindex(df_hybrid_t.index).ffill()
+    
+    # Calculate FX Volatility from DXY (realized vol, annualized)
+    # EVZ was discontinued Jan 2025, so we compute realized vol from DXY
+    if 'DXY' in df_hybrid_t.columns:
+        dxy_series = df_hybrid_t['DXY'].ffill()
+        if dxy_series.notna().sum() > 20:
+            dxy_returns = np.log(dxy_series).diff()
+            df_hybrid_t['FX_VOL'] = dxy_returns.rolling(21, min_periods=10).std() * np.sqrt(252) * 100
+    return df_hybrid_t
+
+
+def align_daily_frame(df_t: pd.DataFrame) -> pd.DataFrame:
+    """
+    Strictly daily, forward-filled copy of the hybrid frame, starting at the
+    first FED_USD value (the frame process_and_save_final works on).
+    """
+    # Alignment: Ensure index is strictly daily for charts
+    all_dates = pd.date_range(start=df_t.index.min(), end=df_t.index.max(), freq='D')
+    df_t = df_t.reindex(all_dates)
+    
+    # CRITICAL: Forward fill specific credit and yield columns to prevent nulls in derivative calculations (spreads, z-scores)
+    # This addresses the issue where "0 bps" or "0 sigma" appears due to missing late data points.
+    ffill_cols = ['HY_SPREAD', 'IG_SPREAD', 'BAA_YIELD', 'AAA_YIELD', 'TREASURY_10Y_YIELD', 'TREASURY_2Y_YIELD', 'TREASURY_30Y_YIELD', 'TREASURY_5Y_YIELD']
+    for col in ffill_cols:
+        if col in df_t.columns:
+            df_t[col] = df_t[col].ffill()
+    
+    df_t = df_t.ffill() # General fallback ffill
+
+    # Data Trimming: Find the first date where major US series have data
+    # Fed Assets (FED_USD) started being populated in FRED from 2002-12-18
+    # Trimming helps charts start at the first available data point
+    main_series = df_t.get('FED_USD', df_t.get('NET_LIQUIDITY', pd.Series(dtype=float)))
+    if not main_series.empty:
+        first_valid_idx = main_series.first_valid_index()
+        if first_valid_idx:
+            df_t = df_t.loc[first_valid_idx:]
+    return df_t
+
+
+@traced()
+def offshore_liquidity_stage(df_hybrid_t: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Offshore liquidity output shared by the legacy file and OffshoreDomain.
+
+    Inputs are the offshore FRED/TV columns of the daily-aligned frame and
+    the foreign rate series, which are fetched once here, concurrently.
+    Unchanged inputs (e.g. a refresh_daemon run that only touched BTC)
+    return the previous output without recomputing.
+    """
+    # FED_USD / NET_LIQUIDITY only decide where the aligned frame starts
+    cols = [c for c in ['FED_USD', 'NET_LIQUIDITY', *OFFSHORE_FRED_COLUMNS, *OFFSHORE_TV_COLUMNS]
+            if c in df_hybrid_t.columns]
+    df_fred, df_tv = select_offshore_inputs(align_daily_frame(df_hybrid_t[cols]))
+    foreign_rates = resolve_foreign_rates(df_fred) if df_tv is not None else {}
+    return get_offshore_liquidity_output(df_fred, df_tv, foreign_rates=foreign_rates)
+
+
+@traced()
+def run_pipeline(inputs: Optional[Dict[str, Dict[str, pd.Series]]] = None, orchestrator=None):
+    """
+    Fetch (unless `inputs` from fetch_pipeline_inputs() are given) and process
+    all pipeline data.
+
+    `orchestrator` lets a long-running caller (refresh_daemon.py) reuse an
+    incremental DataOrchestrator across runs; by default a new one is created.
+    """
+    print("Starting Data Pipeline...")
+    if inputs is None:
+        inputs = fetch_pipeline_inputs()
+    raw_fred = inputs['fred']
+    raw_tv = inputs['tv']
+    
+    df_fred, df_fred_t = build_fred_frame(raw_fred)
+    df_hybrid_t = build_hybrid_frame(df_fred, df_fred_t, raw_tv)
+
+    # Read by both the legacy file and OffshoreDomain
+    offshore_liquidity = offshore_liquidity_stage(df_hybrid_t).get('offshore_liquidity', {})
 
     # 4. Final Processing and JSON Save
+    @traced()
     def process_and_save_final(df_t, filename, silent=False):
-        # Alignment: Ensure index is strictly daily for charts
-        all_dates = pd.date_range(start=df_t.index.min(), end=df_t.index.max(), freq='D')
-        df_t = df_t.reindex(all_dates)
-        
-        # CRITICAL: Forward fill specific credit and yield columns to prevent nulls in derivative calculations (spreads, z-scores)
-        # This addresses the issue where "0 bps" or "0 sigma" appears due to missing late data points.
-        ffill_cols = ['HY_SPREAD', 'IG_SPREAD', 'BAA_YIELD', 'AAA_YIELD', 'TREASURY_10Y_YIELD', 'TREASURY_2Y_YIELD', 'TREASURY_30Y_YIELD', 'TREASURY_5Y_YIELD']
-        for col in ffill_cols:
-            if col in df_t.columns:
-                df_t[col] = df_t[col].ffill()
-        
-        df_t = df_t.ffill() # General fallback ffill
-
-        # Data Trimming: Find the first date where major US series have data
-        # Fed Assets (FED_USD) started being populated in FRED from 2002-12-18
-        # Trimming helps charts start at the first available data point
-        main_series = df_t.get('FED_USD', df_t.get('NET_LIQUIDITY', pd.Series(dtype=float)))
-        if not main_series.empty:
-            first_valid_idx = main_series.first_valid_index()
-            if first_valid_idx:
-                df_t = df_t.loc[first_valid_idx:]
+        df_t = align_daily_frame(df_t)
 
         # Units Logic and derived columns for Risk Model
         if 'TREASURY_10Y_YIELD' in df_t.columns and 'TREASURY_2Y_YIELD' in df_t.columns:
@@ -4304,6 +4584,7 @@ def run_pipeline():
         
         # Compute aggregate signal score for dashboard
         signal_aggregate = aggregate_signal_score(signals)
+        signal_states, signal_aggregate_history = calculate_signal_history(df_t, cli_df)
 
         # ================================================================
         # CLI V2 and Regime V2 Calculations (from regime_v2 module)
@@ -4315,7 +4596,7 @@ def run_pipeline():
         if 'GLI_TOTAL' in gli:
             df_t['GLI_TOTAL'] = gli['GLI_TOTAL']
 
-        DATA_DIR = os.path.join(os.path.dirname(__file__), 'data') # Ensure defined
+        DATA_DIR = OUTPUT_DIR
 
         # Regime V2A (Inflation-Aware) and V2B (Growth-Aware)
         regime_v2a = calculate_macro_regime_v2a(df_t)
@@ -4329,11 +4610,9 @@ def run_pipeline():
             macro_domain = MacroRegimeDomain()
             macro_domain_output = macro_domain.process(df_t)
             
-            # Save to modular JSON
-            domain_file_path = os.path.join(DATA_DIR, 'domains', 'macro_regime.json')
-            os.makedirs(os.path.dirname(domain_file_path), exist_ok=True)
-            with open(domain_file_path, 'w') as f:
-                json.dump(macro_domain_output, f)
+            # Save to modular JSON (with a delta record if the orchestrator writes them)
+            from orchestrator import domain_output_formats
+            macro_domain.save_json(macro_domain_output, DATA_DIR, deltas='delta' in domain_output_formats())
             print("Saved modular domain: macro_regime.json")
         except Exception as e:
             print(f"Error processing MacroRegimeDomain: {e}")
@@ -4485,15 +4764,8 @@ def run_pipeline():
         # Net Liquidity ROCs (for the sidebar)
         net_liq_rocs = calculate_rocs(us_net_liq['NET_LIQUIDITY'])
         
-        # Offshore Liquidity XCCY Basis - Build TV DataFrame
-        offshore_tv_cols = ['EURUSD', 'USDJPY', 'GBPUSD', 
-                            'EURUSD_FUT', 'JPYUSD_FUT', 'GBPUSD_FUT']
-        df_offshore_tv = pd.DataFrame({
-            col: df_t[col] for col in offshore_tv_cols if col in df_t.columns
-        }, index=df_t.index)
-        
         data_output = {
-            'dates': df_t.index.strftime('%Y-%m-%d').tolist(),
+            'dates': DateAxis(df_t.index),
             'last_dates': {k: get_safe_last_date(df_t[k]) for k in df_t.columns},
             'gli': {
                 'total': clean_for_json(gli['GLI_TOTAL']),
@@ -4677,6 +4949,12 @@ def run_pipeline():
             },
             'signals': signals,
             'signal_aggregate': signal_aggregate,
+            'signal_history': {
+                'score': clean_for_json(signal_aggregate_history['score']),
+                'state': clean_for_json(signal_aggregate_history['state']),
+                'coverage': clean_for_json(signal_aggregate_history['coverage']),
+                'states': {k: clean_for_json(v['state']) for k, v in signal_states.items()},
+            },
             'schema_version': 2,
             'nfci_credit': clean_for_json(df_t.get('NFCI_CREDIT', pd.Series(dtype=float))),
             'nfci_risk': clean_for_json(df_t.get('NFCI_RISK', pd.Series(dtype=float))),
@@ -4882,7 +5160,7 @@ def run_pipeline():
             'inflation_expect_5y': clean_for_json(df_t.get('INFLATION_EXPECT_5Y', pd.Series(dtype=float))),
             'inflation_expect_10y': clean_for_json(df_t.get('INFLATION_EXPECT_10Y', pd.Series(dtype=float))),
             # Market Stress Analysis (calculated from current data)
-            'stress_analysis': calculate_market_stress_analysis(df_t, silent=silent),
+            'stress_analysis': calculate_market_stress_analysis(df_t, silent=silent, stress_historical=stress_historical),
             # Treasury Settlements with RRP liquidity coverage
             'treasury_settlements': fetch_treasury_settlements(),
             # ================================================================
@@ -5039,8 +5317,8 @@ def run_pipeline():
                 },
                 silent=True
             ),
-            # Offshore Dollar Liquidity
-            'offshore_liquidity': get_offshore_liquidity_output(df_t, df_offshore_tv if not df_offshore_tv.empty else None).get('offshore_liquidity', {}),
+            # Offshore Dollar Liquidity (computed once in offshore_liquidity_stage)
+            'offshore_liquidity': offshore_liquidity,
             # Currency Analytics
             'currencies': {
                 'dates': currencies_data.get('dates', []),
@@ -5050,33 +5328,26 @@ def run_pipeline():
             },
         }
 
+        # Shared date axes are written once in a top-level 'axes' table
+        attach_axes(data_output, data_output)
+
         output_path = os.path.join(OUTPUT_DIR, filename)
-        with open(output_path, 'w') as f:
-            json.dump(data_output, f)
+        result = get_publisher(OUTPUT_DIR).publish_json(output_path, data_output, default=json_default)
+        if not result.written:
+            print(f"  -> {filename} unchanged, skipped write")
 
     # Modular Domain Processing (New Architecture)
     print("Running modular domain orchestrator...")
     try:
         from orchestrator import create_orchestrator
         
-        # Add FEAR_GREED to df_hybrid_t so CryptoDomain can access it
-        # (normally added inside process_and_save_final, but orchestrator runs before that)
-        if 'FEAR_GREED' not in df_hybrid_t.columns:
-            from analytics.crypto_analytics import fetch_fear_and_greed
-            fng_series = fetch_fear_and_greed()
-            if not fng_series.empty:
-                df_hybrid_t['FEAR_GREED'] = fng_series.reindex(df_hybrid_t.index).ffill()
+        add_domain_columns(df_hybrid_t)
         
-        # Calculate FX Volatility from DXY (realized vol, annualized)
-        # EVZ was discontinued Jan 2025, so we compute realized vol from DXY
-        if 'DXY' in df_hybrid_t.columns:
-            dxy_series = df_hybrid_t['DXY'].ffill()
-            if dxy_series.notna().sum() > 20:
-                dxy_returns = np.log(dxy_series).diff()
-                df_hybrid_t['FX_VOL'] = dxy_returns.rolling(21, min_periods=10).std() * np.sqrt(252) * 100
-        
-        orchestrator = create_orchestrator(OUTPUT_DIR)
-        orchestrator.run(df_hybrid_t, generate_legacy=False) # Skip legacy for now as it's done above
+        if orchestrator is None:
+            orchestrator = create_orchestrator(OUTPUT_DIR)
+        with span('orchestrator.run', rows=len(df_hybrid_t)):
+            orchestrator.run(df_hybrid_t, generate_legacy=False, # Skip legacy for now as it's done above
+                             context={'offshore_liquidity': offshore_liquidity})
         print("  -> Modular domain files saved to backend/data/domains/")
     except Exception as e:
         print(f"Error in orchestrator: {e}")
@@ -5089,16 +5360,18 @@ def run_pipeline():
     try:
         etf_data = clean_for_json(fetch_etf_data())
         etf_output_path = os.path.join(OUTPUT_DIR, 'etf_data.json')
-        with open(etf_output_path, 'w') as f:
-            json.dump(etf_data, f)
+        get_publisher(OUTPUT_DIR).publish_json(etf_output_path, etf_data)
         print(f"  -> ETF data saved to {etf_output_path}")
     except Exception as e:
         print(f"Error saving separate ETF data: {e}")
     
     # Copy to dashboard_data.json for backwards compatibility
-    import shutil
-    shutil.copyfile(os.path.join(OUTPUT_DIR, 'dashboard_data_tv.json'), os.path.join(OUTPUT_DIR, 'dashboard_data.json'))
+    get_publisher(OUTPUT_DIR).publish_file(
+        os.path.join(OUTPUT_DIR, 'dashboard_data.json'),
+        os.path.join(OUTPUT_DIR, 'dashboard_data_tv.json')
+    )
     print("Pipeline complete.")
 
 if __name__ == "__main__":
     run_pipeline()
+    finish_trace(OUTPUT_DIR)
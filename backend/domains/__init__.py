@@ -9,7 +9,7 @@ Each domain is responsible for:
 - Saving to domain-specific JSON file
 """
 
-from .base import BaseDomain, MetadataDomain, clean_for_json, calculate_rocs, calculate_zscore, rolling_percentile
+from .base import BaseDomain, DomainResult, MetadataDomain, clean_for_json, calculate_rocs, calculate_zscore, rolling_percentile
 from .currencies import CurrenciesDomain
 from .core import SharedDomain, GLIDomain, USSystemDomain, M2Domain
 from .cli import CLIDomain
@@ -22,7 +22,7 @@ from .offshore import OffshoreDomain
 
 __all__ = [
     # Base
-    'BaseDomain', 'MetadataDomain', 'clean_for_json', 'calculate_rocs', 
+    'BaseDomain', 'DomainResult', 'MetadataDomain', 'clean_for_json', 'calculate_rocs', 
     'calculate_zscore', 'rolling_percentile',
     # Core domains
     'SharedDomain', 'GLIDomain', 'USSystemDomain', 'M2Domain',
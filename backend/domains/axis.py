@@ -0,0 +1,189 @@
+"""
+Shared Date Axis
+
+Output convention for calendar axes. Instead of writing the same list of
+8,000+ ISO date strings into every section of an artifact, producers put a
+DateAxis in their output:
+
+    result = {'dates': DateAxis(df.index), ...}
+
+Serialization turns each DateAxis into a reference ``{"$axis": "<id>"}``
+and the artifact gets a single top-level table:
+
+    "axes": {"daily": {"freq": "D", "start": "2002-12-01", "end": "...", "length": 8453}}
+
+Contiguous daily calendars are encoded as start/end/length; anything else
+falls back to an explicit list. DateAxis behaves like a read-only list of ISO
+strings in Python, so in-process consumers keep working unchanged.
+"""
+
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+DEFAULT_AXIS_ID = 'daily'
+AXES_KEY = 'axes'
+AXIS_REF_KEY = '$axis'
+
+
+def encode_date_axis(dates) -> Dict[str, Any]:
+    """
+    Encode a DatetimeIndex or list of ISO dates compactly.
+
+    Contiguous daily calendars (the orchestrator output) are stored as
+    start/end/length; anything else falls back to the explicit list.
+    """
+    if dates is None or len(dates) == 0:
+        return {'freq': None, 'length': 0, 'values': []}
+
+    index = dates if isinstance(dates, pd.DatetimeIndex) else pd.DatetimeIndex(pd.to_datetime(list(dates)))
+    index = index.normalize()
+    span_days = (index[-1] - index[0]).days
+
+    if span_days == len(index) - 1 and index.is_monotonic_increasing and index.is_unique:
+        return {
+            'freq': 'D',
+            'start': index[0].strftime('%Y-%m-%d'),
+            'end': index[-1].strftime('%Y-%m-%d'),
+            'length': len(index),
+        }
+
+    return {'freq': None, 'length': len(index), 'values': index.strftime('%Y-%m-%d').tolist()}
+
+
+def decode_date_axis(axis: Dict[str, Any]) -> List[str]:
+    """Expand an encoded date axis back into a list of ISO dates."""
+    if axis.get('values') is not None:
+        return list(axis['values'])
+    if axis.get('freq') == 'D' and axis.get('length'):
+        start = pd.Timestamp(axis['start'])
+        return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(axis['length'])]
+    return []
+
+
+class DateAxis(Sequence):
+    """
+    Calendar axis reference, serialized once per artifact.
+
+    Acts as a lazy read-only list of 'YYYY-MM-DD' strings; the string list
+    is only materialized if something indexes or iterates it.
+    """
+
+    def __init__(self, index, axis_id: str = DEFAULT_AXIS_ID):
+        if not isinstance(index, pd.DatetimeIndex):
+            index = pd.DatetimeIndex(pd.to_datetime(list(index)))
+        self.index = index
+        self.axis_id = axis_id
+        self._strings: Optional[List[str]] = None
+        self._encoded: Optional[Dict[str, Any]] = None
+
+    def encode(self) -> Dict[str, Any]:
+        if self._encoded is None:
+            self._encoded = encode_date_axis(self.index)
+        return self._encoded
+
+    def to_list(self) -> List[str]:
+        if self._strings is None:
+            self._strings = self.index.strftime('%Y-%m-%d').tolist()
+        return self._strings
+
+    def ref(self) -> Dict[str, str]:
+        return {AXIS_REF_KEY: self.axis_id}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, item):
+        return self.to_list()[item]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DateAxis):
+            return self.encode() == other.encode()
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        enc = self.encode()
+        return f"DateAxis({self.axis_id!r}, start={enc.get('start')}, length={enc['length']})"
+
+
+def collect_axes(obj: Any, axes: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Find every DateAxis in a (raw or partially cleaned) output tree.
+
+    Only dicts/lists are descended, never Series/arrays, and lists are only
+    walked when their first item is a container (value lists are homogeneous),
+    so this stays cheap on already-cleaned output. Raises ValueError if one
+    id is used for two different axes.
+    """
+    if axes is None:
+        axes = {}
+
+    if isinstance(obj, DateAxis):
+        encoded = obj.encode()
+        existing = axes.get(obj.axis_id)
+        if existing is not None and existing != encoded:
+            raise ValueError(f"Axis id {obj.axis_id!r} used for two different date axes")
+        axes[obj.axis_id] = encoded
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            collect_axes(v, axes)
+    elif isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], (dict, list, tuple, DateAxis)):
+            for v in obj:
+                collect_axes(v, axes)
+
+    return axes
+
+
+def attach_axes(raw: Any, clean: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the top-level axes table to a cleaned artifact.
+
+    Existing tables in `clean` (e.g. from a previously loaded legacy file)
+    are kept, entries found in `raw` take precedence.
+    """
+    axes = collect_axes(raw)
+    if axes:
+        merged = dict(clean.get(AXES_KEY) or {})
+        merged.update(axes)
+        clean[AXES_KEY] = merged
+    return clean
+
+
+def json_default(obj: Any) -> Any:
+    """`default=` hook for json.dump on output that is otherwise already clean."""
+    if isinstance(obj, DateAxis):
+        return obj.ref()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def expand_axes(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace {"$axis": id} references with plain date lists.
+
+    Inverse of the serialization convention, for Python consumers that read
+    artifacts back (diagnostic scripts, legacy merge, tests).
+    """
+    table = data.get(AXES_KEY) if isinstance(data, dict) else None
+    if not table:
+        return data
+
+    decoded: Dict[str, List[str]] = {}
+
+    def walk(node: Any) -> Any:
+        if isinstance(node, dict):
+            if len(node) == 1 and AXIS_REF_KEY in node:
+                axis_id = node[AXIS_REF_KEY]
+                if axis_id not in decoded:
+                    decoded[axis_id] = decode_date_axis(table[axis_id])
+                return decoded[axis_id]
+            return {k: walk(v) for k, v in node.items() if k != AXES_KEY}
+        if isinstance(node, list):
+            return [walk(x) if isinstance(x, (dict, list)) else x for x in node]
+        return node
+
+    return walk(data)
@@ -12,10 +12,14 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 import pandas as pd
 import numpy as np
 
+from .axis import DateAxis, attach_axes
+from utils.publisher import get_publisher
+from utils.tracing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,17 +33,26 @@ def clean_for_json(obj: Any) -> Any:
     - np.nan/np.inf -> None
     - np.int64/float64 -> Python native types
     - datetime/date -> ISO string
+    - DateAxis -> {"$axis": id} reference (see domains/axis.py)
     """
     if obj is None:
         return None
     
+    if isinstance(obj, DateAxis):
+        return obj.ref()
+    
     if isinstance(obj, pd.Series):
+        values = obj.to_numpy()
+        if values.dtype.kind in 'fiub':
+            return _clean_numeric_array(values)
         return [clean_for_json(x) for x in obj.tolist()]
     
     if isinstance(obj, pd.DataFrame):
         return {col: clean_for_json(obj[col]) for col in obj.columns}
     
     if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in 'fiub' and obj.ndim == 1:
+            return _clean_numeric_array(obj)
         return [clean_for_json(x) for x in obj.tolist()]
     
     if isinstance(obj, (np.integer, np.int64)):
@@ -67,6 +80,76 @@ def clean_for_json(obj: Any) -> Any:
     return obj
 
 
+def _clean_numeric_array(values: np.ndarray) -> List[Any]:
+    """Vectorized clean_for_json for 1-D numeric arrays (NaN/inf -> None)."""
+    if values.dtype.kind != 'f':
+        return values.tolist()
+    finite = np.isfinite(values)
+    if finite.all():
+        return values.tolist()
+    out = values.astype(object)
+    out[~finite] = None
+    return out.tolist()
+
+
+class DomainResult(dict):
+    """
+    Raw domain output, serialized once at the publishing boundary.
+
+    Domains fill it like a normal dict but keep pd.Series / np.ndarray values
+    as-is instead of calling clean_for_json on each one. Downstream domains
+    (which receive previous results as kwargs) can use the Series directly,
+    and save_json()/save_binary()/save_pyramid() share a single cached
+    serialize() pass.
+
+    Every dict mutator drops the cache. Nested values (Series, sub-dicts)
+    must not be modified in place after serialize(): the cache can't see
+    that, so assign a new value to the top-level key instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serialized: Optional[Dict[str, Any]] = None
+
+    def __setitem__(self, key, value):
+        self._serialized = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._serialized = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._serialized = None
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._serialized = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._serialized = None
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._serialized = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._serialized = None
+        return super().popitem()
+
+    def clear(self):
+        self._serialized = None
+        super().clear()
+
+    def serialize(self) -> Dict[str, Any]:
+        """JSON-ready copy (clean_for_json + shared date axes), computed once."""
+        if self._serialized is None:
+            self._serialized = attach_axes(self, clean_for_json(self))
+        return self._serialized
+
+
 def calculate_rocs(series: pd.Series) -> Dict[str, pd.Series]:
     """
     Calculate Rate of Change for multiple periods.
@@ -155,8 +238,12 @@ class BaseDomain(ABC):
     Optional overrides:
     - validate(): Custom schema validation
     - get_schema(): Return JSON schema for validation
+    - depends_on: Names of domains (or orchestrator context entries) whose
+      results process() reads from kwargs
     """
     
+    depends_on: Tuple[str, ...] = ()
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -178,7 +265,8 @@ class BaseDomain(ABC):
             **kwargs: Additional context (e.g., other domain outputs)
         
         Returns:
-            Dict ready for JSON serialization
+            DomainResult with raw Series/arrays, or a dict already cleaned
+            for JSON (see serialize())
         """
         pass
     
@@ -200,13 +288,27 @@ class BaseDomain(ABC):
         """
         return None
     
-    def save_json(self, data: Dict[str, Any], output_dir: str) -> str:
+    def serialize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert process() output to its JSON-ready form.
+
+        DomainResult caches this, so writing several formats only walks the
+        tree once; plain dicts are cleaned on every call.
+        """
+        with span(f"{self.name}.serialize", cat='serialize'):
+            if isinstance(data, DomainResult):
+                return data.serialize()
+            return attach_axes(data, clean_for_json(data))
+    
+    def save_json(self, data: Dict[str, Any], output_dir: str, deltas: bool = False) -> str:
         """
         Save domain data to JSON file.
         
         Args:
             data: Processed domain data
             output_dir: Directory path for output
+            deltas: Also record the change to the previous file as a
+                versioned delta (see domains/delta.py)
         
         Returns:
             Full path to saved file
@@ -217,19 +319,154 @@ class BaseDomain(ABC):
         
         output_path = os.path.join(domains_dir, self.output_filename)
         
-        # Clean data for JSON serialization
-        clean_data = clean_for_json(data)
+        # Clean data for JSON serialization (date axes written once, top-level)
+        clean_data = self.serialize(data)
         
         # Validate before saving
         self.validate(clean_data)
         
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump(clean_data, f)
+        publisher = get_publisher(output_dir)
+        if deltas:
+            from .delta import read_published, write_domain_delta
+            previous = read_published(output_path, publisher)
+        
+        # Atomic write, skipped if content is unchanged
+        result = publisher.publish_json(output_path, clean_data)
         
-        logger.info(f"Saved {self.name} domain to {output_path}")
+        if deltas:
+            with span(f"{self.name}.delta", cat='serialize'):
+                record = write_domain_delta(previous, clean_data, self.name, domains_dir,
+                                            result.sha256, result.size, publisher=publisher)
+            if record is not None:
+                kind = 'full' if record.get('full') else f"{len(record['tails'])} tails, {len(record['set'])} sets"
+                logger.info(f"{self.name} delta v{record['version']} ({kind})")
+        
+        if result.written:
+            logger.info(f"Saved {self.name} domain to {output_path}")
+        else:
+            logger.info(f"{self.name} domain unchanged, kept {output_path}")
         return output_path
-    
+
+    @property
+    def binary_filename(self) -> str:
+        """Binary blob filename (see domains/binary.py)."""
+        return f"{self.name}.bin"
+
+    @property
+    def manifest_filename(self) -> str:
+        """Manifest filename describing the binary blob."""
+        return f"{self.name}.manifest.json"
+
+    def save_binary(
+        self,
+        data: Dict[str, Any],
+        output_dir: str,
+        dates: Optional[List[str]] = None,
+        dtype: str = 'float64'
+    ) -> str:
+        """
+        Save domain data as a binary blob + JSON manifest.
+
+        Sibling of save_json(): numeric series are written as little-endian
+        Float32/Float64 arrays, everything else stays in the manifest.
+
+        Args:
+            data: Processed domain data
+            output_dir: Directory path for output
+            dates: Shared date axis (defaults to the artifact's 'daily' axis)
+            dtype: 'float32' or 'float64'
+
+        Returns:
+            Full path to saved manifest
+        """
+        from .binary import write_domain_binary
+
+        domains_dir = os.path.join(output_dir, 'domains')
+        os.makedirs(domains_dir, exist_ok=True)
+
+        manifest_path = os.path.join(domains_dir, self.manifest_filename)
+        blob_path = os.path.join(domains_dir, self.binary_filename)
+
+        clean_data = self.serialize(data)
+        self.validate(clean_data)
+
+        manifest = write_domain_binary(
+            clean_data, manifest_path, blob_path, dates=dates, dtype=dtype,
+            publisher=get_publisher(output_dir)
+        )
+
+        logger.info(f"Saved {self.name} binary domain ({len(manifest['series'])} series) to {blob_path}")
+        return manifest_path
+
+    @property
+    def pyramid_filename(self) -> str:
+        """Resolution pyramid manifest filename (see domains/pyramid.py)."""
+        return f"{self.name}.pyramid.json"
+
+    def save_pyramid(
+        self,
+        data: Dict[str, Any],
+        output_dir: str,
+        dates: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Save weekly/monthly/LTTB versions of the domain series + a manifest.
+
+        The daily level is the regular save_json() file.
+
+        Args:
+            data: Processed domain data
+            output_dir: Directory path for output
+            dates: Shared date axis (defaults to the artifact's 'daily' axis)
+
+        Returns:
+            Full path to saved manifest, or None if the domain has no daily series
+        """
+        from .pyramid import write_domain_pyramid
+
+        domains_dir = os.path.join(output_dir, 'domains')
+        os.makedirs(domains_dir, exist_ok=True)
+
+        clean_data = self.serialize(data)
+        self.validate(clean_data)
+
+        manifest = write_domain_pyramid(
+            clean_data, self.name, domains_dir, dates=dates,
+            publisher=get_publisher(output_dir)
+        )
+        if manifest is None:
+            logger.info(f"{self.name} has no daily series, no pyramid written")
+            return None
+
+        manifest_path = os.path.join(domains_dir, self.pyramid_filename)
+        logger.info(f"Saved {self.name} resolution pyramid ({len(manifest['levels'])} levels) to {manifest_path}")
+        return manifest_path
+
+    def save_to_db(
+        self,
+        data: Dict[str, Any],
+        adapter,
+        dates: Optional[List[str]] = None,
+        state=None
+    ) -> Dict[str, int]:
+        """
+        Upsert new and revised rows of this domain (see domains/sync.py).
+
+        Args:
+            data: Processed domain data
+            adapter: SupabaseAdapter (or compatible)
+            dates: Shared date axis (defaults to the artifact's 'daily' axis)
+            state: SyncState with locally cached row hashes
+
+        Returns:
+            Rows upserted per table
+        """
+        from .sync import sync_domain
+
+        clean_data = self.serialize(data)
+        self.validate(clean_data)
+        return sync_domain(self.name, clean_data, adapter, dates=dates, state=state)
+
     def load_json(self, output_dir: str) -> Optional[Dict[str, Any]]:
         """
         Load domain data from JSON file.
@@ -261,7 +498,7 @@ class MetadataDomain(BaseDomain):
     def process(self, df: pd.DataFrame, **kwargs) -> Dict[str, Any]:
         """Generate metadata with dates and series info."""
         return {
-            'dates': df.index.strftime('%Y-%m-%d').tolist(),
+            'dates': DateAxis(df.index),
             'last_dates': {
                 col: get_safe_last_date(df[col]) 
                 for col in df.columns
@@ -0,0 +1,187 @@
+"""
+Binary Domain Format
+
+Alternative output format for domain files. Every numeric time series in a
+domain output is written as a little-endian Float32/Float64 blob into a
+single ``<domain>.bin`` file, and a small ``<domain>.manifest.json`` describes:
+
+- the shared date axes (see domains/axis.py)
+- the offset, length and dtype of every series inside the blob
+- the remaining (non-series) JSON structure, with series replaced by
+  ``{"$series": <index>}`` placeholders
+
+Missing values (None/NaN/inf) are stored as NaN. Offsets are aligned to
+8 bytes so the frontend can map each series directly into a typed array.
+"""
+
+import os
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from .axis import DateAxis, AXES_KEY, DEFAULT_AXIS_ID
+from utils.publisher import get_publisher
+
+FORMAT_NAME = 'domain-binary'
+FORMAT_VERSION = 1
+
+# Series shorter than this are kept inline in the manifest (config arrays,
+# small lookup tables, etc.) when no date axis is available for matching.
+MIN_SERIES_LENGTH = 32
+
+SUPPORTED_DTYPES = {
+    'float32': '<f4',
+    'float64': '<f8',
+}
+
+_ALIGNMENT = 8
+
+
+def _is_numeric_list(value: Any) -> bool:
+    """True for lists whose items are all numbers or None (at least one number)."""
+    if not isinstance(value, list) or not value:
+        return False
+    has_number = False
+    for x in value:
+        if x is None:
+            continue
+        if isinstance(x, bool) or not isinstance(x, (int, float)):
+            return False
+        has_number = True
+    return has_number
+
+
+def _is_series(value: Any, axis_length: Optional[int]) -> bool:
+    if not _is_numeric_list(value):
+        return False
+    if axis_length:
+        return len(value) == axis_length
+    return len(value) >= MIN_SERIES_LENGTH
+
+
+def encode_domain(
+    data: Dict[str, Any],
+    dates: Optional[List[str]] = None,
+    dtype: str = 'float64'
+) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Split JSON-clean domain data into a manifest and a binary blob.
+
+    Args:
+        data: Domain output, already passed through clean_for_json
+        dates: Shared date axis (DateAxis or list of ISO dates); defaults to
+            the 'daily' entry of data['axes'] if present
+        dtype: 'float32' or 'float64'
+
+    Returns:
+        (manifest dict, blob bytes)
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {list(SUPPORTED_DTYPES)}")
+
+    axes = dict(data.get(AXES_KEY) or {})
+    if dates is not None and not isinstance(dates, DateAxis):
+        dates = DateAxis(dates)
+    if dates is not None:
+        axes.setdefault(dates.axis_id, dates.encode())
+
+    if dates is not None:
+        axis_length = len(dates)
+    elif DEFAULT_AXIS_ID in axes:
+        axis_length = axes[DEFAULT_AXIS_ID]['length']
+    else:
+        axis_length = None
+
+    np_dtype = np.dtype(SUPPORTED_DTYPES[dtype])
+    chunks: List[bytes] = []
+    series_index: List[Dict[str, Any]] = []
+    offset = 0
+
+    def walk(node: Any, path: List[str]) -> Any:
+        nonlocal offset
+        if isinstance(node, dict):
+            return {k: walk(v, path + [str(k)]) for k, v in node.items()}
+        if _is_series(node, axis_length):
+            arr = np.array([np.nan if x is None else x for x in node], dtype=np_dtype)
+            raw = arr.tobytes()
+            padding = (-len(raw)) % _ALIGNMENT
+            chunks.append(raw + b'\x00' * padding)
+            series_index.append({
+                'path': path,
+                'offset': offset,
+                'length': len(arr),
+                'dtype': dtype,
+            })
+            offset += len(raw) + padding
+            return {'$series': len(series_index) - 1}
+        if isinstance(node, list):
+            return [walk(x, path + [str(i)]) for i, x in enumerate(node)]
+        return node
+
+    tree = walk(data, [])
+
+    manifest = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'byte_order': 'little',
+        'axes': axes,
+        'series': series_index,
+        'byte_length': offset,
+        'data': tree,
+    }
+    return manifest, b''.join(chunks)
+
+
+def decode_domain(manifest: Dict[str, Any], blob: bytes) -> Dict[str, Any]:
+    """
+    Rebuild the JSON-style domain dict (lists with None for NaN).
+
+    Inverse of encode_domain; used by Python consumers and tests. Axis
+    references are left in place (see domains.axis.expand_axes).
+    """
+    if manifest.get('format') != FORMAT_NAME:
+        raise ValueError(f"Not a {FORMAT_NAME} manifest")
+
+    def read_series(idx: int) -> List[Optional[float]]:
+        entry = manifest['series'][idx]
+        np_dtype = np.dtype(SUPPORTED_DTYPES[entry['dtype']])
+        arr = np.frombuffer(blob, dtype=np_dtype, count=entry['length'], offset=entry['offset'])
+        values = arr.astype(float)
+        return [None if not np.isfinite(x) else float(x) for x in values.tolist()]
+
+    def walk(node: Any) -> Any:
+        if isinstance(node, dict):
+            if '$series' in node and len(node) == 1:
+                return read_series(node['$series'])
+            return {k: walk(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [walk(x) for x in node]
+        return node
+
+    return walk(manifest['data'])
+
+
+def write_domain_binary(
+    data: Dict[str, Any],
+    manifest_path: str,
+    blob_path: str,
+    dates: Optional[List[str]] = None,
+    dtype: str = 'float64',
+    publisher=None
+) -> Dict[str, Any]:
+    """
+    Encode domain data and write the manifest/blob pair. Returns the manifest.
+
+    The blob is published before the manifest so a reader never sees a
+    manifest pointing at a blob it doesn't describe.
+    """
+    manifest, blob = encode_domain(data, dates=dates, dtype=dtype)
+
+    manifest['blob'] = os.path.basename(blob_path)
+
+    if publisher is None:
+        publisher = get_publisher(os.path.dirname(os.path.abspath(manifest_path)))
+    publisher.publish_bytes(blob_path, blob)
+    publisher.publish_json(manifest_path, manifest)
+
+    return manifest
@@ -16,7 +16,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
 
-from ..base import BaseDomain, clean_for_json, calculate_rocs, rolling_percentile
+from ..base import BaseDomain, DomainResult, calculate_rocs, rolling_percentile
+from ..axis import DateAxis
 
 
 class SharedDomain(BaseDomain):
@@ -46,7 +47,7 @@ class SharedDomain(BaseDomain):
         # NOTE: We trust the input DataFrame to have the correct date range.
         # Date alignment is now handled by the frontend loader if needed.
         result = {
-            'dates': df.index.strftime('%Y-%m-%d').tolist(),
+            'dates': DateAxis(df.index),
             'metadata': {
                 'data_start': df.index.min().strftime('%Y-%m-%d'),
                 'data_end': df.index.max().strftime('%Y-%m-%d'),
@@ -58,8 +59,8 @@ class SharedDomain(BaseDomain):
         if 'BTC' in df.columns:
             btc = df['BTC'].ffill()
             result['btc'] = {
-                'price': clean_for_json(btc),
-                'rocs': {k: clean_for_json(v) for k, v in calculate_rocs(btc).items()}
+                'price': btc,
+                'rocs': calculate_rocs(btc)
             }
         
         # Central Bank balance sheets in USD (referenced by GLI, US System, M2)
@@ -74,9 +75,9 @@ class SharedDomain(BaseDomain):
         result['central_banks'] = {}
         for col, name in cb_cols:
             if col in df.columns:
-                result['central_banks'][name] = clean_for_json(df[col].ffill())
+                result['central_banks'][name] = df[col].ffill()
         
-        return result
+        return DomainResult(result)
 
 
 class GLIDomain(BaseDomain):
@@ -144,12 +145,12 @@ class GLIDomain(BaseDomain):
         # Inject GLI_TOTAL back into main DF for downstream domains (e.g. MacroRegime)
         df['GLI_TOTAL'] = gli_total
         
-        result['total'] = clean_for_json(gli_total)
-        result['constant_fx'] = clean_for_json(self._calc_constant_fx_gli(df))
+        result['total'] = gli_total
+        result['constant_fx'] = self._calc_constant_fx_gli(df)
         result['cb_count'] = active_cbs
         
         # ROCs
-        result['rocs'] = {k: clean_for_json(v) for k, v in calculate_rocs(gli_total).items()}
+        result['rocs'] = calculate_rocs(gli_total)
         
         # Bank-level ROCs and impacts
         result['bank_rocs'] = {}
@@ -173,14 +174,14 @@ class GLIDomain(BaseDomain):
                     impacts[f'impact_{period}'] = impact
                 
                 result['bank_rocs'][bank_name] = {
-                    **{k: clean_for_json(v) for k, v in rocs.items()},
-                    **{k: clean_for_json(v) for k, v in impacts.items()}
+                    **rocs,
+                    **impacts
                 }
                 
                 # Weight
                 result['weights'][bank_name] = float(series.iloc[-1] / latest_gli * 100)
         
-        return result
+        return DomainResult(result)
 
 
 class USSystemDomain(BaseDomain):
@@ -226,30 +227,30 @@ class USSystemDomain(BaseDomain):
         # Net Liquidity = Fed - TGA - RRP
         net_liquidity = fed_usd - tga_usd - rrp_usd
         
-        result['net_liquidity'] = clean_for_json(net_liquidity)
-        result['rrp'] = clean_for_json(rrp_usd)
-        result['tga'] = clean_for_json(tga_usd)
-        result['bank_reserves'] = clean_for_json(reserves)
+        result['net_liquidity'] = net_liquidity
+        result['rrp'] = rrp_usd
+        result['tga'] = tga_usd
+        result['bank_reserves'] = reserves
         
         # ROCs
-        result['net_liq_rocs'] = {k: clean_for_json(v) for k, v in calculate_rocs(net_liquidity).items()}
+        result['net_liq_rocs'] = calculate_rocs(net_liquidity)
         
         # System metrics
         result['metrics'] = {
             # RRP drain rate and weeks to empty
-            'rrp_drain_weekly': clean_for_json((rrp_usd - rrp_usd.shift(5)).rolling(4).mean()),
-            'rrp_weeks_to_empty': clean_for_json(rrp_usd / ((rrp_usd - rrp_usd.shift(5)).rolling(4).mean().abs() + 0.001)),
+            'rrp_drain_weekly': (rrp_usd - rrp_usd.shift(5)).rolling(4).mean(),
+            'rrp_weeks_to_empty': rrp_usd / ((rrp_usd - rrp_usd.shift(5)).rolling(4).mean().abs() + 0.001),
             # TGA Z-score
-            'tga_zscore': clean_for_json(self._calc_zscore(tga_usd, 252)),
+            'tga_zscore': self._calc_zscore(tga_usd, 252),
             # Fed momentum
-            'fed_momentum': clean_for_json(fed_usd.ewm(span=60).mean() - fed_usd.ewm(span=130).mean()),
+            'fed_momentum': fed_usd.ewm(span=60).mean() - fed_usd.ewm(span=130).mean(),
             # Absolute deltas
-            'rrp_delta_4w': clean_for_json(rrp_usd - rrp_usd.shift(20)),
-            'rrp_delta_13w': clean_for_json(rrp_usd - rrp_usd.shift(65)),
-            'tga_delta_4w': clean_for_json(tga_usd - tga_usd.shift(20)),
-            'tga_delta_13w': clean_for_json(tga_usd - tga_usd.shift(65)),
-            'netliq_delta_4w': clean_for_json(net_liquidity - net_liquidity.shift(20)),
-            'netliq_delta_13w': clean_for_json(net_liquidity - net_liquidity.shift(65)),
+            'rrp_delta_4w': rrp_usd - rrp_usd.shift(20),
+            'rrp_delta_13w': rrp_usd - rrp_usd.shift(65),
+            'tga_delta_4w': tga_usd - tga_usd.shift(20),
+            'tga_delta_13w': tga_usd - tga_usd.shift(65),
+            'netliq_delta_4w': net_liquidity - net_liquidity.shift(20),
+            'netliq_delta_13w': net_liquidity - net_liquidity.shift(65),
         }
         
         # Repo operations (if available)
@@ -257,10 +258,10 @@ class USSystemDomain(BaseDomain):
             srf = df['SRF_USAGE'].ffill()
             net_repo = srf - rrp_usd
             result['repo_operations'] = {
-                'srf_usage': clean_for_json(srf),
-                'rrp_usage': clean_for_json(rrp_usd),
-                'net_repo': clean_for_json(net_repo),
-                'net_repo_zscore': clean_for_json(self._calc_zscore(net_repo, 252)),
+                'srf_usage': srf,
+                'rrp_usage': rrp_usd,
+                'net_repo': net_repo,
+                'net_repo_zscore': self._calc_zscore(net_repo, 252),
             }
             
         # Repo Stress (SOFR - IORB Spread)
@@ -274,13 +275,13 @@ class USSystemDomain(BaseDomain):
         srf_usage = df['SRF_USAGE'].ffill() if 'SRF_USAGE' in df.columns else pd.Series(0.0, index=df.index)
 
         result['repo_stress'] = {
-            'total': clean_for_json(repo_spread), # Main spread value
-            'sofr': clean_for_json(sofr),
-            'iorb': clean_for_json(iorb),
-            'srf_rate': clean_for_json(srf_rate),
-            'rrp_award': clean_for_json(rrp_award),
-            'srf_usage': clean_for_json(srf_usage),  # Added per user request/frontend need
-            'z_score': clean_for_json(self._calc_zscore(repo_spread, 252))
+            'total': repo_spread, # Main spread value
+            'sofr': sofr,
+            'iorb': iorb,
+            'srf_rate': srf_rate,
+            'rrp_award': rrp_award,
+            'srf_usage': srf_usage,  # Added per user request/frontend need
+            'z_score': self._calc_zscore(repo_spread, 252)
         }
 
         # --- PHASE 2: SIGNAL MIGRATION ---
@@ -306,21 +307,21 @@ class USSystemDomain(BaseDomain):
         if 'ST_LOUIS_STRESS' in df.columns:
             stlfsi = df['ST_LOUIS_STRESS'].ffill()
             result['st_louis_stress'] = {
-                'total': clean_for_json(stlfsi),
-                'z_score': clean_for_json(self._calc_zscore(stlfsi, 1260)), # 5yr window
-                'percentile': clean_for_json(rolling_percentile(stlfsi, min_periods=100, expanding=True))
+                'total': stlfsi,
+                'z_score': self._calc_zscore(stlfsi, 1260), # 5yr window
+                'percentile': rolling_percentile(stlfsi, min_periods=100, expanding=True)
             }
             
         # Kansas City Financial Stress Index (KANSAS_CITY_STRESS)
         if 'KANSAS_CITY_STRESS' in df.columns:
             kcfsi = df['KANSAS_CITY_STRESS'].ffill()
             result['kansas_city_stress'] = {
-                'total': clean_for_json(kcfsi),
-                'z_score': clean_for_json(self._calc_zscore(kcfsi, 1260)), # 5yr window
-                'percentile': clean_for_json(rolling_percentile(kcfsi, min_periods=100, expanding=True))
+                'total': kcfsi,
+                'z_score': self._calc_zscore(kcfsi, 1260), # 5yr window
+                'percentile': rolling_percentile(kcfsi, min_periods=100, expanding=True)
             }
         
-        return result
+        return DomainResult(result)
 
     def _calc_repo_stress(self, cols: Dict[str, pd.Series]) -> Dict[str, Any]:
         """
@@ -413,13 +414,13 @@ class M2Domain(BaseDomain):
                 else:
                     m2_usd = m2_local
                 
-                result['economies'][name] = clean_for_json(m2_usd)
+                result['economies'][name] = m2_usd
                 if name == 'gb':
                     result['economies']['uk'] = result['economies']['gb']
                 m2_total += m2_usd.fillna(0)
         
-        result['total'] = clean_for_json(m2_total)
-        result['rocs'] = {k: clean_for_json(v) for k, v in calculate_rocs(m2_total).items()}
+        result['total'] = m2_total
+        result['rocs'] = calculate_rocs(m2_total)
         
         # Economy-level ROCs and weights
         result['economy_rocs'] = {}
@@ -427,11 +428,10 @@ class M2Domain(BaseDomain):
         
         latest_m2 = m2_total.iloc[-1] if m2_total.iloc[-1] > 0 else 1.0
         
-        for name, series_data in result['economies'].items():
-            if series_data:
-                series = pd.Series(series_data, index=df.index)
+        for name, series in result['economies'].items():
+            if not series.empty:
                 rocs = calculate_rocs(series)
-                result['economy_rocs'][name] = {k: clean_for_json(v) for k, v in rocs.items()}
+                result['economy_rocs'][name] = rocs
                 last_val = series.iloc[-1] if not pd.isna(series.iloc[-1]) else 0
                 result['weights'][name] = float(last_val / latest_m2 * 100)
         
@@ -441,4 +441,4 @@ class M2Domain(BaseDomain):
             result['economy_rocs']['uk'] = result['economy_rocs']['gb']
             result['weights']['uk'] = result['weights']['gb']
         
-        return result
+        return DomainResult(result)
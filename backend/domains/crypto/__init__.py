@@ -11,7 +11,6 @@ Contains:
 import numpy as np
 import pandas as pd
 from typing import Dict, Any
-from scipy.stats import norm
 
 from ..base import BaseDomain, clean_for_json, calculate_rocs
 
@@ -25,6 +24,8 @@ class CryptoDomain(BaseDomain):
     - stablecoins.total: Total stablecoin supply
     """
     
+    depends_on = ('stablecoins',)
+    
     @property
     def name(self) -> str:
         return "crypto"
@@ -73,6 +74,7 @@ class CryptoDomain(BaseDomain):
         mu = rs_90_clean.expanding(min_periods=90).mean()
         sd = rs_90_clean.expanding(min_periods=90).std().replace(0, np.nan)
         z_rs_90 = (rs_90_clean - mu) / sd
+        from scipy.stats import norm  # scipy is slow to import; only needed here
         cai_raw = pd.Series(norm.cdf(z_rs_90) * 100, index=df.index)
         cai = cai_raw.rolling(7, min_periods=1).mean()
         
@@ -12,7 +12,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
-from ..base import BaseDomain, clean_for_json
+from ..base import BaseDomain, DomainResult
+from ..axis import DateAxis
 
 
 class CurrenciesDomain(BaseDomain):
@@ -67,7 +68,7 @@ class CurrenciesDomain(BaseDomain):
             Dict with dxy, pairs, btc sections
         """
         result = {
-            'dates': df.index.strftime('%Y-%m-%d').tolist(),
+            'dates': DateAxis(df.index),
             'dxy': {},
             'pairs': {},
             'btc': {}
@@ -78,25 +79,25 @@ class CurrenciesDomain(BaseDomain):
             dxy = df['DXY'].ffill()
             
             result['dxy'] = {
-                'absolute': clean_for_json(dxy),
+                'absolute': dxy,
                 # ROC Metrics
-                'roc_7d': clean_for_json(self._calc_roc(dxy, 7)),
-                'roc_30d': clean_for_json(self._calc_roc(dxy, 30)),
-                'roc_90d': clean_for_json(self._calc_roc(dxy, 90)),
-                'roc_180d': clean_for_json(self._calc_roc(dxy, 180)),
-                'roc_yoy': clean_for_json(self._calc_roc(dxy, 365)),
+                'roc_7d': self._calc_roc(dxy, 7),
+                'roc_30d': self._calc_roc(dxy, 30),
+                'roc_90d': self._calc_roc(dxy, 90),
+                'roc_180d': self._calc_roc(dxy, 180),
+                'roc_yoy': self._calc_roc(dxy, 365),
                 # Z-Scores for ROCs
-                'roc_7d_z': clean_for_json(self._calc_zscore(self._calc_roc(dxy, 7), 252)),
-                'roc_30d_z': clean_for_json(self._calc_zscore(self._calc_roc(dxy, 30), 252)),
-                'roc_90d_z': clean_for_json(self._calc_zscore(self._calc_roc(dxy, 90), 252)),
-                'roc_180d_z': clean_for_json(self._calc_zscore(self._calc_roc(dxy, 180), 252)),
+                'roc_7d_z': self._calc_zscore(self._calc_roc(dxy, 7), 252),
+                'roc_30d_z': self._calc_zscore(self._calc_roc(dxy, 30), 252),
+                'roc_90d_z': self._calc_zscore(self._calc_roc(dxy, 90), 252),
+                'roc_180d_z': self._calc_zscore(self._calc_roc(dxy, 180), 252),
                 # Percentiles for ROCs
-                'roc_7d_pct': clean_for_json(self._calc_percentile(self._calc_roc(dxy, 7), 252)),
-                'roc_30d_pct': clean_for_json(self._calc_percentile(self._calc_roc(dxy, 30), 252)),
-                'roc_90d_pct': clean_for_json(self._calc_percentile(self._calc_roc(dxy, 90), 252)),
-                'roc_180d_pct': clean_for_json(self._calc_percentile(self._calc_roc(dxy, 180), 252)),
+                'roc_7d_pct': self._calc_percentile(self._calc_roc(dxy, 7), 252),
+                'roc_30d_pct': self._calc_percentile(self._calc_roc(dxy, 30), 252),
+                'roc_90d_pct': self._calc_percentile(self._calc_roc(dxy, 90), 252),
+                'roc_180d_pct': self._calc_percentile(self._calc_roc(dxy, 180), 252),
                 # Volatility
-                'volatility': clean_for_json(self._calc_volatility(dxy, 21))
+                'volatility': self._calc_volatility(dxy, 21)
             }
         
         # 2. Process Major Pairs
@@ -114,27 +115,27 @@ class CurrenciesDomain(BaseDomain):
             if col in df.columns:
                 pair_series = df[col].ffill()
                 result['pairs'][name] = {
-                    'absolute': clean_for_json(pair_series),
-                    'roc_7d': clean_for_json(self._calc_roc(pair_series, 7)),
-                    'roc_30d': clean_for_json(self._calc_roc(pair_series, 30)),
-                    'roc_90d': clean_for_json(self._calc_roc(pair_series, 90)),
-                    'roc_180d': clean_for_json(self._calc_roc(pair_series, 180)),
-                    'roc_yoy': clean_for_json(self._calc_roc(pair_series, 365)),
+                    'absolute': pair_series,
+                    'roc_7d': self._calc_roc(pair_series, 7),
+                    'roc_30d': self._calc_roc(pair_series, 30),
+                    'roc_90d': self._calc_roc(pair_series, 90),
+                    'roc_180d': self._calc_roc(pair_series, 180),
+                    'roc_yoy': self._calc_roc(pair_series, 365),
                 }
         
         # 3. Process Bitcoin for overlay
         if 'BTC' in df.columns:
             btc = df['BTC'].ffill()
             result['btc'] = {
-                'absolute': clean_for_json(btc),
-                'roc_7d': clean_for_json(self._calc_roc(btc, 7)),
-                'roc_30d': clean_for_json(self._calc_roc(btc, 30)),
-                'roc_90d': clean_for_json(self._calc_roc(btc, 90)),
-                'roc_180d': clean_for_json(self._calc_roc(btc, 180)),
-                'roc_yoy': clean_for_json(self._calc_roc(btc, 365)),
+                'absolute': btc,
+                'roc_7d': self._calc_roc(btc, 7),
+                'roc_30d': self._calc_roc(btc, 30),
+                'roc_90d': self._calc_roc(btc, 90),
+                'roc_180d': self._calc_roc(btc, 180),
+                'roc_yoy': self._calc_roc(btc, 365),
             }
         
-        return result
+        return DomainResult(result)
     
     def validate(self, data: Dict[str, Any]) -> bool:
         """Validate currencies output."""
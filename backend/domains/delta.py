@@ -0,0 +1,250 @@
+"""
+Domain Delta Records
+
+Between two runs most of a domain file stays the same: a refresh appends a
+few dates and revises the tail of some series. With the 'delta' output
+format, publishing ``<domain>.json`` also writes
+
+- ``deltas/<domain>.<version>.json``: how to turn version - 1 into version
+- ``<domain>.versions.json``: the current version, the sha256 of the
+  current domain file and the last MAX_DELTAS delta records
+
+so a client holding version v fetches the (usually few hundred byte)
+deltas v+1..current instead of the whole file.
+
+A delta record:
+
+    {"domain": "gli", "version": 8, "base_version": 7,
+     "sha256": "...", "base_sha256": "...",
+     "tails":  [[path, from, values], ...],    # list = list[:from] + values
+     "set":    [[path, value], ...],           # changed/added nodes
+     "remove": [path, ...]}                    # deleted dict keys
+
+Paths are lists of dict keys (str) and list indices (int) into the JSON as
+written, i.e. with ``{"$axis": id}`` references and the ``axes`` table.
+Every operation sets absolute values, so re-applying a delta to data that
+already contains it changes nothing: a client that reads the index before
+the domain file can never end up behind. A delta that would be larger than
+DELTA_MAX_RATIO of the file is written as ``{"full": true, ...}`` without
+operations; clients then reload the file.
+
+Versions only increase. If the file on disk no longer matches the index
+(e.g. written by a run without the delta format), the next version is a
+full record.
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.publisher import get_publisher, sha256_bytes
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = 'domain-delta'
+FORMAT_VERSION = 1
+
+DELTA_SUBDIR = 'deltas'
+
+# Delta records kept in the index (older files are removed)
+MAX_DELTAS = 50
+
+# Deltas larger than this fraction of the domain file become full records
+DELTA_MAX_RATIO = 0.5
+
+# Last published (sha256, data) per domain file, so a long-running process
+# doesn't re-read and re-parse the previous version from disk
+_published: Dict[str, Tuple[str, Any]] = {}
+
+
+# ============================================================
+# DIFF / APPLY
+# ============================================================
+
+def _is_scalar_list(value: Any) -> bool:
+    return isinstance(value, list) and not any(isinstance(x, (dict, list)) for x in value)
+
+
+def _first_difference(old: list, new: list) -> int:
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b or type(a) is not type(b):
+            return i
+    return min(len(old), len(new))
+
+
+def diff_tree(old: Any, new: Any) -> Dict[str, list]:
+    """
+    Operations turning `old` into `new` (see module docstring).
+
+    Scalar lists (series, date lists) become tail patches from their first
+    changed index; lists of containers are diffed per item when the length
+    is unchanged and replaced otherwise.
+    """
+    ops: Dict[str, list] = {'tails': [], 'set': [], 'remove': []}
+
+    def walk(a: Any, b: Any, path: List[Any]) -> None:
+        if isinstance(a, dict) and isinstance(b, dict):
+            for key, value in b.items():
+                if key in a:
+                    walk(a[key], value, path + [key])
+                else:
+                    ops['set'].append([path + [key], value])
+            ops['remove'].extend(path + [key] for key in a if key not in b)
+        elif type(a) is type(b) and a == b:
+            return
+        elif _is_scalar_list(a) and _is_scalar_list(b) and path:
+            start = _first_difference(a, b)
+            ops['tails'].append([path, start, b[start:]])
+        elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b) and path:
+            for i, (x, y) in enumerate(zip(a, b)):
+                walk(x, y, path + [i])
+        elif not path:
+            raise ValueError("Domain data must be a dict")
+        else:
+            ops['set'].append([path, b])
+
+    walk(old, new, [])
+    return ops
+
+
+def _parent(data: Any, path: List[Any]) -> Any:
+    node = data
+    for key in path[:-1]:
+        node = node[key]
+    return node
+
+
+def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a (non-full) delta record to domain data in place. Returns data."""
+    if delta.get('full'):
+        raise ValueError(f"Delta {delta.get('version')} of {delta.get('domain')} is a full record")
+    for path, start, values in delta['tails']:
+        parent = _parent(data, path)
+        parent[path[-1]] = parent[path[-1]][:start] + values
+    for path, value in delta['set']:
+        _parent(data, path)[path[-1]] = value
+    for path in delta['remove']:
+        _parent(data, path).pop(path[-1], None)
+    return data
+
+
+# ============================================================
+# OUTPUT
+# ============================================================
+
+def versions_filename(domain_name: str) -> str:
+    return f'{domain_name}.versions.json'
+
+
+def load_versions(domains_dir: str, domain_name: str) -> Dict[str, Any]:
+    """The domain's version index (``current`` is 0 if none was written yet)."""
+    path = os.path.join(domains_dir, versions_filename(domain_name))
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable version index {path}: {e}")
+    return {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'domain': domain_name,
+            'current': 0, 'sha256': None, 'deltas': []}
+
+
+def read_published(path: str, publisher=None) -> Optional[Tuple[str, Any]]:
+    """
+    (sha256, data) of a published domain file.
+
+    Served from memory if this process published the current version
+    (checked against the publisher manifest), otherwise read from disk.
+    """
+    cached = _published.get(os.path.abspath(path))
+    if cached is not None:
+        if publisher is None:
+            publisher = get_publisher(os.path.dirname(os.path.dirname(os.path.abspath(path))))
+        entry = publisher.entry(path)
+        if entry is not None and entry.get('sha256') == cached[0]:
+            return cached
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        raw = f.read()
+    try:
+        return sha256_bytes(raw), json.loads(raw)
+    except ValueError:
+        return None
+
+
+def write_domain_delta(
+    previous: Optional[Tuple[str, Any]],
+    data: Dict[str, Any],
+    domain_name: str,
+    domains_dir: str,
+    sha256: str,
+    size: int,
+    publisher=None
+) -> Optional[Dict[str, Any]]:
+    """
+    Record the step from `previous` to the just published `data`.
+
+    Call after ``<domain>.json`` was published (it must be on disk before
+    the index points at its version).
+
+    Args:
+        previous: (sha256, data) of the file before publishing (read_published)
+        data: JSON-clean domain data as published
+        domain_name: Domain name
+        domains_dir: Directory holding the domain files
+        sha256: Hash of the published file
+        size: Size of the published file in bytes
+
+    Returns:
+        The delta record, or None if the content did not change
+    """
+    if publisher is None:
+        publisher = get_publisher(os.path.dirname(os.path.abspath(domains_dir)))
+    _published[os.path.abspath(os.path.join(domains_dir, f'{domain_name}.json'))] = (sha256, data)
+
+    index = load_versions(domains_dir, domain_name)
+    # Unchanged, unless someone else rewrote the file in between
+    if index.get('sha256') == sha256 and (previous is None or previous[0] == sha256):
+        return None
+
+    base_version = index.get('current', 0)
+    record: Dict[str, Any] = {
+        'domain': domain_name,
+        'version': base_version + 1,
+        'base_version': base_version,
+        'sha256': sha256,
+        'base_sha256': index.get('sha256'),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+    if previous is not None and previous[0] == index.get('sha256'):
+        ops = diff_tree(previous[1], data)
+        if len(json.dumps(ops, separators=(',', ':'))) <= DELTA_MAX_RATIO * size:
+            record.update(ops)
+    if 'tails' not in record:
+        record['full'] = True
+
+    entries = list(index.get('deltas') or [])
+    if base_version > 0:
+        filename = f'{DELTA_SUBDIR}/{domain_name}.{record["version"]}.json'
+        result = publisher.publish_json(os.path.join(domains_dir, filename), record, separators=(',', ':'))
+        entries.append({
+            'version': record['version'],
+            'file': filename,
+            'bytes': result.size,
+            'full': bool(record.get('full')),
+        })
+    for entry in entries[:-MAX_DELTAS]:
+        publisher.remove(os.path.join(domains_dir, entry['file']))
+
+    index.update({
+        'current': record['version'],
+        'sha256': sha256,
+        'updated_at': record['created_at'],
+        'deltas': entries[-MAX_DELTAS:],
+    })
+    publisher.publish_json(os.path.join(domains_dir, versions_filename(domain_name)), index, indent=2)
+    return record
@@ -12,7 +12,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any
 
-from ..base import BaseDomain, clean_for_json
+from ..base import BaseDomain, DomainResult
 from analytics.regime_v2 import (
     calculate_macro_regime_v2a, 
     calculate_macro_regime_v2b, 
@@ -48,36 +48,27 @@ class MacroRegimeDomain(BaseDomain):
         v2b_data = calculate_macro_regime_v2b(df)
         stress_historical = calculate_stress_historical(df)
         
-        # Clean for JSON
-        v2a_clean = {k: clean_for_json(v) for k, v in v2a_data.items()}
-        v2b_clean = {k: clean_for_json(v) for k, v in v2b_data.items()}
-        stress_clean = {k: clean_for_json(v) for k, v in stress_historical.items()}
-        
-        # Combine into result
+        # Combine into result (raw Series, serialized once on save)
         # CRITICAL FIX: Ensure all output series are reindexed to df.index to match Shared Dates (16k)
         # This prevents 8k vs 16k mismatch which breaks frontend charts
         def align_to_df(data_dict, index):
-            aligned = {}
-            for k, v in data_dict.items():
-                if isinstance(v, pd.Series):
-                    # Reindex and clean
-                    aligned[k] = clean_for_json(v.reindex(index))
-                else:
-                    aligned[k] = clean_for_json(v)
-            return aligned
+            return {
+                k: v.reindex(index) if isinstance(v, pd.Series) else v
+                for k, v in data_dict.items()
+            }
 
-        result = {
+        result = DomainResult({
             'v2a': align_to_df(v2a_data, df.index),
             'v2b': align_to_df(v2b_data, df.index),
             'stress_historical': align_to_df(stress_historical, df.index),
             # CLI data for comparison chart
-            'cli_v1': clean_for_json(df.get('CLI', pd.Series(0, index=df.index)).reindex(df.index)),
-            'cli_v2': clean_for_json(cli_v2_df['CLI_V2'].reindex(df.index)),
+            'cli_v1': df.get('CLI', pd.Series(0, index=df.index)).reindex(df.index),
+            'cli_v2': cli_v2_df['CLI_V2'].reindex(df.index),
             # Top-level legacy aliases for compatibility
-            'score': clean_for_json(v2a_data.get('score', pd.Series(dtype=float)).reindex(df.index)),
-            'regime_code': clean_for_json(v2a_data.get('regime_code', pd.Series(dtype=float)).reindex(df.index)),
-            'total_z': clean_for_json(v2a_data.get('total_z', pd.Series(dtype=float)).reindex(df.index)),
-        }
+            'score': v2a_data.get('score', pd.Series(dtype=float)).reindex(df.index),
+            'regime_code': v2a_data.get('regime_code', pd.Series(dtype=float)).reindex(df.index),
+            'total_z': v2a_data.get('total_z', pd.Series(dtype=float)).reindex(df.index),
+        })
 
         print(f"DEBUG [MacroRegime]: v2a output length: {len(result['score'])} vs DF index: {len(df.index)}")
         if len(result['score']) != len(df.index):
@@ -86,32 +77,21 @@ class MacroRegimeDomain(BaseDomain):
         # Add diagnostic fields from v2a to top level if needed
         for k in ['liquidity_z', 'credit_z', 'brakes_z', 'cli_gli_divergence', 
                   'cb_diffusion_13w', 'cb_hhi_13w']:
-            if k in v2a_clean:
+            if k in v2a_data:
                 # SPECIAL HANDLING: cli_gli_divergence
                 # If the last values are 0 (likely due to ffill padding of GLI vs daily CLI),
                 # we should set them to None so the frontend shows the last REAL value, not 0.
                 if k == 'cli_gli_divergence':
-                     series = v2a_data[k]
-                     # Find last non-zero valid index
-                     last_valid_idx = None
-                     if not series.empty:
-                         # Check backwards for first non-zero
-                         for i in range(len(series)-1, -1, -1):
-                             val = series.iloc[i]
-                             if pd.notnull(val) and abs(val) > 1e-6: # Treat near-zero as zero
-                                 last_valid_idx = i
-                                 break
-                     
-                     # If we found a valid end, everything after it should be None
-                     clean_series = clean_for_json(series)
-                     if last_valid_idx is not None and last_valid_idx < len(clean_series) - 1:
-                         # Replace trailing zeros/values with None
-                         for i in range(last_valid_idx + 1, len(clean_series)):
-                             clean_series[i] = None
-                     
-                     result[k] = clean_series
+                    series = v2a_data[k]
+                    # Last non-zero valid value (treat near-zero as zero); everything after it becomes None
+                    is_real = series.notna() & (series.abs() > 1e-6)
+                    if is_real.any():
+                        last_valid_pos = int(np.flatnonzero(is_real.to_numpy())[-1])
+                        series = series.astype(float).copy()
+                        series.iloc[last_valid_pos + 1:] = np.nan
+                    result[k] = series
                 else:
-                    result[k] = v2a_clean[k]
+                    result[k] = v2a_data[k]
                 
         return result
 
@@ -4,12 +4,14 @@ Offshore Liquidity Domain - Eurodollar stress, XCCY basis
 Contains:
 - OBFR-EFFR spread (offshore USD funding stress)
 - Fed CB Liquidity Swaps
-- XCCY basis (reference to existing module)
+- XCCY basis, analysis, thresholds and statistics history from
+  analytics/offshore_liquidity.py (the offshore_liquidity stage, passed in
+  by the orchestrator)
 """
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..base import BaseDomain, clean_for_json, calculate_zscore
 
@@ -17,6 +19,8 @@ from ..base import BaseDomain, clean_for_json, calculate_zscore
 class OffshoreDomain(BaseDomain):
     """Offshore liquidity domain."""
     
+    depends_on = ('offshore_liquidity',)
+    
     @property
     def name(self) -> str:
         return "offshore"
@@ -32,8 +36,17 @@ class OffshoreDomain(BaseDomain):
             return (arr[:-1] < current).sum() / (len(arr) - 1) * 100
         return series.rolling(window, min_periods=window // 2).apply(percentile_rank, raw=True)
     
-    def process(self, df: pd.DataFrame, **kwargs) -> Dict[str, Any]:
-        """Process offshore liquidity data."""
+    def process(self, df: pd.DataFrame, offshore_liquidity: Optional[Dict[str, Any]] = None,
+                **kwargs) -> Dict[str, Any]:
+        """
+        Process offshore liquidity data.
+        
+        Args:
+            df: Main DataFrame
+            offshore_liquidity: Output of the offshore liquidity stage (same
+                as dashboard_data.json's offshore_liquidity); without it
+                the XCCY part is left out
+        """
         result = {}
         
         # OBFR-EFFR spread (offshore vs onshore funding cost)
@@ -87,8 +100,12 @@ class OffshoreDomain(BaseDomain):
         if components > 0:
             result['stress_score'] = clean_for_json(stress_score / components)
         
-        # XCCY basis is calculated in offshore_liquidity.py module
-        # Reference it rather than duplicate
-        result['xccy_basis_ref'] = 'offshore_liquidity_module'
+        # XCCY basis is calculated once in offshore_liquidity.py (shared
+        # with the legacy file), not recomputed here
+        if offshore_liquidity:
+            result['xccy_basis_ref'] = offshore_liquidity.get('chart2_xccy_diy')
+            result['analysis'] = offshore_liquidity.get('analysis', {})
+            result['thresholds'] = offshore_liquidity.get('thresholds', {})
+            result['stats_history'] = offshore_liquidity.get('stats_history', {})
         
         return result
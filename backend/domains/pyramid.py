@@ -0,0 +1,351 @@
+"""
+Resolution Pyramid
+
+Charts rarely need every daily point: a 20-year view is ~7,300 points on a
+chart a few hundred pixels wide. Next to ``<domain>.json`` the pyramid
+output writes the same series at coarser resolutions:
+
+- ``weekly`` / ``monthly``: last valid value per calendar period, with the
+  same tree structure as the domain file and a coarser date axis
+- ``lttb_<budget>``: Largest-Triangle-Three-Buckets downsampling of each
+  series to at most ~budget points, preserving its visual shape (peaks,
+  troughs, the latest value); series are replaced by
+  ``{"$points": {"index": [...], "values": [...]}}`` with indices into the
+  daily axis
+
+and a ``<domain>.pyramid.json`` manifest listing every level (including the
+daily domain file itself) with its point count, so the frontend can request
+the coarsest level that still has enough points for the visible range
+(see frontend/src/lib/utils/pyramid.js).
+"""
+
+import os
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .axis import DateAxis, AXES_KEY, AXIS_REF_KEY, DEFAULT_AXIS_ID, encode_date_axis, decode_date_axis
+from .binary import _is_numeric_list
+from utils.publisher import get_publisher
+
+FORMAT_NAME = 'domain-pyramid'
+FORMAT_VERSION = 1
+
+# Level id -> pandas period frequency
+CALENDAR_LEVELS = {
+    'weekly': 'W',
+    'monthly': 'M',
+}
+
+# Point budgets for the LTTB levels
+LTTB_BUDGETS = (500, 1000, 2000)
+
+POINTS_KEY = '$points'
+PYRAMID_SUBDIR = 'pyramid'
+
+
+# ============================================================
+# DOWNSAMPLING
+# ============================================================
+
+def lttb_indices(values: np.ndarray, budget: int) -> List[np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets selection for every column of `values`.
+
+    All columns share the bucket boundaries (they live on one axis), so the
+    bucket loop runs once for the whole (T, S) matrix. Missing values never
+    become anchors; buckets with no valid values select nothing. The first
+    and last valid point of each series are always kept.
+
+    Args:
+        values: (T, S) array with NaN for missing values
+        budget: Target number of points per series (>= 3)
+
+    Returns:
+        Sorted index array into the T axis, one per column
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_rows, n_cols = values.shape
+    valid = np.isfinite(values)
+
+    if budget < 3 or n_rows <= budget:
+        return [np.flatnonzero(valid[:, j]) for j in range(n_cols)]
+
+    x = np.arange(n_rows, dtype=float)
+    y = np.where(valid, values, 0.0)
+
+    # Interior bucket edges: bucket i covers rows [edges[i], edges[i + 1])
+    every = (n_rows - 2) / (budget - 2)
+    edges = np.floor(np.arange(budget - 1) * every).astype(int) + 1
+    edges[-1] = n_rows - 1
+
+    # Per-bucket averages (the "next bucket" point of each triangle)
+    interior = slice(0, n_rows - 1)
+    counts = np.add.reduceat(valid[interior], edges[:-1], axis=0).astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_y = np.add.reduceat(y[interior], edges[:-1], axis=0) / counts
+        avg_x = np.add.reduceat(valid[interior] * x[interior, None], edges[:-1], axis=0) / counts
+    # The last bucket's successor is the final row
+    avg_y = np.vstack([avg_y, np.where(valid[-1], y[-1], np.nan)])
+    avg_x = np.vstack([avg_x, np.full(n_cols, n_rows - 1.0)])
+
+    columns = np.arange(n_cols)
+    anchor_x = np.zeros(n_cols)
+    anchor_y = y[0].copy()
+    anchor_valid = valid[0].copy()
+    selected = np.full((budget - 2, n_cols), -1, dtype=int)
+
+    for b in range(budget - 2):
+        start, stop = edges[b], edges[b + 1]
+        xs = x[start:stop, None]
+        ys = y[start:stop]
+        next_x = avg_x[b + 1]
+        next_y = avg_y[b + 1]
+        # Without a valid anchor or successor, fall back to the first valid point
+        usable = anchor_valid & np.isfinite(next_y)
+        with np.errstate(invalid='ignore'):
+            area = np.abs((anchor_x - next_x) * (ys - anchor_y) - (anchor_x - xs) * (next_y - anchor_y))
+        area = np.where(usable, area, 0.0)
+        area = np.where(valid[start:stop], area, -1.0)
+
+        pick = np.argmax(area, axis=0)
+        picked_valid = valid[start + pick, columns]
+        rows = start + pick
+        selected[b] = np.where(picked_valid, rows, -1)
+
+        anchor_x = np.where(picked_valid, rows, anchor_x)
+        anchor_y = np.where(picked_valid, y[rows, columns], anchor_y)
+        anchor_valid |= picked_valid
+
+    out = []
+    for j in range(n_cols):
+        rows = np.flatnonzero(valid[:, j])
+        if len(rows) == 0:
+            out.append(rows)
+            continue
+        picks = selected[:, j]
+        out.append(np.unique(np.concatenate([rows[[0, -1]], picks[picks >= 0]])))
+    return out
+
+
+def resample_last(
+    values: np.ndarray,
+    index: pd.DatetimeIndex,
+    freq: str
+) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """
+    Last valid value of each column per calendar period.
+
+    Periods are labelled with the last axis date they contain, so the
+    current (partial) period ends on the latest date rather than in the future.
+    """
+    periods = index.to_period(freq)
+    frame = pd.DataFrame(values, index=index)
+    resampled = frame.groupby(periods, sort=True).last()
+    labels = pd.Series(index, index=index).groupby(periods, sort=True).max()
+    return resampled.to_numpy(dtype=float), pd.DatetimeIndex(labels.to_numpy())
+
+
+# ============================================================
+# PYRAMID
+# ============================================================
+
+def _daily_index(data: Dict[str, Any], dates) -> Optional[pd.DatetimeIndex]:
+    if dates is not None:
+        if isinstance(dates, DateAxis):
+            return dates.index
+        return pd.DatetimeIndex(pd.to_datetime(list(dates)))
+    axis = (data.get(AXES_KEY) or {}).get(DEFAULT_AXIS_ID)
+    if not axis:
+        return None
+    if axis.get('freq') == 'D':
+        return pd.date_range(axis['start'], periods=axis['length'], freq='D')
+    return pd.DatetimeIndex(pd.to_datetime(decode_date_axis(axis)))
+
+
+def _collect_series(data: Dict[str, Any], length: int) -> List[Tuple[Tuple[str, ...], List]]:
+    """(path, values) of every numeric list on the daily axis, in tree order."""
+    found = []
+
+    def walk(node: Any, path: Tuple[str, ...]) -> None:
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k != AXES_KEY:
+                    walk(v, path + (str(k),))
+        elif isinstance(node, list):
+            if len(node) == length and _is_numeric_list(node):
+                found.append((path, node))
+            elif node and isinstance(node[0], (dict, list)):
+                for i, x in enumerate(node):
+                    walk(x, path + (str(i),))
+
+    walk(data, ())
+    return found
+
+
+def _to_json_values(values: np.ndarray) -> List[Optional[float]]:
+    cells = values.astype(object)
+    cells[~np.isfinite(values)] = None
+    return cells.tolist()
+
+
+def _replace(
+    data: Dict[str, Any],
+    replacements: Dict[Tuple[str, ...], Any],
+    axis_id: str,
+    length: int
+) -> Dict[str, Any]:
+    """
+    Copy of the tree with series swapped out and the daily axis (as a
+    reference or a plain date list) pointed at axis_id.
+    """
+    axis_ref = {AXIS_REF_KEY: axis_id}
+
+    def walk(node: Any, path: Tuple[str, ...]) -> Any:
+        if path in replacements:
+            return replacements[path]
+        if isinstance(node, dict):
+            if len(node) == 1 and node.get(AXIS_REF_KEY) == DEFAULT_AXIS_ID:
+                return axis_ref
+            return {k: walk(v, path + (str(k),)) for k, v in node.items() if k != AXES_KEY}
+        if isinstance(node, list) and node:
+            if len(node) == length and isinstance(node[0], str):
+                return axis_ref
+            if isinstance(node[0], (dict, list)):
+                return [walk(x, path + (str(i),)) for i, x in enumerate(node)]
+        return node
+
+    return walk(data, ())
+
+
+def build_pyramid(
+    data: Dict[str, Any],
+    dates=None,
+    budgets: Sequence[int] = LTTB_BUDGETS
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Coarser versions of JSON-clean domain data.
+
+    Args:
+        data: Domain output, already passed through clean_for_json
+        dates: Shared daily axis (DateAxis or list of ISO dates); defaults to
+            the 'daily' entry of data['axes']
+        budgets: Point budgets for the LTTB levels (budgets at or above the
+            axis length are skipped)
+
+    Returns:
+        {level_id: level artifact}, or None if the data has no daily series
+    """
+    index = _daily_index(data, dates)
+    if index is None or len(index) == 0:
+        return None
+    series = _collect_series(data, len(index))
+    if not series:
+        return None
+
+    paths = [path for path, _ in series]
+    matrix = np.array([[np.nan if x is None else x for x in values] for _, values in series], dtype=float).T
+    axes = dict(data.get(AXES_KEY) or {})
+    axes[DEFAULT_AXIS_ID] = encode_date_axis(index)
+    levels: Dict[str, Dict[str, Any]] = {}
+
+    for level_id, freq in CALENDAR_LEVELS.items():
+        resampled, level_index = resample_last(matrix, index, freq)
+        columns = [_to_json_values(col) for col in resampled.T]
+        level = _replace(data, dict(zip(paths, columns)), level_id, len(index))
+        level[AXES_KEY] = {**axes, level_id: encode_date_axis(level_index)}
+        levels[level_id] = level
+
+    for budget in sorted(set(budgets)):
+        if budget >= len(index):
+            continue
+        picks = lttb_indices(matrix, budget)
+        points = {
+            path: {POINTS_KEY: {'index': rows.tolist(), 'values': _to_json_values(matrix[rows, j])}}
+            for j, (path, rows) in enumerate(zip(paths, picks))
+        }
+        level = _replace(data, points, DEFAULT_AXIS_ID, len(index))
+        level[AXES_KEY] = axes
+        levels[f'lttb_{budget}'] = level
+
+    return levels
+
+
+def _level_points(level: Dict[str, Any], level_id: str) -> int:
+    axes = level.get(AXES_KEY) or {}
+    if level_id in axes:
+        return axes[level_id]['length']
+    longest = 0
+
+    def walk(node: Any) -> None:
+        nonlocal longest
+        if isinstance(node, dict):
+            if POINTS_KEY in node and len(node) == 1:
+                longest = max(longest, len(node[POINTS_KEY]['index']))
+                return
+            for v in node.values():
+                walk(v)
+        elif isinstance(node, list) and node and isinstance(node[0], (dict, list)):
+            for x in node:
+                walk(x)
+
+    walk(level)
+    return longest
+
+
+def write_domain_pyramid(
+    data: Dict[str, Any],
+    domain_name: str,
+    domains_dir: str,
+    dates=None,
+    budgets: Sequence[int] = LTTB_BUDGETS,
+    publisher=None
+) -> Optional[Dict[str, Any]]:
+    """
+    Write the level files and the pyramid manifest. Returns the manifest.
+
+    Level files go to ``<domains_dir>/pyramid/<domain>.<level>.json`` and are
+    published before ``<domains_dir>/<domain>.pyramid.json``; the daily level
+    is the regular ``<domain>.json``. File paths in the manifest are relative
+    to the manifest.
+    """
+    levels = build_pyramid(data, dates=dates, budgets=budgets)
+    if levels is None:
+        return None
+
+    if publisher is None:
+        publisher = get_publisher(os.path.dirname(os.path.abspath(domains_dir)))
+    index = _daily_index(data, dates)
+
+    entries = [{
+        'id': 'daily',
+        'kind': 'calendar',
+        'freq': 'D',
+        'points': len(index),
+        'file': f'{domain_name}.json',
+    }]
+    for level_id, level in levels.items():
+        rel_path = f'{PYRAMID_SUBDIR}/{domain_name}.{level_id}.json'
+        os.makedirs(os.path.join(domains_dir, PYRAMID_SUBDIR), exist_ok=True)
+        publisher.publish_json(os.path.join(domains_dir, rel_path), level)
+
+        entry = {'id': level_id, 'points': _level_points(level, level_id), 'file': rel_path}
+        if level_id in CALENDAR_LEVELS:
+            entry.update(kind='calendar', freq=CALENDAR_LEVELS[level_id])
+        else:
+            entry.update(kind='lttb', budget=int(level_id.split('_', 1)[1]))
+        entries.append(entry)
+
+    manifest = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'domain': domain_name,
+        'start': index[0].strftime('%Y-%m-%d'),
+        'end': index[-1].strftime('%Y-%m-%d'),
+        'levels': sorted(entries, key=lambda e: e['points']),
+    }
+    publisher.publish_json(os.path.join(domains_dir, f'{domain_name}.pyramid.json'), manifest)
+    return manifest
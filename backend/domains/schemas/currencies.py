@@ -84,6 +84,7 @@ CREATE TABLE IF NOT EXISTS domain_currencies_dxy (
     roc_90d_pct DECIMAL(6, 2),
     roc_180d_pct DECIMAL(6, 2),
     volatility DECIMAL(8, 4),
+    row_hash CHAR(16),  -- content hash used by domains/sync.py
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
@@ -97,6 +98,7 @@ CREATE TABLE IF NOT EXISTS domain_currencies_pairs (
     roc_90d DECIMAL(8, 4),
     roc_180d DECIMAL(8, 4),
     roc_yoy DECIMAL(8, 4),
+    row_hash CHAR(16),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     PRIMARY KEY (date, pair)
 );
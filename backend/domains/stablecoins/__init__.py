@@ -12,7 +12,7 @@ import numpy as np
 import pandas as pd
 from typing import Dict, Any, List
 
-from ..base import BaseDomain, clean_for_json, calculate_rocs, calculate_zscore, rolling_percentile
+from ..base import BaseDomain, DomainResult, calculate_rocs, calculate_zscore, rolling_percentile
 
 
 class StablecoinsDomain(BaseDomain):
@@ -72,32 +72,32 @@ class StablecoinsDomain(BaseDomain):
         for name, col in stables.items():
             if col in df.columns:
                 mcap = df[col].ffill() / 1e9  # Convert to billions
-                result['market_caps'][name] = clean_for_json(mcap)
+                result['market_caps'][name] = mcap
                 total_supply += mcap.fillna(0)
         
-        result['total'] = clean_for_json(total_supply)
+        result['total'] = total_supply
         
         # Total supply ROCs
         roc_30d = self._calc_roc(total_supply, 30)
         result['total_rocs'] = {
-            '7d': clean_for_json(self._calc_roc(total_supply, 7)),
-            '30d': clean_for_json(roc_30d),
-            '90d': clean_for_json(self._calc_roc(total_supply, 90)),
-            '180d': clean_for_json(self._calc_roc(total_supply, 180)),
-            'yoy': clean_for_json(self._calc_roc(total_supply, 365)),
+            '7d': self._calc_roc(total_supply, 7),
+            '30d': roc_30d,
+            '90d': self._calc_roc(total_supply, 90),
+            '180d': self._calc_roc(total_supply, 180),
+            'yoy': self._calc_roc(total_supply, 365),
         }
         
         # Z-scores for ROCs
         result['total_rocs_z'] = {
-            '7d': clean_for_json(calculate_zscore(self._calc_roc(total_supply, 7), 252)),
-            '30d': clean_for_json(calculate_zscore(roc_30d, 252)),
-            '90d': clean_for_json(calculate_zscore(self._calc_roc(total_supply, 90), 252)),
+            '7d': calculate_zscore(self._calc_roc(total_supply, 7), 252),
+            '30d': calculate_zscore(roc_30d, 252),
+            '90d': calculate_zscore(self._calc_roc(total_supply, 90), 252),
         }
 
         # Acceleration Z-Score (2nd derivative proxy: change in 30d ROC)
         # Using 30d diff of 30d ROC to capture monthly acceleration trends
         accel_raw = roc_30d.diff(30)
-        result['total_accel_z'] = clean_for_json(calculate_zscore(accel_raw, 252))
+        result['total_accel_z'] = calculate_zscore(accel_raw, 252)
         
         # Prices and depeg detection
         price_cols = {
@@ -115,7 +115,7 @@ class StablecoinsDomain(BaseDomain):
         for name, col in price_cols.items():
             if col in df.columns:
                 price = df[col].ffill()
-                result['prices'][name] = clean_for_json(price)
+                result['prices'][name] = price
                 result['depeg_events'][name] = self._detect_depeg(price)
         
         # Dominance (share of total stablecoin supply)
@@ -126,7 +126,7 @@ class StablecoinsDomain(BaseDomain):
             mcap_series = pd.Series(mcap_data, index=df.index)
             # Dominance
             dom = (mcap_series / total_supply.replace(0, np.nan)) * 100
-            result['dominance'][name] = clean_for_json(dom)
+            result['dominance'][name] = dom
             # Growth (Using iloc safely)
             result['growth'][name] = {
                 '7d': float(self._calc_roc(mcap_series, 7).iloc[-1]) if len(mcap_series) > 7 else 0,
@@ -141,33 +141,33 @@ class StablecoinsDomain(BaseDomain):
             for name, mcap_data in result['market_caps'].items():
                 mcap_series = pd.Series(mcap_data, index=df.index)
                 dom_total = (mcap_series / total_crypto.replace(0, np.nan)) * 100
-                result['dominance_total'][name] = clean_for_json(dom_total)
+                result['dominance_total'][name] = dom_total
             
             # Custom Total Stables / Total Crypto Dominance
             custom_dom = (total_supply / total_crypto.replace(0, np.nan)) * 100
-            result['crypto_dominance'] = clean_for_json(custom_dom)
-            result['total_crypto_mcap'] = clean_for_json(total_crypto)
+            result['crypto_dominance'] = custom_dom
+            result['total_crypto_mcap'] = total_crypto
             
             # Custom Dominance ROCs
-            result['custom_stables_dom'] = clean_for_json(custom_dom)
+            result['custom_stables_dom'] = custom_dom
             result['custom_stables_dom_rocs'] = {
-                '7d': clean_for_json(self._calc_roc(custom_dom, 7)),
-                '30d': clean_for_json(self._calc_roc(custom_dom, 30)),
-                '90d': clean_for_json(self._calc_roc(custom_dom, 90)),
-                '180d': clean_for_json(self._calc_roc(custom_dom, 180)),
-                'yoy': clean_for_json(self._calc_roc(custom_dom, 365)),
+                '7d': self._calc_roc(custom_dom, 7),
+                '30d': self._calc_roc(custom_dom, 30),
+                '90d': self._calc_roc(custom_dom, 90),
+                '180d': self._calc_roc(custom_dom, 180),
+                'yoy': self._calc_roc(custom_dom, 365),
             }
             # Z-scores for Custom Dom ROCs
             result['custom_stables_dom_rocs_z'] = {
-                '7d': clean_for_json(calculate_zscore(self._calc_roc(custom_dom, 7), 252)),
-                '30d': clean_for_json(calculate_zscore(self._calc_roc(custom_dom, 30), 252)),
-                '90d': clean_for_json(calculate_zscore(self._calc_roc(custom_dom, 90), 252)),
+                '7d': calculate_zscore(self._calc_roc(custom_dom, 7), 252),
+                '30d': calculate_zscore(self._calc_roc(custom_dom, 30), 252),
+                '90d': calculate_zscore(self._calc_roc(custom_dom, 90), 252),
             }
             # Percentiles for Custom Dom ROCs
             result['custom_stables_dom_rocs_pct'] = {
-                '7d': clean_for_json(rolling_percentile(self._calc_roc(custom_dom, 7), 252*2)),
-                '30d': clean_for_json(rolling_percentile(self._calc_roc(custom_dom, 30), 252*2)),
-                '90d': clean_for_json(rolling_percentile(self._calc_roc(custom_dom, 90), 252*2)),
+                '7d': rolling_percentile(self._calc_roc(custom_dom, 7), 252*2),
+                '30d': rolling_percentile(self._calc_roc(custom_dom, 30), 252*2),
+                '90d': rolling_percentile(self._calc_roc(custom_dom, 90), 252*2),
             }
         
         # SFAI (Stablecoin Flow Attribution Index)
@@ -196,9 +196,9 @@ class StablecoinsDomain(BaseDomain):
             # Forward fill any remaining zeros (e.g. from NaNs at start) to ensure continuity where possible
             regime = regime.replace(0, np.nan).ffill().fillna(0).astype(int)
             
-            result['sfai_regime'] = clean_for_json(regime)
-            result['sfai_continuous'] = clean_for_json(sfai_index)
-            result['sfai_velocity'] = clean_for_json(sfai_velocity)
+            result['sfai_regime'] = regime
+            result['sfai_continuous'] = sfai_index
+            result['sfai_velocity'] = sfai_velocity
         
         # TradingView stablecoin indices (STABLE.C.D)
         if 'STABLE_INDEX_MCAP' in df.columns:
@@ -211,26 +211,26 @@ class StablecoinsDomain(BaseDomain):
             # If we have STABLE_INDEX_DOM in pipeline (which we seem to get from `df.get('STABLE_INDEX_DOM'...`), use that.
             
             stable_dom_idx = df.get('STABLE_INDEX_DOM', pd.Series(0, index=df.index))
-            result['stable_index_dom'] = clean_for_json(stable_dom_idx)
+            result['stable_index_dom'] = stable_dom_idx
             
             result['stable_index_rocs'] = {
-                '7d': clean_for_json(self._calc_roc(stable_dom_idx, 7)),
-                '30d': clean_for_json(self._calc_roc(stable_dom_idx, 30)),
-                '90d': clean_for_json(self._calc_roc(stable_dom_idx, 90)),
-                '180d': clean_for_json(self._calc_roc(stable_dom_idx, 180)),
-                'yoy': clean_for_json(self._calc_roc(stable_dom_idx, 365)),
+                '7d': self._calc_roc(stable_dom_idx, 7),
+                '30d': self._calc_roc(stable_dom_idx, 30),
+                '90d': self._calc_roc(stable_dom_idx, 90),
+                '180d': self._calc_roc(stable_dom_idx, 180),
+                'yoy': self._calc_roc(stable_dom_idx, 365),
             }
             
             result['stable_index_rocs_z'] = {
-                '7d': clean_for_json(calculate_zscore(self._calc_roc(stable_dom_idx, 7), 252)),
-                '30d': clean_for_json(calculate_zscore(self._calc_roc(stable_dom_idx, 30), 252)),
-                '90d': clean_for_json(calculate_zscore(self._calc_roc(stable_dom_idx, 90), 252)),
+                '7d': calculate_zscore(self._calc_roc(stable_dom_idx, 7), 252),
+                '30d': calculate_zscore(self._calc_roc(stable_dom_idx, 30), 252),
+                '90d': calculate_zscore(self._calc_roc(stable_dom_idx, 90), 252),
             }
             
             result['stable_index_rocs_pct'] = {
-                '7d': clean_for_json(rolling_percentile(self._calc_roc(stable_dom_idx, 7), 252*2)),
-                '30d': clean_for_json(rolling_percentile(self._calc_roc(stable_dom_idx, 30), 252*2)),
-                '90d': clean_for_json(rolling_percentile(self._calc_roc(stable_dom_idx, 90), 252*2)),
+                '7d': rolling_percentile(self._calc_roc(stable_dom_idx, 7), 252*2),
+                '30d': rolling_percentile(self._calc_roc(stable_dom_idx, 30), 252*2),
+                '90d': rolling_percentile(self._calc_roc(stable_dom_idx, 90), 252*2),
             }
         
-        return result
+        return DomainResult(result)
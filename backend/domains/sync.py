@@ -0,0 +1,224 @@
+"""
+Domain to Database Sync
+
+Converts column-oriented domain output into row-per-date tables (the layout
+of the DDL in domains/schemas/) and upserts only rows that changed:
+
+- every numeric series on the shared date axis becomes a column; top-level
+  series go to ``domain_<name>``, each top-level section to
+  ``domain_<name>_<section>`` (nested keys joined with '_')
+- sections listed in LONG_SECTIONS are stored long, one row per
+  (date, key), e.g. domain_currencies_pairs(date, pair, absolute, ...)
+- each row carries a short content hash (``row_hash``); rows newer than
+  the table's latest date, or whose hash differs from the stored one, are
+  upserted, everything else is skipped
+
+Stored hashes are cached locally in ``domains/db_sync_state.json`` and only
+re-read from the table (paged) when the cache doesn't match the table's
+latest date, so a daily sync transfers just the new and revised rows. A
+table whose latest date or hashes can't be read is skipped with a warning,
+not treated as empty.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from .axis import DateAxis, AXES_KEY, DEFAULT_AXIS_ID, decode_date_axis
+from .binary import _is_numeric_list
+from utils.publisher import get_publisher
+
+logger = logging.getLogger(__name__)
+
+TABLE_PREFIX = 'domain_'
+ROW_HASH_COLUMN = 'row_hash'
+SYNC_STATE_FILENAME = 'db_sync_state.json'
+
+# Sections stored in long format: (domain, section) -> key column
+LONG_SECTIONS = {
+    ('currencies', 'pairs'): 'pair',
+}
+
+# Top-level keys that are not data sections
+_SKIP_KEYS = {AXES_KEY, 'dates'}
+
+
+def _column_name(path: List[str]) -> str:
+    return re.sub(r'[^0-9a-z_]+', '_', '_'.join(path).lower()).strip('_')
+
+
+def row_hash(row: Dict[str, Any]) -> str:
+    """Content hash of a row (16 hex chars), independent of key order."""
+    payload = json.dumps(row, sort_keys=True, separators=(',', ':'), allow_nan=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _collect_series(node: Any, axis_length: int, path: List[str], out: Dict[str, list]) -> None:
+    """Flatten numeric series of the axis length under node into {column: values}."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _collect_series(value, axis_length, path + [str(key)], out)
+    elif _is_numeric_list(node) and len(node) == axis_length:
+        out[_column_name(path)] = node
+
+
+def _build_rows(columns: Dict[str, list], dates: List[str], extra: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Transpose {column: values} into row dicts, skipping rows with no values."""
+    names = list(columns)
+    rows = []
+    for date, values in zip(dates, zip(*columns.values())):
+        if all(v is None for v in values):
+            continue
+        row = {'date': date}
+        if extra:
+            row.update(extra)
+        row.update(zip(names, values))
+        rows.append(row)
+    return rows
+
+
+def domain_to_tables(name: str, data: Dict[str, Any], dates) -> Dict[str, Tuple[List[str], List[Dict[str, Any]]]]:
+    """
+    Split serialized domain output into table rows.
+
+    Args:
+        name: Domain name
+        data: Output of BaseDomain.serialize()
+        dates: Shared date axis (DateAxis or list of ISO dates)
+
+    Returns:
+        {table: (key columns, rows)}
+    """
+    dates = dates.to_list() if isinstance(dates, DateAxis) else list(dates)
+    axis_length = len(dates)
+
+    tables: Dict[str, Tuple[List[str], List[Dict[str, Any]]]] = {}
+    top_level: Dict[str, list] = {}
+
+    for section, value in data.items():
+        if section in _SKIP_KEYS:
+            continue
+        table = _column_name([TABLE_PREFIX + name, section])
+        key_column = LONG_SECTIONS.get((name, section))
+
+        if key_column and isinstance(value, dict):
+            rows = []
+            for key, sub in value.items():
+                columns: Dict[str, list] = {}
+                _collect_series(sub, axis_length, [], columns)
+                if columns:
+                    rows.extend(_build_rows(columns, dates, {key_column: key}))
+            if rows:
+                tables[table] = (['date', key_column], rows)
+        elif isinstance(value, dict):
+            columns = {}
+            _collect_series(value, axis_length, [], columns)
+            if columns:
+                tables[table] = (['date'], _build_rows(columns, dates))
+        else:
+            _collect_series(value, axis_length, [section], top_level)
+
+    if top_level:
+        tables[TABLE_PREFIX + name] = (['date'], _build_rows(top_level, dates))
+
+    return tables
+
+
+def _row_key(row: Dict[str, Any], key_columns: List[str]) -> str:
+    return '|'.join(str(row[c]) for c in key_columns)
+
+
+class SyncState:
+    """Locally cached row hashes per table: {table: {'latest': date, 'hashes': {key: hash}}}."""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, 'domains', SYNC_STATE_FILENAME)
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.tables = json.load(f).get('tables', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable sync state {self.path}: {e}")
+
+    def save(self) -> None:
+        get_publisher(self.output_dir).publish_json(self.path, {'tables': self.tables}, sort_keys=True)
+
+
+def _stored_hashes(adapter, table: str, key_columns: List[str], latest: Optional[str], state: Optional[SyncState]) -> Dict[str, str]:
+    """Row hashes currently in the table (local cache if it matches the table's latest date)."""
+    if latest is None:
+        return {}
+    cached = state.tables.get(table) if state else None
+    if cached and cached.get('latest') == latest:
+        return cached.get('hashes', {})
+
+    logger.info(f"Reading stored row hashes for {table}")
+    hashes = {}
+    for page in adapter.iter_domain(table, columns=key_columns + [ROW_HASH_COLUMN], order_by=key_columns):
+        for row in page:
+            hashes[_row_key(row, key_columns)] = row.get(ROW_HASH_COLUMN)
+    return hashes
+
+
+def sync_domain(
+    name: str,
+    data: Dict[str, Any],
+    adapter,
+    dates=None,
+    state: Optional[SyncState] = None,
+) -> Dict[str, int]:
+    """
+    Upsert new and revised rows of one domain.
+
+    Args:
+        name: Domain name
+        data: Output of BaseDomain.serialize()
+        adapter: SupabaseAdapter (or compatible)
+        dates: Shared date axis; defaults to the artifact's 'daily' axis
+        state: Local hash cache (updated in place, saved by the caller)
+
+    Returns:
+        {table: rows upserted}; tables whose stored rows could not be read
+        (query failed after retries, missing table) are skipped and left out
+    """
+    if dates is None:
+        axis = (data.get(AXES_KEY) or {}).get(DEFAULT_AXIS_ID)
+        if axis is None:
+            logger.warning(f"No date axis for {name}, skipping DB sync")
+            return {}
+        dates = decode_date_axis(axis)
+
+    upserted = {}
+    for table, (key_columns, rows) in domain_to_tables(name, data, dates).items():
+        try:
+            latest = adapter.fetch_latest_date(table)
+            stored = _stored_hashes(adapter, table, key_columns, latest, state)
+        except Exception as e:
+            # Not an empty table: don't resend its whole history
+            logger.warning(f"Skipping {table}, could not read its stored rows: {e}")
+            continue
+
+        hashes = {}
+        changed = []
+        for row in rows:
+            digest = row_hash(row)
+            key = _row_key(row, key_columns)
+            hashes[key] = digest
+            if latest is None or row['date'] > latest or stored.get(key) != digest:
+                changed.append(dict(row, **{ROW_HASH_COLUMN: digest}))
+
+        if changed:
+            adapter.upsert_domain_data(table, changed, on_conflict=','.join(key_columns))
+        upserted[table] = len(changed)
+
+        if state is not None and rows:
+            state.tables[table] = {'latest': max(r['date'] for r in rows), 'hashes': hashes}
+
+        logger.info(f"Synced {table}: {len(changed)}/{len(rows)} rows changed")
+
+    return upserted
@@ -0,0 +1,82 @@
+"""
+Column Tracking
+
+Records which DataFrame columns a domain reads and writes, so an incremental
+orchestrator run (DataOrchestrator(incremental=True)) can skip domains whose
+inputs did not change since the previous run.
+
+A ColumnTracker is a DataFrame that notes every column looked up through
+``df[...]``, ``df.get(...)`` or attribute access, and every membership test
+(``'X' in df``), so a domain branching on whether a column exists re-runs
+when it appears. Frames derived from it (copies, slices, arithmetic) are
+trackers too and report into the same sets, so reads made inside analytics
+helpers are seen as well. Iterating over the frame counts as reading every
+column.
+
+Reads through ``.loc``/``.iloc``, ``df.columns`` or whole-frame methods are
+not seen. The orchestrator re-runs every domain when the set of input
+columns changes, which covers probes of ``df.columns``; value reads that way
+must be declared in ``depends_on`` or rely on the periodic full run.
+"""
+
+from typing import Any, Set
+
+import pandas as pd
+
+
+class ColumnTracker(pd.DataFrame):
+    """DataFrame recording column reads (``_reads``) and writes (``_writes``)."""
+
+    _metadata = ['_reads', '_writes']
+
+    @property
+    def _constructor(self):
+        return ColumnTracker
+
+    @classmethod
+    def wrap(cls, df: pd.DataFrame) -> 'ColumnTracker':
+        """Tracker over `df` (no data copy; writes stay on the tracker)."""
+        tracker = cls(df)
+        object.__setattr__(tracker, '_reads', set())
+        object.__setattr__(tracker, '_writes', set())
+        return tracker
+
+    def _record(self, key: Any) -> None:
+        reads = getattr(self, '_reads', None)
+        if reads is None:
+            return
+        if isinstance(key, str):
+            reads.add(key)
+        elif isinstance(key, (list, tuple, pd.Index)):
+            reads.update(k for k in key if isinstance(k, str))
+
+    def __getitem__(self, key):
+        self._record(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self._record(key)
+        return super().__contains__(key)
+
+    def __setitem__(self, key, value):
+        writes = getattr(self, '_writes', None)
+        if writes is not None and isinstance(key, str):
+            writes.add(key)
+        super().__setitem__(key, value)
+
+    def __iter__(self):
+        self._record(list(self.columns))
+        return super().__iter__()
+
+    def items(self):
+        self._record(list(self.columns))
+        return super().items()
+
+    @property
+    def columns_read(self) -> Set[str]:
+        return set(getattr(self, '_reads', None) or ())
+
+    @property
+    def columns_written(self) -> Set[str]:
+        """Columns assigned on this tracker (or a derived one) that it now holds."""
+        return {c for c in (getattr(self, '_writes', None) or ()) if c in self.columns}
@@ -10,10 +10,14 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 import pandas as pd
 
 from domains.base import BaseDomain, MetadataDomain, clean_for_json
+from domains.axis import attach_axes, expand_axes
+from domains.tracking import ColumnTracker
+from utils.publisher import get_publisher
+from utils.tracing import span
 from domains.currencies import CurrenciesDomain
 from domains.core import SharedDomain, GLIDomain, USSystemDomain, M2Domain
 from domains.cli import CLIDomain
@@ -38,14 +42,36 @@ class DataOrchestrator:
     - Track processing metadata and timing
     """
     
-    def __init__(self, output_dir: str):
+    def __init__(
+        self,
+        output_dir: str,
+        output_formats: Optional[List[str]] = None,
+        binary_dtype: str = 'float64',
+        db_adapter=None,
+        incremental: bool = False
+    ):
         """
         Initialize orchestrator.
         
         Args:
             output_dir: Base directory for data output (e.g., backend/data)
+            output_formats: Domain output formats to write: 'json', 'binary'
+                (see domains/binary.py), 'pyramid' (weekly/monthly/LTTB
+                levels, see domains/pyramid.py), 'delta' (versioned changes to
+                the JSON files, see domains/delta.py) and/or 'db' (changed rows
+                upserted to Supabase, see domains/sync.py). Defaults to ['json'].
+            binary_dtype: Float dtype for binary blobs ('float32' or 'float64')
+            db_adapter: Adapter for the 'db' format (defaults to get_db_adapter())
+            incremental: Keep state between run() calls and only re-process
+                domains whose input columns (recorded with
+                domains/tracking.py) or upstream domains changed; the
+                others keep their previous results and files.
         """
         self.output_dir = output_dir
+        self.output_formats = list(output_formats) if output_formats else ['json']
+        self.binary_dtype = binary_dtype
+        self._db_adapter = db_adapter
+        self._sync_state = None
         self.domains_dir = os.path.join(output_dir, 'domains')
         os.makedirs(self.domains_dir, exist_ok=True)
         
@@ -67,13 +93,34 @@ class DataOrchestrator:
         ]
         
         self._results: Dict[str, Any] = {}
+        self._context: Dict[str, Any] = {}
         self._timing: Dict[str, float] = {}
+        
+        # Incremental state: last input frame, columns each domain read and
+        # the columns it added to the frame
+        self.incremental = incremental
+        self._last_frame: Optional[pd.DataFrame] = None
+        self._inputs: Dict[str, Set[str]] = {}
+        self._outputs: Dict[str, Dict[str, pd.Series]] = {}
+        self._processed: List[str] = []
+        self._skipped: List[str] = []
+        self._changed_context: Set[str] = set()
     
     @property 
     def domains(self) -> List[BaseDomain]:
         """Get list of registered domains."""
         return self._domains
     
+    @property
+    def processed_domains(self) -> List[str]:
+        """Domains processed by the last run() (all of them unless incremental)."""
+        return list(self._processed)
+    
+    @property
+    def skipped_domains(self) -> List[str]:
+        """Domains an incremental run() left untouched."""
+        return list(self._skipped)
+    
     def register_domain(self, domain: BaseDomain) -> None:
         """Register a new domain processor."""
         self._domains.append(domain)
@@ -93,10 +140,27 @@ class DataOrchestrator:
         
         try:
             # Process domain, passing previous results as context
-            data = domain.process(df, **self._results)
+            with span(f"{domain.name}.process", cat='domain', rows=len(df)):
+                data = domain.process(df, **{**self._context, **self._results})
             
             # Save to domain-specific JSON file
-            domain.save_json(data, self.output_dir)
+            if 'json' in self.output_formats:
+                domain.save_json(data, self.output_dir, deltas='delta' in self.output_formats)
+            
+            # Optional binary blob + manifest, sharing the metadata date axis
+            if 'binary' in self.output_formats:
+                shared_dates = self._results.get('metadata', {}).get('dates')
+                domain.save_binary(data, self.output_dir, dates=shared_dates, dtype=self.binary_dtype)
+            
+            # Optional coarser resolutions for charts, on the same axis
+            if 'pyramid' in self.output_formats:
+                shared_dates = self._results.get('metadata', {}).get('dates')
+                domain.save_pyramid(data, self.output_dir, dates=shared_dates)
+            
+            # Optional DB sync of new/revised rows (never fails the domain)
+            if 'db' in self.output_formats:
+                with span(f"{domain.name}.db_sync", cat='io'):
+                    self._sync_domain_to_db(domain, data)
             
             # Track results and timing
             self._results[domain.name] = data
@@ -110,13 +174,39 @@ class DataOrchestrator:
             logger.error(f"Error processing {domain.name}: {e}")
             raise
     
-    def run(self, df: pd.DataFrame, generate_legacy: bool = True) -> Dict[str, Any]:
+    def _sync_domain_to_db(self, domain: BaseDomain, data: Dict[str, Any]) -> None:
+        """Upsert changed rows of one domain; errors are logged, not raised."""
+        from domains.sync import SyncState
+
+        try:
+            if self._db_adapter is None:
+                from connectors.db_adapter import get_db_adapter
+                self._db_adapter = get_db_adapter()
+            if self._sync_state is None:
+                self._sync_state = SyncState(self.output_dir)
+            shared_dates = self._results.get('metadata', {}).get('dates')
+            counts = domain.save_to_db(data, self._db_adapter, dates=shared_dates, state=self._sync_state)
+            logger.info(f"DB sync {domain.name}: {sum(counts.values())} rows upserted")
+        except Exception as e:
+            logger.warning(f"DB sync failed for {domain.name}: {e}")
+    
+    def run(
+        self,
+        df: pd.DataFrame,
+        generate_legacy: bool = True,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Process all registered domains.
         
         Args:
             df: Main DataFrame with all columns
             generate_legacy: If True, also generate dashboard_data.json
+            context: Results of pipeline stages computed outside the
+                orchestrator (e.g. {'offshore_liquidity': ...}), passed to
+                process() like the results of earlier domains. Incremental
+                runs re-process domains listing a key in depends_on when its
+                value is a different object than last time.
         
         Returns:
             Dict with all domain results
@@ -148,18 +238,47 @@ class DataOrchestrator:
         
         logger.info(f"Reindexed to calendar days: {original_len} trading days -> {len(df)} calendar days (with ffill)")
         
-        # Reset results for new run
-        self._results = {}
+        # Columns that changed since the last run (None: process everything)
+        changed = self._changed_columns(df) if self.incremental else None
+        if self.incremental:
+            self._last_frame = df.copy()
+        
+        # Reset results for new run (incremental runs keep unaffected domains)
+        if changed is None:
+            self._results = {}
+        context = dict(context or {})
+        self._changed_context = {k for k in context.keys() | self._context.keys()
+                                 if context.get(k) is not self._context.get(k)}
+        self._context = context
         self._timing = {}
+        self._processed = []
+        self._skipped = []
         
         # Process each domain in order
         for domain in self._domains:
+            if changed is not None and not self._is_affected(domain, changed):
+                self._reuse_outputs(domain, df)
+                self._skipped.append(domain.name)
+                continue
+            self._processed.append(domain.name)
             try:
-                self.process_domain(domain, df)
+                with span(domain.name, cat='domain', rows=len(df)):
+                    if self.incremental:
+                        self._process_tracked(domain, df, changed)
+                    else:
+                        self.process_domain(domain, df)
             except Exception as e:
                 logger.warning(f"Domain {domain.name} failed: {e}, continuing...")
                 continue
         
+        if changed is not None:
+            logger.info(f"Incremental run: {len(changed)} changed columns, "
+                        f"skipped {len(self._skipped)} of {len(self._domains)} domains")
+        
+        # Persist row hashes of synced tables for the next run
+        if self._sync_state is not None:
+            self._sync_state.save()
+        
         # Generate legacy format if requested
         if generate_legacy:
             self._generate_legacy_format(df)
@@ -172,6 +291,54 @@ class DataOrchestrator:
         
         return self._results
     
+    # ------------------------------------------------------------------
+    # Incremental runs
+    # ------------------------------------------------------------------
+    
+    def _changed_columns(self, df: pd.DataFrame) -> Optional[Set[str]]:
+        """
+        Columns differing from the last run's frame; None (process
+        everything) if the index or the set of columns changed, since
+        domains may probe df.columns without the tracker seeing it.
+        """
+        old = self._last_frame
+        if old is None or not old.index.equals(df.index):
+            return None
+        if set(df.columns) != set(old.columns):
+            return None
+        changed = set()
+        for col in df.columns:
+            if not df[col].equals(old[col]):
+                changed.add(col)
+        return changed
+    
+    def _is_affected(self, domain: BaseDomain, changed: Set[str]) -> bool:
+        if domain.name not in self._results or domain.name not in self._inputs:
+            return True
+        if self._inputs[domain.name] & changed:
+            return True
+        return any(dep in self._processed or dep in self._changed_context for dep in domain.depends_on)
+    
+    def _process_tracked(self, domain: BaseDomain, df: pd.DataFrame, changed: Optional[Set[str]]) -> None:
+        """process_domain() recording the columns read; columns it adds are copied to df."""
+        tracker = ColumnTracker.wrap(df)
+        self.process_domain(domain, tracker)
+        self._inputs[domain.name] = tracker.columns_read
+        
+        previous = self._outputs.get(domain.name, {})
+        outputs = {col: tracker[col] for col in tracker.columns_written}
+        for col, series in outputs.items():
+            df[col] = series
+            # Downstream domains reading this column must re-run too
+            if changed is not None and (col not in previous or not previous[col].equals(series)):
+                changed.add(col)
+        self._outputs[domain.name] = outputs
+    
+    def _reuse_outputs(self, domain: BaseDomain, df: pd.DataFrame) -> None:
+        """Put back the columns a skipped domain added to the frame last time."""
+        for col, series in self._outputs.get(domain.name, {}).items():
+            df[col] = series
+    
     def _generate_legacy_format(self, df: pd.DataFrame) -> None:
         """
         Generate combined dashboard_data.json for backward compatibility.
@@ -186,7 +353,8 @@ class DataOrchestrator:
         if os.path.exists(legacy_path):
             try:
                 with open(legacy_path, 'r') as f:
-                    legacy_data = json.load(f)
+                    # Expand axis refs so untouched sections keep their own dates
+                    legacy_data = expand_axes(json.load(f))
             except Exception:
                 legacy_data = {}
         else:
@@ -257,11 +425,14 @@ class DataOrchestrator:
             legacy_data['regime_score'] = regime.get('score', [])
             legacy_data['regime_code'] = regime.get('regime_code', [])
         
-        # Save merged legacy format
-        with open(legacy_path, 'w') as f:
-            json.dump(legacy_data, f)
+        # Save merged legacy format (shared date axes written once)
+        legacy_data = attach_axes(legacy_data, clean_for_json(legacy_data))
+        result = get_publisher(self.output_dir).publish_json(legacy_path, legacy_data)
         
-        logger.info(f"Updated legacy dashboard_data.json")
+        if result.written:
+            logger.info(f"Updated legacy dashboard_data.json")
+        else:
+            logger.info(f"Legacy dashboard_data.json unchanged")
     
     def _save_timing_metadata(self, total_elapsed: float) -> None:
         """Save processing timing metadata."""
@@ -271,11 +442,11 @@ class DataOrchestrator:
             'domains': self._timing,
             'domain_count': len(self._timing),
             'successful': list(self._timing.keys()),
+            'skipped': list(self._skipped),
         }
         
         timing_path = os.path.join(self.domains_dir, 'processing_metadata.json')
-        with open(timing_path, 'w') as f:
-            json.dump(timing_data, f, indent=2)
+        get_publisher(self.output_dir).publish_json(timing_path, timing_data, indent=2)
     
     def get_domain_result(self, domain_name: str) -> Optional[Dict[str, Any]]:
         """Get result for a specific domain from last run."""
@@ -290,7 +461,27 @@ class DataOrchestrator:
         return None
 
 
-def create_orchestrator(output_dir: str) -> DataOrchestrator:
-    """Factory function to create configured orchestrator."""
-    return DataOrchestrator(output_dir)
+def domain_output_formats() -> List[str]:
+    """Domain output formats from DOMAIN_OUTPUT_FORMATS (comma-separated, default 'json')."""
+    env_formats = os.environ.get('DOMAIN_OUTPUT_FORMATS', 'json')
+    return [f.strip() for f in env_formats.split(',') if f.strip()]
+
+
+def create_orchestrator(
+    output_dir: str,
+    output_formats: Optional[List[str]] = None,
+    incremental: bool = False
+) -> DataOrchestrator:
+    """
+    Factory function to create configured orchestrator.
+    
+    If output_formats is not given, the DOMAIN_OUTPUT_FORMATS environment
+    variable is used (comma-separated, e.g. "json,binary", "json,pyramid",
+    "json,delta" or "json,db").
+    """
+    if output_formats is None:
+        output_formats = domain_output_formats()
+    binary_dtype = os.environ.get('DOMAIN_BINARY_DTYPE', 'float64')
+    return DataOrchestrator(output_dir, output_formats=output_formats, binary_dtype=binary_dtype,
+                            incremental=incremental)
 
@@ -0,0 +1,238 @@
+"""
+refresh_daemon.py
+Long-running refresh loop that keeps pipeline state warm between updates.
+
+A cold `python run_scrapers.py` re-imports pandas/sklearn, logs into
+TradingView, re-reads the JSON caches and recomputes every domain. The
+daemon pays for that once and then keeps in memory:
+
+- the TradingView session (utils/tv_client.py singleton, never closed)
+- the raw FRED/TV series, refreshed per source group on its TTL
+- the FRED frame incl. CLI, rebuilt only when FRED series change
+- an incremental DataOrchestrator, which re-processes only the domains
+  whose input columns changed and keeps the other results
+
+Jobs (TTLs from data_pipeline):
+    tv_markets     every TV_CACHE_HOURS            -> affected domains only
+    tv_economics   every TV_ECONOMICS_CACHE_HOURS  -> full pipeline
+    fred           every FRED_CACHE_HOURS          -> full pipeline
+    scrapers       every SCRAPER_INTERVAL_MINUTES
+
+The full pipeline also rebuilds dashboard_data*.json and the side outputs
+(treasury, ETF, FOMC); the markets job only republishes domain files.
+Refreshed series are written back to the JSON caches, so a cold run after
+the daemon stops starts from current data.
+
+Usage:
+    python refresh_daemon.py [--once] [--no-scrapers]
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import traceback
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import data_pipeline
+from orchestrator import create_orchestrator
+from utils.tv_client import close_session
+from utils.tracing import span, finish_trace, get_tracer
+
+SCRAPER_INTERVAL_MINUTES = int(os.environ.get('SCRAPER_INTERVAL_MINUTES', 60))
+
+
+@dataclass(frozen=True)
+class SourceGroup:
+    """Input series refreshed together; `full` re-runs the whole pipeline."""
+    name: str
+    hours: float
+    full: bool
+
+
+SOURCE_GROUPS = [
+    SourceGroup('tv_markets', data_pipeline.TV_CACHE_HOURS, full=False),
+    SourceGroup('tv_economics', data_pipeline.TV_ECONOMICS_CACHE_HOURS, full=True),
+    SourceGroup('fred', data_pipeline.FRED_CACHE_HOURS, full=True),
+]
+
+
+class RefreshDaemon:
+    """Warm pipeline state plus the refresh steps the scheduler calls."""
+
+    def __init__(self, output_dir: Optional[str] = None):
+        self.output_dir = output_dir or data_pipeline.OUTPUT_DIR
+        self.inputs: Dict[str, Dict[str, pd.Series]] = {'fred': {}, 'tv': {}}
+        self.orchestrator = create_orchestrator(self.output_dir, incremental=True)
+        self.last_refresh: Dict[str, float] = {}
+        self._fred_frames = None      # (df_fred, df_fred_t) for self.inputs['fred']
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Processing
+    # ------------------------------------------------------------------
+
+    def warm_up(self) -> None:
+        """Load inputs (JSON caches, stale symbols fetched) and run the full pipeline once."""
+        with self._lock, span('daemon.warm_up', cat='task'):
+            self.inputs = data_pipeline.fetch_pipeline_inputs()
+            self._fred_frames = None
+            self.run_full()
+            now = time.time()
+            self.last_refresh = {group.name: now for group in SOURCE_GROUPS}
+
+    def build_frame(self) -> pd.DataFrame:
+        """Hybrid frame for the orchestrator; the FRED part is reused until FRED changes."""
+        if self._fred_frames is None:
+            self._fred_frames = data_pipeline.build_fred_frame(self.inputs['fred'])
+        df_fred, df_fred_t = self._fred_frames
+        # build_hybrid_frame may hand back df_fred_t itself, which add_domain_columns extends
+        df = data_pipeline.build_hybrid_frame(df_fred, df_fred_t.copy(), self.inputs['tv'])
+        return data_pipeline.add_domain_columns(df)
+
+    def run_domains(self) -> List[str]:
+        """Re-process the domains affected by changed inputs. Returns their names."""
+        df = self.build_frame()
+        offshore_liquidity = data_pipeline.offshore_liquidity_stage(df).get('offshore_liquidity', {})
+        with span('orchestrator.run', rows=len(df)):
+            self.orchestrator.run(df, generate_legacy=False, context={'offshore_liquidity': offshore_liquidity})
+        return self.orchestrator.processed_domains
+
+    def run_full(self) -> List[str]:
+        """Whole pipeline (legacy JSON, side outputs) on the in-memory inputs."""
+        data_pipeline.run_pipeline(inputs=self.inputs, orchestrator=self.orchestrator)
+        return self.orchestrator.processed_domains
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def fetch_group(self, group: SourceGroup) -> Dict[str, pd.Series]:
+        """Fetch every series of one source group; failed fetches are left out."""
+        fetched: Dict[str, pd.Series] = {}
+        if group.name == 'fred':
+            for sid, name in data_pipeline.FRED_CONFIG.items():
+                with span(f"fred:{name}", cat='fetch') as sp:
+                    s = data_pipeline.fetch_fred_series(sid, name)
+                    if sp is not None:
+                        sp.rows = len(s)
+                if not s.empty:
+                    fetched[name] = s
+            return fetched
+
+        if not data_pipeline.TV_AVAILABLE:
+            return fetched
+        economics = group.name == 'tv_economics'
+        for symbol, (exchange, name) in data_pipeline.TV_CONFIG.items():
+            if (exchange == 'ECONOMICS') == economics:
+                fetched.update(data_pipeline.fetch_tv_symbol(symbol, exchange, name))
+        return fetched
+
+    def refresh(self, group: SourceGroup) -> List[str]:
+        """
+        Fetch one source group and republish what it affects.
+
+        Returns the names of the series whose data changed.
+        """
+        with self._lock, span(f"refresh:{group.name}", cat='task'):
+            start = time.perf_counter()
+            fetched = self.fetch_group(group)
+            source = 'fred' if group.name == 'fred' else 'tv'
+            store = self.inputs[source]
+            changed = [name for name, s in fetched.items() if name not in store or not store[name].equals(s)]
+            store.update(fetched)
+            self.last_refresh[group.name] = time.time()
+
+            if changed:
+                data_pipeline.save_input_cache(source, store)
+            for name in fetched:
+                data_pipeline.update_cache_timestamp(f"FRED_{name}" if source == 'fred' else name)
+
+            if not changed:
+                print(f"[daemon] {group.name}: {len(fetched)} series fetched, nothing changed")
+                return []
+
+            if source == 'fred':
+                self._fred_frames = None
+            domains = self.run_full() if group.full else self.run_domains()
+            print(f"[daemon] {group.name}: {len(changed)} series changed, "
+                  f"re-processed {', '.join(domains) or 'no domains'} in {time.perf_counter() - start:.1f}s")
+            return changed
+
+    def run_job(self, group: SourceGroup) -> None:
+        """Scheduler entry point: one refresh, errors logged rather than raised."""
+        try:
+            self.refresh(group)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _flush_trace(self.output_dir)
+
+    def run_scrapers(self) -> None:
+        from run_scrapers import build_tasks, run_tasks
+
+        try:
+            results = run_tasks(build_tasks(skip_pipeline=True))
+            failed = [r.name for r in results if r.status != 'ok']
+            if failed:
+                print(f"[daemon] scrapers did not complete: {', '.join(failed)}")
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _flush_trace(self.output_dir)
+
+
+def _flush_trace(output_dir: str) -> None:
+    """Write the trace of the last job and start over, so spans don't pile up."""
+    finish_trace(output_dir)
+    get_tracer().clear()
+
+
+def schedule_jobs(daemon: RefreshDaemon, scheduler=None, scrapers: bool = True):
+    """Register the refresh jobs on a `schedule` scheduler (a new one by default)."""
+    import schedule
+
+    scheduler = scheduler or schedule.Scheduler()
+    for group in SOURCE_GROUPS:
+        scheduler.every(int(group.hours * 60)).minutes.do(daemon.run_job, group)
+    if scrapers:
+        scheduler.every(SCRAPER_INTERVAL_MINUTES).minutes.do(daemon.run_scrapers)
+    return scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep pipeline state warm and refresh on a schedule.')
+    parser.add_argument('--once', action='store_true', help='Warm up (full run) and exit')
+    parser.add_argument('--no-scrapers', action='store_true', help='Only refresh pipeline inputs')
+    args = parser.parse_args()
+
+    daemon = RefreshDaemon()
+    try:
+        daemon.warm_up()
+        _flush_trace(daemon.output_dir)
+        if args.once:
+            return
+        if not args.no_scrapers:
+            daemon.run_scrapers()
+
+        scheduler = schedule_jobs(daemon, scrapers=not args.no_scrapers)
+        jobs = ', '.join(f"{g.name} every {g.hours:g}h" for g in SOURCE_GROUPS)
+        print(f"[daemon] Warm. Scheduled: {jobs}")
+        while True:
+            scheduler.run_pending()
+            idle = scheduler.idle_seconds
+            time.sleep(min(60.0, max(1.0, idle if idle is not None else 60.0)))
+    except KeyboardInterrupt:
+        print("[daemon] Stopping")
+    finally:
+        close_session()
+
+
+if __name__ == '__main__':
+    main()
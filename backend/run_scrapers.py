@@ -2,72 +2,212 @@
 run_scrapers.py
 Master orchestrator that runs all scrapers AND data pipeline in a single process,
 sharing the same TradingView session for efficiency.
+
+The scrapers and the pipeline's fetch stage run concurrently; TradingView
+requests from all of them go through the shared rate limiter in
+utils/tv_client.py, so total latency is bounded by the slowest task rather
+than the sum. Pipeline processing starts as soon as its inputs are fetched.
+Each task has a timeout (SCRAPER_TASK_TIMEOUT seconds) and its wall time is
+reported at the end (--json for a machine-readable summary). With
+PIPELINE_TRACE=1 a Chrome trace of every stage is written as well
+(see utils/tracing.py).
+
+For frequent refreshes use refresh_daemon.py, which keeps the session, the
+raw series and the computed domains warm between runs.
+
+Usage:
+    python run_scrapers.py [--force] [--no-pipeline | --only-pipeline] [--json]
 """
 import os
 import sys
+import json
+import time
+import queue
+import threading
+import traceback
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from utils.tv_client import get_tv_session, close_session, TV_AVAILABLE
+from utils.tv_client import cancel_requests, close_session, get_rate_limiter, TV_AVAILABLE
+from utils.tracing import span, finish_trace
 
-def main():
-    """Run all scrapers and data pipeline with shared TV session."""
-    
-    # Parse arguments
-    force_refresh = '--force' in sys.argv or '-f' in sys.argv
-    skip_pipeline = '--no-pipeline' in sys.argv
-    only_pipeline = '--only-pipeline' in sys.argv
-    
-    # Initialize TV session once (shared across all scripts)
-    if TV_AVAILABLE:
-        print("Initializing shared TradingView session...")
-        tv = get_tv_session()
-        if tv:
-            print("[OK] TradingView session ready")
+DEFAULT_TASK_TIMEOUT = float(os.environ.get('SCRAPER_TASK_TIMEOUT', 900))
+
+
+@dataclass
+class Task:
+    """A unit of work; `after` names a task whose result is passed to fn."""
+    name: str
+    fn: Callable[..., Any]
+    after: Optional[str] = None
+    timeout: float = DEFAULT_TASK_TIMEOUT
+
+
+@dataclass
+class TaskResult:
+    name: str
+    status: str          # ok | error | timeout | skipped
+    seconds: float
+    started_at: float    # seconds since the run started
+    error: Optional[str] = None
+
+
+def run_tasks(tasks: List[Task], timeout: Optional[float] = None) -> List[TaskResult]:
+    """
+    Run tasks concurrently, each in its own daemon thread.
+
+    A task with `after` starts once that task succeeds (and is skipped if it
+    fails). A task still running after its timeout is reported as such and
+    abandoned; daemon threads don't keep the process alive at exit. Callers
+    sharing state with the tasks (the TV session) must stop abandoned ones
+    from using it, see main().
+
+    Returns one TaskResult per task, in the order given.
+    """
+    run_start = time.perf_counter()
+    done: "queue.Queue" = queue.Queue()
+    running: Dict[str, tuple] = {}   # name -> (task, start, deadline)
+    results: Dict[str, TaskResult] = {}
+
+    def launch(task: Task, args: tuple) -> None:
+        start = time.perf_counter()
+
+        def target():
+            try:
+                with span(task.name, cat='task'):
+                    value = task.fn(*args)
+                done.put((task.name, 'ok', value, None))
+            except BaseException as e:
+                traceback.print_exc()
+                done.put((task.name, 'error', None, f"{type(e).__name__}: {e}"))
+
+        deadline = start + (timeout if timeout is not None else task.timeout)
+        running[task.name] = (task, start, deadline)
+        threading.Thread(target=target, name=f"task-{task.name}", daemon=True).start()
+
+    def finish(name: str, status: str, error: Optional[str] = None) -> None:
+        _, start, _ = running.pop(name)
+        results[name] = TaskResult(name, status, round(time.perf_counter() - start, 3),
+                                   round(start - run_start, 3), error)
+
+    def skip_dependents(name: str) -> None:
+        for task in tasks:
+            if task.after == name and task.name not in results:
+                results[task.name] = TaskResult(task.name, 'skipped', 0.0, 0.0, f"{name} did not succeed")
+                skip_dependents(task.name)
+
+    for task in tasks:
+        if task.after is None:
+            launch(task, ())
+
+    while running:
+        next_deadline = min(deadline for _, _, deadline in running.values())
+        try:
+            name, status, value, error = done.get(timeout=max(0.0, next_deadline - time.perf_counter()))
+        except queue.Empty:
+            now = time.perf_counter()
+            for name in [n for n, (_, _, deadline) in running.items() if deadline <= now]:
+                task = running[name][0]
+                finish(name, 'timeout', f"still running after {timeout or task.timeout:.0f}s")
+                skip_dependents(name)
+            continue
+
+        if name not in running:
+            continue  # finished after being reported as timed out
+        finish(name, status, error)
+        if status == 'ok':
+            for task in tasks:
+                if task.after == name:
+                    launch(task, (value,))
         else:
-            print("[WARN] Running without authenticated TV session")
-    else:
-        print("[WARN] TvDatafeed not available - scrapers may fail")
-    
+            skip_dependents(name)
+
+    return [results[task.name] for task in tasks]
+
+
+def build_tasks(force_refresh: bool = False, skip_pipeline: bool = False, only_pipeline: bool = False) -> List[Task]:
+    """The refresh tasks for the given command line options."""
+    tasks = []
+
     if not only_pipeline:
-        # Run Index scraper
-        print("\n" + "="*50)
-        print("RUNNING: scraper_indexes.py")
-        print("="*50)
-        try:
+        def indexes():
             from scrapers import scraper_indexes
             scraper_indexes.run_scraper(force_refresh=force_refresh)
-        except Exception as e:
-            print(f"Error in scraper_indexes: {e}")
-        
-        # Run Commodities scraper (reuses same session)
-        print("\n" + "="*50)
-        print("RUNNING: scraper_commodities.py")
-        print("="*50)
-        try:
+
+        def commodities():
             from scrapers import scraper_commodities
             scraper_commodities.run_scraper(force_refresh=force_refresh)
-        except Exception as e:
-            print(f"Error in scraper_commodities: {e}")
-    
+
+        tasks.append(Task('scraper_indexes', indexes))
+        tasks.append(Task('scraper_commodities', commodities))
+
     if not skip_pipeline:
-        # Run Data Pipeline (reuses same session)
-        print("\n" + "="*50)
-        print("RUNNING: data_pipeline.py")
-        print("="*50)
-        try:
+        def pipeline_fetch():
             import data_pipeline
-            data_pipeline.run_pipeline()
-        except Exception as e:
-            print(f"Error in data_pipeline: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Cleanup
+            return data_pipeline.fetch_pipeline_inputs()
+
+        def pipeline_process(inputs):
+            import data_pipeline
+            data_pipeline.run_pipeline(inputs=inputs)
+
+        tasks.append(Task('pipeline_fetch', pipeline_fetch))
+        tasks.append(Task('pipeline_process', pipeline_process, after='pipeline_fetch'))
+
+    return tasks
+
+
+def print_timings(results: List[TaskResult], total: float) -> None:
+    print("\n" + "=" * 50)
+    print(f"{'TASK':<22}{'STATUS':<10}{'START':>8}{'SECONDS':>10}")
+    print("-" * 50)
+    for r in results:
+        print(f"{r.name:<22}{r.status:<10}{r.started_at:>8.1f}{r.seconds:>10.1f}")
+        if r.error:
+            print(f"  {r.error}")
+    print("-" * 50)
+    limiter = get_rate_limiter()
+    print(f"{'total':<22}{'':<10}{'':>8}{total:>10.1f}")
+    print(f"TV requests: {limiter.requests} (rate limit waits {limiter.waited:.1f}s)")
+
+
+def main():
+    """Run all scrapers and data pipeline with shared TV session."""
+
+    # Parse arguments
+    force_refresh = '--force' in sys.argv or '-f' in sys.argv
+    skip_pipeline = '--no-pipeline' in sys.argv
+    only_pipeline = '--only-pipeline' in sys.argv
+    as_json = '--json' in sys.argv
+
+    # The shared TV session is opened lazily by the first fetch that needs it,
+    # so runs served entirely from cache never log in
+    if not TV_AVAILABLE:
+        print("[WARN] TvDatafeed not available - scrapers may fail")
+
+    tasks = build_tasks(force_refresh, skip_pipeline, only_pipeline)
+    print(f"RUNNING: {', '.join(t.name for t in tasks)}")
+
+    start = time.perf_counter()
+    results = run_tasks(tasks)
+    total = time.perf_counter() - start
+
+    # Cleanup. Tasks abandoned on timeout still run in their threads: make
+    # their TradingView requests fail instead of reopening the session
+    if any(r.status == 'timeout' for r in results):
+        cancel_requests()
     close_session()
-    print("\n[OK] All tasks completed")
+
+    print_timings(results, total)
+    finish_trace(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+    if as_json:
+        print(json.dumps({'total_seconds': round(total, 3), 'tasks': [asdict(r) for r in results]}, indent=2))
+
+    failed = [r for r in results if r.status != 'ok']
+    print("\n[OK] All tasks completed" if not failed else f"\n[WARN] {len(failed)} task(s) did not complete")
+    return results
 
 if __name__ == "__main__":
     main()
-
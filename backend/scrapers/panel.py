@@ -0,0 +1,133 @@
+"""
+panel.py
+Vectorized ROC / z-score / percentile panel for multi-asset scraper output.
+
+The scrapers align every symbol on one date index (`all_prices`). Instead of
+computing each horizon per symbol and converting each series to a list
+inside the loop, compute_panel() works on the whole 2-D price matrix:
+
+- all ROC horizons for all symbols come from one lagged-index gather
+  (horizons x dates x symbols)
+- optional rolling z-scores and percentile ranks run as single rolling
+  operations over every (symbol, horizon) column (utils/rolling.py)
+- serialize_panel() converts the result to JSON-ready lists once,
+  column-wise, with NaN/inf as None
+
+Values match the per-series computation the scrapers used before
+((p / p.shift(lag) - 1) * 100) and calculate_zscore() / rolling_percentile()
+in domains/base.py.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.rolling import rolling_percentile_rank, rolling_zscore
+
+# Output key -> lag in rows (trading days)
+ROC_HORIZONS = {
+    'roc_7d': 7,
+    'roc_30d': 30,
+    'roc_90d': 90,
+    'roc_180d': 180,
+    'roc_yoy': 252,
+}
+
+ABSOLUTE_KEY = 'absolute'
+
+# Same defaults as domains/base.py calculate_zscore / rolling_percentile
+ZSCORE_WINDOW = 252
+ZSCORE_MIN_PERIODS = 100
+PERCENTILE_WINDOW = 252 * 5
+PERCENTILE_MIN_PERIODS = 126
+
+
+def roc_matrix(prices: np.ndarray, lags: List[int]) -> np.ndarray:
+    """
+    Percent change over each lag for every column: shape (len(lags), T, S).
+
+    Rows with fewer than `lag` predecessors are NaN.
+    """
+    prices = np.asarray(prices, dtype=float)
+    if prices.ndim == 1:
+        prices = prices[:, None]
+    n_rows = prices.shape[0]
+    lags = np.asarray(lags, dtype=int)
+
+    source = np.arange(n_rows)[None, :] - lags[:, None]          # (H, T)
+    lagged = prices[np.clip(source, 0, None)]                     # (H, T, S)
+    lagged[source < 0] = np.nan
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((prices[None, :, :] / lagged) - 1) * 100
+
+
+def compute_panel(
+    prices: pd.DataFrame,
+    horizons: Optional[Dict[str, int]] = None,
+    zscores: bool = False,
+    percentiles: bool = False,
+    include_absolute: bool = True,
+) -> pd.DataFrame:
+    """
+    ROC panel for aligned prices (dates x symbols).
+
+    Args:
+        prices: Prices with one column per symbol (already forward-filled)
+        horizons: {key: lag}; defaults to ROC_HORIZONS
+        zscores: Add '<key>_z' rolling z-scores of each ROC
+        percentiles: Add '<key>_pct' rolling percentile ranks of each ROC
+        include_absolute: Include the prices themselves as 'absolute'
+
+    Returns:
+        DataFrame with (symbol, metric) MultiIndex columns, metrics per
+        symbol in order: absolute, ROC horizons, z-scores, percentiles.
+    """
+    horizons = ROC_HORIZONS if horizons is None else horizons
+    symbols = list(prices.columns)
+    keys = list(horizons)
+
+    rocs = roc_matrix(prices.to_numpy(dtype=float), list(horizons.values()))   # (H, T, S)
+    # (T, H, S) -> (T, H*S) with columns ordered metric-major
+    flat = rocs.transpose(1, 0, 2).reshape(len(prices), -1)
+    roc_columns = pd.MultiIndex.from_product([keys, symbols], names=['metric', 'symbol'])
+    roc_frame = pd.DataFrame(flat, index=prices.index, columns=roc_columns)
+
+    blocks = []
+    if include_absolute:
+        absolute = prices.astype(float).copy()
+        absolute.columns = pd.MultiIndex.from_product([[ABSOLUTE_KEY], symbols], names=['metric', 'symbol'])
+        blocks.append(absolute)
+    blocks.append(roc_frame)
+
+    if zscores:
+        z = rolling_zscore(roc_frame, ZSCORE_WINDOW, ZSCORE_MIN_PERIODS)
+        z.columns = pd.MultiIndex.from_product([[f'{k}_z' for k in keys], symbols], names=['metric', 'symbol'])
+        blocks.append(z)
+    if percentiles:
+        pct = rolling_percentile_rank(roc_frame, PERCENTILE_WINDOW, PERCENTILE_MIN_PERIODS)
+        pct.columns = pd.MultiIndex.from_product([[f'{k}_pct' for k in keys], symbols], names=['metric', 'symbol'])
+        blocks.append(pct)
+
+    panel = pd.concat(blocks, axis=1)
+    metrics = list(dict.fromkeys(panel.columns.get_level_values('metric')))
+    order = pd.MultiIndex.from_product([symbols, metrics], names=['symbol', 'metric'])
+    return panel.swaplevel(axis=1).reindex(columns=order)
+
+
+def serialize_panel(panel: pd.DataFrame) -> Dict[str, Dict[str, list]]:
+    """
+    {symbol: {metric: values}} with NaN/inf as None.
+
+    The whole panel is converted in one pass (column-major) rather than
+    series by series.
+    """
+    values = panel.to_numpy(dtype=float)
+    cells = values.astype(object)
+    cells[~np.isfinite(values)] = None
+    columns = cells.T.tolist()
+
+    out: Dict[str, Dict[str, list]] = {}
+    for (symbol, metric), column in zip(panel.columns, columns):
+        out.setdefault(symbol, {})[metric] = column
+    return out
@@ -5,7 +5,6 @@ Fetches global stock index data from TradingView with caching.
 import os
 import sys
 import pandas as pd
-import numpy as np
 import json
 from datetime import datetime, date
 
@@ -14,6 +13,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Use shared TV client
 from utils.tv_client import fetch_historical_data, get_tv_session, TV_AVAILABLE
+from utils.publisher import get_publisher
+from scrapers.panel import compute_panel, serialize_panel
 
 # Configuration
 N_BARS = 7500  # ~30 years of daily data
@@ -34,12 +35,6 @@ INDEXES_CONFIG = {
     'BUZZ': ('AMEX', 'VanEck Social Sentiment ETF'),
 }
 
-def calc_roc(series, period):
-    return ((series / series.shift(period)) - 1) * 100
-
-def clean_series(series):
-    return [float(x) if pd.notnull(x) and np.isfinite(x) else None for x in series.tolist()]
-
 def is_cache_valid():
     """Check if cached data is recent enough to skip refresh."""
     if not os.path.exists(OUTPUT_PATH):
@@ -47,8 +42,9 @@ def is_cache_valid():
         return False
     
     try:
-        file_mtime = datetime.fromtimestamp(os.path.getmtime(OUTPUT_PATH))
-        age_hours = (datetime.now() - file_mtime).total_seconds() / 3600
+        # Unchanged refreshes skip the write, so use the publisher's check time
+        checked_at = get_publisher(os.path.dirname(OUTPUT_PATH)).checked_at(OUTPUT_PATH)
+        age_hours = (datetime.now() - checked_at).total_seconds() / 3600
         
         if age_hours > CACHE_MAX_AGE_HOURS:
             print(f"Cache is {age_hours:.1f}h old (max: {CACHE_MAX_AGE_HOURS}h) - will refresh")
@@ -134,34 +130,20 @@ def run_scraper(force_refresh=False):
         else:
             print(f"Warning: Could not fetch {symbol}")
 
-    # Process each index
-    for symbol in all_prices.columns:
-        print(f"Processing {symbol}...")
-        prices = all_prices[symbol].ffill()
-        
-        data_output['indexes'][symbol] = {
-            'absolute': clean_series(prices),
-            'roc_7d': clean_series(calc_roc(prices, 7)),
-            'roc_30d': clean_series(calc_roc(prices, 30)),
-            'roc_90d': clean_series(calc_roc(prices, 90)),
-            'roc_180d': clean_series(calc_roc(prices, 180)),
-            'roc_yoy': clean_series(calc_roc(prices, 252)),
-        }
+    # All symbols and horizons at once, serialized column-wise
+    print(f"Processing {len(all_prices.columns)} symbols...")
+    data_output['indexes'] = serialize_panel(compute_panel(all_prices.ffill()))
 
     # Fetch BTC overlay
     print("Fetching BTC overlay...")
     btc_df = fetch_historical_data('BTCUSD', 'BITSTAMP', n_bars=N_BARS)
     if btc_df is not None and not btc_df.empty:
         btc_df.index = btc_df.index.normalize()
-        btc_aligned = btc_df['close'].reindex(all_prices.index).ffill()
-        data_output['btc'] = {
-            'absolute': clean_series(btc_aligned),
-            'roc_30d': clean_series(calc_roc(btc_aligned, 30))
-        }
+        btc_aligned = btc_df['close'].reindex(all_prices.index).ffill().to_frame('btc')
+        data_output['btc'] = serialize_panel(compute_panel(btc_aligned, horizons={'roc_30d': 30}))['btc']
 
     # Save
-    with open(OUTPUT_PATH, 'w') as f:
-        json.dump(data_output, f)
+    get_publisher(os.path.dirname(OUTPUT_PATH)).publish_json(OUTPUT_PATH, data_output)
     
     print(f"[OK] Saved {len(data_output['dates'])} days to {OUTPUT_PATH}")
 
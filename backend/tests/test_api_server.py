@@ -0,0 +1,368 @@
+"""
+API Server Tests
+
+Tests for the local domain API (api_server.py):
+- Domain tables from JSON and memory-mapped binary outputs agree
+- Domain files without an axes table sit on the tail of the shared axis
+- Slices project series, cut date ranges and resample
+- Tables are reloaded when the files change
+- HTTP: ETag revalidation, gzip, errors, static files
+- Delta records over /domains/{name}/deltas and server-sent /events
+"""
+
+import os
+import sys
+import json
+import gzip
+import http.client
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server
+import domains.delta as delta
+from api_server import ApiError, ApiServer, DomainStore, load_domain_table, parse_slice_query, slice_domain
+from domains.axis import encode_date_axis
+from domains.binary import write_domain_binary
+from domains.delta import read_published, write_domain_delta
+from utils.publisher import get_publisher
+
+DAYS = 400
+
+
+def _domain(index, scale=1.0):
+    n = len(index)
+    return {
+        'axes': {'daily': encode_date_axis(index)},
+        'dates': {'$axis': 'daily'},
+        'total': [None, None] + (np.arange(2, n) * scale).tolist(),
+        'rocs': {'1M': np.linspace(-1, 1, n).tolist(), '1Y': np.full(n, 2.0).tolist()},
+        'latest': {'total': 1.0},
+    }
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    index = pd.date_range('2025-01-01', periods=DAYS, freq='D')
+    publisher = get_publisher(str(tmp_path))
+    domains = tmp_path / 'domains'
+    publisher.publish_json(str(domains / 'metadata.json'), {'axes': {'daily': encode_date_axis(index)}})
+    publisher.publish_json(str(domains / 'gli.json'), _domain(index))
+    # No axes table, last 100 days only
+    publisher.publish_json(str(domains / 'offshore.json'), {'stress': list(range(100)), 'label': 'x'})
+    return tmp_path
+
+
+def _write_binary(data_dir, name='gli', scale=1.0):
+    index = pd.date_range('2025-01-01', periods=DAYS, freq='D')
+    domains = data_dir / 'domains'
+    write_domain_binary(_domain(index, scale), str(domains / f'{name}.manifest.json'), str(domains / f'{name}.bin'),
+                        publisher=get_publisher(str(data_dir)))
+
+
+# ============================================================
+# DOMAIN TABLES
+# ============================================================
+
+class TestDomainTables:
+    """Tests for load_domain_table and DomainStore."""
+
+    def test_json_table(self, data_dir):
+        table = load_domain_table(str(data_dir / 'domains'), 'gli')
+
+        assert set(table.columns) == {'total', 'rocs.1M', 'rocs.1Y'}
+        assert len(table.index) == DAYS
+        assert np.isnan(table.columns['total'][0])
+
+    def test_binary_table_is_memory_mapped_and_matches_json(self, data_dir):
+        from_json = load_domain_table(str(data_dir / 'domains'), 'gli')
+        _write_binary(data_dir)
+        from_binary = load_domain_table(str(data_dir / 'domains'), 'gli')
+
+        assert isinstance(from_binary.columns['total'], np.memmap)
+        assert set(from_binary.columns) == set(from_json.columns)
+        for path, values in from_json.columns.items():
+            np.testing.assert_array_equal(from_binary.columns[path], values)
+
+    def test_stale_binary_is_ignored(self, data_dir):
+        _write_binary(data_dir, scale=5.0)
+        # Later JSON-only run
+        index = pd.date_range('2025-01-01', periods=DAYS, freq='D')
+        path = data_dir / 'domains' / 'gli.json'
+        get_publisher(str(data_dir)).publish_json(str(path), _domain(index, scale=2.0))
+        os.utime(path, ns=(os.stat(path).st_mtime_ns + 10**9,) * 2)
+
+        table = load_domain_table(str(data_dir / 'domains'), 'gli')
+        assert not isinstance(table.columns['total'], np.memmap)
+        assert table.columns['total'][-1] == (DAYS - 1) * 2.0
+
+    def test_domain_without_axes_uses_shared_tail(self, data_dir):
+        table = load_domain_table(str(data_dir / 'domains'), 'offshore')
+
+        assert list(table.columns) == ['stress']
+        assert table.index[0] == pd.Timestamp('2025-01-01') + pd.Timedelta(days=DAYS - 100)
+        assert table.index[-1] == pd.Timestamp('2025-01-01') + pd.Timedelta(days=DAYS - 1)
+
+    def test_store_reloads_changed_files(self, data_dir):
+        store = DomainStore(str(data_dir))
+        first = store.get('gli')
+        assert store.get('gli') is first
+
+        _write_binary(data_dir, scale=3.0)
+        second = store.get('gli')
+        assert second is not first
+        assert second.version != first.version
+        assert second.columns['total'][-1] == (DAYS - 1) * 3.0
+
+    def test_unknown_domain(self, data_dir):
+        store = DomainStore(str(data_dir))
+
+        for name in ('nope', '../gli'):
+            with pytest.raises(ApiError) as e:
+                store.get(name)
+            assert e.value.status == 404
+
+
+# ============================================================
+# SLICING
+# ============================================================
+
+class TestSlice:
+    """Tests for slice_domain and parse_slice_query."""
+
+    @pytest.fixture
+    def table(self, data_dir):
+        return load_domain_table(str(data_dir / 'domains'), 'gli')
+
+    def test_series_and_date_range(self, table):
+        result = slice_domain(table, series=['total'], start='2025-01-01', end='2025-01-05')
+
+        assert result['dates'] == ['2025-01-01', '2025-01-02', '2025-01-03', '2025-01-04', '2025-01-05']
+        assert result['series'] == {'total': [None, None, 2.0, 3.0, 4.0]}
+
+    def test_series_prefix(self, table):
+        result = slice_domain(table, series=['rocs'], start='2026-01-01')
+
+        assert list(result['series']) == ['rocs.1M', 'rocs.1Y']
+        assert result['start'] == '2026-01-01'
+        assert result['end'] == table.index[-1].strftime('%Y-%m-%d')
+
+    def test_unknown_series(self, table):
+        with pytest.raises(ApiError) as e:
+            slice_domain(table, series=['rocs.3M'])
+        assert e.value.status == 404
+
+    def test_monthly_resolution(self, table):
+        result = slice_domain(table, series=['total'], start='2025-01-10', end='2025-03-15', resolution='monthly')
+
+        # Last value per month, labelled with the last date in the slice
+        assert result['dates'] == ['2025-01-31', '2025-02-28', '2025-03-15']
+        assert result['series']['total'] == [30.0, 58.0, 73.0]
+
+    def test_lttb_shares_one_date_list(self, table):
+        result = slice_domain(table, resolution='lttb', points=20)
+
+        assert len(result['dates']) < DAYS
+        assert all(len(v) == len(result['dates']) for v in result['series'].values())
+        assert result['end'] == table.index[-1].strftime('%Y-%m-%d')
+
+    def test_empty_range(self, table):
+        result = slice_domain(table, series=['total'], start='2030-01-01')
+
+        assert result['dates'] == []
+        assert result['series'] == {'total': []}
+
+    def test_bad_parameters(self, table):
+        for kwargs in ({'resolution': 'hourly'}, {'start': 'yesterday-ish'}, {'resolution': 'lttb', 'points': 2}):
+            with pytest.raises(ApiError) as e:
+                slice_domain(table, **kwargs)
+            assert e.value.status == 400
+
+    def test_timezone_aware_dates_use_utc_date(self, table):
+        result = slice_domain(table, series=['total'], start='2025-01-03T00:00Z', end='2025-01-05T23:00-02:00')
+
+        assert result['dates'] == ['2025-01-03', '2025-01-04', '2025-01-05', '2025-01-06']
+
+    def test_query_normalization(self):
+        a = parse_slice_query('series=total,%20rocs&start=2025-01-01')
+        b = parse_slice_query('start=2025-01-01&series=total,rocs&end=&points=50')
+
+        assert a == b
+        assert a['series'] == ['total', 'rocs']
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+class TestHttp:
+    """Tests for ApiServer over a real socket."""
+
+    @pytest.fixture
+    def server(self, data_dir, tmp_path_factory):
+        static = tmp_path_factory.mktemp('public')
+        (static / 'commodities_data.json').write_text(json.dumps({'gold': list(range(500))}))
+        srv = ApiServer(('127.0.0.1', 0), data_dir=str(data_dir), static_dirs=[str(static)])
+        thread = threading.Thread(target=srv.serve_forever, daemon=True)
+        thread.start()
+        yield f'http://127.0.0.1:{srv.server_address[1]}'
+        srv.shutdown()
+        srv.server_close()
+
+    @staticmethod
+    def _get(url, **headers):
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as r:
+                return r.status, r.headers, r.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def test_slice_with_gzip_and_etag(self, server):
+        url = f'{server}/domains/gli?series=rocs.1Y&start=2025-01-01'
+        status, headers, body = self._get(url, **{'Accept-Encoding': 'gzip'})
+
+        assert status == 200
+        assert headers['Content-Encoding'] == 'gzip'
+        result = json.loads(gzip.decompress(body))
+        assert result['series']['rocs.1Y'] == [2.0] * DAYS
+
+        status, headers, body = self._get(url, **{'If-None-Match': headers['ETag']})
+        assert status == 304
+        assert body == b''
+
+    def test_etag_depends_on_query(self, server):
+        _, a, _ = self._get(f'{server}/domains/gli?series=total')
+        _, b, _ = self._get(f'{server}/domains/gli?series=rocs')
+
+        assert a['ETag'] != b['ETag']
+
+    def test_errors(self, server):
+        assert self._get(f'{server}/domains/nope')[0] == 404
+        status, _, body = self._get(f'{server}/domains/gli?resolution=hourly')
+        assert status == 400
+        assert 'hourly' in json.loads(body)['error']
+        assert self._get(f'{server}/domains/gli?start=2020-01-01T00:00Z')[0] == 200
+
+    def test_static_files(self, server):
+        status, headers, body = self._get(f'{server}/domains/gli.json')
+        assert status == 200
+        assert 'Content-Encoding' not in headers
+        assert json.loads(body)['latest'] == {'total': 1.0}
+
+        status, _, body = self._get(f'{server}/commodities_data.json', **{'Accept-Encoding': 'gzip'})
+        assert status == 200
+        assert json.loads(gzip.decompress(body))['gold'][-1] == 499
+
+        assert self._get(f'{server}/../../etc/passwd')[0] == 404
+        assert self._get(f'{server}/%2e%2e/api_server.py')[0] == 404
+
+
+
+# ============================================================
+# DELTAS
+# ============================================================
+
+def _publish_version(data_dir, days):
+    index = pd.date_range('2025-01-01', periods=days, freq='D')
+    publisher = get_publisher(str(data_dir))
+    domains = str(data_dir / 'domains')
+    path = os.path.join(domains, 'gli.json')
+    data = _domain(index)
+    data['rocs']['1M'] = np.sin(np.arange(days)).tolist()    # appended, not rescaled
+    previous = read_published(path, publisher)
+    result = publisher.publish_json(path, data)
+    return write_domain_delta(previous, data, 'gli', domains, result.sha256, result.size, publisher=publisher)
+
+
+class TestDeltas:
+    """Tests for DomainStore.deltas and the /events stream."""
+
+    @pytest.fixture(autouse=True)
+    def versions(self, data_dir, monkeypatch):
+        monkeypatch.setattr(delta, '_published', {})
+        _publish_version(data_dir, DAYS)        # v1 (overwrites the fixture file)
+        _publish_version(data_dir, DAYS + 1)    # v2
+        _publish_version(data_dir, DAYS + 2)    # v3
+
+    def test_records_since_version(self, data_dir):
+        store = DomainStore(str(data_dir))
+
+        result = store.deltas('gli', 1)
+        assert result['current'] == 3
+        assert [r['version'] for r in result['deltas']] == [2, 3]
+        assert store.deltas('gli', 3)['deltas'] == []
+        assert store.deltas('gli', 0)['full'] is True
+        assert store.versions() == {'gli': 3}
+
+    def test_missing_record_means_full(self, data_dir, monkeypatch):
+        monkeypatch.setattr(delta, 'MAX_DELTAS', 1)
+        _publish_version(data_dir, DAYS + 3)
+
+        store = DomainStore(str(data_dir))
+        assert store.deltas('gli', 2)['full'] is True
+        assert [r['version'] for r in store.deltas('gli', 3)['deltas']] == [4]
+
+    def test_events_stream_new_records(self, data_dir, monkeypatch):
+        monkeypatch.setattr(api_server, 'EVENT_POLL_SECONDS', 0.05)
+        srv = ApiServer(('127.0.0.1', 0), data_dir=str(data_dir), static_dirs=[])
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        conn = http.client.HTTPConnection('127.0.0.1', srv.server_address[1], timeout=10)
+        try:
+            conn.request('GET', '/events?domains=gli')
+            response = conn.getresponse()
+            assert response.getheader('Content-Type') == 'text/event-stream'
+
+            def next_event():
+                fields = {}
+                while True:
+                    line = response.fp.readline().decode().rstrip('\n')
+                    if not line:
+                        return fields
+                    key, _, value = line.partition(': ')
+                    fields[key] = value
+
+            assert next_event() == {'event': 'versions', 'data': '{"gli":3}'}
+            _publish_version(data_dir, DAYS + 3)
+            event = next_event()
+            assert (event['event'], event['id']) == ('delta', 'gli:4')
+            record = json.loads(event['data'])
+            assert record['base_version'] == 3
+            assert [['axes', 'daily', 'length'], DAYS + 3] in record['set']
+        finally:
+            conn.close()
+            srv.shutdown()
+            srv.server_close()
+
+    def test_events_stream_ends_on_error(self, data_dir, monkeypatch):
+        monkeypatch.setattr(api_server, 'EVENT_POLL_SECONDS', 0.05)
+
+        def broken(self, name, since):
+            raise RuntimeError('store failed')
+
+        monkeypatch.setattr(DomainStore, 'deltas', broken)
+        srv = ApiServer(('127.0.0.1', 0), data_dir=str(data_dir), static_dirs=[])
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        conn = http.client.HTTPConnection('127.0.0.1', srv.server_address[1], timeout=10)
+        try:
+            conn.request('GET', '/events?domains=gli')
+            response = conn.getresponse()
+            _publish_version(data_dir, DAYS + 3)
+
+            rest = response.read().decode()
+            assert rest.endswith('event: error\ndata: {"error":"Internal error"}\n\n')
+            assert 'HTTP/1.1' not in rest
+        finally:
+            conn.close()
+            srv.shutdown()
+            srv.server_close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,191 @@
+"""
+Auction Alert Engine Tests
+
+Tests for the rule tables in treasury/treasury_auction_demand.py:
+- Threshold levels are exclusive and use per-security-type thresholds
+- Combined stress rules (zero readings, suppression by critical alerts)
+- Frame evaluation matches single-auction detection
+- Trend rules over a rolling window of same-type auctions
+- Alert history for backtesting
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from treasury.treasury_auction_demand import (
+    ALERT_HISTORY_COLUMNS,
+    build_alert_history,
+    detect_auction_alerts,
+    detect_trend_alerts,
+    evaluate_auction_alerts,
+)
+
+
+def _auction(security_type='Note', security_term='10-Year', dealer_pct=10.0, indirect_pct=75.0, bid_to_cover=2.8, **extra):
+    return dict(security_type=security_type, security_term=security_term, dealer_pct=dealer_pct,
+                indirect_pct=indirect_pct, bid_to_cover=bid_to_cover, **extra)
+
+
+def _history(values, security_type='Note', metric='dealer_pct'):
+    """Auctions of one type, most recent first (as fetched), with `values` given oldest first."""
+    rows = []
+    dates = pd.date_range('2024-01-01', periods=len(values), freq='7D')
+    for i, (date, value) in enumerate(zip(dates, values)):
+        rows.append(_auction(security_type, cusip=f'CUSIP{i:04d}', auction_date=date, **{metric: value}))
+    return pd.DataFrame(rows[::-1])
+
+
+# ============================================================
+# THRESHOLD RULES
+# ============================================================
+
+class TestThresholdRules:
+    """Tests for per-auction threshold alerts."""
+
+    def test_healthy_auction_has_no_alerts(self):
+        assert detect_auction_alerts(_auction()) == []
+
+    def test_only_worst_level_per_metric(self):
+        alerts = detect_auction_alerts(_auction(dealer_pct=40.0))
+
+        assert [a['type'] for a in alerts] == ['HIGH_DEALER_TAKEDOWN']
+        assert alerts[0]['level'] == 'critical'
+        assert alerts[0]['threshold'] == 35
+        assert alerts[0]['message'] == "Dealers absorbed 40.0% of 10-Year Note (threshold: 35%)"
+
+    def test_thresholds_depend_on_security_type(self):
+        # 40% is critical for a Note but only a warning for a Bill
+        bill = detect_auction_alerts(_auction('Bill', '13-Week', dealer_pct=40.0))
+        assert bill[0]['level'] == 'warning'
+
+    def test_unknown_type_uses_note_thresholds(self):
+        alerts = detect_auction_alerts(_auction('Other', dealer_pct=40.0))
+        assert alerts[0]['threshold'] == 35
+
+    def test_missing_values_never_alert(self):
+        assert detect_auction_alerts(_auction(dealer_pct=None, indirect_pct=None, bid_to_cover=None)) == []
+
+    def test_name_formatting_matches_fields(self):
+        alerts = detect_auction_alerts(_auction('FRN', np.nan, dealer_pct=45.0))
+        assert 'of nan FRN' in alerts[0]['message']
+
+
+# ============================================================
+# STRESS RULES
+# ============================================================
+
+class TestStressRules:
+    """Tests for combined multi-metric stress alerts."""
+
+    def test_three_metrics_is_critical(self):
+        alerts = detect_auction_alerts(_auction(dealer_pct=23.0, indirect_pct=62.0, bid_to_cover=2.35))
+        stress = [a for a in alerts if a['metric'] == 'combined']
+
+        assert [a['type'] for a in stress] == ['MULTI_METRIC_STRESS']
+        assert stress[0]['value'] == 3
+
+    def test_dual_stress_suppressed_by_critical_alert(self):
+        dual = detect_auction_alerts(_auction(dealer_pct=23.0, indirect_pct=62.0))
+        assert dual[-1]['type'] == 'DUAL_METRIC_STRESS'
+
+        with_critical = detect_auction_alerts(_auction(dealer_pct=40.0, indirect_pct=62.0))
+        assert 'DUAL_METRIC_STRESS' not in [a['type'] for a in with_critical]
+
+    def test_zero_reading_does_not_count(self):
+        alerts = detect_auction_alerts(_auction(indirect_pct=0.0, bid_to_cover=2.35))
+        assert 'DUAL_METRIC_STRESS' not in [a['type'] for a in alerts]
+        assert alerts[0]['type'] == 'WEAK_FOREIGN_DEMAND'
+
+
+# ============================================================
+# FRAME EVALUATION
+# ============================================================
+
+class TestEvaluateAuctionAlerts:
+    """Tests for whole-frame evaluation."""
+
+    def test_matches_single_auction_detection(self):
+        rng = np.random.default_rng(0)
+        types = ['Bill', 'Note', 'Bond', 'TIPS', 'FRN', 'CMB']
+        auctions = [
+            _auction(types[i % len(types)], f'{i}-Week',
+                     dealer_pct=float(rng.uniform(5, 50)),
+                     indirect_pct=float(rng.uniform(30, 80)),
+                     bid_to_cover=float(rng.uniform(1.9, 3.2)))
+            for i in range(200)
+        ]
+
+        alerts = evaluate_auction_alerts(pd.DataFrame(auctions))
+
+        assert len(alerts) == len(auctions)
+        assert alerts == [detect_auction_alerts(a) for a in auctions]
+
+    def test_empty_frame(self):
+        assert evaluate_auction_alerts(pd.DataFrame()) == []
+
+
+# ============================================================
+# TREND RULES
+# ============================================================
+
+class TestTrendRules:
+    """Tests for rolling-window trend alerts."""
+
+    def test_rising_dealer_share(self):
+        df = _history([10, 11, 10, 12, 13, 14, 15, 16])
+        alerts = detect_trend_alerts(df)
+
+        assert [a['type'] for a in alerts] == ['DETERIORATING_DEALER_TREND']
+        assert alerts[0]['title'] == 'Note Dealer Trend Deteriorating'
+        assert alerts[0]['value'] == pytest.approx(15.0)
+        assert alerts[0]['threshold'] == pytest.approx(31 / 3 * 1.25)
+
+    def test_window_limited_to_lookback(self):
+        # The rise happened long before the last 6 auctions
+        df = _history([5, 5, 5, 20, 20, 20, 20, 20, 20, 20])
+        assert detect_trend_alerts(df, lookback_auctions=10) != []
+        assert detect_trend_alerts(df, lookback_auctions=6) == []
+
+    def test_needs_minimum_auctions(self):
+        df = _history([10, 10, 20, 20])
+        assert detect_trend_alerts(pd.concat([df, _history([2.6] * 4, 'TIPS', 'bid_to_cover')])) == []
+
+
+# ============================================================
+# ALERT HISTORY
+# ============================================================
+
+class TestAlertHistory:
+    """Tests for the backtesting alert history."""
+
+    def test_threshold_and_trend_hits(self):
+        df = _history([10, 11, 10, 12, 13, 14, 15, 40])
+        history = build_alert_history(df)
+
+        assert list(history.columns) == ALERT_HISTORY_COLUMNS
+        assert history['auction_date'].is_monotonic_decreasing
+        latest = history[history['auction_date'] == history['auction_date'].max()]
+        assert set(latest['type']) == {'HIGH_DEALER_TAKEDOWN', 'DETERIORATING_DEALER_TREND'}
+
+    def test_trend_evaluated_as_of_each_auction(self):
+        df = _history([10, 11, 10, 12, 13, 14, 15, 16])
+        history = build_alert_history(df)
+        trend_dates = history.loc[history['metric'] == 'dealer_pct_trend', 'auction_date']
+
+        # Every auction from the 6th on already shows the rise
+        assert len(trend_dates) == 3
+
+    def test_no_alerts(self):
+        history = build_alert_history(_history([10.0] * 6))
+        assert history.empty
+        assert list(history.columns) == ALERT_HISTORY_COLUMNS
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
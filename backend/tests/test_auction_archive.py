@@ -0,0 +1,195 @@
+"""
+Auction Archive Tests
+
+Tests for the local auction archive in treasury/treasury_auction_demand.py
+(TreasuryDirect pages are served by a fake, no network):
+- Save/load round trip of the columnar file
+- Upserts keyed by (cusip, auction_date)
+- Paginated backfill and incremental updates
+- fetch_all_auction_data lookback on top of the archive
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from treasury import treasury_auction_demand as tad
+
+
+def _raw_auction(sec_type, i, auction_date, bid_to_cover=2.5):
+    return {
+        'cusip': f'{sec_type[:2].upper()}{i:07d}',
+        'auctionDate': auction_date.strftime('%Y-%m-%dT00:00:00'),
+        'issueDate': (auction_date + timedelta(days=2)).strftime('%Y-%m-%dT00:00:00'),
+        'maturityDate': None,
+        'securityType': sec_type,
+        'securityTerm': '13-Week' if sec_type == 'Bill' else '10-Year',
+        'bidToCoverRatio': str(bid_to_cover),
+        'totalAccepted': '1000',
+        'indirectBidderAccepted': '600',
+        'directBidderAccepted': '',
+        'primaryDealerAccepted': '150',
+    }
+
+
+class FakeTreasuryDirect:
+    """Serves auctions per type, most recent first, page by page."""
+
+    def __init__(self, counts, end=datetime(2025, 6, 30), ignore_pagenum=False):
+        self.auctions = {
+            sec_type: [_raw_auction(sec_type, i, end - timedelta(days=7 * i)) for i in range(n)]
+            for sec_type, n in counts.items()
+        }
+        self.ignore_pagenum = ignore_pagenum
+        self.requests = []
+        self.fail_on = set()
+        self._lock = threading.Lock()
+
+    def add(self, sec_type, auction):
+        self.auctions[sec_type].insert(0, auction)
+
+    def __call__(self, security_type, page=1, page_size=tad.MAX_PAGE_SIZE):
+        with self._lock:
+            self.requests.append((security_type, page))
+        if (security_type, page) in self.fail_on:
+            raise requests.exceptions.ConnectionError('boom')
+        if self.ignore_pagenum:
+            page = 1
+        auctions = self.auctions.get(security_type, [])
+        return auctions[(page - 1) * page_size:page * page_size]
+
+
+@pytest.fixture
+def archive_file(tmp_path, monkeypatch):
+    path = str(tmp_path / 'archive.npz')
+    monkeypatch.setattr(tad, 'ARCHIVE_FILE', path)
+    return path
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeTreasuryDirect({'Bill': 600, 'Note': 260, 'Bond': 10})
+    monkeypatch.setattr(tad, '_fetch_auction_page', fake)
+    monkeypatch.setattr(tad, 'SECURITY_TYPES', ['Bill', 'Note', 'Bond'])
+    return fake
+
+
+# ============================================================
+# STORAGE
+# ============================================================
+
+class TestArchiveStorage:
+    """Tests for the columnar archive file."""
+
+    def test_round_trip(self, archive_file):
+        records = tad._parse_auction_records(
+            [_raw_auction('Note', i, datetime(2024, 1, 1) + timedelta(days=i)) for i in range(5)], 'Note')
+        df = tad.merge_auctions(tad._empty_archive(), tad._records_to_archive_frame(records))
+
+        tad.save_auction_archive(df)
+        loaded = tad.load_auction_archive()
+
+        pd.testing.assert_frame_equal(loaded, df)
+        assert loaded['maturity_date'].iloc[0] is None
+        assert np.isnan(loaded['direct_bidder_accepted']).all()
+
+    def test_missing_or_unreadable_archive_is_empty(self, archive_file):
+        assert tad.load_auction_archive().empty
+        with open(archive_file, 'wb') as f:
+            f.write(b'not an archive')
+        assert list(tad.load_auction_archive().columns) == tad.ARCHIVE_COLUMNS
+
+    def test_merge_keys_on_cusip_and_date(self):
+        date = datetime(2025, 1, 2)
+        old = tad._records_to_archive_frame(tad._parse_auction_records(
+            [_raw_auction('Note', 1, date, 2.4), _raw_auction('Note', 2, date)], 'Note'))
+        # Revised result for the same auction, and a reopening of the same CUSIP
+        fresh = tad._records_to_archive_frame(tad._parse_auction_records(
+            [_raw_auction('Note', 1, date, 2.6), _raw_auction('Note', 1, date + timedelta(days=28))], 'Note'))
+
+        merged = tad.merge_auctions(old, fresh)
+
+        assert len(merged) == 3
+        assert merged['auction_date'].is_monotonic_decreasing
+        revised = merged[(merged['cusip'] == 'NO0000001') & (merged['auction_date'] == date)]
+        assert revised['bid_to_cover'].tolist() == [2.6]
+
+
+# ============================================================
+# BACKFILL / INCREMENTAL
+# ============================================================
+
+class TestArchiveUpdates:
+    """Tests for paginated backfill and incremental updates."""
+
+    def test_backfill_fetches_every_page(self, archive_file, server):
+        archive = tad.update_auction_archive(silent=True)
+
+        assert len(archive) == 870
+        assert os.path.exists(archive_file)
+        bill_pages = sorted(p for t, p in server.requests if t == 'Bill')
+        assert bill_pages[:3] == [1, 2, 3]
+
+    def test_unparsable_record_does_not_end_backfill(self, archive_file, server):
+        server.auctions['Bill'][10]['auctionDate'] = 'not a date'
+
+        archive = tad.update_auction_archive(silent=True)
+
+        assert len(archive) == 869
+        assert max(p for t, p in server.requests if t == 'Bill') >= 3
+
+    def test_incremental_requests_only_first_page(self, archive_file, server):
+        tad.update_auction_archive(silent=True)
+        server.requests.clear()
+        server.add('Bill', _raw_auction('Bill', 9999, datetime(2025, 7, 7)))
+
+        archive = tad.update_auction_archive(silent=True)
+
+        assert sorted(server.requests) == [('Bill', 1), ('Bond', 1), ('Note', 1)]
+        assert len(archive) == 871
+        assert archive['auction_date'].iloc[0] == pd.Timestamp('2025-07-07')
+
+    def test_failed_backfill_is_not_saved(self, archive_file, server):
+        server.fail_on.add(('Bill', 2))
+
+        assert tad.update_auction_archive(silent=True).empty
+        assert not os.path.exists(archive_file)
+
+    def test_server_ignoring_pagination_terminates(self, archive_file, monkeypatch):
+        fake = FakeTreasuryDirect({'Bill': 600}, ignore_pagenum=True)
+        monkeypatch.setattr(tad, '_fetch_auction_page', fake)
+
+        fresh = tad.fetch_auction_history(security_types=['Bill'])
+
+        assert len(fresh) == tad.MAX_PAGE_SIZE
+        assert max(p for _, p in fake.requests) <= tad.ARCHIVE_PAGES_PER_WAVE
+
+
+# ============================================================
+# FETCH
+# ============================================================
+
+class TestFetchAllAuctionData:
+    """Tests for fetch_all_auction_data on top of the archive."""
+
+    def test_lookback_filters_archive(self, archive_file, server):
+        full = tad.fetch_all_auction_data(lookback_days=None, silent=True)
+        assert len(full) == 870
+        assert 'dealer_pct' in full.columns
+
+        cutoff = datetime.now() - timedelta(days=730)
+        recent = tad.fetch_all_auction_data(lookback_days=730, silent=True)
+        assert len(recent) == (full['auction_date'] >= cutoff).sum()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
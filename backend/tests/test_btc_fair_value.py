@@ -0,0 +1,346 @@
+"""
+BTC Fair Value Fit Tests
+
+Tests for analytics/btc_fair_value.py and the fair value models using it:
+- LinearFit predictions match the sklearn scaler + model they came from
+- fit_linear_cached reuses fits by training data and hyperparameters, in
+  memory and from the npz cache file
+- walk_forward_elasticnet predicts each week from earlier weeks only (fitted
+  features included), persists its predictions and resumes with only the
+  new weeks and the weeks whose training data was revised
+- gli_factor_lags signs the PCA factor consistently
+- calculate_btc_fair_value_v2 reports walk-forward OOS history and metrics
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics.btc_fair_value as bfv
+
+WEEKS = 150
+FAST_CV = {'l1_ratio': [0.5, 0.9], 'alphas': np.logspace(-3, 0, 5).tolist(), 'cv': 3, 'max_iter': 2000, 'random_state': 42}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(bfv, 'FIT_CACHE_FILE', str(tmp_path / 'fits.npz'))
+    monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'oos.npz'))
+    monkeypatch.setattr(bfv, '_fit_cache', None)
+
+
+def _weekly(weeks=WEEKS, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-03', periods=weeks, freq='W-FRI')
+    X = pd.DataFrame(rng.normal(size=(weeks, 4)), index=index, columns=['A', 'B', 'C', 'D'])
+    y = pd.Series(0.5 * X['A'] - 0.2 * X['C'] + rng.normal(scale=0.5, size=weeks), index=index)
+    return X, y
+
+
+def _count_fits(monkeypatch):
+    calls = []
+    fit = bfv._fit_linear
+
+    def counting(kind, *args, **kwargs):
+        calls.append(kind)
+        return fit(kind, *args, **kwargs)
+
+    monkeypatch.setattr(bfv, '_fit_linear', counting)
+    return calls
+
+
+# ============================================================
+# FITS
+# ============================================================
+
+class TestLinearFit:
+    """Tests for _fit_linear / LinearFit against sklearn."""
+
+    def test_predictions_match_sklearn(self):
+        from sklearn.linear_model import Ridge
+        from sklearn.preprocessing import StandardScaler
+
+        X, y = _weekly()
+        scaler = StandardScaler()
+        model = Ridge(alpha=1.0).fit(scaler.fit_transform(X), y)
+        fit = bfv._fit_linear('ridge', X, y, {'alpha': 1.0})
+
+        np.testing.assert_allclose(fit.predict(X), model.predict(scaler.transform(X)))
+        assert fit.r2(X, y) == pytest.approx(model.score(scaler.transform(X), y))
+
+    def test_cv_records_selected_hyperparameters(self):
+        X, y = _weekly()
+        fit = bfv._fit_linear('elasticnet_cv', X, y, FAST_CV)
+
+        assert fit.params['alpha'] in FAST_CV['alphas']
+        assert fit.params['l1_ratio'] in FAST_CV['l1_ratio']
+
+    def test_unknown_kind(self):
+        X, y = _weekly()
+        with pytest.raises(ValueError):
+            bfv._fit_linear('lasso', X, y, {})
+
+
+class TestFitCache:
+    """Tests for fit_linear_cached."""
+
+    def test_same_data_and_params_reuse_fit(self, monkeypatch):
+        X, y = _weekly()
+        first = bfv.fit_linear_cached('ridge', X, y, {'alpha': 1.0})
+        calls = _count_fits(monkeypatch)
+
+        assert bfv.fit_linear_cached('ridge', X.copy(), y.copy(), {'alpha': 1.0}) is first
+        bfv.fit_linear_cached('ridge', X, y, {'alpha': 2.0})
+        revised = y.copy()
+        revised.iloc[-1] += 1
+        bfv.fit_linear_cached('ridge', X, revised, {'alpha': 1.0})
+        assert calls == ['ridge', 'ridge']
+
+    def test_fits_persist_across_processes(self, monkeypatch):
+        X, y = _weekly()
+        first = bfv.fit_linear_cached('elasticnet_cv', X, y, FAST_CV)
+
+        monkeypatch.setattr(bfv, '_fit_cache', None)      # fresh process: load from disk
+        monkeypatch.setattr(bfv, '_fit_linear', lambda *a, **k: pytest.fail('refitted'))
+        loaded = bfv.fit_linear_cached('elasticnet_cv', X, y, FAST_CV)
+
+        np.testing.assert_array_equal(loaded.coef, first.coef)
+        assert loaded.params == first.params
+        np.testing.assert_allclose(loaded.predict(X), first.predict(X))
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(bfv, 'FIT_CACHE_SIZE', 2)
+        X, y = _weekly()
+        for alpha in (1.0, 2.0, 3.0):
+            bfv.fit_linear_cached('ridge', X, y, {'alpha': alpha})
+
+        calls = _count_fits(monkeypatch)
+        bfv.fit_linear_cached('ridge', X, y, {'alpha': 3.0})
+        bfv.fit_linear_cached('ridge', X, y, {'alpha': 1.0})
+        assert calls == ['ridge']
+
+
+# ============================================================
+# WALK-FORWARD
+# ============================================================
+
+class TestWalkForward:
+    """Tests for walk_forward_elasticnet."""
+
+    def _run(self, X, y):
+        return bfv.walk_forward_elasticnet(X, y, cv_params=FAST_CV, min_weeks=100, retune_weeks=20)
+
+    def test_predictions_only_use_earlier_weeks(self, tmp_path, monkeypatch):
+        X, y = _weekly()
+        oos = self._run(X, y)
+        assert list(oos.index) == list(X.index[100:])
+
+        # Changing the last weeks cannot change earlier predictions
+        monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'other.npz'))
+        X2, y2 = X.copy(), y.copy()
+        X2.iloc[-10:] += 5
+        y2.iloc[-10:] -= 5
+        other = self._run(X2, y2)
+        pd.testing.assert_series_equal(oos['predicted'].iloc[:-10], other['predicted'].iloc[:-10])
+
+    def test_resume_scores_only_new_weeks(self, monkeypatch):
+        X, y = _weekly()
+        self._run(X.iloc[:130], y.iloc[:130])
+
+        calls = _count_fits(monkeypatch)
+        resumed = self._run(X, y)
+        assert calls.count('elasticnet') == 20            # weeks 130..149
+        assert calls.count('elasticnet_cv') == 1          # re-tuned at week 140
+
+        calls.clear()
+        assert self._run(X, y).equals(resumed)            # nothing new
+        assert calls == []
+
+    def test_resume_matches_single_pass(self, tmp_path, monkeypatch):
+        X, y = _weekly()
+        self._run(X.iloc[:125], y.iloc[:125])
+        resumed = self._run(X, y)
+
+        monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'single.npz'))
+        single = self._run(X, y)
+        pd.testing.assert_frame_equal(resumed, single)
+
+    def test_revision_rescores_from_first_affected_week(self, tmp_path, monkeypatch):
+        X, y = _weekly()
+        first = self._run(X, y)
+
+        revised = y.copy()
+        revised.iloc[120] *= 2                            # first used by week 121
+        calls = _count_fits(monkeypatch)
+        again = self._run(X, revised)
+        assert calls.count('elasticnet') == 29            # weeks 121..149
+        assert calls.count('elasticnet_cv') == 1          # re-tuned at week 140
+        pd.testing.assert_frame_equal(again.iloc[:21], first.iloc[:21])
+
+        monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'single.npz'))
+        pd.testing.assert_frame_equal(again, self._run(X, revised))
+
+    def test_target_of_last_week_is_not_training_data(self, monkeypatch):
+        X, y = _weekly()
+        self._run(X, y)
+
+        revised = y.copy()
+        revised.iloc[-1] += 1                             # current week still moving
+        calls = _count_fits(monkeypatch)
+        self._run(X, revised)
+        assert calls == []
+
+    def test_refit_features_only_see_earlier_weeks(self, tmp_path, monkeypatch):
+        X, y = _weekly()
+        inputs = pd.DataFrame({'G': np.random.default_rng(1).normal(size=len(X))}, index=X.index)
+
+        def demeaned(window, weeks):                      # fitted on the window it gets
+            lagged = (window - window.mean()).reindex(window.index.union(weeks)).shift(1)
+            return lagged.reindex(weeks).rename(columns={'G': 'G_L1'})
+
+        run = lambda X_, inputs_: bfv.walk_forward_elasticnet(
+            X_.iloc[1:], y.iloc[1:], cv_params=FAST_CV, min_weeks=100, retune_weeks=20,
+            refit_features=demeaned, refit_inputs=inputs_)
+        oos = run(X, inputs)
+
+        monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'other.npz'))
+        later = inputs.copy()
+        later.iloc[-10:] += 50
+        other = run(X, later)
+        pd.testing.assert_series_equal(oos['predicted'].iloc[:-9], other['predicted'].iloc[:-9])
+        assert not oos['predicted'].iloc[-9:].equals(other['predicted'].iloc[-9:])
+
+    def test_warm_starts_between_retunes(self, monkeypatch):
+        X, y = _weekly()
+        warm = []
+        fit = bfv._fit_linear
+
+        def spy(kind, X_, y_, params, warm_coef=None):
+            if kind == 'elasticnet':
+                warm.append(warm_coef is not None)
+            return fit(kind, X_, y_, params, warm_coef=warm_coef)
+
+        monkeypatch.setattr(bfv, '_fit_linear', spy)
+        self._run(X, y)
+        assert len(warm) == 50 and all(warm)
+
+    def test_feature_change_rebuilds_history(self, monkeypatch):
+        X, y = _weekly()
+        self._run(X, y)
+
+        calls = _count_fits(monkeypatch)
+        self._run(X.drop(columns='D'), y)
+        assert calls.count('elasticnet') == 50
+
+    def test_short_history(self):
+        X, y = _weekly(weeks=60)
+        oos = self._run(X, y)
+
+        assert oos.empty and list(oos.columns) == ['predicted', 'alpha', 'l1_ratio']
+        assert not os.path.exists(bfv.OOS_FILE)
+
+
+# ============================================================
+# FEATURES
+# ============================================================
+
+class TestGliFactor:
+    """Tests for gli_factor_lags."""
+
+    def _dlog(self, weeks):
+        rng = np.random.default_rng(0)
+        common = rng.normal(size=(weeks, 1))
+        index = pd.date_range('2020-01-03', periods=weeks, freq='W-FRI')
+        return pd.DataFrame(common + 0.3 * rng.normal(size=(weeks, 4)), index=index, columns=list('ABCD'))
+
+    def test_factor_follows_the_common_move(self):
+        dlog = self._dlog(120)
+        lags = bfv.gli_factor_lags(dlog)
+
+        assert list(lags.columns) == [f'GLI_L{lag}' for lag in range(1, 9)]
+        assert lags['GLI_L1'].corr(dlog.mean(axis=1).shift(1)) > 0.9
+        for weeks in (60, 90):                            # same sign on every window
+            assert bfv.gli_factor_lags(dlog.iloc[:weeks])['GLI_L1'].corr(lags['GLI_L1']) > 0.9
+
+    def test_short_history(self):
+        assert bfv.gli_factor_lags(self._dlog(50)).columns.empty
+
+
+# ============================================================
+# PIPELINE MODELS
+# ============================================================
+
+class TestFairValueModels:
+    """Tests for the data_pipeline fair value models on the cached fits."""
+
+    @pytest.fixture
+    def daily(self):
+        days = 365 * 3
+        index = pd.date_range('2021-01-01', periods=days, freq='D')
+        rng = np.random.default_rng(0)
+        level = lambda start: start * np.exp(np.cumsum(rng.normal(scale=0.002, size=days)))
+        cli = np.cumsum(rng.normal(scale=0.05, size=days))
+        return pd.DataFrame({
+            'BTC': 30000 * np.exp(np.cumsum(rng.normal(0.0005, 0.03, size=days))),
+            'CLI': cli,
+            'VIX': 15 + np.abs(np.cumsum(rng.normal(size=days))) % 20,
+            'NET_LIQUIDITY': level(5), 'GLI_TOTAL': level(30),
+            'FED_USD': level(7), 'ECB_USD': level(6), 'BOJ_USD': level(5),
+            'BOE_USD': level(1), 'PBOC_USD': level(6),
+        }, index=index)
+
+    def test_v2_walk_forward_history(self, daily, monkeypatch):
+        from data_pipeline import calculate_btc_fair_value_v2
+
+        monkeypatch.setattr(bfv, 'ELASTICNET_CV_PARAMS', FAST_CV)
+        result = calculate_btc_fair_value_v2(daily)
+
+        walk_forward = result['walk_forward']
+        assert len(walk_forward['dates']) == result['metrics']['oos_weeks'] > 26
+        assert result['metrics']['oos_method'] == 'walk_forward'
+        assert walk_forward['dates'][-1] == result['dates'][-1]
+        assert os.path.exists(bfv.OOS_FILE)
+
+        # A rerun on the same data reuses the full-sample fit and the stored history
+        calls = _count_fits(monkeypatch)
+        assert calculate_btc_fair_value_v2(daily)['walk_forward'] == walk_forward
+        assert calls == []
+
+    def test_v2_walk_forward_gli_factor_is_point_in_time(self, daily, tmp_path, monkeypatch):
+        from data_pipeline import calculate_btc_fair_value_v2
+
+        monkeypatch.setattr(bfv, 'ELASTICNET_CV_PARAMS', FAST_CV)
+        first = calculate_btc_fair_value_v2(daily)['walk_forward']
+
+        # Later central bank data moves the full-sample PCA, not earlier OOS weeks
+        monkeypatch.setattr(bfv, 'OOS_FILE', str(tmp_path / 'other.npz'))
+        later = daily.copy()
+        later.iloc[-60:, later.columns.get_loc('FED_USD')] *= 3
+        other = calculate_btc_fair_value_v2(later)['walk_forward']
+
+        cutoff = str(later.index[-60].date())
+        early = [i for i, date in enumerate(first['dates']) if date < cutoff]
+        assert len(early) > 20
+        for key in ('dates', 'predicted'):
+            assert [first[key][i] for i in early] == [other[key][i] for i in early]
+
+    def test_v1_reruns_use_cached_fits(self, daily, monkeypatch):
+        from data_pipeline import calculate_btc_fair_value
+
+        first = calculate_btc_fair_value(daily)
+        calls = _count_fits(monkeypatch)
+        again = calculate_btc_fair_value(daily)
+
+        assert calls == []
+        pd.testing.assert_frame_equal(first, again)
+        assert first['ADJ_BTC_FAIR_VALUE'].notna().any()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,276 @@
+"""
+Database Adapter Tests
+
+Tests for connectors/db_adapter.py against an in-memory fake of the
+Supabase query builder:
+- Upserts are split into batches and retried on transient errors only
+- Queries page through the table in key order, past the server row cap
+"""
+
+import os
+import random
+import sys
+import threading
+from datetime import date, timedelta
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connectors.db_adapter import SupabaseAdapter, _is_transient
+
+
+class FakeAPIError(Exception):
+    def __init__(self, code):
+        super().__init__(f"error {code}")
+        self.code = code
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """Chainable subset of the postgrest query builder."""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.filters = []
+        self.bounds = None
+        self.payload = None
+        self.order_by = []
+
+    def select(self, columns):
+        self.columns = None if columns == '*' else columns.split(',')
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row[column] >= value)
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: row[column] <= value)
+        return self
+
+    def order(self, column, desc=False):
+        self.order_by.append((column, desc))
+        return self
+
+    def limit(self, n):
+        self.bounds = (0, n - 1)
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def upsert(self, rows, on_conflict='date'):
+        self.payload = (rows, on_conflict)
+        return self
+
+    def execute(self):
+        return self.client.execute(self)
+
+
+class FakeClient:
+    """Stores rows per table keyed by the conflict column."""
+
+    def __init__(self, max_rows=1000, failures=()):
+        self.tables = {}
+        self.random = random.Random(0)
+        self.max_rows = max_rows
+        self.failures = list(failures)  # exceptions raised by the next executes
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def execute(self, query):
+        with self.lock:
+            self.requests.append(query)
+            if self.failures:
+                raise self.failures.pop(0)
+            table = self.tables.setdefault(query.table, {})
+            if query.payload is not None:
+                rows, on_conflict = query.payload
+                keys = on_conflict.split(',')
+                for row in rows:
+                    key = row[keys[0]] if len(keys) == 1 else tuple(row[k] for k in keys)
+                    table[key] = dict(row)
+                return FakeResponse(rows)
+
+            # Like Postgres, rows that tie on the ORDER BY columns come back in no fixed order
+            rows = [r for r in table.values() if all(f(r) for f in query.filters)]
+            self.random.shuffle(rows)
+            for column, desc in reversed(query.order_by):
+                rows.sort(key=lambda r: r[column], reverse=desc)
+            start, end = query.bounds or (0, len(rows))
+            rows = rows[start:min(end + 1, start + self.max_rows)]
+            if query.columns:
+                rows = [{c: r[c] for c in query.columns} for r in rows]
+            return FakeResponse(rows)
+
+
+def _rows(n):
+    start = date(2000, 1, 1)
+    return [{'date': (start + timedelta(days=i)).isoformat(), 'value': float(i)} for i in range(n)]
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+# ============================================================
+# UPSERT
+# ============================================================
+
+class TestUpsert:
+    """Tests for batched upserts."""
+
+    def test_rows_are_sent_in_batches(self, client):
+        adapter = SupabaseAdapter(client=client, batch_size=100, max_workers=4)
+
+        result = adapter.upsert_domain_data('domain_gli', _rows(1050))
+
+        assert result == {'count': 1050, 'batches': 11}
+        assert len(client.requests) == 11
+        assert max(len(q.payload[0]) for q in client.requests) == 100
+        assert len(client.tables['domain_gli']) == 1050
+
+    def test_transient_error_is_retried(self):
+        client = FakeClient(failures=[ConnectionError('reset'), FakeAPIError('503')])
+        adapter = SupabaseAdapter(client=client, batch_size=10, max_workers=1, retry_backoff=0)
+
+        result = adapter.upsert_domain_data('domain_gli', _rows(10))
+
+        assert result['count'] == 10
+        assert len(client.requests) == 3
+
+    def test_permanent_error_is_raised(self):
+        client = FakeClient(failures=[FakeAPIError('23505')])
+        adapter = SupabaseAdapter(client=client, max_workers=1, retry_backoff=0)
+
+        with pytest.raises(FakeAPIError):
+            adapter.upsert_domain_data('domain_gli', _rows(10))
+        assert len(client.requests) == 1
+
+    def test_retries_are_bounded(self):
+        client = FakeClient(failures=[TimeoutError()] * 5)
+        adapter = SupabaseAdapter(client=client, max_workers=1, max_retries=2, retry_backoff=0)
+
+        with pytest.raises(TimeoutError):
+            adapter.upsert_domain_data('domain_gli', _rows(10))
+        assert len(client.requests) == 3
+
+    def test_transient_classification(self):
+        assert _is_transient(ConnectionError())
+        assert _is_transient(FakeAPIError('40P01'))
+        assert _is_transient(FakeAPIError(429))
+        assert _is_transient(FakeAPIError('503'))
+        assert not _is_transient(FakeAPIError('PGRST204'))
+        assert not _is_transient(FakeAPIError('400'))
+        assert not _is_transient(FakeAPIError('408'))
+
+    def test_errors_without_code_are_not_retried(self):
+        assert not _is_transient(ValueError('bad row'))
+        assert not _is_transient(KeyError('date'))
+
+        client = FakeClient(failures=[TypeError('not serializable')])
+        adapter = SupabaseAdapter(client=client, max_workers=1, retry_backoff=0)
+        with pytest.raises(TypeError):
+            adapter.upsert_domain_data('domain_gli', _rows(10))
+        assert len(client.requests) == 1
+
+    def test_http_client_transport_errors_are_retried(self):
+        TransportError = type('TransportError', (Exception,), {'__module__': 'httpx._exceptions'})
+        ReadTimeout = type('ReadTimeout', (TransportError,), {'__module__': 'httpx._exceptions'})
+
+        assert _is_transient(ReadTimeout('timed out'))
+
+
+# ============================================================
+# QUERY
+# ============================================================
+
+class TestQuery:
+    """Tests for paged queries."""
+
+    def test_query_reads_past_server_row_cap(self, client):
+        client.max_rows = 500
+        adapter = SupabaseAdapter(client=client, page_size=500)
+        adapter.upsert_domain_data('domain_gli', _rows(1234))
+        client.requests.clear()
+
+        rows = adapter.query_domain('domain_gli')
+
+        assert len(rows) == 1234
+        assert rows == sorted(rows, key=lambda r: r['date'])
+        assert len(client.requests) == 4          # 3 pages + the empty one that ends it
+
+    def test_page_size_above_server_row_cap(self, client):
+        client.max_rows = 100
+        adapter = SupabaseAdapter(client=client, page_size=1000)
+        adapter.upsert_domain_data('domain_gli', _rows(250))
+
+        rows = adapter.query_domain('domain_gli')
+
+        assert [r['value'] for r in rows] == [float(i) for i in range(250)]
+
+    def test_composite_key_pages_are_stable(self, client):
+        adapter = SupabaseAdapter(client=client, page_size=7)
+        rows = [{'date': r['date'], 'key': key, 'value': r['value']} for r in _rows(20) for key in 'abc']
+        adapter.upsert_domain_data('domain_gli_pairs', rows, on_conflict='date,key')
+
+        read = adapter.query_domain('domain_gli_pairs', order_by=['date', 'key'])
+
+        assert [(r['date'], r['key']) for r in read] == [(r['date'], r['key']) for r in rows]
+
+    def test_iter_domain_yields_pages(self, client):
+        adapter = SupabaseAdapter(client=client, page_size=100)
+        adapter.upsert_domain_data('domain_gli', _rows(250))
+
+        pages = list(adapter.iter_domain('domain_gli', columns=['date']))
+
+        assert [len(p) for p in pages] == [100, 100, 50]
+        assert set(pages[0][0]) == {'date'}
+
+    def test_date_filters(self, client):
+        adapter = SupabaseAdapter(client=client, page_size=10)
+        adapter.upsert_domain_data('domain_gli', _rows(50))
+
+        rows = adapter.query_domain('domain_gli', start_date='2000-01-11', end_date='2000-01-20')
+
+        assert [r['value'] for r in rows] == [float(i) for i in range(10, 20)]
+
+    def test_query_domain_frame(self, client):
+        adapter = SupabaseAdapter(client=client, page_size=100)
+        adapter.upsert_domain_data('domain_gli', _rows(250))
+
+        df = adapter.query_domain_frame('domain_gli')
+
+        assert len(df) == 250
+        assert str(df.index[0].date()) == '2000-01-01'
+        assert df['value'].iloc[-1] == 249.0
+
+    def test_latest_date(self, client):
+        adapter = SupabaseAdapter(client=client)
+        adapter.upsert_domain_data('domain_gli', _rows(5))
+
+        assert adapter.get_latest_date('domain_gli') == '2000-01-05'
+        assert adapter.get_latest_date('missing') is None
+
+    def test_fetch_latest_date_raises(self):
+        client = FakeClient(failures=[FakeAPIError('42P01')])
+        adapter = SupabaseAdapter(client=client, retry_backoff=0)
+
+        with pytest.raises(FakeAPIError):
+            adapter.fetch_latest_date('domain_gli')
+        assert adapter.get_latest_date('domain_gli') is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
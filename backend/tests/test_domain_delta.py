@@ -0,0 +1,202 @@
+"""
+Domain Delta Tests
+
+Tests for versioned delta records (domains/delta.py):
+- diff_tree/apply_delta round trips (appended dates, revised tails, added and
+  removed keys) and are idempotent
+- write_domain_delta versions, full records and pruning
+- The orchestrator's 'delta' output format
+"""
+
+import os
+import sys
+import json
+import copy
+
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import domains.delta as delta
+from domains.axis import encode_date_axis
+from domains.delta import apply_delta, diff_tree, load_versions, read_published, write_domain_delta
+from utils.publisher import get_publisher
+
+
+def _data(days, revision=0.0, **extra):
+    index = pd.date_range('2025-01-01', periods=days, freq='D')
+    data = {
+        'axes': {'daily': encode_date_axis(index)},
+        'dates': {'$axis': 'daily'},
+        'total': [float(i) for i in range(days)],
+        'rocs': {'1M': [None] * 3 + [1.0] * (days - 3)},
+        'pad': [0.0] * 500,
+        'latest': {'total': days - 1.0},
+    }
+    data['total'][-1] += revision
+    data.update(extra)
+    return data
+
+
+@pytest.fixture(autouse=True)
+def no_memory_cache(monkeypatch):
+    monkeypatch.setattr(delta, '_published', {})
+
+
+def _publish(root, data, name='gli'):
+    publisher = get_publisher(str(root))
+    domains_dir = os.path.join(str(root), 'domains')
+    path = os.path.join(domains_dir, f'{name}.json')
+    previous = read_published(path, publisher)
+    result = publisher.publish_json(path, data)
+    return write_domain_delta(previous, data, name, domains_dir, result.sha256, result.size, publisher=publisher)
+
+
+# ============================================================
+# DIFF / APPLY
+# ============================================================
+
+class TestDiff:
+    """Tests for diff_tree and apply_delta."""
+
+    def test_appended_dates_and_revised_tail(self):
+        old, new = _data(30), _data(32, revision=0.5)
+        ops = diff_tree(old, new)
+
+        assert [['total'], 30, [30.0, 31.5]] in ops['tails']
+        assert [['rocs', '1M'], 30, [1.0, 1.0]] in ops['tails']
+        assert [['axes', 'daily', 'length'], 32] in ops['set']
+        assert apply_delta(copy.deepcopy(old), ops) == new
+
+    def test_added_and_removed_keys(self):
+        old = _data(30, gone={'a': 1})
+        new = _data(30, added=[{'x': 1}])
+        ops = diff_tree(old, new)
+
+        assert ops['remove'] == [['gone']]
+        assert ops['set'] == [[['added'], [{'x': 1}]]]
+        assert apply_delta(copy.deepcopy(old), ops) == new
+
+    def test_list_of_containers_is_diffed_per_item(self):
+        old = {'events': [{'date': '2025-01-01', 'value': 1}, {'date': '2025-01-02', 'value': 2}]}
+        new = {'events': [{'date': '2025-01-01', 'value': 1}, {'date': '2025-01-02', 'value': 3}]}
+
+        assert diff_tree(old, new)['set'] == [[['events', 1, 'value'], 3]]
+
+    def test_apply_is_idempotent(self):
+        old, new = _data(30), _data(31, revision=2.0)
+        ops = diff_tree(old, new)
+
+        assert apply_delta(apply_delta(copy.deepcopy(old), ops), ops) == new
+
+    def test_no_changes(self):
+        assert diff_tree(_data(30), _data(30)) == {'tails': [], 'set': [], 'remove': []}
+
+
+# ============================================================
+# VERSIONS
+# ============================================================
+
+class TestWriteDomainDelta:
+    """Tests for write_domain_delta and the version index."""
+
+    def test_versions_increase_and_deltas_apply(self, tmp_path):
+        first = _publish(tmp_path, _data(30))
+        second = _publish(tmp_path, _data(31, revision=1.0))
+
+        assert (first['version'], first['full']) == (1, True)
+        assert (second['version'], second['base_version']) == (2, 1)
+        index = load_versions(str(tmp_path / 'domains'), 'gli')
+        assert index['current'] == 2
+        assert [e['version'] for e in index['deltas']] == [2]
+
+        with open(tmp_path / 'domains' / index['deltas'][0]['file']) as f:
+            record = json.load(f)
+        assert index['deltas'][0]['bytes'] < 1000
+        assert apply_delta(_data(30), record) == _data(31, revision=1.0)
+
+    def test_unchanged_content_keeps_version(self, tmp_path):
+        _publish(tmp_path, _data(30))
+
+        assert _publish(tmp_path, _data(30)) is None
+        assert load_versions(str(tmp_path / 'domains'), 'gli')['current'] == 1
+
+    def test_large_change_is_full_record(self, tmp_path):
+        _publish(tmp_path, _data(30))
+        record = _publish(tmp_path, {'other': list(range(1000))})
+
+        assert record['full'] is True
+        assert 'tails' not in record
+
+    def test_file_rewritten_outside_index_is_full_record(self, tmp_path):
+        _publish(tmp_path, _data(30))
+        get_publisher(str(tmp_path)).publish_json(str(tmp_path / 'domains' / 'gli.json'), _data(30, revision=9.0))
+
+        record = _publish(tmp_path, _data(30))
+        assert record['full'] is True
+        assert record['version'] == 2
+
+    def test_old_deltas_are_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(delta, 'MAX_DELTAS', 2)
+        for days in range(30, 35):
+            _publish(tmp_path, _data(days))
+
+        index = load_versions(str(tmp_path / 'domains'), 'gli')
+        assert [e['version'] for e in index['deltas']] == [4, 5]
+        assert sorted(os.listdir(tmp_path / 'domains' / 'deltas')) == ['gli.4.json', 'gli.5.json']
+
+    def test_memory_cache_is_used_when_current(self, tmp_path):
+        _publish(tmp_path, _data(30))
+        path = str(tmp_path / 'domains' / 'gli.json')
+        cached = delta._published[os.path.abspath(path)]
+
+        assert read_published(path) is cached
+        # Rewritten by another writer: read from disk
+        get_publisher(str(tmp_path)).publish_json(path, _data(31))
+        assert read_published(path)[1] == _data(31)
+
+
+# ============================================================
+# ORCHESTRATOR
+# ============================================================
+
+class TestDeltaOutputFormat:
+    """Tests for DataOrchestrator(output_formats=['json', 'delta'])."""
+
+    def test_orchestrator_writes_deltas(self, tmp_path):
+        from orchestrator import DataOrchestrator
+        from domains.base import BaseDomain
+
+        class Series(BaseDomain):
+            name = 'series'
+
+            def process(self, df, **kwargs):
+                return {'values': df['A'], 'latest': float(df['A'].iloc[-1])}
+
+        def frame(revision):
+            index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=400, freq='D')
+            values = pd.Series(range(400), index=index, dtype=float)
+            values.iloc[-1] += revision
+            return pd.DataFrame({'A': values})
+
+        orch = DataOrchestrator(str(tmp_path), output_formats=['json', 'delta'])
+        orch._domains = [Series()]
+        orch.run(frame(0.0), generate_legacy=False)
+        with open(tmp_path / 'domains' / 'series.json') as f:
+            before = json.load(f)
+        orch.run(frame(0.5), generate_legacy=False)
+
+        index = load_versions(str(tmp_path / 'domains'), 'series')
+        assert index['current'] == 2
+        with open(tmp_path / 'domains' / index['deltas'][-1]['file']) as f:
+            record = json.load(f)
+        (path, start, values), = record['tails']
+        assert (path, values) == (['values'], [399.5])
+        with open(tmp_path / 'domains' / 'series.json') as f:
+            assert apply_delta(before, record) == json.load(f)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
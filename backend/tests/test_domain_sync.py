@@ -0,0 +1,160 @@
+"""
+Domain Sync Tests
+
+Tests for domains/sync.py (domain output -> DB tables):
+- Column-oriented output is split into row-per-date tables
+- Only new and revised rows are upserted
+- Row hashes are cached locally between runs
+- Tables that can't be read are skipped, not resent in full
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connectors.db_adapter import SupabaseAdapter
+from domains import CurrenciesDomain, DomainResult
+from domains.axis import DateAxis
+from domains.sync import SyncState, domain_to_tables, sync_domain, ROW_HASH_COLUMN
+from tests.test_db_adapter import FakeAPIError, FakeClient
+
+
+def _result(days=60, last_value=None):
+    index = pd.date_range('2024-01-01', periods=days, freq='D')
+    total = pd.Series(np.arange(days, dtype=float), index=index)
+    total.iloc[:5] = np.nan
+    if last_value is not None:
+        total.iloc[-1] = last_value
+    return DomainResult({
+        'dates': DateAxis(index),
+        'total': total,
+        'rocs': {'1M': total.pct_change(30) * 100},
+        'pairs': {'EUR': {'absolute': total * 2}, 'JPY': {'absolute': total * 3}},
+        'weights': {'fed': 0.5},
+    }), index
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def adapter(client):
+    return SupabaseAdapter(client=client, max_workers=1, retry_backoff=0)
+
+
+class TestDomainToTables:
+    """Tests for splitting domain output into tables."""
+
+    def test_sections_become_tables(self):
+        data, index = _result()
+        tables = domain_to_tables('gli', data.serialize(), DateAxis(index))
+
+        assert set(tables) == {'domain_gli', 'domain_gli_rocs', 'domain_gli_pairs'}
+        keys, rows = tables['domain_gli']
+        assert keys == ['date']
+        # All-null leading rows are skipped
+        assert len(rows) == 55
+        assert rows[0] == {'date': '2024-01-06', 'total': 5.0}
+        assert set(tables['domain_gli_rocs'][1][-1]) == {'date', '1m'}
+
+    def test_long_sections_have_key_column(self):
+        data, index = _result()
+        tables = domain_to_tables('currencies', data.serialize(), DateAxis(index))
+
+        keys, rows = tables['domain_currencies_pairs']
+        assert keys == ['date', 'pair']
+        assert {r['pair'] for r in rows} == {'EUR', 'JPY'}
+        assert rows[0] == {'date': '2024-01-06', 'pair': 'EUR', 'absolute': 10.0}
+
+
+class TestSyncDomain:
+    """Tests for incremental upserts."""
+
+    def test_first_sync_sends_everything(self, adapter, client):
+        data, index = _result()
+        counts = sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index))
+
+        assert counts['domain_gli'] == 55
+        assert ROW_HASH_COLUMN in client.tables['domain_gli']['2024-01-06']
+
+    def test_unchanged_data_sends_nothing(self, adapter, tmp_path):
+        data, index = _result()
+        state = SyncState(str(tmp_path))
+        sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=state)
+
+        counts = sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=state)
+
+        assert sum(counts.values()) == 0
+
+    def test_new_and_revised_rows_only(self, adapter, client, tmp_path):
+        state = SyncState(str(tmp_path))
+        data, index = _result(days=60)
+        sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=state)
+
+        # One new day, and the previous last day revised
+        data, index = _result(days=61, last_value=1000.0)
+        data['total'].iloc[-2] = 500.0
+        counts = sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=state)
+
+        assert counts['domain_gli'] == 2
+        assert client.tables['domain_gli']['2024-02-29']['total'] == 500.0
+
+    def test_hashes_read_from_table_without_local_state(self, adapter, client, tmp_path):
+        data, index = _result()
+        sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index))
+        client.requests.clear()
+
+        counts = sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=SyncState(str(tmp_path)))
+
+        assert sum(counts.values()) == 0
+        assert not any(q.payload for q in client.requests)
+
+    def test_state_persists(self, adapter, tmp_path):
+        data, index = _result()
+        state = SyncState(str(tmp_path))
+        sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=state)
+        state.save()
+
+        reloaded = SyncState(str(tmp_path))
+        assert reloaded.tables['domain_gli']['latest'] == '2024-02-29'
+
+
+    def test_unreadable_table_is_skipped(self, adapter, client, tmp_path):
+        data, index = _result()
+        sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index))
+        client.requests.clear()
+        client.failures = [FakeAPIError('42501')]         # permission denied on the first table
+
+        counts = sync_domain('gli', data.serialize(), adapter, dates=DateAxis(index), state=SyncState(str(tmp_path)))
+
+        skipped = client.requests[0].table
+        assert skipped not in counts and len(counts) == 2
+        assert sum(counts.values()) == 0
+        assert not any(q.payload for q in client.requests)
+
+
+class TestSaveToDb:
+    """Tests for BaseDomain.save_to_db."""
+
+    def test_currencies_domain(self, adapter, client):
+        index = pd.date_range('2024-01-01', periods=400, freq='D')
+        df = pd.DataFrame({'DXY': np.linspace(100, 110, 400), 'EURUSD': np.linspace(1.0, 1.2, 400)}, index=index)
+        domain = CurrenciesDomain()
+        data = domain.process(df)
+
+        counts = domain.save_to_db(data, adapter, dates=DateAxis(index))
+
+        assert counts['domain_currencies_dxy'] == 400
+        assert 'absolute' in client.tables['domain_currencies_dxy']['2024-01-01']
+        assert ('2024-01-01', 'EUR') in client.tables['domain_currencies_pairs']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -18,8 +18,11 @@ from datetime import datetime, timedelta
 # Add parent to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from domains.base import BaseDomain, MetadataDomain, clean_for_json, calculate_rocs
+from domains.base import BaseDomain, DomainResult, MetadataDomain, clean_for_json, calculate_rocs
 from domains.currencies import CurrenciesDomain
+from domains.binary import encode_domain, decode_domain
+from domains.pyramid import build_pyramid, lttb_indices, resample_last
+from domains.axis import DateAxis, encode_date_axis, decode_date_axis, attach_axes, expand_axes
 
 
 # ============================================================
@@ -86,6 +89,44 @@ class TestCleanForJson:
         result = clean_for_json(data)
         assert result['series'] == [1, 2, 3]
         assert result['nested']['value'] == 1.5
+    
+    def test_float_fast_path_matches_elementwise(self):
+        s = pd.Series([1.5, np.nan, np.inf, -np.inf, 2.0], dtype='float32')
+        result = clean_for_json(s)
+        assert result == [1.5, None, None, None, 2.0]
+        assert all(type(x) is float for x in result if x is not None)
+
+
+class TestDomainResult:
+    """Tests for the raw-output container."""
+    
+    def test_serialize_matches_clean_for_json(self, sample_df):
+        raw = DomainResult({'dxy': sample_df['DXY'], 'meta': {'n': np.int64(3)}})
+        assert raw.serialize() == clean_for_json(dict(raw))
+    
+    def test_serialize_is_cached_until_modified(self, sample_df):
+        raw = DomainResult({'dxy': sample_df['DXY']})
+        first = raw.serialize()
+        assert raw.serialize() is first
+        
+        raw['btc'] = sample_df['BTC']
+        assert 'btc' in raw.serialize()
+
+    @pytest.mark.parametrize('mutate', [
+        lambda raw: raw.update(btc=1),
+        lambda raw: raw.setdefault('btc', 1),
+        lambda raw: raw.__ior__({'btc': 1}),
+        lambda raw: raw.pop('dxy'),
+        lambda raw: raw.popitem(),
+        lambda raw: raw.__delitem__('dxy'),
+        lambda raw: raw.clear(),
+    ])
+    def test_every_mutator_drops_the_cache(self, sample_df, mutate):
+        raw = DomainResult({'dxy': sample_df['DXY']})
+        raw.serialize()
+
+        mutate(raw)
+        assert raw.serialize() == clean_for_json(dict(raw))
 
 
 class TestCalculateRocs:
@@ -199,10 +240,234 @@ class TestCurrenciesDomain:
         with open(output_path, 'r') as f:
             loaded = json.load(f)
         
-        assert loaded['dates'][0] == '2020-01-01'
+        assert loaded['dates'] == {'$axis': 'daily'}
+        assert expand_axes(loaded)['dates'][0] == '2020-01-01'
         assert 'dxy' in loaded
 
 
+# ============================================================
+# M2 DOMAIN TESTS
+# ============================================================
+
+def _legacy_m2(df, config):
+    """M2Domain output as built before DomainResult: every piece cleaned in place."""
+    result = {'economies': {}}
+    m2_total = pd.Series(0.0, index=df.index)
+    for col, (name, fx_col) in config.items():
+        m2_usd = df[col].ffill() / 1e12
+        if fx_col:
+            m2_usd = m2_usd * df[fx_col].ffill()
+        result['economies'][name] = clean_for_json(m2_usd)
+        m2_total += m2_usd.fillna(0)
+    result['total'] = clean_for_json(m2_total)
+    result['rocs'] = {k: clean_for_json(v) for k, v in calculate_rocs(m2_total).items()}
+
+    result['economy_rocs'] = {}
+    result['weights'] = {}
+    latest_m2 = m2_total.iloc[-1] if m2_total.iloc[-1] > 0 else 1.0
+    for name, series_data in result['economies'].items():
+        series = pd.Series(series_data, index=df.index)
+        result['economy_rocs'][name] = {k: clean_for_json(v) for k, v in calculate_rocs(series).items()}
+        last_val = series.iloc[-1] if not pd.isna(series.iloc[-1]) else 0
+        result['weights'][name] = float(last_val / latest_m2 * 100)
+
+    result['economies']['uk'] = result['economies']['gb']
+    result['economy_rocs']['uk'] = result['economy_rocs']['gb']
+    result['weights']['uk'] = result['weights']['gb']
+    return result
+
+
+class TestM2Domain:
+    """Tests for M2Domain."""
+
+    def test_matches_legacy_output(self, sample_df):
+        from domains.core import M2Domain
+
+        df = sample_df.copy()
+        df['USM2'] = 21e12 + np.cumsum(np.random.randn(len(df)) * 1e9)
+        df['EUM2'] = 15e12 + np.cumsum(np.random.randn(len(df)) * 1e9)
+        df['GBM2'] = 3e12 + np.cumsum(np.random.randn(len(df)) * 1e8)
+        df.loc[df.index[::7], 'EUM2'] = np.nan      # gaps are forward-filled
+
+        config = {'USM2': ('us', None), 'EUM2': ('eu', 'EURUSD'), 'GBM2': ('gb', 'GBPUSD')}
+        result = M2Domain().process(df).serialize()
+
+        assert result == _legacy_m2(df, config)
+        assert sum(result['weights'][k] for k in ('us', 'eu', 'gb')) == pytest.approx(100)
+
+
+# ============================================================
+# DATE AXIS TESTS
+# ============================================================
+
+class TestDateAxis:
+    """Tests for the shared date axis convention."""
+
+    def test_behaves_like_date_list(self, sample_df):
+        axis = DateAxis(sample_df.index)
+        expected = sample_df.index.strftime('%Y-%m-%d').tolist()
+
+        assert len(axis) == len(expected)
+        assert axis[-1] == expected[-1]
+        assert axis == expected
+
+    def test_contiguous_axis_is_compact(self, sample_df):
+        encoded = encode_date_axis(sample_df.index)
+
+        assert encoded == {
+            'freq': 'D',
+            'start': '2020-01-01',
+            'end': '2024-01-01',
+            'length': len(sample_df),
+        }
+        assert decode_date_axis(encoded) == DateAxis(sample_df.index).to_list()
+
+    def test_gapped_axis_falls_back_to_values(self):
+        dates = ['2020-01-01', '2020-01-02', '2020-01-06']
+        encoded = encode_date_axis(dates)
+
+        assert encoded['freq'] is None
+        assert decode_date_axis(encoded) == dates
+
+    def test_axis_written_once(self, sample_df):
+        data = {
+            'dates': DateAxis(sample_df.index),
+            'nested': {'dates': DateAxis(sample_df.index)},
+            'weekly': {'dates': DateAxis(sample_df.index[::7], axis_id='weekly')},
+        }
+        clean = attach_axes(data, clean_for_json(data))
+
+        assert set(clean['axes']) == {'daily', 'weekly'}
+        assert clean['nested']['dates'] == {'$axis': 'daily'}
+
+        expanded = expand_axes(json.loads(json.dumps(clean)))
+        assert 'axes' not in expanded
+        assert expanded['nested']['dates'] == data['dates'].to_list()
+        assert expanded['weekly']['dates'][1] == '2020-01-08'
+
+
+# ============================================================
+# BINARY FORMAT TESTS
+# ============================================================
+
+class TestBinaryFormat:
+    """Tests for the binary blob + manifest domain format."""
+
+    def test_round_trip_matches_json(self, sample_df):
+        domain = CurrenciesDomain()
+        result = domain.process(sample_df)
+        clean_result = attach_axes(result, clean_for_json(result))
+
+        manifest, blob = encode_domain(clean_result)
+
+        assert manifest['axes']['daily']['freq'] == 'D'
+        assert manifest['axes']['daily']['length'] == len(sample_df)
+        assert decode_domain(manifest, blob) == clean_result
+
+    def test_offsets_are_aligned(self):
+        data = {'a': [1.0] * 33, 'b': [None, 2.0] + [3.0] * 31}
+        manifest, blob = encode_domain(data, dtype='float32')
+
+        assert all(s['offset'] % 8 == 0 for s in manifest['series'])
+        assert len(blob) == manifest['byte_length']
+        assert decode_domain(manifest, blob)['b'][0] is None
+
+    def test_save_binary_creates_files(self, sample_df, temp_output_dir):
+        domain = CurrenciesDomain()
+        result = domain.process(sample_df)
+
+        manifest_path = domain.save_binary(result, temp_output_dir)
+        blob_path = os.path.join(temp_output_dir, 'domains', 'currencies.bin')
+
+        assert os.path.exists(manifest_path)
+        assert os.path.exists(blob_path)
+
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        with open(blob_path, 'rb') as f:
+            loaded = decode_domain(manifest, f.read())
+
+        assert expand_axes(loaded)['dates'][0] == '2020-01-01'
+        assert len(loaded['dxy']['absolute']) == len(sample_df)
+
+
+# ============================================================
+# RESOLUTION PYRAMID TESTS
+# ============================================================
+
+class TestResolutionPyramid:
+    """Tests for the weekly/monthly/LTTB pyramid levels."""
+
+    def test_lttb_keeps_extremes_and_endpoints(self):
+        values = np.sin(np.linspace(0, 20, 5000))
+        values[1234] = 5.0
+
+        picks = lttb_indices(values, 200)[0]
+
+        assert len(picks) <= 200
+        assert picks[0] == 0 and picks[-1] == 4999
+        assert 1234 in picks
+        assert np.all(np.diff(picks) > 0)
+
+    def test_lttb_skips_missing_values(self):
+        values = np.arange(1000, dtype=float)
+        values[:300] = np.nan
+        values[-5:] = np.nan
+
+        picks = lttb_indices(values, 100)[0]
+
+        assert picks[0] == 300
+        assert picks[-1] == 994
+        assert np.isfinite(values[picks]).all()
+
+    def test_short_series_not_downsampled(self):
+        values = np.array([1.0, np.nan, 3.0])
+        assert lttb_indices(values, 100)[0].tolist() == [0, 2]
+
+    def test_resample_last_labels_with_last_axis_date(self):
+        index = pd.date_range('2024-01-01', '2024-03-10', freq='D')
+        values = np.arange(len(index), dtype=float)[:, None]
+        values[-1] = np.nan
+
+        monthly, labels = resample_last(values, index, 'M')
+
+        assert labels.strftime('%Y-%m-%d').tolist() == ['2024-01-31', '2024-02-29', '2024-03-10']
+        assert monthly[:, 0].tolist() == [30.0, 59.0, 68.0]
+
+    def test_levels_keep_domain_structure(self, sample_df):
+        domain = CurrenciesDomain()
+        clean_result = domain.serialize(domain.process(sample_df))
+
+        levels = build_pyramid(clean_result, budgets=(500,))
+
+        assert list(levels) == ['weekly', 'monthly', 'lttb_500']
+        monthly = expand_axes(levels['monthly'])
+        assert len(monthly['dates']) == 49
+        assert len(monthly['dxy']['absolute']) == 49
+        assert monthly['dxy']['absolute'][-1] == clean_result['dxy']['absolute'][-1]
+
+        points = levels['lttb_500']['dxy']['absolute']['$points']
+        assert len(points['index']) <= 500
+        assert points['values'][-1] == clean_result['dxy']['absolute'][-1]
+
+    def test_save_pyramid_writes_manifest(self, sample_df, temp_output_dir):
+        domain = CurrenciesDomain()
+        manifest_path = domain.save_pyramid(domain.process(sample_df), temp_output_dir)
+
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+        points = [level['points'] for level in manifest['levels']]
+        assert points == sorted(points)
+        assert manifest['levels'][-1] == {
+            'id': 'daily', 'kind': 'calendar', 'freq': 'D',
+            'points': len(sample_df), 'file': 'currencies.json',
+        }
+        domains_dir = os.path.dirname(manifest_path)
+        for level in manifest['levels'][:-1]:
+            assert os.path.exists(os.path.join(domains_dir, level['file']))
+
+
 # ============================================================
 # RUN TESTS
 # ============================================================
@@ -0,0 +1,216 @@
+"""
+ETF Data Loader Tests
+
+Tests for the pure transforms in connectors/etf_data.py (no database):
+- Summary fallback for null/zero fields on the latest date
+- Grouped normalization matches per-ticker processing
+- Single connection fetch issues one query for all tickers
+- Incremental aggregate updates match a full recomputation
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connectors import etf_data
+from connectors.etf_data import (
+    _latest_summary, _build_individual_daily, _build_flows_agg, _derive_flows_agg, update_flows_agg,
+)
+
+
+def _individual_frame(tickers=('IBIT', 'FBTC'), days=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2024-10-01', periods=days, freq='B').date
+    frames = []
+    for ticker in tickers:
+        premium = rng.normal(0, 0.5, days)
+        premium[rng.random(days) < 0.05] = np.nan
+        frames.append(pd.DataFrame({
+            'ticker': ticker,
+            'date': dates,
+            'flow_btc': rng.normal(0, 100, days),
+            'flow_usd': rng.normal(0, 1e6, days),
+            'nav': rng.normal(50, 1, days),
+            'shares_outstanding': rng.normal(1e6, 1e3, days),
+            'holdings_btc': rng.normal(1e4, 10, days),
+            'premium_discount': premium,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _agg_frame(days=600, seed=0):
+    rng = np.random.default_rng(seed)
+    premium = rng.normal(0, 0.5, days)
+    premium[rng.random(days) < 0.03] = 4.0
+    price = 40000 + rng.normal(0, 500, days).cumsum()
+    price[rng.random(days) < 0.02] = np.nan
+    return pd.DataFrame({
+        'date': pd.date_range('2024-01-11', periods=days, freq='B').date,
+        'total_flow_btc': rng.normal(0, 1000, days),
+        'total_flow_usd': rng.normal(0, 5e7, days),
+        'total_aum_usd': 1e10 + rng.normal(0, 1e8, days).cumsum(),
+        'avg_premium_discount': premium,
+        'btc_price': price,
+    })
+
+
+@pytest.fixture
+def agg_cache(tmp_path, monkeypatch):
+    path = tmp_path / etf_data.AGG_CACHE_FILENAME
+    monkeypatch.setattr(etf_data, '_get_agg_cache_path', lambda: path)
+    return path
+
+
+# ============================================================
+# SUMMARY
+# ============================================================
+
+class TestLatestSummary:
+    """Tests for the latest-record summary with D-1 fallback."""
+
+    def test_zero_and_null_fall_back_to_previous_value(self):
+        df = pd.DataFrame({
+            'ticker': ['IBIT', 'FBTC', 'IBIT', 'FBTC'],
+            'date': ['2025-06-02', '2025-06-02', '2025-05-30', '2025-05-30'],
+            'nav': [0.0, 30.0, 55.0, 29.0],
+            'premium_discount': [np.nan, 0.1, 0.2, 0.3],
+            'aum_usd': [5e10, 2e10, 4e10, 1e10],
+        })
+
+        summary = _latest_summary(df)
+
+        assert [s['ticker'] for s in summary] == ['IBIT', 'FBTC']
+        assert summary[0]['nav'] == 55.0
+        assert summary[0]['premium_discount'] == 0.2
+        assert summary[0]['date'] == '2025-06-02'
+        assert summary[1]['nav'] == 30.0
+
+    def test_empty_frame(self):
+        assert _latest_summary(pd.DataFrame(columns=['ticker', 'date', 'aum_usd'])) == []
+
+
+# ============================================================
+# INDIVIDUAL TRACKS
+# ============================================================
+
+class TestIndividualDaily:
+    """Tests for grouped per-ticker normalization."""
+
+    def test_grouped_matches_single_ticker(self):
+        df = _individual_frame()
+
+        combined = _build_individual_daily(df)
+        alone = _build_individual_daily(df[df['ticker'] == 'FBTC'])
+
+        assert set(combined) == {'IBIT', 'FBTC'}
+        assert combined['FBTC'] == alone['FBTC']
+        assert 'ticker' not in combined['FBTC']
+
+    def test_rolling_stats_do_not_leak_across_tickers(self):
+        df = _individual_frame(days=40)
+        track = _build_individual_daily(df)['IBIT']
+
+        # Fewer than NORM_MIN_PERIODS rows of its own history -> no z-score yet
+        assert track['pd_zscore_1y'][:etf_data.NORM_MIN_PERIODS - 1] == [0.0] * (etf_data.NORM_MIN_PERIODS - 1)
+        assert track['pd_zscore_1y'][-1] != 0.0
+
+
+# ============================================================
+# FETCH
+# ============================================================
+
+class TestFetchEtfData:
+    """Tests for fetch_etf_data with a supplied connection."""
+
+    def test_one_query_for_all_tickers(self, monkeypatch, agg_cache):
+        ind = _individual_frame()
+        agg = ind.groupby('date', as_index=False).agg(
+            total_flow_btc=('flow_btc', 'sum'), total_flow_usd=('flow_usd', 'sum'))
+        agg['total_aum_usd'] = 1e10
+        agg['avg_premium_discount'] = 0.1
+        agg['btc_price'] = np.linspace(60000, 90000, len(agg))
+        summary = ind.groupby('ticker', as_index=False).last()
+        summary['market_price'] = 50.0
+        summary['aum_usd'] = [2e10, 5e10]
+
+        queries = []
+
+        def fake_read_sql(query, conn, params=None):
+            queries.append((query, params))
+            if query is etf_data.SUMMARY_QUERY:
+                return summary.copy()
+            if query is etf_data.AGG_QUERY:
+                return agg.copy()
+            return ind[ind['ticker'].isin(params['tickers'])].copy()
+
+        monkeypatch.setattr(etf_data.pd, 'read_sql', fake_read_sql)
+        data = etf_data.fetch_etf_data(conn=object())
+
+        assert len(queries) == 3
+        assert queries[2][1] == {'tickers': ['IBIT', 'FBTC']}
+        assert list(data['individual_daily']) == ['IBIT', 'FBTC']
+        assert 'btc_price' not in data['flows_agg']
+        assert data['dates'] == _build_flows_agg(agg)['date'].tolist()
+
+    def test_incremental_run_queries_only_recent_days(self, monkeypatch, agg_cache):
+        agg = _agg_frame()
+        since_params = []
+
+        def fake_read_sql(query, conn, params=None):
+            since_params.append(params['since'])
+            if params['since'] is None:
+                return agg.copy()
+            return agg[pd.to_datetime(agg['date']) >= params['since']].copy()
+
+        monkeypatch.setattr(etf_data.pd, 'read_sql', fake_read_sql)
+        full = etf_data._load_flows_agg(object(), incremental=True)
+        again = etf_data._load_flows_agg(object(), incremental=True)
+
+        assert since_params[0] is None
+        assert since_params[1] is not None
+        assert agg_cache.exists()
+        pd.testing.assert_frame_equal(again, full)
+
+
+# ============================================================
+# INCREMENTAL AGGREGATES
+# ============================================================
+
+class TestIncrementalFlowsAgg:
+    """Tests for update_flows_agg against a full recomputation."""
+
+    def test_appended_days_match_full_history(self):
+        agg = _agg_frame()
+        full = _derive_flows_agg(agg)
+
+        cached = _derive_flows_agg(agg.iloc[:450])
+        updated = update_flows_agg(cached, agg.iloc[440:])
+
+        assert updated['date'].tolist() == full['date'].tolist()
+        # Cumulative sums are seeded, not re-added: exact
+        assert updated['cum_flow_usd'].tolist() == full['cum_flow_usd'].tolist()
+        pd.testing.assert_frame_equal(updated, full, check_exact=False, rtol=1e-9)
+
+    def test_revised_rows_replace_cached_values(self):
+        agg = _agg_frame()
+        cached = _derive_flows_agg(agg)
+
+        revised = agg.iloc[-5:].copy()
+        revised['total_flow_usd'] += 1e6
+        updated = update_flows_agg(cached, revised)
+
+        assert len(updated) == len(cached)
+        assert updated['cum_flow_usd'].iloc[-1] == pytest.approx(cached['cum_flow_usd'].iloc[-1] + 5e6)
+
+    def test_no_new_rows_returns_cache(self):
+        cached = _derive_flows_agg(_agg_frame(days=100))
+        assert update_flows_agg(cached, _agg_frame(days=0)) is cached
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
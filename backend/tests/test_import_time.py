@@ -0,0 +1,70 @@
+"""
+Import-Time Tests
+
+Guards against startup regressions in data_pipeline / run_scrapers:
+- No heavy optional dependencies (sklearn, scipy, bs4, tvDatafeed, ...) at import
+- No network sessions created at import
+- Cumulative import time stays under a budget (python -X importtime)
+"""
+
+import os
+import sys
+import subprocess
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only imported inside the functions that use them
+LAZY_MODULES = ['sklearn', 'scipy', 'bs4', 'tvDatafeed', 'fredapi', 'psycopg2', 'supabase']
+
+# Generous default; override on slow CI machines
+IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_TIME_BUDGET_MS', 4000))
+
+
+def _import_profile(module):
+    """Run `python -X importtime -c 'import <module>'` and parse its report."""
+    env = dict(os.environ, FRED_API_KEY='', TV_USERNAME='', TV_PASSWORD='')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cum_us, name = line[len('import time:'):].split('|')
+        if cum_us.strip().isdigit():
+            cumulative[name.strip()] = int(cum_us) / 1000
+    return cumulative, proc.stdout
+
+
+@pytest.mark.parametrize('module', ['data_pipeline', 'run_scrapers'])
+def test_no_heavy_modules_at_import(module):
+    cumulative, _ = _import_profile(module)
+
+    loaded = [m for m in cumulative if m.split('.')[0] in LAZY_MODULES]
+    assert not loaded, f"{module} eagerly imports {sorted(set(m.split('.')[0] for m in loaded))}"
+
+
+def test_no_network_session_at_import():
+    _, stdout = _import_profile('data_pipeline')
+
+    # Messages printed by get_tv_session() / the local login fallback
+    for marker in ('Logging into TradingView', 'Using TradingView without login',
+                   'TvDatafeed not available', 'TV Login'):
+        assert marker not in stdout
+
+
+def test_import_time_budget():
+    cumulative, _ = _import_profile('data_pipeline')
+
+    assert cumulative['data_pipeline'] < IMPORT_BUDGET_MS, (
+        f"import data_pipeline took {cumulative['data_pipeline']:.0f}ms "
+        f"(budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
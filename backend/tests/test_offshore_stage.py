@@ -0,0 +1,189 @@
+"""
+Offshore Stage Tests
+
+Tests for the shared offshore liquidity computation:
+- Foreign rates are resolved concurrently, failed fetches are skipped
+- get_offshore_liquidity_output only reads its explicit inputs and reuses
+  the previous output when they are unchanged
+- OffshoreDomain reads the stage output from the orchestrator context;
+  incremental runs re-process it only when the stage output changes
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics.offshore_liquidity as offshore
+from config.rates_sources import ForeignRateFetcher
+from domains.base import MetadataDomain
+from domains.offshore import OffshoreDomain
+from orchestrator import DataOrchestrator
+
+DAYS = 120
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch):
+    monkeypatch.setattr(offshore, '_last_output', None)
+
+
+def _frame(days=DAYS, seed=0):
+    index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=days, freq='D')
+    rng = np.random.default_rng(seed)
+    noise = lambda scale: rng.normal(scale=scale, size=days)
+    spot = 1.08 + noise(0.01)
+    return pd.DataFrame({
+        'OBFR': 4.35 + noise(0.01),
+        'EFFR': 4.33 + noise(0.01),
+        'FED_CB_SWAPS': np.abs(noise(100)),
+        'SOFR': 4.30 + noise(0.02),
+        'SOFR_INDEX': np.cumprod(np.full(days, 1 + 4.3 / 36000)),
+        'EURUSD': spot,
+        'EURUSD_FUT': spot * (1 + 0.0055 + noise(0.0002)),   # ~CIP forward
+        'BTC': 60000 + noise(1000),         # not an offshore input
+    }, index=index)
+
+
+def _rates(frame):
+    return {'USD': pd.Series(4.3, index=frame.index), 'EUR': pd.Series(2.0, index=frame.index)}
+
+
+# ============================================================
+# FOREIGN RATES
+# ============================================================
+
+class TestForeignRates:
+    """Tests for ForeignRateFetcher.fetch_all and resolve_foreign_rates."""
+
+    def test_fetch_all_runs_concurrently(self, monkeypatch):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fetch(self, currency):
+            barrier.wait()      # only passes when all four fetches run at once
+            return pd.Series([1.0], name=currency)
+
+        monkeypatch.setattr(ForeignRateFetcher, 'get_rate_for_currency', fetch)
+        rates = ForeignRateFetcher().fetch_all()
+
+        assert list(rates) == ['USD', 'EUR', 'GBP', 'JPY']
+        assert all(s.iloc[0] == 1.0 for s in rates.values())
+
+    def test_failed_fetch_is_dropped(self, monkeypatch):
+        def fetch(self, currency):
+            if currency == 'EUR':
+                raise ConnectionError('ECB down')
+            return pd.Series(dtype=float) if currency == 'GBP' else pd.Series([2.0])
+
+        monkeypatch.setattr(ForeignRateFetcher, 'get_rate_for_currency', fetch)
+        rates = offshore.resolve_foreign_rates(_frame())
+
+        assert set(rates) == {'USD', 'JPY'}
+
+    def test_usd_falls_back_to_sofr(self, monkeypatch):
+        monkeypatch.setattr(ForeignRateFetcher, 'get_rate_for_currency', lambda self, c: pd.Series(dtype=float))
+        frame = _frame()
+        rates = offshore.resolve_foreign_rates(frame)
+
+        assert rates['USD'].equals(frame['SOFR'])
+
+
+# ============================================================
+# STAGE
+# ============================================================
+
+class TestOffshoreStage:
+    """Tests for get_offshore_liquidity_output inputs and reuse."""
+
+    def test_unchanged_inputs_reuse_output(self, monkeypatch):
+        frame = _frame()
+        first = offshore.get_offshore_liquidity_output(frame, frame, foreign_rates=_rates(frame))
+
+        monkeypatch.setattr(offshore, '_compute_offshore_liquidity_output',
+                            lambda *a: pytest.fail('recomputed'))
+        # Non-offshore columns and fresh (equal) rate objects don't count
+        other = frame.assign(BTC=0.0)
+        again = offshore.get_offshore_liquidity_output(other, other, foreign_rates=_rates(frame))
+        assert again is first
+
+    def test_changed_inputs_recompute(self):
+        frame = _frame()
+        first = offshore.get_offshore_liquidity_output(frame, frame, foreign_rates=_rates(frame))
+
+        revised = frame.copy()
+        revised.loc[revised.index[-1], 'EURUSD_FUT'] += 0.001
+        second = offshore.get_offshore_liquidity_output(revised, revised, foreign_rates=_rates(frame))
+
+        assert second is not first
+        old = first['offshore_liquidity']['chart2_xccy_diy']['xccy_eurusd']
+        new = second['offshore_liquidity']['chart2_xccy_diy']['xccy_eurusd']
+        assert old[:-1] == new[:-1] and old[-1] != new[-1]
+
+    def test_given_rates_are_not_fetched(self, monkeypatch):
+        monkeypatch.setattr(offshore, 'resolve_foreign_rates', lambda df: pytest.fail('fetched rates'))
+        frame = _frame()
+        result = offshore.get_offshore_liquidity_output(frame, frame, foreign_rates=_rates(frame))
+
+        assert result['offshore_liquidity']['chart2_xccy_diy']['dates']
+
+    def test_fred_only(self, monkeypatch):
+        monkeypatch.setattr(offshore, 'resolve_foreign_rates', lambda df: pytest.fail('fetched rates'))
+        result = offshore.get_offshore_liquidity_output(_frame())
+
+        assert result['offshore_liquidity']['chart2_xccy_diy'] is None
+        assert len(result['offshore_liquidity']['chart1_fred_proxy']['obfr_effr_spread']) == DAYS
+
+
+# ============================================================
+# DOMAIN
+# ============================================================
+
+class TestOffshoreDomainContext:
+    """Tests for OffshoreDomain reading the stage through the orchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        orch = DataOrchestrator(str(tmp_path), incremental=True)
+        orch._domains = [MetadataDomain(), OffshoreDomain()]
+        return orch
+
+    def _stage(self, frame):
+        return offshore.get_offshore_liquidity_output(frame, frame, foreign_rates=_rates(frame))['offshore_liquidity']
+
+    def test_domain_uses_stage_output(self, orchestrator):
+        frame = _frame()
+        stage = self._stage(frame)
+        results = orchestrator.run(frame, generate_legacy=False, context={'offshore_liquidity': stage})
+
+        assert results['offshore']['xccy_basis_ref'] == stage['chart2_xccy_diy']
+        assert results['offshore']['thresholds'] == stage['thresholds']
+
+    def test_without_stage(self, orchestrator):
+        results = orchestrator.run(_frame(), generate_legacy=False)
+
+        assert 'xccy_basis_ref' not in results['offshore']
+        assert 'obfr_effr_spread' in results['offshore']
+
+    def test_incremental_run_follows_stage(self, orchestrator):
+        frame = _frame()
+        orchestrator.run(frame, generate_legacy=False, context={'offshore_liquidity': self._stage(frame)})
+
+        # BTC only: the stage hands back the same object, offshore is skipped
+        frame.loc[frame.index[-1], 'BTC'] += 1
+        orchestrator.run(frame, generate_legacy=False, context={'offshore_liquidity': self._stage(frame)})
+        assert 'offshore' in orchestrator.skipped_domains
+
+        # XCCY input changed: new stage output, offshore re-processed
+        frame.loc[frame.index[-1], 'EURUSD_FUT'] += 0.001
+        orchestrator.run(frame, generate_legacy=False, context={'offshore_liquidity': self._stage(frame)})
+        assert 'offshore' in orchestrator.processed_domains
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
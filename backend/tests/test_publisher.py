@@ -0,0 +1,131 @@
+"""
+Artifact Publisher Tests
+
+Tests for utils/publisher.py:
+- Unchanged content skips the write (and the manifest rewrite)
+- Manifest tracks hashes and sizes
+- Published files get normal permissions, not mkstemp's 0600
+- No temp files are left behind
+- Removal drops the file and its manifest entry
+"""
+
+import os
+import sys
+import json
+import stat
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.publisher as publisher_module
+from utils.publisher import ArtifactPublisher, MANIFEST_FILENAME, atomic_write_bytes, sha256_file
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    return ArtifactPublisher(str(tmp_path))
+
+
+class TestArtifactPublisher:
+    """Tests for ArtifactPublisher."""
+
+    def test_first_publish_writes(self, publisher, tmp_path):
+        path = str(tmp_path / 'domains' / 'gli.json')
+        result = publisher.publish_json(path, {'total': [1.0, 2.0]})
+
+        assert result.written
+        with open(path) as f:
+            assert json.load(f) == {'total': [1.0, 2.0]}
+
+    def test_unchanged_content_skips_write(self, publisher, tmp_path):
+        path = str(tmp_path / 'gli.json')
+        publisher.publish_json(path, {'total': [1.0]})
+        os.utime(path, (0, 0))
+
+        result = publisher.publish_json(path, {'total': [1.0]})
+
+        assert not result.written
+        assert os.path.getmtime(path) == 0
+
+    def test_unchanged_content_skips_manifest_write(self, publisher, tmp_path):
+        path = str(tmp_path / 'gli.json')
+        publisher.publish_json(path, {'total': [1.0]})
+        manifest_path = tmp_path / MANIFEST_FILENAME
+        os.utime(manifest_path, (0, 0))
+
+        publisher.publish_json(path, {'total': [1.0]})
+
+        assert os.path.getmtime(manifest_path) == 0
+
+    def test_stale_check_time_is_refreshed(self, publisher, tmp_path, monkeypatch):
+        path = str(tmp_path / 'gli.json')
+        publisher.publish_json(path, {'total': [1.0]})
+        monkeypatch.setattr(publisher_module, 'CHECKED_AT_REFRESH_SECONDS', 0)
+        os.utime(tmp_path / MANIFEST_FILENAME, (0, 0))
+
+        publisher.publish_json(path, {'total': [1.0]})
+
+        assert os.path.getmtime(tmp_path / MANIFEST_FILENAME) > 0
+
+    def test_changed_content_rewrites(self, publisher, tmp_path):
+        path = str(tmp_path / 'gli.json')
+        first = publisher.publish_json(path, {'total': [1.0]})
+        second = publisher.publish_json(path, {'total': [2.0]})
+
+        assert second.written
+        assert second.sha256 != first.sha256
+        assert sha256_file(path) == second.sha256
+
+    def test_manifest_tracks_artifacts(self, publisher, tmp_path):
+        path = str(tmp_path / 'domains' / 'gli.json')
+        result = publisher.publish_json(path, {'total': [1.0]})
+
+        with open(tmp_path / MANIFEST_FILENAME) as f:
+            manifest = json.load(f)
+
+        entry = manifest['artifacts']['domains/gli.json']
+        assert entry['sha256'] == result.sha256
+        assert entry['size'] == os.path.getsize(path)
+        assert publisher.checked_at(path) is not None
+
+    def test_existing_file_without_manifest_entry_is_hashed(self, tmp_path):
+        path = tmp_path / 'legacy.json'
+        path.write_text(json.dumps({'a': 1}))
+
+        result = ArtifactPublisher(str(tmp_path)).publish_json(str(path), {'a': 1})
+
+        assert not result.written
+
+    def test_no_temp_files_left(self, publisher, tmp_path):
+        publisher.publish_bytes(str(tmp_path / 'blob.bin'), b'\x00' * 64)
+
+        assert not [p for p in os.listdir(tmp_path) if p.endswith('.tmp')]
+
+    def test_new_files_follow_umask(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(publisher_module, '_UMASK', 0o022)
+        path = tmp_path / 'gli.json'
+        atomic_write_bytes(str(path), b'{}')
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+    def test_replaced_files_keep_their_mode(self, tmp_path):
+        path = tmp_path / 'gli.json'
+        path.write_bytes(b'{}')
+        os.chmod(path, 0o640)
+        atomic_write_bytes(str(path), b'{"a": 1}')
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+    def test_remove(self, publisher, tmp_path):
+        path = str(tmp_path / 'deltas' / 'gli.1.json')
+        publisher.publish_json(path, {'a': 1})
+
+        assert publisher.remove(path)
+        assert not os.path.exists(path)
+        assert publisher.entry(path) is None
+        assert not publisher.remove(path)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,272 @@
+"""
+Refresh Daemon Tests
+
+Tests for warm refreshes (refresh_daemon.py) and what they build on:
+- ColumnTracker records column reads/writes (and membership tests), also
+  through derived frames
+- Incremental orchestrator runs skip domains whose inputs did not change,
+  and re-run domains probing for a column that appears
+- Daemon refreshes update the in-memory store and pick the processing path
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domains.base import BaseDomain, MetadataDomain
+from domains.tracking import ColumnTracker
+from orchestrator import DataOrchestrator
+
+
+class _Domain(BaseDomain):
+    """Test domain: sums `reads`, optionally adds a column to the frame."""
+
+    def __init__(self, name, reads, writes=None, depends_on=()):
+        self._name = name
+        self.reads = reads
+        self.writes = writes
+        self.depends_on = depends_on
+        self.calls = 0
+
+    @property
+    def name(self):
+        return self._name
+
+    def process(self, df, **kwargs):
+        self.calls += 1
+        total = sum(df[c] for c in self.reads)
+        if self.writes:
+            df[self.writes] = total
+        return {'last': float(total.iloc[-1])}
+
+
+class _Probe(_Domain):
+    """Test domain that also sums `optional` columns when they are present."""
+
+    def __init__(self, name, reads, optional, writes=None, when=None):
+        super().__init__(name, reads, writes=writes)
+        self.optional = optional
+        self.when = when   # write only if the sum's last value exceeds this
+
+    def process(self, df, **kwargs):
+        self.calls += 1
+        total = sum(df[c] for c in self.reads + [c for c in self.optional if c in df])
+        if self.writes and (self.when is None or total.iloc[-1] > self.when):
+            df[self.writes] = total
+        return {'last': float(total.iloc[-1])}
+
+
+def _frame(days=30, **overrides):
+    index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=days, freq='D')
+    df = pd.DataFrame({c: np.arange(days, dtype=float) for c in ('A', 'B', 'C')}, index=index)
+    for col, value in overrides.items():
+        df.loc[df.index[-1], col] = value
+    return df
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orch = DataOrchestrator(str(tmp_path), incremental=True)
+    orch._domains = [
+        MetadataDomain(),
+        _Domain('a', ['A'], writes='A2'),
+        _Domain('b', ['B']),
+        _Domain('uses_a2', ['A2', 'C']),
+        _Domain('after_b', ['C'], depends_on=('b',)),
+    ]
+    return orch
+
+
+def _calls(orch):
+    return {d.name: d.calls for d in orch.domains if isinstance(d, _Domain)}
+
+
+# ============================================================
+# COLUMN TRACKER
+# ============================================================
+
+class TestColumnTracker:
+    """Tests for domains/tracking.py."""
+
+    def test_records_reads_through_derived_frames(self):
+        tracker = ColumnTracker.wrap(_frame())
+
+        tracker.get('A')
+        tracker.copy()[['B']].rolling(2).mean()
+        tracker.ffill().C
+
+        assert tracker.columns_read == {'A', 'B', 'C'}
+
+    def test_records_membership_tests(self):
+        tracker = ColumnTracker.wrap(_frame())
+
+        assert 'MISSING' not in tracker
+        assert 'A' in tracker.copy()
+
+        assert tracker.columns_read == {'MISSING', 'A'}
+
+    def test_writes_stay_on_tracker(self):
+        df = _frame()
+        tracker = ColumnTracker.wrap(df)
+
+        tracker['NEW'] = tracker['A'] * 2
+        tracker.copy()['SCRATCH'] = 1.0
+
+        assert tracker.columns_written == {'NEW'}
+        assert 'NEW' not in df.columns
+
+
+# ============================================================
+# INCREMENTAL ORCHESTRATOR
+# ============================================================
+
+class TestIncrementalOrchestrator:
+    """Tests for DataOrchestrator(incremental=True)."""
+
+    def test_first_run_processes_everything(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+
+        assert orchestrator.skipped_domains == []
+        assert _calls(orchestrator) == {'a': 1, 'b': 1, 'uses_a2': 1, 'after_b': 1}
+
+    def test_unchanged_frame_skips_everything(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+        orchestrator.run(_frame(), generate_legacy=False)
+
+        assert orchestrator.processed_domains == []
+        assert set(orchestrator._results) == {'metadata', 'a', 'b', 'uses_a2', 'after_b'}
+
+    def test_changed_column_reaches_downstream_readers(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+        orchestrator.run(_frame(A=100.0), generate_legacy=False)
+
+        # a re-runs, its new A2 column makes uses_a2 re-run
+        assert orchestrator.processed_domains == ['metadata', 'a', 'uses_a2']
+        assert orchestrator.get_domain_result('uses_a2')['last'] == 100.0 + 29.0
+
+    def test_skipped_domain_outputs_stay_on_frame(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+        orchestrator.run(_frame(C=50.0), generate_legacy=False)
+
+        # a was skipped, uses_a2 still finds A2 from a's previous run
+        assert 'a' in orchestrator.skipped_domains
+        assert orchestrator.get_domain_result('uses_a2')['last'] == 29.0 + 50.0
+
+    def test_depends_on_domain_results(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+        orchestrator.run(_frame(B=7.0), generate_legacy=False)
+
+        assert orchestrator.processed_domains == ['metadata', 'b', 'after_b']
+
+    def test_new_dates_process_everything(self, orchestrator):
+        orchestrator.run(_frame(), generate_legacy=False)
+        orchestrator.run(_frame(days=31), generate_legacy=False)
+
+        assert orchestrator.skipped_domains == []
+
+    def test_new_input_column_processes_everything(self, orchestrator, tmp_path):
+        orchestrator._domains.append(_Probe('probe', ['C'], optional=['D']))
+        orchestrator.run(_frame(), generate_legacy=False)
+
+        df = _frame()
+        df['D'] = 1000.0
+        orchestrator.run(df, generate_legacy=False)
+
+        assert orchestrator.skipped_domains == []
+        assert orchestrator.get_domain_result('probe')['last'] == 29.0 + 1000.0
+
+    def test_column_added_upstream_reaches_probing_domain(self, orchestrator):
+        orchestrator._domains += [
+            _Probe('maybe', ['A'], optional=[], writes='M', when=50.0),
+            _Probe('probe', ['C'], optional=['M']),
+        ]
+        orchestrator.run(_frame(), generate_legacy=False)
+        assert orchestrator.get_domain_result('probe')['last'] == 29.0
+
+        orchestrator.run(_frame(A=100.0), generate_legacy=False)
+
+        assert 'probe' in orchestrator.processed_domains
+        assert orchestrator.get_domain_result('probe')['last'] == 29.0 + 100.0
+
+    def test_results_match_full_run(self, orchestrator, tmp_path):
+        full = DataOrchestrator(str(tmp_path / 'full'))
+        full._domains = [MetadataDomain(), _Domain('a', ['A'], writes='A2'), _Domain('uses_a2', ['A2', 'C'])]
+        orchestrator.run(_frame(), generate_legacy=False)
+
+        orchestrator.run(_frame(A=3.0, C=4.0), generate_legacy=False)
+        full.run(_frame(A=3.0, C=4.0), generate_legacy=False)
+
+        for name in ('a', 'uses_a2'):
+            assert orchestrator.get_domain_result(name) == full.get_domain_result(name)
+
+
+# ============================================================
+# DAEMON
+# ============================================================
+
+class TestRefreshDaemon:
+    """Tests for RefreshDaemon.refresh with stubbed fetchers."""
+
+    @pytest.fixture
+    def daemon(self, monkeypatch, tmp_path):
+        import data_pipeline
+        import refresh_daemon
+
+        monkeypatch.setattr(data_pipeline, 'OUTPUT_DIR', str(tmp_path))
+        monkeypatch.setattr(data_pipeline, 'CACHE_FILE', str(tmp_path / 'data_cache_info.json'))
+        monkeypatch.setattr(data_pipeline, 'TV_AVAILABLE', True)
+        monkeypatch.setattr(data_pipeline, 'TV_CONFIG', {
+            'FX:EURUSD': ('FX', 'EURUSD'),
+            'ECONOMICS:USCBBS': ('ECONOMICS', 'FED'),
+        })
+        self.prices = {'EURUSD': 1.10, 'FED': 7e12}
+        self.fetched = []
+
+        def fetch_tv_symbol(symbol, exchange, name):
+            self.fetched.append(name)
+            return {name: pd.Series([self.prices[name]], index=pd.DatetimeIndex(['2026-01-02']), name=name)}
+
+        monkeypatch.setattr(data_pipeline, 'fetch_tv_symbol', fetch_tv_symbol)
+
+        d = refresh_daemon.RefreshDaemon(str(tmp_path))
+        self.runs = []
+        monkeypatch.setattr(d, 'run_domains', lambda: self.runs.append('domains') or [])
+        monkeypatch.setattr(d, 'run_full', lambda: self.runs.append('full') or [])
+        return d
+
+    def _group(self, name):
+        from refresh_daemon import SOURCE_GROUPS
+        return next(g for g in SOURCE_GROUPS if g.name == name)
+
+    def test_markets_refresh_only_fetches_market_symbols(self, daemon):
+        changed = daemon.refresh(self._group('tv_markets'))
+
+        assert self.fetched == ['EURUSD']
+        assert changed == ['EURUSD']
+        assert self.runs == ['domains']
+        assert daemon.inputs['tv']['EURUSD'].iloc[-1] == 1.10
+
+    def test_unchanged_data_is_not_reprocessed(self, daemon):
+        daemon.refresh(self._group('tv_markets'))
+        changed = daemon.refresh(self._group('tv_markets'))
+
+        assert changed == []
+        assert self.runs == ['domains']
+
+    def test_economics_refresh_runs_full_pipeline(self, daemon, tmp_path):
+        daemon.refresh(self._group('tv_economics'))
+
+        assert self.fetched == ['FED']
+        assert self.runs == ['full']
+        # Written back for cold runs
+        assert os.path.exists(tmp_path / 'tv_cache_data.json')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,132 @@
+"""
+Rolling Statistics Tests
+
+Tests for utils/rolling.py and the offshore statistics history built on it:
+- Percentile ranks match the per-window definitions (current in/out of n)
+- Quantiles and z-scores match pandas per-window results; flat windows
+  give NaN, or 0 in the offshore history as in its snapshot
+- calculate_rolling_statistics reproduces calculate_series_statistics at
+  every date, and serializes with the snapshot's rounding
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rolling import rolling_percentile_rank, rolling_quantiles, rolling_zscore
+from analytics.offshore_liquidity import (
+    calculate_rolling_statistics,
+    calculate_series_statistics,
+    rolling_statistics_for_json,
+)
+
+
+def _series(days=800, seed=0):
+    rng = np.random.default_rng(seed)
+    series = pd.Series(rng.normal(size=days), index=pd.date_range('2020-01-01', periods=days))
+    series.iloc[50:60] = np.nan
+    return series
+
+
+def _window(series, i, window):
+    return series.iloc[max(0, i + 1 - window):i + 1].dropna()
+
+
+# ============================================================
+# ENGINE
+# ============================================================
+
+class TestRollingEngine:
+    """Tests for the vectorized rolling kernels."""
+
+    @pytest.mark.parametrize('include_current', [False, True])
+    def test_percentile_rank(self, include_current):
+        series = _series()
+        ranks = rolling_percentile_rank(series, 100, 30, include_current=include_current)
+
+        for i in range(0, len(series), 17):
+            values, current = _window(series, i, 100), series.iloc[i]
+            if np.isnan(current) or len(values) < 30:
+                assert np.isnan(ranks.iloc[i])
+                continue
+            n = len(values) if include_current else len(values) - 1
+            assert ranks.iloc[i] == pytest.approx((values < current).sum() / n * 100)
+
+    def test_quantiles_and_zscore(self):
+        series = _series()
+        quantiles = rolling_quantiles(series, 100, 30)
+        z = rolling_zscore(series, 100, 30)
+
+        i = 400
+        values = _window(series, i, 100)
+        assert list(quantiles.columns) == [0.10, 0.25, 0.75, 0.90]
+        assert quantiles.iloc[i][0.25] == pytest.approx(values.quantile(0.25))
+        assert z.iloc[i] == pytest.approx((series.iloc[i] - values.mean()) / values.std())
+
+    def test_zscore_of_flat_window(self):
+        series = pd.Series(3.0, index=pd.date_range('2020-01-01', periods=50))
+
+        assert rolling_zscore(series, 20, 10).iloc[9:].isna().all()
+        z = rolling_zscore(series, 20, 10, zero_std=0.0)
+        assert z.iloc[:9].isna().all()
+        assert (z.iloc[9:] == 0).all()
+
+    def test_frames_rank_each_column(self):
+        frame = pd.DataFrame({'a': _series(seed=1), 'b': _series(seed=2)})
+        ranks = rolling_percentile_rank(frame, 100, 30)
+
+        pd.testing.assert_series_equal(ranks['b'], rolling_percentile_rank(frame['b'], 100, 30))
+
+
+# ============================================================
+# OFFSHORE HISTORY
+# ============================================================
+
+class TestRollingStatistics:
+    """Tests for calculate_rolling_statistics against the snapshot."""
+
+    @pytest.mark.parametrize('frequency', ['daily', 'weekly'])
+    def test_matches_snapshot_at_every_date(self, frequency):
+        series = _series(days=1600)
+        history = calculate_rolling_statistics(series, lookback_years=1, frequency=frequency)
+        valid = series.dropna()
+
+        assert history.index.equals(valid.index)
+        for i in range(5, len(valid), 41):
+            snapshot = calculate_series_statistics(valid.iloc[:i + 1], lookback_years=1, frequency=frequency)
+            row = history.iloc[i]
+            if not snapshot:
+                assert row.isna().all()
+                continue
+            for key in ('percentile', 'zscore', 'p10', 'p25', 'p75', 'p90'):
+                assert row[key] == pytest.approx(snapshot[key], abs=0.051 if key == 'percentile' else 0.0051)
+
+    def test_constant_series_matches_snapshot(self):
+        series = pd.Series(1.5, index=pd.date_range('2020-01-01', periods=300))
+        history = calculate_rolling_statistics(series, lookback_years=1)
+        snapshot = calculate_series_statistics(series, lookback_years=1)
+
+        assert snapshot['zscore'] == 0
+        assert history['zscore'].iloc[-1] == snapshot['zscore']
+        assert rolling_statistics_for_json(history)['zscore'][-1] == 0
+
+    def test_json(self):
+        history = calculate_rolling_statistics(_series(days=100))
+        output = rolling_statistics_for_json(history)
+
+        assert set(output) == {'dates', 'percentile', 'zscore', 'p10', 'p25', 'p75', 'p90'}
+        assert len(output['dates']) == 90
+        assert output['percentile'][0] is None         # fewer than 20 points
+        assert output['zscore'][-1] == round(history['zscore'].iloc[-1], 2)
+
+    def test_empty(self):
+        assert calculate_rolling_statistics(pd.Series(dtype=float)).empty
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
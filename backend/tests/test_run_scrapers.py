@@ -0,0 +1,181 @@
+"""
+Refresh Runner Tests
+
+Tests for run_scrapers.run_tasks and the shared TV rate limiter:
+- Independent tasks overlap; dependents get their upstream result
+- Failures and timeouts are reported and skip dependents
+- Rate limiter spacing and concurrency cap
+- Cancelled TV requests fail instead of reopening the shared session
+"""
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run_scrapers import Task, run_tasks, build_tasks
+import utils.tv_client as tv_client
+from utils.tv_client import RateLimiter, RequestsCancelled
+
+
+def _sleeper(seconds, value=None):
+    def fn(*args):
+        time.sleep(seconds)
+        return value
+    return fn
+
+
+# ============================================================
+# TASK RUNNER
+# ============================================================
+
+class TestRunTasks:
+    """Tests for concurrent task execution."""
+
+    def test_independent_tasks_run_concurrently(self):
+        start = time.perf_counter()
+        results = run_tasks([Task(f't{i}', _sleeper(0.2)) for i in range(4)])
+        elapsed = time.perf_counter() - start
+
+        assert [r.status for r in results] == ['ok'] * 4
+        assert elapsed < 0.6
+        assert all(r.seconds >= 0.2 for r in results)
+
+    def test_dependent_receives_result(self):
+        received = []
+        results = run_tasks([
+            Task('process', lambda inputs: received.append(inputs), after='fetch'),
+            Task('fetch', _sleeper(0.05, {'fred': {}})),
+        ])
+
+        assert [r.name for r in results] == ['process', 'fetch']
+        assert received == [{'fred': {}}]
+        assert results[0].started_at >= results[1].seconds
+
+    def test_failure_skips_dependents(self):
+        def boom():
+            raise RuntimeError('no data')
+
+        results = run_tasks([
+            Task('fetch', boom),
+            Task('process', lambda inputs: None, after='fetch'),
+            Task('other', _sleeper(0.01)),
+        ])
+
+        assert [r.status for r in results] == ['error', 'skipped', 'ok']
+        assert 'RuntimeError: no data' in results[0].error
+
+    def test_timeout_does_not_block(self):
+        start = time.perf_counter()
+        results = run_tasks([
+            Task('stuck', _sleeper(5), timeout=0.1),
+            Task('after_stuck', lambda _: None, after='stuck'),
+            Task('quick', _sleeper(0.01)),
+        ])
+
+        assert time.perf_counter() - start < 1
+        assert [r.status for r in results] == ['timeout', 'skipped', 'ok']
+
+    def test_build_tasks_options(self):
+        names = [t.name for t in build_tasks()]
+        assert names == ['scraper_indexes', 'scraper_commodities', 'pipeline_fetch', 'pipeline_process']
+        assert [t.name for t in build_tasks(skip_pipeline=True)] == names[:2]
+        assert [t.name for t in build_tasks(only_pipeline=True)] == names[2:]
+
+
+# ============================================================
+# RATE LIMITER
+# ============================================================
+
+class TestRateLimiter:
+    """Tests for the shared TradingView rate limiter."""
+
+    def test_spaces_request_starts(self):
+        limiter = RateLimiter(min_interval=0.05)
+        starts = []
+        for _ in range(4):
+            with limiter.slot():
+                starts.append(time.monotonic())
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.045
+        assert limiter.requests == 4
+
+    def test_caps_concurrent_requests(self):
+        limiter = RateLimiter(min_interval=0, max_concurrent=1)
+        active = []
+        peak = []
+
+        def request():
+            with limiter.slot():
+                active.append(1)
+                peak.append(len(active))
+                time.sleep(0.02)
+                active.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) == 1
+
+
+# ============================================================
+# CANCELLATION
+# ============================================================
+
+class TestCancelRequests:
+    """Tests for stopping abandoned tasks from using the TV session."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_flag(self, monkeypatch):
+        monkeypatch.setattr(tv_client, '_cancelled', threading.Event())
+
+    def test_abandoned_task_cannot_reopen_session(self, monkeypatch):
+        opened = []
+        monkeypatch.setattr(tv_client, '_get_tv_session', lambda force_new: opened.append(1))
+        release = threading.Event()
+        outcome = []
+
+        def stuck():
+            release.wait(5)
+            try:
+                tv_client.get_tv_session()
+            except RequestsCancelled as e:
+                outcome.append(e)
+
+        results = run_tasks([Task('stuck', stuck, timeout=0.05)])
+        tv_client.cancel_requests()
+        release.set()
+        for _ in range(100):
+            if outcome:
+                break
+            time.sleep(0.01)
+
+        assert results[0].status == 'timeout'
+        assert len(outcome) == 1
+        assert opened == []
+
+    def test_requests_fail_after_cancel(self):
+        class FakeTv:
+            calls = 0
+
+            def get_hist(self, **kwargs):
+                FakeTv.calls += 1
+
+        tv_client.cancel_requests()
+
+        with pytest.raises(RequestsCancelled):
+            tv_client.rate_limited_get_hist(FakeTv(), 'SPX', 'SP', None, 10)
+        assert FakeTv.calls == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,103 @@
+"""
+Scraper Panel Tests
+
+Tests for scrapers/panel.py against the per-series helpers it replaces:
+- ROC horizons match the former per-series calc_roc + clean_series
+- Z-scores / percentiles match domains/base.py helpers
+- Serialized layout (symbol -> metric -> list, NaN/inf as None)
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.panel import ROC_HORIZONS, compute_panel, roc_matrix, serialize_panel
+from domains.base import calculate_zscore, rolling_percentile
+
+
+# Per-series helpers the scrapers used before the panel
+def calc_roc(series, period):
+    return ((series / series.shift(period)) - 1) * 100
+
+
+def clean_series(series):
+    return [float(x) if pd.notnull(x) and np.isfinite(x) else None for x in series.tolist()]
+
+
+def _prices(days=1500, symbols=('SPX', 'NDX', 'DAX', 'NI225'), seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2019-01-01', periods=days)
+    data = 100 * np.exp(rng.normal(0, 0.01, (days, len(symbols))).cumsum(axis=0))
+    prices = pd.DataFrame(data, index=index, columns=list(symbols))
+    # Late listing and gaps, as after aligning on the base symbol's dates
+    prices.iloc[:300, -1] = np.nan
+    prices.iloc[rng.random(days) < 0.03, 0] = np.nan
+    return prices.ffill()
+
+
+# ============================================================
+# ROC
+# ============================================================
+
+class TestRocPanel:
+    """Tests for vectorized ROC horizons."""
+
+    def test_matches_per_series_output(self):
+        prices = _prices()
+        out = serialize_panel(compute_panel(prices))
+
+        assert list(out) == list(prices.columns)
+        for symbol in prices.columns:
+            assert list(out[symbol]) == ['absolute'] + list(ROC_HORIZONS)
+            assert out[symbol]['absolute'] == clean_series(prices[symbol])
+            for key, lag in ROC_HORIZONS.items():
+                assert out[symbol][key] == clean_series(calc_roc(prices[symbol], lag)), (symbol, key)
+
+    def test_zero_price_gives_none(self):
+        prices = pd.DataFrame({'X': [0.0, 1.0, 2.0, 0.0, 4.0]})
+        out = serialize_panel(compute_panel(prices, horizons={'roc_1d': 1}))
+
+        assert out['X']['roc_1d'] == [None, None, 100.0, -100.0, None]
+
+    def test_roc_matrix_shape(self):
+        assert roc_matrix(np.arange(1.0, 11.0), [1, 3]).shape == (2, 10, 1)
+
+
+# ============================================================
+# STATISTICS
+# ============================================================
+
+class TestPanelStatistics:
+    """Tests for optional z-scores and percentiles."""
+
+    def test_zscores_match_calculate_zscore(self):
+        prices = _prices()
+        panel = compute_panel(prices, zscores=True)
+
+        for symbol in prices.columns:
+            expected = calculate_zscore(calc_roc(prices[symbol], 30), 252, 100)
+            pd.testing.assert_series_equal(panel[(symbol, 'roc_30d_z')], expected,
+                                           check_names=False, rtol=1e-9)
+
+    def test_percentiles_match_rolling_percentile(self):
+        prices = _prices(days=1700, symbols=('SPX', 'DAX'))
+        panel = compute_panel(prices, horizons={'roc_7d': 7}, percentiles=True)
+
+        for symbol in prices.columns:
+            expected = rolling_percentile(calc_roc(prices[symbol], 7))
+            pd.testing.assert_series_equal(panel[(symbol, 'roc_7d_pct')], expected,
+                                           check_names=False, rtol=1e-9)
+
+    def test_metric_order(self):
+        panel = compute_panel(_prices(days=50, symbols=('A',)), horizons={'roc_7d': 7},
+                              zscores=True, percentiles=True)
+        assert list(panel.columns.get_level_values('metric')) == ['absolute', 'roc_7d', 'roc_7d_z', 'roc_7d_pct']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,216 @@
+"""
+Signal Config Tests
+
+Tests for the vectorized signal evaluation (config/signal_config.py):
+- compute_signal_series matches compute_signal at every date, including
+  momentum confirmation, the TIPS grid and the repo SRF overlay
+- aggregate_signal_series matches aggregate_signal_score at every date
+- calculate_signal_history reproduces calculate_signals as of each date
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.signal_config import (
+    STANCE_KEYS,
+    aggregate_signal_score,
+    aggregate_signal_series,
+    compute_signal,
+    compute_signal_series,
+)
+
+DAYS = 400
+
+
+def _values(scale, center=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    values = pd.Series(center + rng.normal(scale=scale, size=DAYS),
+                       index=pd.date_range('2022-01-01', periods=DAYS))
+    values.iloc[::37] = np.nan
+    return values
+
+
+def _assert_matches(frame, scalar_call):
+    """Compare every non-missing date against the scalar evaluator."""
+    for i, (date, row) in enumerate(frame.iterrows()):
+        result = scalar_call(i)
+        if result is None:
+            assert row['state'] == 'unknown', date
+            continue
+        assert row['state'] == result.state, date
+        assert row['confidence'] == pytest.approx(result.confidence), date
+        assert (None if pd.isna(row['label']) else row['label']) == result.label, date
+
+
+# ============================================================
+# PER-INDICATOR STATES
+# ============================================================
+
+class TestComputeSignalSeries:
+    """Tests for compute_signal_series against compute_signal."""
+
+    @pytest.mark.parametrize('indicator,scale,center', [
+        ('hy_spread', 1.5, 0.0),
+        ('nfci_risk', 1.5, 0.0),
+        ('vix', 2.0, -0.5),
+        ('move', 30, 100),
+        ('fx_vol', 3, 10),
+        ('yield_curve', 60, 20),
+    ])
+    def test_standard(self, indicator, scale, center):
+        values = _values(scale, center)
+        frame = compute_signal_series(indicator, values)
+
+        _assert_matches(frame, lambda i: None if np.isnan(values.iloc[i])
+                        else compute_signal(indicator, values.iloc[i]))
+        assert frame.index.equals(values.index)
+
+    def test_momentum_confirmation(self):
+        values, momentum = _values(1.0), _values(1.0, seed=1)
+        frame = compute_signal_series('cli', values, momentum=momentum)
+
+        def scalar(i):
+            if np.isnan(values.iloc[i]):
+                return None
+            mom = None if np.isnan(momentum.iloc[i]) else momentum.iloc[i]
+            return compute_signal('cli', values.iloc[i], momentum=mom)
+
+        _assert_matches(frame, scalar)
+        # Strong CLI without positive momentum stays neutral
+        assert set(frame.loc[(values > 0.5) & ~(momentum > 0), 'state']) == {'neutral'}
+
+    def test_tips_grid(self):
+        be, rr = _values(0.4, 2.25), _values(1.0, 1.25, seed=1)
+        frame = compute_signal_series('tips', be_values=be, rr_values=rr)
+
+        def scalar(i):
+            if np.isnan(be.iloc[i]) or np.isnan(rr.iloc[i]):
+                return None
+            return compute_signal('tips', 0, be_value=be.iloc[i], rr_value=rr.iloc[i])
+
+        _assert_matches(frame, scalar)
+        assert frame['label'].nunique() == 9
+
+    def test_repo_srf_overlay(self):
+        spread = _values(4.0, 2.0)
+        srf = _values(1.0, 0.5, seed=1) > 1.0
+        frame = compute_signal_series('repo', spread, srf_usage=srf)
+
+        _assert_matches(frame, lambda i: None if np.isnan(spread.iloc[i])
+                        else compute_signal('repo', spread.iloc[i], srf_usage=bool(srf.iloc[i])))
+        assert (frame.loc[srf & spread.notna(), 'state'] == 'danger').all()
+
+    def test_thresholds_are_inclusive(self):
+        frame = compute_signal_series('hy_spread', [1.2, -1.2, 0.0])
+
+        assert list(frame['state']) == ['bullish', 'bearish', 'neutral']
+
+
+# ============================================================
+# AGGREGATE
+# ============================================================
+
+class TestAggregateSignalSeries:
+    """Tests for aggregate_signal_series against aggregate_signal_score."""
+
+    def test_matches_scalar_aggregate(self):
+        states = ['bullish', 'neutral', 'warning', 'bearish', 'danger', 'unknown']
+        rng = np.random.default_rng(2)
+        signals = {
+            key: pd.DataFrame({
+                'state': rng.choice(states, size=DAYS),
+                'confidence': rng.uniform(size=DAYS).round(2),
+            })
+            for key in STANCE_KEYS
+            if key != 'tips'            # missing indicator: coverage < 1
+        }
+        aggregate = aggregate_signal_series(signals)
+
+        for i in range(DAYS):
+            scalar = aggregate_signal_score({k: v.iloc[i].to_dict() for k, v in signals.items()})
+            row = aggregate.iloc[i]
+            assert row['state'] == scalar['state']
+            assert row['score'] == pytest.approx(scalar['score'], abs=1e-3)
+            assert row['coverage'] == pytest.approx(scalar['coverage'])
+            assert row['confidence'] == pytest.approx(scalar['confidence'], abs=1e-3)
+
+    def test_no_signals(self):
+        aggregate = aggregate_signal_series({'vix': pd.DataFrame({'state': ['unknown'], 'confidence': [0.0]})})
+
+        assert aggregate.iloc[0].to_dict() == {'score': 0.0, 'state': 'neutral', 'coverage': 0.0, 'confidence': 0.0}
+
+
+# ============================================================
+# PIPELINE HISTORY
+# ============================================================
+
+class TestSignalHistory:
+    """Tests for data_pipeline.calculate_signal_history."""
+
+    @pytest.fixture
+    def frames(self):
+        index = pd.date_range('2023-01-01', periods=120)
+        rng = np.random.default_rng(3)
+        walk = lambda scale, start: pd.Series(start + np.cumsum(rng.normal(scale=scale, size=120)), index=index)
+        df = pd.DataFrame({
+            'TIPS_BREAKEVEN': walk(0.05, 2.3),
+            'TIPS_REAL_RATE': walk(0.05, 1.5),
+            'SOFR': walk(0.01, 4.32),
+            'IORB': pd.Series(4.40, index=index),
+            'SRF_USAGE': pd.Series(np.where(np.arange(120) >= 100, 5.0, 0.0), index=index),
+            'MOVE': walk(3, 100),
+            'FX_VOL': walk(0.3, 9),
+            'TREASURY_10Y_YIELD': walk(0.03, 4.2),
+            'TREASURY_2Y_YIELD': walk(0.03, 4.3),
+        }, index=index)
+        df.iloc[::7, df.columns.get_loc('MOVE')] = np.nan    # weekly gaps are forward-filled
+        cli_df = pd.DataFrame({
+            'CLI': walk(0.1, 0.0),
+            'HY_SPREAD_Z': walk(0.2, 0.0),
+            'IG_SPREAD_Z': walk(0.2, 0.0),
+            'NFCI_CREDIT_Z': walk(0.2, 0.0),
+            'NFCI_RISK_Z': walk(0.2, 0.0),
+            'LENDING_STD_Z': walk(0.2, 0.0),
+            'VIX_Z': walk(0.2, 0.0),
+        }, index=index)
+        cli_df.iloc[:30, cli_df.columns.get_loc('VIX_Z')] = np.nan
+        return df, cli_df
+
+    def test_matches_calculate_signals_as_of_each_date(self, frames):
+        from data_pipeline import calculate_signal_history, calculate_signals
+
+        df, cli_df = frames
+        states, aggregate = calculate_signal_history(df, cli_df)
+
+        for i in range(5, len(df), 9):
+            signals = calculate_signals(df.iloc[:i + 1], cli_df.iloc[:i + 1])
+            for key in STANCE_KEYS:
+                expected = signals[key]['state'] if key in signals else 'unknown'
+                assert states[key]['state'].iloc[i] == expected, (key, i)
+
+            scalar = aggregate_signal_score(signals)
+            assert aggregate['state'].iloc[i] == scalar['state']
+            assert aggregate['score'].iloc[i] == pytest.approx(scalar['score'], abs=1e-3)
+            assert aggregate['coverage'].iloc[i] == pytest.approx(scalar['coverage'])
+
+        assert states['repo']['state'].iloc[-1] == 'danger'
+
+    def test_repo_requires_sofr_and_iorb(self, frames):
+        from data_pipeline import calculate_signal_history
+
+        df, cli_df = frames
+        states, aggregate = calculate_signal_history(df.drop(columns='IORB'), cli_df)
+
+        assert 'repo' not in states
+        assert aggregate['coverage'].iloc[-1] == pytest.approx(0.9)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
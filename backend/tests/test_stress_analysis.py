@@ -0,0 +1,152 @@
+"""
+Stress Analysis Tests
+
+Tests for the point-in-time stress card and the historical stress engine:
+- calculate_stress_historical(as_of=...) computes only a trailing window
+  whose last row equals the full-history row at that date
+- calculate_market_stress_analysis takes its scores from the engine's last
+  row and explains each rule that fired
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.regime_v2 import calculate_stress_historical
+
+DAYS = 700
+SCORES = ('inflation_stress', 'liquidity_stress', 'credit_stress', 'volatility_stress', 'total_stress')
+
+
+def _frame(days=DAYS, seed=0):
+    index = pd.date_range('2022-01-03', periods=days, freq='B')
+    rng = np.random.default_rng(seed)
+    walk = lambda scale, start: start + np.cumsum(rng.normal(scale=scale, size=days))
+    df = pd.DataFrame({
+        'TIPS_BREAKEVEN': walk(0.03, 2.3),
+        'TIPS_5Y5Y_FORWARD': walk(0.03, 2.4),
+        'CLEV_EXPINF_10Y': walk(0.02, 2.3),
+        'SOFR': walk(0.005, 4.35),
+        'IORB': np.full(days, 4.40),
+        'BANK_RESERVES': walk(0.02, 3.2),
+        'RRP_USD': np.abs(walk(0.02, 0.3)),
+        'TGA_USD': walk(0.02, 0.8),
+        'FED_USD': walk(0.02, 7.0),
+        'HY_SPREAD': np.abs(walk(0.1, 4.0)),        # in %, normalized to bps
+        'IG_SPREAD': np.abs(walk(0.03, 1.2)),
+        'NFCI': walk(0.02, -0.3),
+        'VIX': np.abs(walk(1.0, 18)) + 9,
+        'MOVE': np.abs(walk(2.0, 100)),
+        'TREASURY_10Y_YIELD': walk(0.03, 4.2),
+    }, index=index)
+    # Weekly/monthly releases: only published values, gaps in between
+    weekly = np.arange(days) % 5 != 0
+    df.loc[weekly, ['BANK_RESERVES', 'NFCI', 'TGA_USD', 'FED_USD']] = np.nan
+    df.loc[np.arange(days) % 21 != 0, 'CLEV_EXPINF_10Y'] = np.nan
+    return df
+
+
+# ============================================================
+# HISTORICAL ENGINE
+# ============================================================
+
+class TestStressAsOf:
+    """Tests for the trailing-window snapshot of calculate_stress_historical."""
+
+    @pytest.mark.parametrize('position', [-1, 400, 150])
+    def test_last_row_matches_full_history(self, position):
+        df = _frame()
+        as_of = df.index[position]
+        full = calculate_stress_historical(df)
+        snapshot = calculate_stress_historical(df, as_of=as_of)
+
+        assert snapshot['total_stress'].index[-1] == as_of
+        assert len(snapshot['total_stress']) <= 252
+        for key, series in full.items():
+            expected, actual = series.loc[as_of], snapshot[key].iloc[-1]
+            if isinstance(expected, str):
+                assert actual == expected, key
+            elif pd.isna(expected):
+                assert pd.isna(actual), key
+            else:
+                assert actual == pytest.approx(expected, rel=1e-9), key
+
+    def test_monthly_value_before_window_carries_in(self):
+        df = _frame()
+        df.loc[df.index[:-300], 'CLEV_EXPINF_10Y'] = 2.0
+        df.loc[df.index[-300]:, 'CLEV_EXPINF_10Y'] = np.nan
+
+        snapshot = calculate_stress_historical(df, as_of=df.index[-1])
+        expected = abs(df['TIPS_BREAKEVEN'].iloc[-1] - 2.0)
+        assert snapshot['tips_clev_divergence'].iloc[-1] == pytest.approx(expected)
+
+
+# ============================================================
+# POINT-IN-TIME CARD
+# ============================================================
+
+class TestStressCard:
+    """Tests for calculate_market_stress_analysis built on the engine."""
+
+    def test_scores_are_engine_last_row(self):
+        from data_pipeline import calculate_market_stress_analysis
+
+        df = _frame()
+        full = calculate_stress_historical(df)
+        card = calculate_market_stress_analysis(df, silent=True)
+
+        assert card['inflation_stress']['score'] == full['inflation_stress'].iloc[-1]
+        assert card['liquidity_stress']['score'] == full['liquidity_stress'].iloc[-1]
+        assert card['credit_stress']['score'] == full['credit_stress'].iloc[-1]
+        assert card['volatility_stress']['score'] == full['volatility_stress'].iloc[-1]
+        assert card['global_stress']['total_score'] == full['total_stress'].iloc[-1]
+        assert card['global_stress']['level'].lower() == full['stress_level'].iloc[-1]
+        assert card['as_of'] == df.index[-1].strftime('%Y-%m-%d')
+
+    def test_reuses_given_history(self, monkeypatch):
+        import data_pipeline
+
+        df = _frame()
+        history = calculate_stress_historical(df)
+        monkeypatch.setattr(data_pipeline, 'calculate_stress_historical',
+                            lambda *a, **k: pytest.fail('recomputed stress history'))
+        card = data_pipeline.calculate_market_stress_analysis(df, silent=True, stress_historical=history)
+
+        assert card['global_stress']['total_score'] == history['total_stress'].iloc[-1]
+
+    def test_signals_explain_fired_rules(self):
+        from data_pipeline import calculate_market_stress_analysis
+
+        df = _frame()
+        # Last week: VIX spike, wide HY (in %), SOFR above IORB
+        df.loc[df.index[-1], 'VIX'] = df['VIX'].iloc[-6] * 1.5 + 25
+        df.loc[df.index[-1], 'HY_SPREAD'] = 6.0
+        df.loc[df.index[-1], 'SOFR'] = 4.50
+        card = calculate_market_stress_analysis(df, silent=True)
+
+        keys = lambda dim: {s['key'] for s in card[dim]['signals']}
+        assert {'ms_vol_vix_high', 'ms_vol_vix_spike'} <= keys('volatility_stress')
+        assert 'ms_cred_hy_high' in keys('credit_stress')
+        assert 'ms_liq_sofr_high' in keys('liquidity_stress')
+        assert card['credit_stress']['metrics']['hy_spread_bps'] == 600.0
+
+    def test_missing_inputs(self):
+        from data_pipeline import calculate_market_stress_analysis
+
+        df = _frame()[['VIX']]
+        card = calculate_market_stress_analysis(df, silent=True)
+
+        assert card['liquidity_stress']['score'] == 0
+        assert card['liquidity_stress']['signals'] == []
+        assert card['liquidity_stress']['metrics']['sofr'] is None
+        assert 'N/A' in card['chart_analyses']['repo_stress']['summary']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,197 @@
+"""
+Symbol Cache Tests
+
+Tests for utils/symbol_cache.py (no TradingView session):
+- Hits, misses and re-downloads for larger requests
+- TTL expiry (per-interval default or the caller's) and the disk store
+  across processes (store instances)
+- Concurrent requests for one symbol share a single download
+- fetch_historical_data is served from the store without a session
+"""
+
+import os
+import sys
+import time
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import symbol_cache, tv_client
+from utils.symbol_cache import SymbolStore
+
+
+def _bars(n, symbol='BITSTAMP:BTCUSD'):
+    index = pd.date_range(end='2025-06-30', periods=n, freq='D', name='datetime')
+    close = 30000 + np.random.default_rng(n).normal(0, 100, n).cumsum()
+    return pd.DataFrame({'symbol': symbol, 'open': close, 'high': close + 1.5,
+                         'low': close - 1.5, 'close': close, 'volume': 1e3}, index=index)
+
+
+class Downloads:
+    """fetch() stand-in counting calls; serves at most `available` bars."""
+
+    def __init__(self, available=10000, delay=0.0):
+        self.available = available
+        self.delay = delay
+        self.calls = []
+
+    def __call__(self, n_bars):
+        def fetch():
+            self.calls.append(n_bars)
+            time.sleep(self.delay)
+            return _bars(min(n_bars, self.available))
+        return fetch
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.delenv('TV_CACHE_TTL_HOURS', raising=False)
+    monkeypatch.delenv('TV_CACHE_DISABLE', raising=False)
+    return SymbolStore(cache_dir=tmp_path)
+
+
+# ============================================================
+# LOOKUP
+# ============================================================
+
+class TestSymbolStore:
+    """Tests for hits, misses and freshness."""
+
+    def test_second_request_is_served_from_cache(self, store):
+        downloads = Downloads()
+        first = store.get('BTCUSD', 'BITSTAMP', '1D', 7500, downloads(7500))
+        smaller = store.get('btcusd', 'bitstamp', '1D', 5000, downloads(5000))
+
+        assert downloads.calls == [7500]
+        assert len(first) == 7500
+        pd.testing.assert_frame_equal(smaller, first.tail(5000))
+
+    def test_larger_request_downloads_again(self, store):
+        downloads = Downloads()
+        store.get('BTCUSD', 'BITSTAMP', '1D', 1500, downloads(1500))
+        store.get('BTCUSD', 'BITSTAMP', '1D', 5000, downloads(5000))
+        store.get('BTCUSD', 'BITSTAMP', '1D', 3000, downloads(3000))
+
+        assert downloads.calls == [1500, 5000]
+
+    def test_full_history_serves_any_request(self, store):
+        downloads = Downloads(available=800)
+        store.get('ZQ1!', 'CBOT', '1D', 1000, downloads(1000))
+        data = store.get('ZQ1!', 'CBOT', '1D', 5000, downloads(5000))
+
+        assert downloads.calls == [1000]
+        assert len(data) == 800
+
+    def test_intervals_are_separate_keys(self, store):
+        downloads = Downloads()
+        store.get('USIRYY', 'ECONOMICS', '1M', 500, downloads(500))
+        store.get('USIRYY', 'ECONOMICS', '1D', 500, downloads(500))
+        assert len(downloads.calls) == 2
+
+    def test_expired_entry_is_refetched(self, store, monkeypatch):
+        downloads = Downloads()
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))
+        key = store.key('GOLD', 'TVC', '1D')
+        store._entries[key].fetched_at = datetime.now() - timedelta(hours=symbol_cache.SYMBOL_CACHE_TTL_HOURS['1D'] + 1)
+        # The disk copy is just as old
+        store._save(key, store._entries[key])
+
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))
+        assert downloads.calls == [100, 100]
+
+    def test_caller_ttl_replaces_interval_default(self, store):
+        downloads = Downloads()
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))
+        key = store.key('GOLD', 'TVC', '1D')
+        store._entries[key].fetched_at = datetime.now() - timedelta(hours=2)
+        store._save(key, store._entries[key])
+
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))                 # default TTL: still fresh
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100), ttl_hours=1)    # caller's TTL: expired
+        assert downloads.calls == [100, 100]
+
+    def test_pipeline_uses_its_own_ttl(self, store, monkeypatch):
+        import data_pipeline
+
+        monkeypatch.setattr(data_pipeline, 'get_symbol_store', lambda: store)
+        monkeypatch.setattr(data_pipeline, 'get_tv', lambda: None)
+        store.get('GOLD', 'TVC', '1D', 100, Downloads()(100))
+        assert data_pipeline.get_tv_hist('GOLD', 'TVC', '1D', 100) is not None
+
+        # Older than TV_CACHE_HOURS but within the daily default: the pipeline refetches
+        key = store.key('GOLD', 'TVC', '1D')
+        store._entries[key].fetched_at = datetime.now() - timedelta(hours=data_pipeline.TV_CACHE_HOURS + 0.5)
+        store._save(key, store._entries[key])
+        assert store.lookup('GOLD', 'TVC', '1D', 100) is not None
+        assert data_pipeline.get_tv_hist('GOLD', 'TVC', '1D', 100) is None     # miss, and no session
+
+    def test_empty_results_are_not_cached(self, store):
+        calls = []
+        store.get('NOPE', 'TVC', '1D', 100, lambda: calls.append(1) or pd.DataFrame())
+        store.get('NOPE', 'TVC', '1D', 100, lambda: calls.append(1) or pd.DataFrame())
+        assert len(calls) == 2
+
+    def test_disabled_store_always_fetches(self, store, monkeypatch):
+        monkeypatch.setenv('TV_CACHE_DISABLE', '1')
+        downloads = Downloads()
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))
+        store.get('GOLD', 'TVC', '1D', 100, downloads(100))
+        assert len(downloads.calls) == 2
+
+
+# ============================================================
+# DISK / CONCURRENCY
+# ============================================================
+
+class TestSharing:
+    """Tests for sharing entries across store instances and threads."""
+
+    def test_disk_entry_survives_new_process(self, store, tmp_path):
+        downloads = Downloads()
+        original = store.get('BTCUSD', 'BITSTAMP', '1D', 300, downloads(300))
+
+        reloaded = SymbolStore(cache_dir=tmp_path).lookup('BTCUSD', 'BITSTAMP', '1D', 300)
+
+        assert downloads.calls == [300]
+        pd.testing.assert_frame_equal(reloaded, original, check_freq=False)
+
+    def test_concurrent_requests_download_once(self, store):
+        downloads = Downloads(delay=0.05)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.get('BTCUSD', 'BITSTAMP', '1D', 7500, downloads(7500))))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert downloads.calls == [7500]
+        assert len(results) == 6
+
+
+class TestFetchHistoricalData:
+    """Tests for tv_client.fetch_historical_data on top of the store."""
+
+    def test_cached_symbol_needs_no_session(self, store, monkeypatch):
+        monkeypatch.setattr(symbol_cache, '_store', store)
+        store.get('BTCUSD', 'BITSTAMP', '1D', 7500, Downloads()(7500))
+
+        def no_session(*args, **kwargs):
+            raise AssertionError('session opened for a cached symbol')
+
+        monkeypatch.setattr(tv_client, 'get_tv_session', no_session)
+        data = tv_client.fetch_historical_data('BTCUSD', 'BITSTAMP', interval='1D', n_bars=7500)
+
+        assert len(data) == 7500
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
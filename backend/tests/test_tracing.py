@@ -0,0 +1,225 @@
+"""
+Tracing Tests
+
+Tests for utils/tracing.py:
+- Disabled tracers record nothing
+- Spans nest per thread and record wall/CPU time and rows
+- tracemalloc peaks are relative to the span and reach the parent span,
+  and survive spans started in other threads
+- traced() decorator infers rows from DataFrame arguments
+- Calls after the tracer exists don't take the creation lock
+- Chrome trace and summary output
+"""
+
+import os
+import sys
+import json
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.tracing as tracing
+from utils.tracing import Tracer, traced
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """Fresh enabled process tracer, stopped afterwards."""
+    t = Tracer()
+    monkeypatch.setattr(tracing, '_tracer', t)
+    t.start()
+    yield t
+    t.stop()
+
+
+# ============================================================
+# SPANS
+# ============================================================
+
+class TestSpans:
+    """Tests for span recording."""
+
+    def test_disabled_tracer_records_nothing(self, monkeypatch):
+        t = Tracer()
+        monkeypatch.setattr(tracing, '_tracer', t)
+
+        with tracing.span('work') as s:
+            assert s is None
+
+        assert t.spans == []
+
+    def test_nested_spans(self, tracer):
+        with tracing.span('outer', rows=10) as outer:
+            with tracing.span('inner', cat='analytics'):
+                sum(range(10000))
+            outer.args['note'] = 'x'
+
+        inner, outer = tracer.spans
+        assert (inner.name, inner.depth, inner.cat) == ('inner', 1, 'analytics')
+        assert (outer.name, outer.depth, outer.rows) == ('outer', 0, 10)
+        assert outer.wall >= inner.wall > 0
+        assert outer.args == {'note': 'x'}
+
+    def test_span_recorded_on_exception(self, tracer):
+        with pytest.raises(ValueError):
+            with tracing.span('failing'):
+                raise ValueError('boom')
+
+        assert [s.name for s in tracer.spans] == ['failing']
+
+    def test_memory_peak_reaches_parent(self, tracer):
+        with tracing.span('outer'):
+            with tracing.span('alloc'):
+                block = np.ones(2_000_000)   # 16 MB
+                del block
+            with tracing.span('small'):
+                pass
+
+        spans = {s.name: s for s in tracer.spans}
+        assert spans['alloc'].peak_bytes > 15e6
+        assert spans['small'].peak_bytes < 1e6
+        assert spans['outer'].peak_bytes >= spans['alloc'].peak_bytes
+
+    def test_memory_peak_survives_other_threads(self, tracer):
+        allocated, other_done = threading.Event(), threading.Event()
+
+        def fetch():
+            with tracing.span('fetch'):
+                block = np.ones(2_000_000)   # 16 MB
+                del block
+                allocated.set()
+                other_done.wait(5)
+
+        worker = threading.Thread(target=fetch)
+        worker.start()
+        allocated.wait(5)
+        with tracing.span('other'):      # resets the process-wide peak
+            pass
+        other_done.set()
+        worker.join()
+
+        spans = {s.name: s for s in tracer.spans}
+        assert spans['fetch'].peak_bytes > 15e6
+        assert spans['other'].peak_bytes < 1e6
+
+    def test_threads_have_separate_stacks(self, tracer):
+        def work():
+            with tracing.span('thread_work'):
+                pass
+
+        with tracing.span('main'):
+            worker = threading.Thread(target=work)
+            worker.start()
+            worker.join()
+
+        spans = {s.name: s for s in tracer.spans}
+        assert spans['thread_work'].depth == 0
+        assert spans['thread_work'].thread != spans['main'].thread
+
+
+# ============================================================
+# DECORATOR
+# ============================================================
+
+class TestTraced:
+    """Tests for the traced() decorator."""
+
+    def test_rows_from_first_argument(self, tracer):
+        @traced(cat='analytics')
+        def calculate_thing(df, scale=1):
+            return df * scale
+
+        result = calculate_thing(pd.DataFrame({'a': range(7)}), scale=2)
+
+        assert result['a'].tolist() == [0, 2, 4, 6, 8, 10, 12]
+        (s,) = tracer.spans
+        assert (s.name, s.cat, s.rows) == ('calculate_thing', 'analytics', 7)
+
+    def test_disabled_passthrough(self, monkeypatch):
+        t = Tracer()
+        monkeypatch.setattr(tracing, '_tracer', t)
+
+        @traced()
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.__name__ == 'add'
+        assert t.spans == []
+
+    def test_calls_skip_the_creation_lock(self, monkeypatch):
+        class NoLock:
+            def __enter__(self):
+                raise AssertionError('lock taken on the hot path')
+
+            def __exit__(self, *exc):
+                return False
+
+        t = Tracer()
+        monkeypatch.setattr(tracing, '_tracer', t)
+        monkeypatch.setattr(tracing, '_tracer_lock', NoLock())
+
+        @traced()
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert tracing.get_tracer() is t
+
+
+# ============================================================
+# OUTPUT
+# ============================================================
+
+class TestOutput:
+    """Tests for Chrome trace and summary output."""
+
+    def test_chrome_trace(self, tracer, tmp_path):
+        with tracing.span('fetch', cat='fetch', rows=3):
+            pass
+
+        path = tracer.write_chrome_trace(str(tmp_path / 'trace.json'))
+        with open(path) as f:
+            trace = json.load(f)
+
+        (event,) = trace['traceEvents']
+        assert event['ph'] == 'X'
+        assert event['name'] == 'fetch'
+        assert event['args']['rows'] == 3
+        assert {'cpu_ms', 'peak_kb'} <= set(event['args'])
+
+    def test_summary_aggregates_by_name(self, tracer):
+        for n in (2, 3):
+            with tracing.span('calculate_rocs', cat='analytics', rows=n):
+                pass
+        with tracing.span('other'):
+            pass
+
+        summary = {t['name']: t for t in tracer.summary()}
+        assert summary['calculate_rocs']['calls'] == 2
+        assert summary['calculate_rocs']['rows'] == 5
+        assert summary['other']['rows'] is None
+        assert 'calculate_rocs' in tracer.format_summary()
+
+    def test_finish_trace_only_when_enabled(self, monkeypatch, tmp_path):
+        monkeypatch.delenv('PIPELINE_TRACE_FILE', raising=False)
+        t = Tracer()
+        monkeypatch.setattr(tracing, '_tracer', t)
+        assert tracing.finish_trace(str(tmp_path)) is None
+
+        t.start()
+        with tracing.span('stage'):
+            pass
+        t.stop()
+        t.enabled = True
+        path = tracing.finish_trace(str(tmp_path))
+        assert path == os.path.join(str(tmp_path), 'pipeline_trace.json')
+        assert os.path.exists(path)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -82,256 +82,469 @@ BTC_THRESHOLDS = {
 
 
 # ==============================================================================
-# ALERT DETECTION FUNCTIONS
+# ALERT RULES
 # ==============================================================================
 
-def detect_auction_alerts(auction: Dict) -> List[Dict]:
-    """
-    Detect alerts for a single auction.
-    
-    Returns list of alerts with severity, type, and description.
-    """
-    alerts = []
-    sec_type = auction.get('security_type', 'Note')
-    security_name = f"{auction.get('security_term', '')} {sec_type}".strip()
-    
-    # Get thresholds for this security type
-    dealer_thresh = DEALER_THRESHOLDS.get(sec_type, DEALER_THRESHOLDS['Note'])
-    indirect_thresh = INDIRECT_THRESHOLDS.get(sec_type, INDIRECT_THRESHOLDS['Note'])
-    btc_thresh = BTC_THRESHOLDS.get(sec_type, BTC_THRESHOLDS['Note'])
-    
-    # === ALERT 1: High Dealer Takedown ===
-    dealer_pct = auction.get('dealer_pct')
-    if dealer_pct is not None:
-        if dealer_pct >= dealer_thresh['critical']:
-            alerts.append({
+# Per-auction threshold rules. Levels of a metric are exclusive and checked
+# in order (first hit wins); 'worse' says which direction breaches.
+THRESHOLD_RULES = {
+    'dealer_pct': {
+        'thresholds': DEALER_THRESHOLDS,
+        'worse': 'higher',
+        'levels': [
+            {
                 'level': AlertLevel.CRITICAL.value,
                 'type': 'HIGH_DEALER_TAKEDOWN',
                 'icon': '🔴',
                 'title': 'Critical Dealer Absorption',
-                'message': f"Dealers absorbed {dealer_pct:.1f}% of {security_name} (threshold: {dealer_thresh['critical']}%)",
-                'metric': 'dealer_pct',
-                'value': dealer_pct,
-                'threshold': dealer_thresh['critical'],
+                'message': "Dealers absorbed {value:.1f}% of {name} (threshold: {threshold}%)",
                 'implication': 'Real demand severely lacking. Dealers forced to absorb excess supply.',
                 'market_impact': 'Bearish for bonds, potential yield pressure'
-            })
-        elif dealer_pct >= dealer_thresh['warning']:
-            alerts.append({
+            },
+            {
                 'level': AlertLevel.WARNING.value,
                 'type': 'HIGH_DEALER_TAKEDOWN',
                 'icon': '🟠',
                 'title': 'Elevated Dealer Absorption',
-                'message': f"Dealers absorbed {dealer_pct:.1f}% of {security_name}",
-                'metric': 'dealer_pct',
-                'value': dealer_pct,
-                'threshold': dealer_thresh['warning'],
+                'message': "Dealers absorbed {value:.1f}% of {name}",
                 'implication': 'End-user demand weaker than normal.',
                 'market_impact': 'Watch for yield drift higher'
-            })
-        elif dealer_pct >= dealer_thresh['caution']:
-            alerts.append({
+            },
+            {
                 'level': AlertLevel.CAUTION.value,
                 'type': 'ELEVATED_DEALER',
                 'icon': '🟡',
                 'title': 'Slightly Elevated Dealer %',
-                'message': f"Dealer takedown at {dealer_pct:.1f}% for {security_name}",
-                'metric': 'dealer_pct',
-                'value': dealer_pct,
-                'threshold': dealer_thresh['caution'],
+                'message': "Dealer takedown at {value:.1f}% for {name}",
                 'implication': 'Minor absorption pressure.',
                 'market_impact': 'Neutral, monitor trend'
-            })
-    
-    # === ALERT 2: Weak Foreign Demand (Low Indirect) ===
-    indirect_pct = auction.get('indirect_pct')
-    if indirect_pct is not None:
-        if indirect_pct <= indirect_thresh['critical']:
-            alerts.append({
+            },
+        ],
+    },
+    'indirect_pct': {
+        'thresholds': INDIRECT_THRESHOLDS,
+        'worse': 'lower',
+        'levels': [
+            {
                 'level': AlertLevel.CRITICAL.value,
                 'type': 'WEAK_FOREIGN_DEMAND',
                 'icon': '🔴',
                 'title': 'Critical Foreign Demand Drop',
-                'message': f"Indirect bidders only {indirect_pct:.1f}% for {security_name} (threshold: {indirect_thresh['critical']}%)",
-                'metric': 'indirect_pct',
-                'value': indirect_pct,
-                'threshold': indirect_thresh['critical'],
+                'message': "Indirect bidders only {value:.1f}% for {name} (threshold: {threshold}%)",
                 'implication': 'Foreign central banks and sovereign funds avoiding this maturity.',
                 'market_impact': 'USD weakness risk, yield pressure'
-            })
-        elif indirect_pct <= indirect_thresh['warning']:
-            alerts.append({
+            },
+            {
                 'level': AlertLevel.WARNING.value,
                 'type': 'WEAK_FOREIGN_DEMAND',
                 'icon': '🟠',
                 'title': 'Below-Average Foreign Demand',
-                'message': f"Indirect bidders at {indirect_pct:.1f}% for {security_name}",
-                'metric': 'indirect_pct',
-                'value': indirect_pct,
-                'threshold': indirect_thresh['warning'],
+                'message': "Indirect bidders at {value:.1f}% for {name}",
                 'implication': 'Foreign demand softening.',
                 'market_impact': 'Monitor USD and yield curve'
-            })
-        elif indirect_pct <= indirect_thresh['caution']:
-            alerts.append({
+            },
+            {
                 'level': AlertLevel.CAUTION.value,
                 'type': 'SOFT_FOREIGN_DEMAND',
                 'icon': '🟡',
                 'title': 'Soft Foreign Participation',
-                'message': f"Indirect bidders at {indirect_pct:.1f}% for {security_name}",
-                'metric': 'indirect_pct',
-                'value': indirect_pct,
-                'threshold': indirect_thresh['caution'],
+                'message': "Indirect bidders at {value:.1f}% for {name}",
                 'implication': 'Slightly below normal foreign interest.',
                 'market_impact': 'Neutral'
-            })
-    
-    # === ALERT 3: Poor Bid-to-Cover ===
-    btc = auction.get('bid_to_cover')
-    if btc is not None:
-        if btc <= btc_thresh['critical']:
-            alerts.append({
+            },
+        ],
+    },
+    'bid_to_cover': {
+        'thresholds': BTC_THRESHOLDS,
+        'worse': 'lower',
+        'levels': [
+            {
                 'level': AlertLevel.CRITICAL.value,
                 'type': 'POOR_BID_TO_COVER',
                 'icon': '🔴',
                 'title': 'Critical Demand Shortage',
-                'message': f"BTC only {btc:.2f}x for {security_name} (threshold: {btc_thresh['critical']}x)",
-                'metric': 'bid_to_cover',
-                'value': btc,
-                'threshold': btc_thresh['critical'],
+                'message': "BTC only {value:.2f}x for {name} (threshold: {threshold}x)",
                 'implication': 'Severe lack of buyer interest.',
                 'market_impact': 'Immediate yield pressure likely'
-            })
-        elif btc <= btc_thresh['warning']:
-            alerts.append({
+            },
+            {
                 'level': AlertLevel.WARNING.value,
                 'type': 'WEAK_BID_TO_COVER',
                 'icon': '🟠',
                 'title': 'Weak Auction Coverage',
-                'message': f"BTC at {btc:.2f}x for {security_name}",
-                'metric': 'bid_to_cover',
-                'value': btc,
-                'threshold': btc_thresh['warning'],
+                'message': "BTC at {value:.2f}x for {name}",
                 'implication': 'Below-average demand.',
                 'market_impact': 'Yields may drift higher'
+            },
+        ],
+    },
+}
+
+# Combined stress: number of metrics past their caution threshold
+STRESS_RULES = [
+    {
+        'count': 3,
+        'level': AlertLevel.CRITICAL.value,
+        'type': 'MULTI_METRIC_STRESS',
+        'icon': '⚠️',
+        'title': 'Multiple Stress Indicators',
+        'message': "{name} showing weakness across {value} metrics",
+        'threshold': 3,
+        'implication': 'Broad-based demand weakness for this maturity.',
+        'market_impact': 'Significant supply/demand imbalance'
+    },
+    {
+        'count': 2,
+        'level': AlertLevel.WARNING.value,
+        'type': 'DUAL_METRIC_STRESS',
+        'icon': '⚠️',
+        'title': 'Multiple Caution Signals',
+        'message': "{name} showing weakness in {value} metrics",
+        'threshold': 2,
+        'implication': 'Auction absorbed but with strain.',
+        'market_impact': 'Watch follow-through in secondary market',
+        # Only added if the auction has no critical threshold alert
+        'unless_critical': True,
+    },
+]
+
+# Trend rules: mean of the 3 most recent vs the 3 oldest valid values within
+# the last `lookback_auctions` auctions of a security type
+TREND_SECURITY_TYPES = ['Bill', 'Note', 'Bond']
+TREND_MIN_AUCTIONS = 5
+TREND_EDGE_AUCTIONS = 3
+
+TREND_RULES = [
+    {
+        'metric': 'dealer_pct',
+        'worse': 'higher',
+        'factor': 1.25,  # 25% increase
+        'level': AlertLevel.WARNING.value,
+        'type': 'DETERIORATING_DEALER_TREND',
+        'icon': '📈',
+        'title': '{sec_type} Dealer Trend Deteriorating',
+        'message': "Dealer absorption rising: {older:.1f}% → {recent:.1f}%",
+        'alert_metric': 'dealer_pct_trend',
+        'implication': 'Systematic weakening in {sec_type} demand.',
+        'market_impact': 'Watch term premium expansion'
+    },
+    {
+        'metric': 'indirect_pct',
+        'worse': 'lower',
+        'factor': 0.85,  # 15% decrease
+        'level': AlertLevel.WARNING.value,
+        'type': 'DETERIORATING_FOREIGN_TREND',
+        'icon': '📉',
+        'title': '{sec_type} Foreign Demand Weakening',
+        'message': "Indirect bidders declining: {older:.1f}% → {recent:.1f}%",
+        'alert_metric': 'indirect_pct_trend',
+        'implication': 'Foreign appetite for {sec_type}s declining.',
+        'market_impact': 'USD and long-end yields at risk'
+    },
+    {
+        'metric': 'bid_to_cover',
+        'worse': 'lower',
+        'factor': 0.90,  # 10% decrease
+        'level': AlertLevel.CAUTION.value,
+        'type': 'DETERIORATING_BTC_TREND',
+        'icon': '📉',
+        'title': '{sec_type} Coverage Declining',
+        'message': "Bid-to-cover weakening: {older:.2f}x → {recent:.2f}x",
+        'alert_metric': 'btc_trend',
+        'implication': 'Overall demand for {sec_type}s softening.',
+        'market_impact': 'Neutral to slightly bearish'
+    },
+]
+
+# Columns of alert history frames
+ALERT_HISTORY_COLUMNS = ['auction_date', 'cusip', 'security_type', 'security_term',
+                         'level', 'type', 'metric', 'value', 'threshold']
+
+
+# ==============================================================================
+# ALERT DETECTION FUNCTIONS
+# ==============================================================================
+
+def _threshold_lookup(security_types: pd.Series, table: Dict[str, Dict]) -> pd.DataFrame:
+    """Per-row thresholds for each auction's security type (unknown types use 'Note')."""
+    lookup = pd.DataFrame.from_dict(table, orient='index')
+    keys = security_types.where(security_types.isin(lookup.index), 'Note')
+    return lookup.reindex(keys.to_numpy()).set_axis(security_types.index)
+
+
+def _breaches(values: pd.Series, thresholds: pd.Series, worse: str) -> np.ndarray:
+    """Boolean mask of values at/past the threshold in the 'worse' direction (NaN never breaches)."""
+    if worse == 'higher':
+        return (values >= thresholds).to_numpy()
+    return (values <= thresholds).to_numpy()
+
+
+def _evaluate_threshold_rules(df: pd.DataFrame) -> List[Tuple[Dict, str, np.ndarray, np.ndarray]]:
+    """
+    Evaluate every per-auction rule as a boolean mask over the whole frame.
+
+    Returns (rule, metric, hit positions, hit values) in alert order: metric
+    levels first (dealer, indirect, bid-to-cover), then combined stress.
+    """
+    if df.empty:
+        return []
+
+    security_types = df['security_type'] if 'security_type' in df.columns else pd.Series('Note', index=df.index)
+    hits = []
+    stress_count = np.zeros(len(df), dtype=int)
+    has_critical = np.zeros(len(df), dtype=bool)
+
+    for metric, spec in THRESHOLD_RULES.items():
+        if metric in df.columns:
+            values = pd.to_numeric(df[metric], errors='coerce')
+        else:
+            values = pd.Series(np.nan, index=df.index)
+        thresholds = _threshold_lookup(security_types, spec['thresholds'])
+
+        matched = np.zeros(len(df), dtype=bool)
+        for rule in spec['levels']:
+            mask = _breaches(values, thresholds[rule['level']], spec['worse']) & ~matched
+            matched |= mask
+            if rule['level'] == AlertLevel.CRITICAL.value:
+                has_critical |= mask
+            if mask.any():
+                positions = np.flatnonzero(mask)
+                hits.append((rule, metric, positions, values.to_numpy()[positions]))
+
+        # A zero reading doesn't count towards combined stress
+        stress_count += _breaches(values, thresholds['caution'], spec['worse']) & (values != 0).to_numpy()
+
+    for rule in STRESS_RULES:
+        mask = stress_count == rule['count']
+        if rule.get('unless_critical'):
+            mask &= ~has_critical
+        if mask.any():
+            positions = np.flatnonzero(mask)
+            hits.append((rule, 'combined', positions, stress_count[positions]))
+
+    return hits
+
+
+def _rule_threshold(rule: Dict, metric: str, security_type) -> Any:
+    if metric == 'combined':
+        return rule['threshold']
+    table = THRESHOLD_RULES[metric]['thresholds']
+    return table.get(security_type, table['Note'])[rule['level']]
+
+
+def evaluate_auction_alerts(df: pd.DataFrame) -> List[List[Dict]]:
+    """
+    Alerts for every auction in df, as a list aligned with its rows.
+
+    All threshold rules are evaluated as masks over the whole frame; alert
+    dicts are only built for hits.
+    """
+    alerts: List[List[Dict]] = [[] for _ in range(len(df))]
+    hits = _evaluate_threshold_rules(df)
+    if not hits:
+        return alerts
+
+    security_types = df['security_type'].tolist() if 'security_type' in df.columns else ['Note'] * len(df)
+    terms = df['security_term'].tolist() if 'security_term' in df.columns else [''] * len(df)
+
+    for rule, metric, positions, values in hits:
+        for pos, value in zip(positions.tolist(), values.tolist()):
+            name = f"{terms[pos]} {security_types[pos]}".strip()
+            threshold = _rule_threshold(rule, metric, security_types[pos])
+            alerts[pos].append({
+                'level': rule['level'],
+                'type': rule['type'],
+                'icon': rule['icon'],
+                'title': rule['title'],
+                'message': rule['message'].format(value=value, name=name, threshold=threshold),
+                'metric': metric,
+                'value': value,
+                'threshold': threshold,
+                'implication': rule['implication'],
+                'market_impact': rule['market_impact']
             })
-    
-    # === ALERT 4: Combined Stress (multiple weak metrics) ===
-    stress_count = 0
-    if dealer_pct and dealer_pct >= dealer_thresh['caution']:
-        stress_count += 1
-    if indirect_pct and indirect_pct <= indirect_thresh['caution']:
-        stress_count += 1
-    if btc and btc <= btc_thresh['caution']:
-        stress_count += 1
-    
-    if stress_count >= 3:
-        alerts.append({
-            'level': AlertLevel.CRITICAL.value,
-            'type': 'MULTI_METRIC_STRESS',
-            'icon': '⚠️',
-            'title': 'Multiple Stress Indicators',
-            'message': f"{security_name} showing weakness across {stress_count} metrics",
-            'metric': 'combined',
-            'value': stress_count,
-            'threshold': 3,
-            'implication': 'Broad-based demand weakness for this maturity.',
-            'market_impact': 'Significant supply/demand imbalance'
-        })
-    elif stress_count == 2:
-        # Only add if we don't already have critical alerts
-        critical_count = sum(1 for a in alerts if a['level'] == AlertLevel.CRITICAL.value)
-        if critical_count == 0:
-            alerts.append({
-                'level': AlertLevel.WARNING.value,
-                'type': 'DUAL_METRIC_STRESS',
-                'icon': '⚠️',
-                'title': 'Multiple Caution Signals',
-                'message': f"{security_name} showing weakness in {stress_count} metrics",
-                'metric': 'combined',
-                'value': stress_count,
-                'threshold': 2,
-                'implication': 'Auction absorbed but with strain.',
-                'market_impact': 'Watch follow-through in secondary market'
-            })
-    
+
     return alerts
 
 
+def detect_auction_alerts(auction: Dict) -> List[Dict]:
+    """
+    Detect alerts for a single auction.
+    
+    Returns list of alerts with severity, type, and description.
+    """
+    row = {
+        'security_type': auction.get('security_type', 'Note'),
+        'security_term': auction.get('security_term', ''),
+    }
+    for metric in THRESHOLD_RULES:
+        value = auction.get(metric)
+        row[metric] = np.nan if value is None else value
+    return evaluate_auction_alerts(pd.DataFrame([row]))[0]
+
+
+def build_alert_history(df: pd.DataFrame, lookback_auctions: int = 10, include_trends: bool = True) -> pd.DataFrame:
+    """
+    Every alert over the full auction history, one row per hit.
+
+    Intended for backtesting: no alert dicts or messages are built. Trend
+    alerts are evaluated as of each auction of their security type.
+    """
+    frames = []
+    for rule, metric, positions, values in _evaluate_threshold_rules(df):
+        hit_rows = df.iloc[positions]
+        if metric == 'combined':
+            threshold = np.full(len(positions), rule['threshold'], dtype=float)
+        else:
+            threshold = _threshold_lookup(hit_rows['security_type'], THRESHOLD_RULES[metric]['thresholds'])[rule['level']].to_numpy()
+        frames.append(pd.DataFrame({
+            'auction_date': hit_rows['auction_date'].to_numpy(),
+            'cusip': hit_rows['cusip'].to_numpy() if 'cusip' in df.columns else None,
+            'security_type': hit_rows['security_type'].to_numpy(),
+            'security_term': hit_rows['security_term'].to_numpy() if 'security_term' in df.columns else None,
+            'level': rule['level'],
+            'type': rule['type'],
+            'metric': metric,
+            'value': values.astype(float),
+            'threshold': threshold,
+        }))
+
+    if include_trends:
+        trends = _evaluate_trend_rules(df, lookback_auctions)
+        if not trends.empty:
+            trends = trends[trends['hit']]
+            frames.append(pd.DataFrame({
+                'auction_date': trends['auction_date'].to_numpy(),
+                'cusip': trends['cusip'].to_numpy() if 'cusip' in trends.columns else None,
+                'security_type': trends['security_type'].to_numpy(),
+                'security_term': trends['security_term'].to_numpy() if 'security_term' in trends.columns else None,
+                'level': trends['level'].to_numpy(),
+                'type': trends['type'].to_numpy(),
+                'metric': trends['alert_metric'].to_numpy(),
+                'value': trends['recent'].to_numpy(),
+                'threshold': trends['threshold'].to_numpy(),
+            }))
+
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=ALERT_HISTORY_COLUMNS)
+    history = pd.concat(frames, ignore_index=True)
+    return history.sort_values('auction_date', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def _window_edge_means(values: np.ndarray, window: int, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    For each position (chronological order), over the trailing `window` values:
+    mean of the k most recent valid values, mean of the k oldest valid
+    values, and the number of valid values.
+
+    Values are summed newest-first, the same order as .head(k)/.tail(k)
+    on the newest-first frame.
+    """
+    padded = np.concatenate([np.full(window - 1, np.nan), values.astype(float)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)[:, ::-1]  # newest -> oldest
+    valid = ~np.isnan(windows)
+    filled = np.where(valid, windows, 0.0)
+    count = valid.sum(axis=1)
+
+    def nth_valid(rank: np.ndarray, n: int) -> np.ndarray:
+        # Exactly one cell per row matches; the rest contribute +0.0
+        return np.where(valid & (rank == n), filled, 0.0).sum(axis=1)
+
+    from_newest = np.cumsum(valid, axis=1)
+    from_oldest = count[:, None] - from_newest + valid
+    recent = nth_valid(from_newest, 1)
+    older = nth_valid(from_oldest, k)
+    for n in range(2, k + 1):
+        recent = recent + nth_valid(from_newest, n)
+        older = older + nth_valid(from_oldest, k + 1 - n)
+
+    enough = count >= k
+    recent = np.where(enough, recent / k, np.nan)
+    older = np.where(enough, older / k, np.nan)
+    return recent, older, count
+
+
+def _evaluate_trend_rules(df: pd.DataFrame, lookback_auctions: int = 10) -> pd.DataFrame:
+    """
+    Trend rules as a grouped rolling comparison, evaluated as of every auction.
+
+    df is ordered most recent first (as fetched). For each auction of a
+    TREND_SECURITY_TYPES type, the window is that auction plus the previous
+    lookback_auctions - 1 auctions of the same type. Returns one row per
+    (auction, rule) with recent/older averages, threshold and a 'hit' flag.
+    """
+    if df.empty or 'security_type' not in df.columns:
+        return pd.DataFrame()
+
+    frames = []
+    for sec_type in TREND_SECURITY_TYPES:
+        # Chronological order (reverse of the fetched, newest-first order)
+        type_df = df[df['security_type'] == sec_type].iloc[::-1]
+        if type_df.empty:
+            continue
+        auctions_in_window = np.minimum(np.arange(1, len(type_df) + 1), lookback_auctions)
+
+        for rule in TREND_RULES:
+            values = pd.to_numeric(type_df[rule['metric']], errors='coerce').to_numpy()
+            recent, older, count = _window_edge_means(values, lookback_auctions, TREND_EDGE_AUCTIONS)
+            threshold = older * rule['factor']
+            eligible = (auctions_in_window >= TREND_MIN_AUCTIONS) & (count >= TREND_MIN_AUCTIONS)
+            if rule['worse'] == 'higher':
+                hit = eligible & (recent > threshold)
+            else:
+                hit = eligible & (recent < threshold)
+
+            frame = type_df[[c for c in ('auction_date', 'cusip', 'security_type', 'security_term') if c in type_df.columns]].copy()
+            frame['rule'] = TREND_RULES.index(rule)
+            frame['level'] = rule['level']
+            frame['type'] = rule['type']
+            frame['alert_metric'] = rule['alert_metric']
+            frame['recent'] = recent
+            frame['older'] = older
+            frame['threshold'] = threshold
+            frame['hit'] = hit
+            frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames)
+
+
 def detect_trend_alerts(df: pd.DataFrame, lookback_auctions: int = 10) -> List[Dict]:
     """
     Detect trend-based alerts across multiple auctions.
+
+    Uses the latest evaluation of each (security type, trend rule).
     """
     alerts = []
     
     if df.empty or len(df) < 5:
         return alerts
-    
-    for sec_type in ['Bill', 'Note', 'Bond']:
-        type_df = df[df['security_type'] == sec_type].head(lookback_auctions)
-        
-        if len(type_df) < 5:
-            continue
-        
-        # Check for deteriorating trend in dealer %
-        dealer_series = type_df['dealer_pct'].dropna()
-        if len(dealer_series) >= 5:
-            recent_avg = dealer_series.head(3).mean()
-            older_avg = dealer_series.tail(3).mean()
-            
-            if recent_avg > older_avg * 1.25:  # 25% increase
-                alerts.append({
-                    'level': AlertLevel.WARNING.value,
-                    'type': 'DETERIORATING_DEALER_TREND',
-                    'icon': '📈',
-                    'title': f'{sec_type} Dealer Trend Deteriorating',
-                    'message': f"Dealer absorption rising: {older_avg:.1f}% → {recent_avg:.1f}%",
-                    'metric': 'dealer_pct_trend',
-                    'value': recent_avg,
-                    'threshold': older_avg * 1.25,
-                    'implication': f'Systematic weakening in {sec_type} demand.',
-                    'market_impact': 'Watch term premium expansion'
-                })
-        
-        # Check for deteriorating indirect %
-        indirect_series = type_df['indirect_pct'].dropna()
-        if len(indirect_series) >= 5:
-            recent_avg = indirect_series.head(3).mean()
-            older_avg = indirect_series.tail(3).mean()
-            
-            if recent_avg < older_avg * 0.85:  # 15% decrease
-                alerts.append({
-                    'level': AlertLevel.WARNING.value,
-                    'type': 'DETERIORATING_FOREIGN_TREND',
-                    'icon': '📉',
-                    'title': f'{sec_type} Foreign Demand Weakening',
-                    'message': f"Indirect bidders declining: {older_avg:.1f}% → {recent_avg:.1f}%",
-                    'metric': 'indirect_pct_trend',
-                    'value': recent_avg,
-                    'threshold': older_avg * 0.85,
-                    'implication': f'Foreign appetite for {sec_type}s declining.',
-                    'market_impact': 'USD and long-end yields at risk'
-                })
-        
-        # Check for deteriorating BTC
-        btc_series = type_df['bid_to_cover'].dropna()
-        if len(btc_series) >= 5:
-            recent_avg = btc_series.head(3).mean()
-            older_avg = btc_series.tail(3).mean()
-            
-            if recent_avg < older_avg * 0.90:  # 10% decrease
-                alerts.append({
-                    'level': AlertLevel.CAUTION.value,
-                    'type': 'DETERIORATING_BTC_TREND',
-                    'icon': '📉',
-                    'title': f'{sec_type} Coverage Declining',
-                    'message': f"Bid-to-cover weakening: {older_avg:.2f}x → {recent_avg:.2f}x",
-                    'metric': 'btc_trend',
-                    'value': recent_avg,
-                    'threshold': older_avg * 0.90,
-                    'implication': f'Overall demand for {sec_type}s softening.',
-                    'market_impact': 'Neutral to slightly bearish'
-                })
+
+    trends = _evaluate_trend_rules(df, lookback_auctions)
+    if trends.empty:
+        return alerts
+
+    # Latest auction per type (frames are chronological within each type)
+    latest = trends.groupby(['security_type', 'rule'], sort=False).tail(1)
+    latest = latest[latest['hit']]
+
+    for row in latest.itertuples(index=False):
+        rule = TREND_RULES[row.rule]
+        sec_type = row.security_type
+        alerts.append({
+            'level': rule['level'],
+            'type': rule['type'],
+            'icon': rule['icon'],
+            'title': rule['title'].format(sec_type=sec_type),
+            'message': rule['message'].format(older=row.older, recent=row.recent),
+            'metric': rule['alert_metric'],
+            'value': float(row.recent),
+            'threshold': float(row.threshold),
+            'implication': rule['implication'].format(sec_type=sec_type),
+            'market_impact': rule['market_impact']
+        })
     
     return alerts
 
@@ -471,88 +684,117 @@ def save_cache(data: Dict) -> None:
 # API FETCHING FUNCTIONS
 # ==============================================================================
 
-def fetch_auctioned_securities(security_type: str, max_results: int = 250) -> List[Dict]:
+TREASURY_DIRECT_HEADERS = {
+    'User-Agent': 'GLI-CLI-Dashboard/2.0 (Treasury Auction Analysis)',
+    'Accept': 'application/json'
+}
+
+# TreasuryDirect's maximum page size
+MAX_PAGE_SIZE = 250
+
+
+def _fetch_auction_page(security_type: str, page: int = 1, page_size: int = MAX_PAGE_SIZE) -> List[Dict]:
+    """
+    One page of auctioned securities of a type, most recent first.
+
+    Raises on request errors (unlike fetch_auctioned_securities), so callers
+    can tell a failed page from the end of the history.
+    """
     url = f"{TREASURY_DIRECT_BASE_URL}/securities/auctioned"
     params = {
         'format': 'json',
         'type': security_type,
-        'pagesize': min(max_results, 250)
-    }
-    
-    headers = {
-        'User-Agent': 'GLI-CLI-Dashboard/2.0 (Treasury Auction Analysis)',
-        'Accept': 'application/json'
+        'pagesize': min(page_size, MAX_PAGE_SIZE),
+        'pagenum': page,
     }
-    
+    response = requests.get(url, params=params, headers=TREASURY_DIRECT_HEADERS, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+    return data if isinstance(data, list) else []
+
+
+def fetch_auctioned_securities(security_type: str, max_results: int = 250) -> List[Dict]:
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        return data if isinstance(data, list) else []
+        return _fetch_auction_page(security_type, page_size=max_results)
     except requests.exceptions.RequestException as e:
         print(f"  [TreasuryDirect] Error fetching {security_type}: {e}")
         return []
 
 
-def fetch_all_auction_data(lookback_days: int = 730, silent: bool = False) -> pd.DataFrame:
-    all_auctions = []
-    cutoff_date = datetime.now() - timedelta(days=lookback_days)
-    
-    for sec_type in SECURITY_TYPES:
-        if not silent:
-            print(f"  [TreasuryDirect] Fetching {sec_type} auctions...")
-        
-        auctions = fetch_auctioned_securities(sec_type)
-        
-        for auction in auctions:
-            try:
-                auction_date_str = auction.get('auctionDate', '')
-                if not auction_date_str:
-                    continue
-                    
-                auction_date = datetime.strptime(auction_date_str[:10], '%Y-%m-%d')
-                
-                if auction_date < cutoff_date:
-                    continue
-                
-                record = {
-                    'auction_date': auction_date,
-                    'issue_date': auction.get('issueDate', '')[:10] if auction.get('issueDate') else None,
-                    'maturity_date': auction.get('maturityDate', '')[:10] if auction.get('maturityDate') else None,
-                    'security_type': auction.get('securityType', sec_type),
-                    'security_term': auction.get('securityTerm', ''),
-                    'cusip': auction.get('cusip', ''),
-                    'bid_to_cover': _safe_float(auction.get('bidToCoverRatio')),
-                    'competitive_accepted': _safe_float(auction.get('competitiveAccepted')),
-                    'competitive_tendered': _safe_float(auction.get('competitiveTendered')),
-                    'noncompetitive_accepted': _safe_float(auction.get('noncompetitiveAccepted')),
-                    'direct_bidder_accepted': _safe_float(auction.get('directBidderAccepted')),
-                    'direct_bidder_tendered': _safe_float(auction.get('directBidderTendered')),
-                    'indirect_bidder_accepted': _safe_float(auction.get('indirectBidderAccepted')),
-                    'indirect_bidder_tendered': _safe_float(auction.get('indirectBidderTendered')),
-                    'primary_dealer_accepted': _safe_float(auction.get('primaryDealerAccepted')),
-                    'primary_dealer_tendered': _safe_float(auction.get('primaryDealerTendered')),
-                    'high_yield': _safe_float(auction.get('highInvestmentRate')) or _safe_float(auction.get('highYield')),
-                    'high_discount_rate': _safe_float(auction.get('highDiscountRate')),
-                    'avg_median_yield': _safe_float(auction.get('averageMedianYield')),
-                    'low_yield': _safe_float(auction.get('lowInvestmentRate')) or _safe_float(auction.get('lowYield')),
-                    'offering_amount': _safe_float(auction.get('offeringAmount')) or _safe_float(auction.get('totalAccepted')),
-                    'total_accepted': _safe_float(auction.get('totalAccepted')),
-                    'total_tendered': _safe_float(auction.get('totalTendered')),
-                    'allocation_pct': _safe_float(auction.get('allocationPercentage')),
-                }
-                
-                all_auctions.append(record)
-                
-            except Exception as e:
-                continue
-        
-        time.sleep(0.2)
-    
-    if not all_auctions:
+def _parse_auction_record(auction: Dict, sec_type: str) -> Optional[Dict]:
+    """Flatten one TreasuryDirect auction into a raw record (None without an auction date)."""
+    auction_date_str = auction.get('auctionDate', '')
+    if not auction_date_str:
+        return None
+
+    return {
+        'auction_date': datetime.strptime(auction_date_str[:10], '%Y-%m-%d'),
+        'issue_date': auction.get('issueDate', '')[:10] if auction.get('issueDate') else None,
+        'maturity_date': auction.get('maturityDate', '')[:10] if auction.get('maturityDate') else None,
+        'security_type': auction.get('securityType', sec_type),
+        'security_term': auction.get('securityTerm', ''),
+        'cusip': auction.get('cusip', ''),
+        'bid_to_cover': _safe_float(auction.get('bidToCoverRatio')),
+        'competitive_accepted': _safe_float(auction.get('competitiveAccepted')),
+        'competitive_tendered': _safe_float(auction.get('competitiveTendered')),
+        'noncompetitive_accepted': _safe_float(auction.get('noncompetitiveAccepted')),
+        'direct_bidder_accepted': _safe_float(auction.get('directBidderAccepted')),
+        'direct_bidder_tendered': _safe_float(auction.get('directBidderTendered')),
+        'indirect_bidder_accepted': _safe_float(auction.get('indirectBidderAccepted')),
+        'indirect_bidder_tendered': _safe_float(auction.get('indirectBidderTendered')),
+        'primary_dealer_accepted': _safe_float(auction.get('primaryDealerAccepted')),
+        'primary_dealer_tendered': _safe_float(auction.get('primaryDealerTendered')),
+        'high_yield': _safe_float(auction.get('highInvestmentRate')) or _safe_float(auction.get('highYield')),
+        'high_discount_rate': _safe_float(auction.get('highDiscountRate')),
+        'avg_median_yield': _safe_float(auction.get('averageMedianYield')),
+        'low_yield': _safe_float(auction.get('lowInvestmentRate')) or _safe_float(auction.get('lowYield')),
+        'offering_amount': _safe_float(auction.get('offeringAmount')) or _safe_float(auction.get('totalAccepted')),
+        'total_accepted': _safe_float(auction.get('totalAccepted')),
+        'total_tendered': _safe_float(auction.get('totalTendered')),
+        'allocation_pct': _safe_float(auction.get('allocationPercentage')),
+    }
+
+
+def _parse_auction_records(auctions: List[Dict], sec_type: str) -> List[Dict]:
+    records = []
+    for auction in auctions:
+        try:
+            record = _parse_auction_record(auction, sec_type)
+        except Exception:
+            continue
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def fetch_all_auction_data(lookback_days: Optional[int] = 730, silent: bool = False, use_archive: bool = True) -> pd.DataFrame:
+    """
+    Auctions of the last `lookback_days` days (all archived history if None),
+    most recent first, with derived metrics.
+
+    With use_archive (default) the local auction archive is brought up to
+    date and read; otherwise only the latest page of each type is fetched.
+    """
+    if use_archive:
+        df = update_auction_archive(silent=silent)
+    else:
+        all_auctions = []
+        for sec_type in SECURITY_TYPES:
+            if not silent:
+                print(f"  [TreasuryDirect] Fetching {sec_type} auctions...")
+            all_auctions.extend(_parse_auction_records(fetch_auctioned_securities(sec_type), sec_type))
+            time.sleep(0.2)
+        df = pd.DataFrame(all_auctions)
+
+    if df.empty:
         return pd.DataFrame()
-    
-    df = pd.DataFrame(all_auctions)
+
+    if lookback_days is not None:
+        cutoff_date = datetime.now() - timedelta(days=lookback_days)
+        df = df[df['auction_date'] >= cutoff_date]
+        if df.empty:
+            return pd.DataFrame()
+
     df = df.sort_values('auction_date', ascending=False).reset_index(drop=True)
     df = _calculate_derived_metrics(df)
     
@@ -649,6 +891,201 @@ def _categorize_maturity(row) -> str:
     return 'Other'
 
 
+# ==============================================================================
+# AUCTION ARCHIVE
+# ==============================================================================
+#
+# Full auction history in a local columnar file (one numpy array per raw
+# column in a compressed .npz), keyed by (cusip, auction_date) since
+# reopenings share a CUSIP. The first run backfills every page of every
+# security type; later runs only page back to the latest archived auction.
+
+ARCHIVE_FILE = os.path.join(OUTPUT_DIR, 'treasury_auction_archive.npz')
+ARCHIVE_VERSION = 1
+ARCHIVE_KEY = ['cusip', 'auction_date']
+
+# Raw (pre-derived-metrics) columns, in record order
+ARCHIVE_STRING_COLUMNS = ['issue_date', 'maturity_date', 'security_type', 'security_term', 'cusip']
+ARCHIVE_NULLABLE_STRINGS = ['issue_date', 'maturity_date']
+ARCHIVE_FLOAT_COLUMNS = [
+    'bid_to_cover', 'competitive_accepted', 'competitive_tendered', 'noncompetitive_accepted',
+    'direct_bidder_accepted', 'direct_bidder_tendered', 'indirect_bidder_accepted',
+    'indirect_bidder_tendered', 'primary_dealer_accepted', 'primary_dealer_tendered',
+    'high_yield', 'high_discount_rate', 'avg_median_yield', 'low_yield', 'offering_amount',
+    'total_accepted', 'total_tendered', 'allocation_pct',
+]
+ARCHIVE_COLUMNS = ['auction_date'] + ARCHIVE_STRING_COLUMNS + ARCHIVE_FLOAT_COLUMNS
+
+ARCHIVE_MAX_WORKERS = 4
+ARCHIVE_PAGES_PER_WAVE = 4      # pages per security type requested concurrently during backfill
+ARCHIVE_MAX_PAGES = 400         # safety stop per security type
+ARCHIVE_OVERLAP_DAYS = 14       # re-fetch recent auctions to pick up late revisions
+
+
+def _empty_archive() -> pd.DataFrame:
+    df = pd.DataFrame({col: pd.Series(dtype=float) for col in ARCHIVE_COLUMNS})
+    df['auction_date'] = pd.Series(dtype='datetime64[ns]')
+    for col in ARCHIVE_STRING_COLUMNS:
+        df[col] = pd.Series(dtype=object)
+    return df
+
+
+def _normalize_archive_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Plain object string columns, missing dates as None (as parsed records have them)."""
+    for col in ARCHIVE_STRING_COLUMNS:
+        df[col] = df[col].astype(object).where(df[col].notna(), None)
+    for col in ARCHIVE_NULLABLE_STRINGS:
+        df[col] = df[col].where(df[col] != '', None)
+    return df
+
+
+def _records_to_archive_frame(records: List[Dict]) -> pd.DataFrame:
+    if not records:
+        return _empty_archive()
+    df = pd.DataFrame(records).reindex(columns=ARCHIVE_COLUMNS)
+    df['auction_date'] = pd.to_datetime(df['auction_date']).astype('datetime64[ns]')
+    df[ARCHIVE_FLOAT_COLUMNS] = df[ARCHIVE_FLOAT_COLUMNS].apply(pd.to_numeric, errors='coerce').astype(float)
+    return _normalize_archive_strings(df)
+
+
+def load_auction_archive() -> pd.DataFrame:
+    """Archived auctions, most recent first (empty frame if there is no usable archive)."""
+    if not os.path.exists(ARCHIVE_FILE):
+        return _empty_archive()
+    try:
+        with np.load(ARCHIVE_FILE, allow_pickle=False) as npz:
+            if int(npz['__version__']) != ARCHIVE_VERSION:
+                return _empty_archive()
+            df = pd.DataFrame({col: npz[col] for col in ARCHIVE_COLUMNS})
+    except Exception as e:
+        print(f"  [TreasuryDirect] Warning: Ignoring unreadable auction archive: {e}")
+        return _empty_archive()
+
+    df['auction_date'] = df['auction_date'].astype('datetime64[ns]')
+    return _normalize_archive_strings(df)
+
+
+def save_auction_archive(df: pd.DataFrame) -> None:
+    """Write the archive atomically (strings as fixed-width unicode, no pickled objects)."""
+    import io
+    from utils.publisher import atomic_write_bytes
+
+    arrays = {'__version__': np.array(ARCHIVE_VERSION)}
+    arrays['auction_date'] = df['auction_date'].to_numpy(dtype='datetime64[D]')
+    for col in ARCHIVE_STRING_COLUMNS:
+        arrays[col] = np.array(['' if pd.isna(v) else str(v) for v in df[col]], dtype=str)
+    for col in ARCHIVE_FLOAT_COLUMNS:
+        arrays[col] = df[col].to_numpy(dtype=float)
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    try:
+        atomic_write_bytes(ARCHIVE_FILE, buffer.getvalue())
+    except OSError as e:
+        print(f"Warning: Could not save auction archive: {e}")
+
+
+def merge_auctions(archive: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """Upsert fresh auctions into the archive by (cusip, auction_date); fresh rows win."""
+    if fresh.empty:
+        return archive
+    merged = pd.concat([archive, fresh], ignore_index=True) if not archive.empty else fresh
+    merged = merged.drop_duplicates(subset=ARCHIVE_KEY, keep='last')
+    return merged.sort_values(['auction_date', 'cusip'], ascending=[False, True]).reset_index(drop=True)
+
+
+def fetch_auction_history(
+    since: Optional[datetime] = None,
+    security_types: Optional[List[str]] = None,
+    pages_per_wave: int = ARCHIVE_PAGES_PER_WAVE,
+    max_workers: int = ARCHIVE_MAX_WORKERS,
+) -> pd.DataFrame:
+    """
+    Page through TreasuryDirect auction history.
+
+    Pages of all security types are requested concurrently, `pages_per_wave`
+    pages per type at a time. A type stops at a short page (counted in raw
+    API rows, so unparsable records don't end it early), a page whose
+    auctions are all known already, or (with `since`) a page reaching back
+    before `since`.
+    Request errors are raised, so a partial history is never mistaken for
+    a complete one.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    security_types = security_types or SECURITY_TYPES
+    records: List[Dict] = []
+    seen = set()
+    next_page = {sec_type: 1 for sec_type in security_types}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while next_page:
+            jobs = {
+                (sec_type, page): executor.submit(_fetch_auction_page, sec_type, page)
+                for sec_type, first in next_page.items()
+                for page in range(first, min(first + pages_per_wave, ARCHIVE_MAX_PAGES + 1))
+            }
+
+            still_paging = {}
+            for sec_type, first in next_page.items():
+                done = False
+                for page in range(first, min(first + pages_per_wave, ARCHIVE_MAX_PAGES + 1)):
+                    raw = jobs[(sec_type, page)].result()
+                    page_records = _parse_auction_records(raw, sec_type)
+                    new = [r for r in page_records if (r['cusip'], r['auction_date']) not in seen]
+                    seen.update((r['cusip'], r['auction_date']) for r in new)
+                    records.extend(new)
+
+                    repeated = bool(page_records) and not new
+                    reached_since = since is not None and any(r['auction_date'] < since for r in page_records)
+                    if len(raw) < MAX_PAGE_SIZE or repeated or reached_since:
+                        done = True
+                        break
+                if not done and page < ARCHIVE_MAX_PAGES:
+                    still_paging[sec_type] = page + 1
+            next_page = still_paging
+
+    fresh = _records_to_archive_frame(records)
+    if since is not None:
+        fresh = fresh[fresh['auction_date'] >= since]
+    return fresh
+
+
+def update_auction_archive(silent: bool = False, full_refresh: bool = False) -> pd.DataFrame:
+    """
+    Bring the local auction archive up to date and return it (raw columns).
+
+    Backfills the full history when there is no archive (or full_refresh),
+    otherwise fetches only auctions from ARCHIVE_OVERLAP_DAYS before the
+    latest archived one. On request errors the archive is returned as is.
+    """
+    archive = _empty_archive() if full_refresh else load_auction_archive()
+
+    if archive.empty:
+        since = None
+        pages_per_wave = ARCHIVE_PAGES_PER_WAVE
+        if not silent:
+            print("  [TreasuryDirect] Backfilling auction archive...")
+    else:
+        since = archive['auction_date'].max() - timedelta(days=ARCHIVE_OVERLAP_DAYS)
+        pages_per_wave = 1
+        if not silent:
+            print(f"  [TreasuryDirect] Updating auction archive from {since:%Y-%m-%d}...")
+
+    try:
+        fresh = fetch_auction_history(since=since, pages_per_wave=pages_per_wave)
+    except requests.exceptions.RequestException as e:
+        print(f"  [TreasuryDirect] Error updating auction archive: {e}")
+        return archive
+
+    updated = merge_auctions(archive, fresh)
+    if not fresh.empty:
+        save_auction_archive(updated)
+    if not silent:
+        print(f"  [TreasuryDirect] Auction archive: {len(updated)} auctions ({len(fresh)} fetched)")
+    return updated
+
+
 # ==============================================================================
 # ANALYSIS FUNCTIONS
 # ==============================================================================
@@ -790,55 +1227,41 @@ def _calculate_type_score(df: pd.DataFrame, sec_type: str) -> Dict:
 
 def _get_recent_auctions_with_alerts(df: pd.DataFrame, n: int = 20) -> List[Dict]:
     recent = df.head(n * 2)
-    
+    recent = recent[recent['bid_to_cover'].notna()].head(n)
+    if recent.empty:
+        return []
+
+    alerts_by_row = evaluate_auction_alerts(recent)
+
+    # Overall status per auction from its worst alert
+    levels = [{a['level'] for a in alerts} for alerts in alerts_by_row]
+    healthy_btc = _threshold_lookup(recent['security_type'], BTC_THRESHOLDS)['healthy'].to_numpy()
+    status = np.select(
+        [
+            [AlertLevel.CRITICAL.value in lv for lv in levels],
+            [AlertLevel.WARNING.value in lv for lv in levels],
+            [AlertLevel.CAUTION.value in lv for lv in levels],
+            recent['bid_to_cover'].to_numpy() >= healthy_btc,
+        ],
+        ['CRITICAL', 'WARNING', 'CAUTION', 'STRONG'],
+        default='NORMAL'
+    )
+    status_colors = {
+        'CRITICAL': '#ef4444',
+        'WARNING': '#f97316',
+        'CAUTION': '#eab308',
+        'STRONG': '#22c55e',
+        'NORMAL': '#6b7280',
+    }
+
     auctions = []
-    for _, row in recent.iterrows():
-        if pd.isna(row.get('bid_to_cover')):
-            continue
-        
+    for row, alerts, row_status in zip(recent.to_dict('records'), alerts_by_row, status.tolist()):
         sec_type = row.get('security_type', 'Note')
         btc = row['bid_to_cover']
         indirect = row.get('indirect_pct')
         direct = row.get('direct_pct')
         dealer = row.get('dealer_pct')
-        
-        # Convert row to dict for alert detection
-        auction_dict = {
-            'security_type': sec_type,
-            'security_term': row.get('security_term', ''),
-            'bid_to_cover': btc,
-            'indirect_pct': indirect,
-            'direct_pct': direct,
-            'dealer_pct': dealer
-        }
-        
-        # Detect alerts for this auction
-        alerts = detect_auction_alerts(auction_dict)
-        
-        # Determine overall status based on alerts
-        has_critical = any(a['level'] == 'critical' for a in alerts)
-        has_warning = any(a['level'] == 'warning' for a in alerts)
-        has_caution = any(a['level'] == 'caution' for a in alerts)
-        
-        if has_critical:
-            status = 'CRITICAL'
-            status_color = '#ef4444'
-        elif has_warning:
-            status = 'WARNING'
-            status_color = '#f97316'
-        elif has_caution:
-            status = 'CAUTION'
-            status_color = '#eab308'
-        else:
-            # Determine if strong or normal
-            btc_thresh = BTC_THRESHOLDS.get(sec_type, BTC_THRESHOLDS['Note'])
-            if btc >= btc_thresh['healthy']:
-                status = 'STRONG'
-                status_color = '#22c55e'
-            else:
-                status = 'NORMAL'
-                status_color = '#6b7280'
-        
+
         auctions.append({
             'date': row['auction_date'].strftime('%Y-%m-%d'),
             'security': f"{row.get('security_term', '')} {sec_type}",
@@ -849,15 +1272,12 @@ def _get_recent_auctions_with_alerts(df: pd.DataFrame, n: int = 20) -> List[Dict
             'direct_pct': round(direct, 1) if direct else None,
             'dealer_pct': round(dealer, 1) if dealer else None,
             'amount_billions': round(row.get('amount_billions', 0), 1),
-            'status': status,
-            'status_key': status.lower(),
-            'status_color': status_color,
+            'status': row_status,
+            'status_key': row_status.lower(),
+            'status_color': status_colors[row_status],
             'alerts': alerts,
             'alert_count': len(alerts)
         })
-        
-        if len(auctions) >= n:
-            break
     
     return auctions
 
@@ -5,7 +5,20 @@ Utility modules and diagnostic scripts.
 
 Contains:
 - tv_client: TradingView client wrapper
+- publisher: Atomic, content-hashed artifact publishing
 - generate_mock_data: Mock data generation for testing
 """
 
-from .tv_client import *
+# tv_client (and tvDatafeed) is loaded on first attribute access, so importing
+# a light submodule such as utils.publisher doesn't pull in TradingView.
+_TV_CLIENT_EXPORTS = (
+    'get_tv_session', 'fetch_historical_data', 'is_session_active',
+    'is_logged_in', 'close_session', 'Interval', 'TV_AVAILABLE',
+)
+
+
+def __getattr__(name):
+    if name in _TV_CLIENT_EXPORTS:
+        from . import tv_client
+        return getattr(tv_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,257 @@
+"""
+publisher.py
+Content-addressed, atomic publishing of output artifacts.
+
+Every JSON/binary file the backend produces goes through an ArtifactPublisher:
+
+- the serialized bytes are hashed (SHA-256); if the file on disk already has
+  that content the write is skipped, so unchanged outputs keep their mtime
+  and downstream caches stay valid
+- changed content is written to a temp file in the same directory and moved
+  into place with os.replace(), so readers never see a half-written file
+- a manifest (artifacts.manifest.json in the publisher root) records sha256,
+  size and timestamps per artifact; the hash doubles as an HTTP ETag. It is
+  only rewritten when an artifact changes (a skipped write refreshes
+  checked_at at most every CHECKED_AT_REFRESH_SECONDS)
+
+Usage:
+    from utils.publisher import get_publisher
+
+    publisher = get_publisher(OUTPUT_DIR)
+    publisher.publish_json(os.path.join(OUTPUT_DIR, 'etf_data.json'), data)
+"""
+import os
+import json
+import hashlib
+import logging
+import stat
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'artifacts.manifest.json'
+MANIFEST_VERSION = 1
+
+# Skipped (unchanged) writes refresh the manifest's checked_at at most this often
+CHECKED_AT_REFRESH_SECONDS = 6 * 3600
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+@dataclass
+class PublishResult:
+    """Outcome of a single publish call."""
+    path: str
+    sha256: str
+    size: int
+    written: bool   # False when content was unchanged and the write skipped
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+
+def sha256_bytes(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def sha256_file(path: str, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def atomic_write_bytes(path: str, payload: bytes) -> None:
+    """
+    Write payload to path via temp file + rename (same filesystem).
+
+    The file keeps the mode of the one it replaces, or gets the usual
+    0666 & ~umask when new (mkstemp alone would leave it 0600).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ArtifactPublisher:
+    """
+    Publishes artifacts under a root directory and tracks them in a manifest.
+
+    Manifest keys are paths relative to the root ('domains/gli.json').
+    Within a process, updates are serialized by a lock. There is no lock
+    across processes: the manifest is re-read before every update, which
+    keeps entries written earlier by another process (pipeline, scrapers),
+    but two processes updating it at the same moment can lose one of the
+    two entries (last write wins). Artifact files themselves are always
+    replaced atomically.
+    """
+
+    def __init__(self, root_dir: str, manifest_name: str = MANIFEST_FILENAME):
+        self.root_dir = os.path.abspath(root_dir)
+        self.manifest_path = os.path.join(self.root_dir, manifest_name)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root_dir).replace(os.sep, '/')
+
+    def load_manifest(self) -> Dict[str, Any]:
+        if not os.path.exists(self.manifest_path):
+            return {'version': MANIFEST_VERSION, 'artifacts': {}}
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+            manifest.setdefault('artifacts', {})
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable artifact manifest {self.manifest_path}: {e}")
+            return {'version': MANIFEST_VERSION, 'artifacts': {}}
+
+    def entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """Manifest entry for an artifact, or None if never published."""
+        return self.load_manifest()['artifacts'].get(self._key(path))
+
+    def checked_at(self, path: str) -> Optional[datetime]:
+        """
+        When the artifact was last confirmed current (written or skipped;
+        skipped writes refresh it at most every CHECKED_AT_REFRESH_SECONDS).
+
+        Use this instead of the file mtime for freshness checks, since
+        skipped writes deliberately leave the mtime untouched.
+        """
+        entry = self.entry(path)
+        if entry and entry.get('checked_at'):
+            return datetime.fromisoformat(entry['checked_at'])
+        if os.path.exists(path):
+            return datetime.fromtimestamp(os.path.getmtime(path))
+        return None
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _is_unchanged(self, path: str, digest: str, size: int, entry: Optional[Dict[str, Any]]) -> bool:
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            return False
+        if entry is not None and entry.get('size') == size:
+            return entry.get('sha256') == digest
+        # No (matching) manifest entry yet: hash what is on disk once
+        return sha256_file(path) == digest
+
+    @staticmethod
+    def _needs_check_refresh(entry: Optional[Dict[str, Any]], digest: str, size: int) -> bool:
+        """Whether a skipped write still has to update the manifest entry."""
+        if entry is None or entry.get('sha256') != digest or entry.get('size') != size:
+            return True
+        try:
+            checked_at = datetime.fromisoformat(entry['checked_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return (datetime.now() - checked_at).total_seconds() >= CHECKED_AT_REFRESH_SECONDS
+
+    def publish_bytes(self, path: str, payload: bytes) -> PublishResult:
+        """Publish raw bytes; skipped if the file already has this content."""
+        digest = sha256_bytes(payload)
+        size = len(payload)
+        key = self._key(path)
+        now = datetime.now().isoformat(timespec='seconds')
+
+        with self._lock:
+            manifest = self.load_manifest()
+            entry = manifest['artifacts'].get(key)
+
+            written = not self._is_unchanged(path, digest, size, entry)
+            if written:
+                atomic_write_bytes(path, payload)
+
+            if written or self._needs_check_refresh(entry, digest, size):
+                manifest['version'] = MANIFEST_VERSION
+                manifest['artifacts'][key] = {
+                    'sha256': digest,
+                    'size': size,
+                    'updated_at': now if written or not entry else entry.get('updated_at', now),
+                    'checked_at': now,
+                }
+                manifest['generated_at'] = now
+                atomic_write_bytes(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+        if written:
+            logger.debug(f"Published {key} ({size} bytes)")
+        else:
+            logger.debug(f"Unchanged {key}, skipped write")
+        return PublishResult(path=path, sha256=digest, size=size, written=written)
+
+    def publish_json(self, path: str, obj: Any, **dump_kwargs) -> PublishResult:
+        """Serialize obj with json.dumps(**dump_kwargs) and publish it."""
+        from utils.tracing import span
+
+        with span(f"json:{os.path.basename(path)}", cat='serialize') as s:
+            payload = json.dumps(obj, **dump_kwargs).encode('utf-8')
+            if s is not None:
+                s.args['bytes'] = len(payload)
+        with span(f"publish:{os.path.basename(path)}", cat='io'):
+            return self.publish_bytes(path, payload)
+
+    def remove(self, path: str) -> bool:
+        """Delete an artifact and its manifest entry. Returns False if neither existed."""
+        key = self._key(path)
+        with self._lock:
+            manifest = self.load_manifest()
+            existed = manifest['artifacts'].pop(key, None) is not None
+            if os.path.exists(path):
+                os.remove(path)
+                existed = True
+            if existed:
+                manifest['generated_at'] = datetime.now().isoformat(timespec='seconds')
+                atomic_write_bytes(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        return existed
+
+    def publish_file(self, path: str, source_path: str) -> PublishResult:
+        """Publish a copy of an existing file (replacement for shutil.copyfile)."""
+        with open(source_path, 'rb') as f:
+            return self.publish_bytes(path, f.read())
+
+
+# Publishers by root directory (one lock per root)
+_publishers: Dict[str, ArtifactPublisher] = {}
+_publishers_lock = threading.Lock()
+
+
+def get_publisher(root_dir: str) -> ArtifactPublisher:
+    """Get the shared ArtifactPublisher for a root directory."""
+    root = os.path.abspath(root_dir)
+    with _publishers_lock:
+        if root not in _publishers:
+            _publishers[root] = ArtifactPublisher(root)
+        return _publishers[root]
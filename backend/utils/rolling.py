@@ -0,0 +1,83 @@
+"""
+rolling.py
+Vectorized rolling-window statistics.
+
+Each function computes a statistic for every date of a Series (or every
+column of a DataFrame) with pandas' rolling kernels, instead of slicing the
+window and recomputing a snapshot per date:
+
+- rolling_zscore: (x - mean) / std over the window
+- rolling_percentile_rank: share of the window's values below the current one
+- rolling_quantiles: several window quantiles as columns of one frame
+
+Windows count rows; NaNs inside a window are skipped. Used by the scraper
+ROC panel (scrapers/panel.py) and the offshore statistics history
+(analytics/offshore_liquidity.py).
+"""
+from typing import Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+SeriesOrFrame = Union[pd.Series, pd.DataFrame]
+
+DEFAULT_QUANTILES = (0.10, 0.25, 0.75, 0.90)
+
+
+def rolling_zscore(
+    data: SeriesOrFrame,
+    window: int,
+    min_periods: int,
+    zero_std: float = np.nan
+) -> SeriesOrFrame:
+    """
+    Rolling z-score.
+
+    Where the window's std is 0 the result is `zero_std`: NaN by default, as
+    domains/base.py calculate_zscore; snapshots that report 0 for a flat
+    window (offshore_liquidity.calculate_series_statistics) pass 0.0.
+    """
+    rolling = data.rolling(window, min_periods=min_periods)
+    std = rolling.std()
+    zscore = (data - rolling.mean()) / std.replace(0, np.nan)
+    return zscore.mask(std == 0, zero_std)
+
+
+def rolling_percentile_rank(
+    data: SeriesOrFrame,
+    window: int,
+    min_periods: int,
+    include_current: bool = False
+) -> SeriesOrFrame:
+    """
+    Percent (0-100) of the valid values in the window below the current one.
+
+    Args:
+        data: Series or DataFrame (each column ranked separately)
+        window: Window length in rows
+        min_periods: Valid values needed in the window
+        include_current: Count the current value in the denominator
+            ((below) / n, as a snapshot `(window < current).mean()`);
+            by default it is excluded ((below) / (n - 1), as
+            domains/base.py rolling_percentile)
+
+    Returns:
+        Same shape as data; NaN where the current value is missing or the
+        window has fewer than min_periods values
+    """
+    rolling = data.rolling(window, min_periods=min_periods)
+    below = rolling.rank(method='min') - 1
+    count = rolling.count()
+    denominator = count if include_current else (count - 1).where(count > 1)
+    return (below / denominator * 100).where(data.notna() & (count >= min_periods))
+
+
+def rolling_quantiles(
+    series: pd.Series,
+    window: int,
+    min_periods: int,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES
+) -> pd.DataFrame:
+    """Window quantiles (linear interpolation), one column per quantile."""
+    rolling = series.rolling(window, min_periods=min_periods)
+    return pd.DataFrame({q: rolling.quantile(q) for q in quantiles}, index=series.index)
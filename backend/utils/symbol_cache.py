@@ -0,0 +1,220 @@
+"""
+symbol_cache.py
+Process-wide, on-disk store of TradingView bars keyed by (exchange, symbol, interval).
+
+The scrapers and the data pipeline request many of the same symbols (e.g.
+BITSTAMP:BTCUSD daily for every BTC overlay). Routing every get_hist call
+through this store means a symbol is downloaded at most once per TTL:
+
+- entries live in memory for the process and on disk (one CSV plus a small
+  JSON sidecar per key under utils/cache/tv/) for later runs
+- an entry serves any request for up to as many bars as were fetched (or
+  any request at all if TradingView returned fewer bars than asked for,
+  i.e. the full history); larger requests re-download and replace it
+- a per-key lock makes concurrent requests for the same symbol wait for a
+  single download instead of each fetching it
+
+TTLs default per interval (SYMBOL_CACHE_TTL_HOURS); callers with their own
+staleness budget pass ttl_hours (the pipeline passes TV_CACHE_HOURS).
+TV_CACHE_TTL_HOURS overrides all of them and TV_CACHE_DISABLE=1 bypasses
+the store.
+
+Usage:
+    from utils.symbol_cache import get_symbol_store
+
+    df = get_symbol_store().get('BTCUSD', 'BITSTAMP', interval, 7500,
+                                lambda: tv.get_hist('BTCUSD', 'BITSTAMP', interval, n_bars=7500))
+"""
+import os
+import re
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Default TTL per tvDatafeed interval value; anything else is intraday
+SYMBOL_CACHE_TTL_HOURS = {
+    '1D': 4,
+    '1W': 12,
+    '1M': 24,
+}
+INTRADAY_TTL_HOURS = 0.25
+
+CACHE_SUBDIR = 'tv'
+
+Key = Tuple[str, str, str]
+
+
+@dataclass
+class _Entry:
+    data: pd.DataFrame
+    fetched_at: datetime
+    n_bars: int   # bars requested when fetched
+
+    def serves(self, n_bars: int) -> bool:
+        return n_bars <= self.n_bars or len(self.data) < self.n_bars
+
+
+def interval_key(interval) -> str:
+    """Stable string for a tvDatafeed Interval (its value, e.g. '1D')."""
+    return str(getattr(interval, 'value', interval))
+
+
+def _ttl_hours(interval: str, ttl_hours: Optional[float] = None) -> float:
+    override = os.environ.get('TV_CACHE_TTL_HOURS')
+    if override:
+        return float(override)
+    if ttl_hours is not None:
+        return ttl_hours
+    return SYMBOL_CACHE_TTL_HOURS.get(interval, INTRADAY_TTL_HOURS)
+
+
+def _get_cache_dir() -> Path:
+    """Return path to the on-disk symbol store."""
+    cache_dir = Path(__file__).resolve().parent / "cache" / CACHE_SUBDIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+class SymbolStore:
+    """Memory + disk cache of TradingView bars with per-interval TTLs."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: Dict[Key, _Entry] = {}
+        self._locks: Dict[Key, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.hits = 0
+        self.downloads = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        if self._cache_dir is None:
+            self._cache_dir = _get_cache_dir()
+        return self._cache_dir
+
+    @staticmethod
+    def key(symbol: str, exchange: str, interval) -> Key:
+        return (str(exchange).upper(), str(symbol).upper(), interval_key(interval))
+
+    def _lock(self, key: Key) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _paths(self, key: Key) -> Tuple[Path, Path]:
+        stem = re.sub(r'[^0-9A-Za-z_.-]+', '_', '__'.join(key))
+        return self.cache_dir / f"{stem}.csv", self.cache_dir / f"{stem}.json"
+
+    # ------------------------------------------------------------------
+    # Disk
+    # ------------------------------------------------------------------
+
+    def _load(self, key: Key) -> Optional[_Entry]:
+        csv_path, meta_path = self._paths(key)
+        if not meta_path.exists() or not csv_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            data = pd.read_csv(csv_path, index_col=0, parse_dates=True, float_precision='round_trip')
+            return _Entry(data, datetime.fromisoformat(meta['fetched_at']), int(meta['n_bars']))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable symbol cache for {':'.join(key)}: {e}")
+            return None
+
+    def _save(self, key: Key, entry: _Entry) -> None:
+        from utils.publisher import atomic_write_bytes
+
+        csv_path, meta_path = self._paths(key)
+        try:
+            atomic_write_bytes(str(csv_path), entry.data.to_csv().encode('utf-8'))
+            meta = {'fetched_at': entry.fetched_at.isoformat(), 'n_bars': entry.n_bars, 'rows': len(entry.data)}
+            atomic_write_bytes(str(meta_path), json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not save symbol cache for {':'.join(key)}: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _fresh(self, key: Key, entry: Optional[_Entry], n_bars: int, ttl_hours: Optional[float]) -> bool:
+        if entry is None or not entry.serves(n_bars):
+            return False
+        age_hours = (datetime.now() - entry.fetched_at).total_seconds() / 3600
+        return age_hours < _ttl_hours(key[2], ttl_hours)
+
+    def _lookup(self, key: Key, n_bars: int, ttl_hours: Optional[float] = None) -> Optional[pd.DataFrame]:
+        entry = self._entries.get(key)
+        if not self._fresh(key, entry, n_bars, ttl_hours):
+            entry = self._load(key)
+            if not self._fresh(key, entry, n_bars, ttl_hours):
+                return None
+            self._entries[key] = entry
+        self.hits += 1
+        return entry.data.tail(n_bars).copy()
+
+    def lookup(self, symbol: str, exchange: str, interval, n_bars: int,
+               ttl_hours: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Cached bars if a fresh entry covers n_bars, else None (never downloads)."""
+        if os.environ.get('TV_CACHE_DISABLE') == '1':
+            return None
+        key = self.key(symbol, exchange, interval)
+        with self._lock(key):
+            return self._lookup(key, n_bars, ttl_hours)
+
+    def get(
+        self,
+        symbol: str,
+        exchange: str,
+        interval,
+        n_bars: int,
+        fetch: Callable[[], Optional[pd.DataFrame]],
+        ttl_hours: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Cached bars, or the result of fetch() (stored if non-empty).
+
+        fetch() is only called on a miss and its exceptions propagate, so
+        callers keep their own retry logic. ttl_hours replaces the
+        interval's default TTL for this request.
+        """
+        if os.environ.get('TV_CACHE_DISABLE') == '1':
+            return fetch()
+
+        key = self.key(symbol, exchange, interval)
+        with self._lock(key):
+            cached = self._lookup(key, n_bars, ttl_hours)
+            if cached is not None:
+                return cached
+
+            data = fetch()
+            self.downloads += 1
+            if data is not None and not data.empty:
+                entry = _Entry(data.copy(), datetime.now(), n_bars)
+                self._entries[key] = entry
+                self._save(key, entry)
+            return data
+
+    def clear_memory(self) -> None:
+        """Drop in-memory entries (the disk store is kept)."""
+        self._entries.clear()
+
+
+_store: Optional[SymbolStore] = None
+_store_lock = threading.Lock()
+
+
+def get_symbol_store() -> SymbolStore:
+    """Get or create the process-wide symbol store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SymbolStore()
+        return _store
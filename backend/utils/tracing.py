@@ -0,0 +1,271 @@
+"""
+tracing.py
+Lightweight spans for profiling pipeline runs.
+
+Every span records wall time, CPU time (thread CPU), the peak traced
+allocation while it was open (tracemalloc, relative to the span start) and
+the number of rows it processed. Spans nest per thread, so the FRED and TV
+fetch threads show up as separate tracks.
+
+Tracing is off unless PIPELINE_TRACE=1 (or enable_tracing() is called);
+disabled spans cost one attribute check. PIPELINE_TRACE_MEMORY=0 skips
+tracemalloc, which otherwise slows allocation-heavy code noticeably.
+Memory peaks are process-wide, so with concurrent threads a span's peak
+also includes what other threads allocated meanwhile.
+
+Output:
+    write_chrome_trace(path)  -> open in chrome://tracing or ui.perfetto.dev
+    format_summary()          -> per-name totals, slowest first
+
+Usage:
+    from utils.tracing import span, traced
+
+    @traced(cat='analytics')
+    def calculate_cli(df): ...
+
+    with span('fred_cache_load', cat='cache') as s:
+        data = json.load(f)
+        s.rows = len(data)
+"""
+import os
+import json
+import time
+import functools
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+TRACE_FILENAME = 'pipeline_trace.json'
+
+
+@dataclass
+class Span:
+    name: str
+    cat: str
+    start: float                 # perf_counter seconds
+    thread: int
+    depth: int
+    rows: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+    wall: float = 0.0            # seconds
+    cpu: float = 0.0             # seconds
+    peak_bytes: Optional[int] = None
+    # Bookkeeping while open
+    _cpu_start: float = 0.0
+    _mem_start: int = 0
+    _mem_peak: int = 0
+
+
+def _rows_of(value: Any) -> Optional[int]:
+    """Row count for pandas/numpy objects, None for anything else."""
+    if hasattr(value, 'shape') and getattr(value, 'shape', None):
+        return int(value.shape[0])
+    return None
+
+
+class Tracer:
+    """Collects finished spans; one per process (see get_tracer())."""
+
+    def __init__(self, enabled: bool = False, memory: bool = True):
+        self.enabled = enabled
+        self.memory = memory
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open_memory: List[Span] = []   # open spans tracking memory, all threads
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start(self) -> None:
+        """Enable tracing (and tracemalloc if memory tracking is on)."""
+        self.enabled = True
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        self.enabled = False
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, cat: str = 'pipeline', rows: Optional[int] = None, **args) -> Iterator[Optional[Span]]:
+        if not self.enabled:
+            yield None
+            return
+
+        stack = self._stack()
+        memory = self.memory and tracemalloc.is_tracing()
+        s = Span(name, cat, time.perf_counter(), threading.get_ident(), len(stack), rows, args)
+        if memory:
+            with self._lock:
+                # The peak is process-wide: the peaks reached so far by the
+                # spans open in every thread must survive the reset below
+                current = self._fold_peak()
+                tracemalloc.reset_peak()
+                s._mem_start = s._mem_peak = current
+                self._open_memory.append(s)
+        s._cpu_start = time.thread_time()
+        stack.append(s)
+        try:
+            yield s
+        finally:
+            stack.pop()
+            s.cpu = time.thread_time() - s._cpu_start
+            s.wall = time.perf_counter() - s.start
+            with self._lock:
+                if memory:
+                    if tracemalloc.is_tracing():
+                        self._fold_peak()
+                        s.peak_bytes = max(0, s._mem_peak - s._mem_start)
+                    self._open_memory.remove(s)
+                self.spans.append(s)
+
+    def _fold_peak(self) -> int:
+        """Fold the peak since the last reset into all open spans (lock held); returns current memory."""
+        current, peak = tracemalloc.get_traced_memory()
+        for s in self._open_memory:
+            s._mem_peak = max(s._mem_peak, peak)
+        return current
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format ('X' complete events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for s in sorted(self.spans, key=lambda s: s.start):
+            args = dict(s.args)
+            args['cpu_ms'] = round(s.cpu * 1000, 3)
+            if s.peak_bytes is not None:
+                args['peak_kb'] = round(s.peak_bytes / 1024, 1)
+            if s.rows is not None:
+                args['rows'] = s.rows
+            events.append({
+                'name': s.name,
+                'cat': s.cat,
+                'ph': 'X',
+                'ts': round((s.start - self._origin) * 1e6, 1),
+                'dur': round(s.wall * 1e6, 1),
+                'pid': pid,
+                'tid': s.thread,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> str:
+        from utils.publisher import atomic_write_bytes
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        atomic_write_bytes(path, json.dumps(self.chrome_trace(), default=str).encode('utf-8'))
+        return path
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Totals per (cat, name), sorted by total wall time."""
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        for s in self.spans:
+            t = totals.setdefault((s.cat, s.name), {
+                'name': s.name, 'cat': s.cat, 'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+                'peak_mb': None, 'rows': None,
+            })
+            t['calls'] += 1
+            t['wall_s'] += s.wall
+            t['cpu_s'] += s.cpu
+            if s.peak_bytes is not None:
+                t['peak_mb'] = max(t['peak_mb'] or 0.0, s.peak_bytes / 1e6)
+            if s.rows is not None:
+                t['rows'] = (t['rows'] or 0) + s.rows
+        return sorted(totals.values(), key=lambda t: t['wall_s'], reverse=True)
+
+    def format_summary(self, limit: Optional[int] = 40) -> str:
+        rows = self.summary()[:limit] if limit else self.summary()
+        lines = [
+            f"{'SPAN':<40}{'CAT':<11}{'CALLS':>6}{'WALL s':>9}{'CPU s':>9}{'PEAK MB':>9}{'ROWS':>10}",
+            '-' * 94,
+        ]
+        for t in rows:
+            peak = f"{t['peak_mb']:.1f}" if t['peak_mb'] is not None else '-'
+            n_rows = str(t['rows']) if t['rows'] is not None else '-'
+            lines.append(f"{t['name'][:39]:<40}{t['cat'][:10]:<11}{t['calls']:>6}"
+                         f"{t['wall_s']:>9.3f}{t['cpu_s']:>9.3f}{peak:>9}{n_rows:>10}")
+        return '\n'.join(lines)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get or create the process-wide tracer (enabled by PIPELINE_TRACE=1)."""
+    global _tracer
+    tracer = _tracer
+    if tracer is not None:
+        return tracer   # hot path (span/traced on every call): no lock once created
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(memory=os.environ.get('PIPELINE_TRACE_MEMORY', '1') != '0')
+            if os.environ.get('PIPELINE_TRACE') == '1':
+                _tracer.start()
+        return _tracer
+
+
+def enable_tracing(memory: bool = True) -> Tracer:
+    tracer = get_tracer()
+    tracer.memory = memory
+    tracer.start()
+    return tracer
+
+
+def span(name: str, cat: str = 'pipeline', rows: Optional[int] = None, **args):
+    """Context manager recording one span on the process tracer (yields the Span or None)."""
+    return get_tracer().span(name, cat=cat, rows=rows, **args)
+
+
+def traced(name: Optional[str] = None, cat: str = 'pipeline') -> Callable:
+    """
+    Decorator form of span(). Rows default to the length of the first
+    positional argument if it is a DataFrame/Series/array.
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name, cat=cat, rows=_rows_of(args[0]) if args else None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def finish_trace(output_dir: str, filename: str = TRACE_FILENAME) -> Optional[str]:
+    """
+    Write the Chrome trace and print the summary table if tracing is on.
+
+    PIPELINE_TRACE_FILE overrides the output path. Returns the path written.
+    """
+    tracer = get_tracer()
+    if not tracer.enabled or not tracer.spans:
+        return None
+    path = os.environ.get('PIPELINE_TRACE_FILE') or os.path.join(output_dir, filename)
+    tracer.write_chrome_trace(path)
+    print("\n" + tracer.format_summary())
+    print(f"Trace written to {path} (open in chrome://tracing or ui.perfetto.dev)")
+    return path
@@ -4,37 +4,160 @@ Shared TradingView session manager with singleton pattern.
 Provides lazy initialization and connection caching.
 """
 import os
+import time
+import threading
+import importlib.util
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# TvDatafeed import
-try:
-    from tvDatafeed import TvDatafeed, Interval
-    TV_AVAILABLE = True
-except ImportError:
+# TvDatafeed is only imported when a session or an Interval value is first
+# needed; importing this module just checks that the package is installed.
+TV_AVAILABLE = importlib.util.find_spec('tvDatafeed') is not None
+if not TV_AVAILABLE:
     print("WARNING: tvDatafeed not found. Install: pip install git+https://github.com/rongardF/tvdatafeed.git")
-    TvDatafeed = None
-    Interval = None
-    TV_AVAILABLE = False
+
+TvDatafeed = None
+_Interval = None
+
+
+def _load_tvdatafeed():
+    """Import tvDatafeed on first use. Returns (TvDatafeed, Interval) or (None, None)."""
+    global TvDatafeed, _Interval, TV_AVAILABLE
+    if TvDatafeed is None and TV_AVAILABLE:
+        try:
+            from tvDatafeed import TvDatafeed as _TvDatafeed, Interval as _IntervalEnum
+            TvDatafeed, _Interval = _TvDatafeed, _IntervalEnum
+        except ImportError as e:
+            print(f"WARNING: tvDatafeed failed to import: {e}")
+            TV_AVAILABLE = False
+    return TvDatafeed, _Interval
+
+
+class _LazyInterval:
+    """Stand-in for tvDatafeed.Interval; resolves members on first access."""
+
+    def __getattr__(self, name):
+        interval = _load_tvdatafeed()[1]
+        if interval is None:
+            raise AttributeError(f"Interval.{name} unavailable: tvDatafeed not installed")
+        return getattr(interval, name)
+
+    def __bool__(self):
+        return TV_AVAILABLE
+
+
+Interval = _LazyInterval()
 
 # Singleton instance
 _tv_instance = None
 _is_logged_in = False
+_session_lock = threading.Lock()
+
+# Set by cancel_requests(): abandoned workers must not use or reopen the session
+_cancelled = threading.Event()
+
+
+class RequestsCancelled(RuntimeError):
+    """Raised by TradingView requests made after cancel_requests()."""
+
+
+def cancel_requests():
+    """
+    Make every later TradingView request (and login) in this process raise
+    RequestsCancelled. Used before close_session() when worker threads that
+    timed out may still be running.
+    """
+    _cancelled.set()
+
+
+def _check_cancelled():
+    if _cancelled.is_set():
+        raise RequestsCancelled("TradingView requests were cancelled")
+
+
+class RateLimiter:
+    """
+    Process-wide throttle for TradingView requests.
+
+    Starts of consecutive requests are at least `min_interval` seconds apart
+    and at most `max_concurrent` run at once. The default of one at a time
+    is required with the shared session: a TvDatafeed instance keeps a
+    single websocket, which concurrent get_hist calls would clobber.
+    """
+
+    def __init__(self, min_interval=0.5, max_concurrent=1):
+        self.min_interval = min_interval
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self.requests = 0
+        self.waited = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Block until a request may start; hold the slot while it runs."""
+        with self._slots:
+            with self._lock:
+                wait = self._next_start - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                    self.waited += wait
+                self._next_start = time.monotonic() + self.min_interval
+                self.requests += 1
+            yield
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Shared RateLimiter (TV_MIN_REQUEST_INTERVAL / TV_MAX_CONCURRENT)."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                min_interval=float(os.environ.get('TV_MIN_REQUEST_INTERVAL', 0.5)),
+                max_concurrent=int(os.environ.get('TV_MAX_CONCURRENT', 1)),
+            )
+        return _rate_limiter
+
+
+def rate_limited_get_hist(tv, symbol, exchange, interval, n_bars):
+    """tv.get_hist under the shared rate limiter."""
+    _check_cancelled()
+    with get_rate_limiter().slot():
+        _check_cancelled()
+        return tv.get_hist(symbol=symbol, exchange=exchange, interval=interval, n_bars=n_bars)
+
 
 def get_tv_session(force_new=False):
     """
     Get or create a TradingView session (singleton pattern).
     
+    Thread-safe: concurrent first callers wait for a single login.
+    
     Args:
         force_new: If True, create a new session even if one exists.
     
     Returns:
         TvDatafeed instance or None if not available.
+    
+    Raises:
+        RequestsCancelled: after cancel_requests().
     """
+    _check_cancelled()
+    with _session_lock:
+        _check_cancelled()
+        return _get_tv_session(force_new)
+
+
+def _get_tv_session(force_new):
     global _tv_instance, _is_logged_in
     
-    if not TV_AVAILABLE:
+    if not TV_AVAILABLE or _load_tvdatafeed()[0] is None:
         print("TvDatafeed not available")
         return None
     
@@ -58,7 +181,6 @@ def get_tv_session(force_new=False):
             except Exception as e:
                 print(f"Login attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
-                    import time
                     wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4, 8, 16 seconds
                     print(f"Waiting {wait_time}s before retry...")
                     time.sleep(wait_time)
@@ -94,6 +216,9 @@ def fetch_historical_data(symbol, exchange, interval=None, n_bars=7500, retries=
     """
     Fetch historical data with automatic session management and retries.
     
+    Served from the shared symbol store (utils/symbol_cache.py) when a
+    fresh copy is cached; the session is only opened on a miss.
+    
     Args:
         symbol: TradingView symbol (e.g., 'SPX', 'GOLD')
         exchange: Exchange code (e.g., 'TVC', 'COMEX')
@@ -104,18 +229,26 @@ def fetch_historical_data(symbol, exchange, interval=None, n_bars=7500, retries=
     Returns:
         DataFrame with OHLCV data or None on failure
     """
-    import time
+    from utils.symbol_cache import get_symbol_store
     
     if interval is None:
         interval = Interval.in_daily if Interval else None
     
+    store = get_symbol_store()
+    cached = store.lookup(symbol, exchange, interval, n_bars)
+    if cached is not None:
+        return cached
+    
     tv = get_tv_session()
     if not tv:
         return None
     
     for attempt in range(retries):
         try:
-            data = tv.get_hist(symbol=symbol, exchange=exchange, interval=interval, n_bars=n_bars)
+            data = store.get(
+                symbol, exchange, interval, n_bars,
+                lambda: rate_limited_get_hist(get_tv_session(), symbol, exchange, interval, n_bars),
+            )
             if data is not None and not data.empty:
                 return data
             print(f"No data for {symbol} on attempt {attempt+1}")
@@ -130,5 +263,6 @@ def fetch_historical_data(symbol, exchange, interval=None, n_bars=7500, retries=
     return None
 
 # Re-export Interval for convenience
-__all__ = ['get_tv_session', 'fetch_historical_data', 'is_session_active', 
-           'is_logged_in', 'close_session', 'Interval', 'TV_AVAILABLE']
+__all__ = ['get_tv_session', 'fetch_historical_data', 'rate_limited_get_hist', 'get_rate_limiter',
+           'is_session_active', 'is_logged_in', 'close_session', 'cancel_requests', 'RequestsCancelled',
+           'Interval', 'TV_AVAILABLE']
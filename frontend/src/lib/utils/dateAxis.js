@@ -0,0 +1,76 @@
+/**
+ * Shared Date Axis
+ *
+ * Backend artifacts write each calendar axis once, in a top-level table:
+ *
+ *   { "axes": { "daily": { "freq": "D", "start": "2002-12-01", "length": 8453 } },
+ *     "dates": { "$axis": "daily" }, ... }
+ *
+ * expandDateAxes() turns the {$axis} references back into plain arrays of
+ * 'YYYY-MM-DD' strings so components keep seeing `data.dates` as before.
+ * Each axis is decoded once and the same array instance is shared.
+ */
+
+const AXES_KEY = 'axes';
+const AXIS_REF_KEY = '$axis';
+
+/**
+ * Expand an encoded date axis ({freq: 'D', start, length} or {values}) to ISO strings.
+ * @param {Object} axis - Encoded axis
+ * @returns {string[]} Array of date strings
+ */
+export function decodeDateAxis(axis) {
+    if (!axis) return [];
+    if (Array.isArray(axis.values)) return axis.values;
+    if (axis.freq !== 'D' || !axis.length) return [];
+
+    const start = Date.parse(`${axis.start}T00:00:00Z`);
+    const dayMs = 86400000;
+    const dates = new Array(axis.length);
+    for (let i = 0; i < axis.length; i++) {
+        dates[i] = new Date(start + i * dayMs).toISOString().slice(0, 10);
+    }
+    return dates;
+}
+
+/**
+ * Replace {$axis: id} references with decoded date arrays.
+ * Artifacts without an axes table are returned untouched.
+ * @param {Object} data - Parsed artifact
+ * @param {Object} [axes] - Axis table (defaults to data.axes)
+ * @param {Object} [decoded] - Axis id -> decoded array; pass an object to keep
+ *   the shared arrays (e.g. to update them in place later)
+ * @returns {Object} Data with plain date arrays
+ */
+export function expandDateAxes(data, axes = data?.[AXES_KEY], decoded = {}) {
+    if (!data || typeof data !== 'object' || !axes) return data;
+
+    const walk = (node) => {
+        if (Array.isArray(node)) {
+            // Value arrays are homogeneous; only descend into arrays of objects
+            const first = node[0];
+            return first && typeof first === 'object' ? node.map(walk) : node;
+        }
+        if (node && typeof node === 'object' && !ArrayBuffer.isView(node)) {
+            const keys = Object.keys(node);
+            if (keys.length === 1 && keys[0] === AXIS_REF_KEY) {
+                const id = node[AXIS_REF_KEY];
+                if (!(id in decoded)) decoded[id] = decodeDateAxis(axes[id]);
+                return decoded[id];
+            }
+            const out = {};
+            for (const key of keys) {
+                if (key !== AXES_KEY) out[key] = walk(node[key]);
+            }
+            return out;
+        }
+        return node;
+    };
+
+    return walk(data);
+}
+
+export default {
+    decodeDateAxis,
+    expandDateAxes,
+};
@@ -18,6 +18,9 @@
  *   const dates = await loadDomain('shared').then(d => d.dates);
  */
 
+import { chooseLevel } from './pyramid.js';
+import { decodeDateAxis, expandDateAxes } from './dateAxis.js';
+
 // Domain configuration
 const DOMAIN_CONFIG = {
     shared: { path: 'domains/shared.json', description: 'Shared data (dates, BTC, CBs)' },
@@ -38,12 +41,28 @@ const DOMAIN_CONFIG = {
 // Cache for loaded domains
 const domainCache = new Map();
 
+// Resolution pyramid manifests and levels, keyed by domain / `${domain}:${level}`
+const pyramidManifestCache = new Map();
+const pyramidLevelCache = new Map();
+
 // Configuration
 const DATA_BASE_URL = '';  // Base URL for data files (files are directly in public/domains/)
 // Modular domain loading - fixed data mapping in loader functions
 // loadM2TabData: spreads m2.economies.* -> m2.*
 // loadOffshoreTabData: builds chart1_fred_proxy nested structure
 const USE_MODULAR_DOMAINS = true;  // ENABLED for testing fixed mappings
+// Binary domain format (backend/domains/binary.py): <domain>.manifest.json + <domain>.bin
+// Requires the pipeline to run with DOMAIN_OUTPUT_FORMATS=json,binary. Falls back to JSON.
+const USE_BINARY_DOMAINS = false;
+// Local domain API (backend/api_server.py), e.g. VITE_DOMAIN_API_URL=http://127.0.0.1:8765
+// Used by loadDomainSlice; without it slices are cut from the full domain files.
+const DOMAIN_API_URL = import.meta.env?.VITE_DOMAIN_API_URL || '';
+// Delta updates (backend/domains/delta.py): cached domains are patched in place
+// instead of re-downloaded. Requires DOMAIN_OUTPUT_FORMATS=json,delta.
+const USE_DOMAIN_DELTAS = false;
+
+// Delta state per cached domain: { version, axes, decoded } (see applyDomainDelta)
+const domainVersions = new Map();
 
 // Flag to track if critical domains have been preloaded
 let criticalDomainsLoaded = false;
@@ -212,12 +231,30 @@ export async function loadDomain(domainName, useCache = true) {
     const url = `${DATA_BASE_URL}/${config.path}`;
 
     try {
-        const response = await fetch(url);
-        if (!response.ok) {
-            throw new Error(`Failed to load ${domainName}: ${response.status}`);
+        let data = null;
+        if (USE_BINARY_DOMAINS) {
+            try {
+                data = await loadDomainBinary(domainName, { typedArrays: false });
+            } catch (binaryError) {
+                console.warn(`[DomainLoader] Binary load failed for ${domainName}, using JSON:`, binaryError.message);
+            }
         }
 
-        const data = await response.json();
+        if (data === null) {
+            // Version index first: the file is then at least that version
+            // (deltas are idempotent, so being newer is harmless)
+            const versions = USE_DOMAIN_DELTAS ? await fetchDomainVersions(domainName) : null;
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`Failed to load ${domainName}: ${response.status}`);
+            }
+            const raw = await response.json();
+            const decoded = {};
+            data = expandDateAxes(raw, raw.axes, decoded);
+            if (versions) {
+                domainVersions.set(domainName, { version: versions.current, axes: { ...raw.axes }, decoded });
+            }
+        }
         // Debug logging for modular loading
         if (USE_MODULAR_DOMAINS) {
             console.log(`[DomainLoader] Loaded ${domainName} from ${url}`, { keys: Object.keys(data) });
@@ -231,6 +268,411 @@ export async function loadDomain(domainName, useCache = true) {
     }
 }
 
+// ============================================================
+// BINARY DOMAIN FORMAT
+// ============================================================
+
+const BINARY_DTYPES = {
+    float32: Float32Array,
+    float64: Float64Array,
+};
+
+/**
+ * Convert a typed array to a plain array with null for NaN (legacy component format).
+ * @param {Float32Array|Float64Array} typed
+ * @returns {Array<number|null>}
+ */
+function typedToNullableArray(typed) {
+    const out = new Array(typed.length);
+    for (let i = 0; i < typed.length; i++) {
+        const v = typed[i];
+        out[i] = Number.isNaN(v) ? null : v;
+    }
+    return out;
+}
+
+/**
+ * Load a domain from its binary manifest + blob.
+ * Series are mapped straight onto the blob as Float32Array/Float64Array views (NaN = missing).
+ * @param {string} domainName - Name of the domain to load
+ * @param {Object} [options]
+ * @param {boolean} [options.typedArrays=true] - Keep typed arrays; false converts to plain arrays with nulls
+ * @returns {Promise<Object>} Domain data
+ */
+export async function loadDomainBinary(domainName, { typedArrays = true } = {}) {
+    const config = DOMAIN_CONFIG[domainName];
+    if (!config) {
+        throw new Error(`Unknown domain: ${domainName}`);
+    }
+
+    const manifestUrl = `${DATA_BASE_URL}/${config.path.replace(/\.json$/, '.manifest.json')}`;
+    const manifestResponse = await fetch(manifestUrl);
+    if (!manifestResponse.ok) {
+        throw new Error(`Failed to load ${domainName} manifest: ${manifestResponse.status}`);
+    }
+    const manifest = await manifestResponse.json();
+    if (manifest.format !== 'domain-binary') {
+        throw new Error(`Unexpected manifest format for ${domainName}: ${manifest.format}`);
+    }
+
+    const blobUrl = manifestUrl.replace(/[^/]+$/, manifest.blob || `${domainName}.bin`);
+    const blobResponse = await fetch(blobUrl);
+    if (!blobResponse.ok) {
+        throw new Error(`Failed to load ${domainName} blob: ${blobResponse.status}`);
+    }
+    const buffer = await blobResponse.arrayBuffer();
+
+    const series = manifest.series.map(entry => {
+        const ArrayType = BINARY_DTYPES[entry.dtype];
+        if (!ArrayType) throw new Error(`Unsupported dtype ${entry.dtype}`);
+        const view = new ArrayType(buffer, entry.offset, entry.length);
+        return typedArrays ? view : typedToNullableArray(view);
+    });
+
+    const rebuild = (node) => {
+        if (Array.isArray(node)) return node.map(rebuild);
+        if (node && typeof node === 'object') {
+            const keys = Object.keys(node);
+            if (keys.length === 1 && keys[0] === '$series') return series[node.$series];
+            const out = {};
+            for (const key of keys) out[key] = rebuild(node[key]);
+            return out;
+        }
+        return node;
+    };
+
+    return expandDateAxes(rebuild(manifest.data), manifest.axes);
+}
+
+// ============================================================
+// RESOLUTION PYRAMID
+// ============================================================
+
+/**
+ * Load a domain's resolution pyramid manifest (<domain>.pyramid.json).
+ * @param {string} domainName - Name of the domain
+ * @returns {Promise<Object>} Manifest with levels sorted coarsest first
+ */
+export async function loadDomainPyramid(domainName) {
+    const config = DOMAIN_CONFIG[domainName];
+    if (!config) {
+        throw new Error(`Unknown domain: ${domainName}`);
+    }
+    if (pyramidManifestCache.has(domainName)) {
+        return pyramidManifestCache.get(domainName);
+    }
+
+    const url = `${DATA_BASE_URL}/${config.path.replace(/\.json$/, '.pyramid.json')}`;
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${domainName} pyramid: ${response.status}`);
+    }
+    const manifest = await response.json();
+    if (manifest.format !== 'domain-pyramid') {
+        throw new Error(`Unexpected pyramid format for ${domainName}: ${manifest.format}`);
+    }
+    manifest.url = url;
+    pyramidManifestCache.set(domainName, manifest);
+    return manifest;
+}
+
+/**
+ * Load the coarsest pyramid level that covers the visible range with enough points.
+ * Falls back to the full daily domain when no pyramid was published.
+ * @param {string} domainName - Name of the domain
+ * @param {Object} [range] - { from, to, targetPoints } (see chooseLevel in pyramid.js)
+ * @returns {Promise<{level: Object, data: Object, dates: string[]}>} Selected level,
+ *   its data and the axis its series refer to (the level's own dates for calendar
+ *   levels, the daily axis for LTTB and daily) - pass both to toChartData()
+ */
+export async function loadDomainLevel(domainName, range = {}) {
+    const daily = async (level) => {
+        const data = await loadDomain(domainName);
+        const dates = Array.isArray(data.dates) ? data.dates : await getSharedDates();
+        return { level, data, dates };
+    };
+
+    let manifest;
+    try {
+        manifest = await loadDomainPyramid(domainName);
+    } catch (error) {
+        console.warn(`[DomainLoader] No pyramid for ${domainName}, using daily data:`, error.message);
+        return daily({ id: 'daily', kind: 'calendar' });
+    }
+
+    const level = chooseLevel(manifest, range);
+    if (level.id === 'daily') {
+        return daily(level);
+    }
+
+    const key = `${domainName}:${level.id}`;
+    if (!pyramidLevelCache.has(key)) {
+        const url = manifest.url.replace(/[^/]+$/, level.file);
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`Failed to load ${domainName} ${level.id}: ${response.status}`);
+        }
+        const raw = await response.json();
+        // Level files always carry their axes, even for domains without a dates key
+        const axisId = level.kind === 'calendar' ? level.id : 'daily';
+        pyramidLevelCache.set(key, {
+            data: expandDateAxes(raw),
+            dates: decodeDateAxis(raw.axes?.[axisId]),
+        });
+    }
+    return { level, ...pyramidLevelCache.get(key) };
+}
+
+// ============================================================
+// DELTA UPDATES
+// ============================================================
+
+/**
+ * Fetch a domain's version index (<domain>.versions.json), or null if there is none.
+ * @param {string} domainName - Name of the domain
+ * @returns {Promise<Object|null>}
+ */
+async function fetchDomainVersions(domainName) {
+    const url = `${DATA_BASE_URL}/${DOMAIN_CONFIG[domainName].path.replace(/\.json$/, '.versions.json')}`;
+    try {
+        const response = await fetch(url, { cache: 'no-cache' });
+        return response.ok ? await response.json() : null;
+    } catch {
+        return null;
+    }
+}
+
+// Pyramid levels are not patched by deltas: drop them when the domain changes
+function dropPyramidCache(domainName) {
+    pyramidManifestCache.delete(domainName);
+    for (const key of [...pyramidLevelCache.keys()]) {
+        if (key.startsWith(`${domainName}:`)) pyramidLevelCache.delete(key);
+    }
+}
+
+function patchList(list, start, values) {
+    list.length = start;
+    for (const v of values) list.push(v);
+}
+
+/**
+ * Apply one delta record to a cached domain in place.
+ * Operations address the file as written; `axes` changes update the shared,
+ * already expanded date arrays in place, new values are expanded on the way in.
+ * @param {string} domainName - Name of the domain
+ * @param {Object} record - Delta record ({version, base_version, tails, set, remove} or {full: true})
+ * @returns {boolean} false if the domain has to be reloaded instead
+ */
+export function applyDomainDelta(domainName, record) {
+    const data = domainCache.get(domainName);
+    const state = domainVersions.get(domainName);
+    if (!data || !state) return false;
+    if (record.version <= state.version) return true;  // already contained
+    if (record.full || record.base_version !== state.version) return false;
+
+    const root = { axes: state.axes };
+    const changedAxes = new Set();
+    const locate = (path) => {
+        let node = path[0] === 'axes' ? root : data;
+        if (path[0] === 'axes' && path.length > 1) changedAxes.add(path[1]);
+        for (const key of path.slice(0, -1)) node = node[key];
+        return [node, path[path.length - 1]];
+    };
+
+    for (const [path, start, values] of record.tails) {
+        const [parent, key] = locate(path);
+        if (Array.isArray(parent[key])) patchList(parent[key], start, values);
+        else parent[key] = values;
+    }
+    for (const [path, value] of record.set) {
+        const [parent, key] = locate(path);
+        parent[key] = path[0] === 'axes' ? value : expandDateAxes(value, state.axes, state.decoded);
+    }
+    for (const path of record.remove) {
+        const [parent, key] = locate(path);
+        delete parent[key];
+    }
+    state.axes = root.axes;
+
+    // Every section shares one decoded array per axis: update it in place
+    for (const id of changedAxes) {
+        if (state.decoded[id]) {
+            const dates = decodeDateAxis(state.axes[id]);
+            patchList(state.decoded[id], 0, dates);
+        }
+    }
+    state.version = record.version;
+    dropPyramidCache(domainName);
+    return true;
+}
+
+/**
+ * Bring cached domains up to date: apply pending delta records, reload
+ * domains whose records are full or no longer available.
+ * @param {string[]} [domainNames] - Domains to check (default: all cached with a version)
+ * @returns {Promise<string[]>} Names of the domains that changed
+ */
+export async function refreshDomains(domainNames = [...domainVersions.keys()]) {
+    const updated = [];
+    await Promise.all(domainNames.map(async (name) => {
+        const state = domainVersions.get(name);
+        if (!state) return;
+        const versions = await fetchDomainVersions(name);
+        if (!versions || versions.current <= state.version) return;
+
+        let records = null;
+        try {
+            if (DOMAIN_API_URL) {
+                const response = await fetch(`${DOMAIN_API_URL}/domains/${name}/deltas?since=${state.version}`);
+                const result = response.ok ? await response.json() : { full: true };
+                records = result.full ? null : result.deltas;
+            } else {
+                const entries = versions.deltas.filter(e => e.version > state.version);
+                if (entries.length === versions.current - state.version && !entries.some(e => e.full)) {
+                    const base = `${DATA_BASE_URL}/${DOMAIN_CONFIG[name].path.replace(/[^/]+$/, '')}`;
+                    records = await Promise.all(entries.map(e => fetch(base + e.file).then(r => r.json())));
+                }
+            }
+        } catch (error) {
+            console.warn(`[DomainLoader] Delta fetch failed for ${name}:`, error.message);
+        }
+
+        if (!records || !records.every(record => applyDomainDelta(name, record))) {
+            domainVersions.delete(name);
+            dropPyramidCache(name);
+            await loadDomain(name, false);
+        }
+        updated.push(name);
+    }));
+    return updated;
+}
+
+/**
+ * Keep cached domains current. With the local API, delta records arrive as
+ * server-sent events (GET /events); otherwise the version indexes are polled.
+ * Does nothing unless USE_DOMAIN_DELTAS is on. Components normally use the
+ * domainUpdates store (stores/dataStore.js) instead of calling this.
+ * @param {function(string[]): void} onUpdate - Called with the names of updated domains
+ * @param {Object} [options]
+ * @param {number} [options.intervalMs=60000] - Polling interval without the API
+ * @returns {function(): void} Unsubscribe
+ */
+export function subscribeDomainUpdates(onUpdate, { intervalMs = 60000 } = {}) {
+    if (!USE_DOMAIN_DELTAS) return () => {};
+
+    if (DOMAIN_API_URL && typeof EventSource !== 'undefined') {
+        const source = new EventSource(`${DOMAIN_API_URL}/events`);
+        source.addEventListener('delta', async (event) => {
+            const record = JSON.parse(event.data);
+            if (!domainVersions.has(record.domain)) return;
+            if (applyDomainDelta(record.domain, record)) {
+                onUpdate([record.domain]);
+            } else {
+                onUpdate(await refreshDomains([record.domain]));
+            }
+        });
+        return () => source.close();
+    }
+
+    const timer = setInterval(async () => {
+        const updated = await refreshDomains();
+        if (updated.length) onUpdate(updated);
+    }, intervalMs);
+    return () => clearInterval(timer);
+}
+
+// ============================================================
+// DOMAIN API SLICES
+// ============================================================
+
+/**
+ * Flatten the daily series of a loaded domain into { 'a.b': values }, cut to [start, end].
+ * Fallback for loadDomainSlice when no API is configured (daily resolution only).
+ */
+function sliceLoadedDomain(domainName, data, dates, { series = [], start, end } = {}) {
+    const flat = {};
+    const walk = (node, path) => {
+        if (Array.isArray(node)) {
+            if (node.length > 0 && node.length <= dates.length && node.some(v => typeof v === 'number')) {
+                flat[path] = node;
+            }
+            return;
+        }
+        if (node && typeof node === 'object') {
+            for (const [key, value] of Object.entries(node)) {
+                if (key !== 'dates') walk(value, path ? `${path}.${key}` : key);
+            }
+        }
+    };
+    walk(data, '');
+
+    const paths = series.length
+        ? Object.keys(flat).filter(p => series.some(s => p === s || p.startsWith(`${s}.`)))
+        : Object.keys(flat);
+    const lo = start ? dates.findIndex(d => d >= start) : 0;
+    const hi = end ? dates.findLastIndex(d => d <= end) + 1 : dates.length;
+    const from = lo < 0 ? dates.length : lo;
+    const to = Math.max(from, hi);
+
+    const out = {};
+    for (const path of paths) {
+        // Series shorter than the axis end on its last date (see alignToSharedDates)
+        const values = flat[path];
+        const offset = dates.length - values.length;
+        out[path] = values.slice(Math.max(0, from - offset), Math.max(0, to - offset));
+        while (out[path].length < to - from) out[path].unshift(null);
+    }
+    const sliced = dates.slice(from, to);
+    return {
+        domain: domainName,
+        resolution: 'daily',
+        start: sliced[0] ?? null,
+        end: sliced[sliced.length - 1] ?? null,
+        dates: sliced,
+        series: out,
+    };
+}
+
+/**
+ * Load only the visible part of a domain from the local API:
+ * GET /domains/{name}?series=&start=&end=&resolution=&points=
+ * The browser revalidates repeated requests with the response ETag.
+ * @param {string} domainName - Name of the domain
+ * @param {Object} [options]
+ * @param {string[]} [options.series] - Dot paths or prefixes ('total', 'rocs.1M', 'rocs'); default all
+ * @param {string} [options.start] - First date (YYYY-MM-DD), inclusive
+ * @param {string} [options.end] - Last date (YYYY-MM-DD), inclusive
+ * @param {string} [options.resolution] - 'daily' | 'weekly' | 'monthly' | 'lttb'
+ * @param {number} [options.points] - Point budget for 'lttb'
+ * @returns {Promise<{domain: string, resolution: string, dates: string[], series: Object}>}
+ */
+export async function loadDomainSlice(domainName, options = {}) {
+    if (!DOMAIN_CONFIG[domainName]) {
+        throw new Error(`Unknown domain: ${domainName}`);
+    }
+
+    if (!DOMAIN_API_URL) {
+        const data = await loadDomain(domainName);
+        const dates = Array.isArray(data.dates) ? data.dates : await getSharedDates();
+        return sliceLoadedDomain(domainName, data, dates, options);
+    }
+
+    const { series = [], start, end, resolution, points } = options;
+    const params = new URLSearchParams();
+    if (series.length) params.set('series', series.join(','));
+    if (start) params.set('start', start);
+    if (end) params.set('end', end);
+    if (resolution) params.set('resolution', resolution);
+    if (points) params.set('points', String(points));
+
+    const response = await fetch(`${DOMAIN_API_URL}/domains/${domainName}?${params}`);
+    if (!response.ok) {
+        const detail = await response.json().catch(() => ({}));
+        throw new Error(`Failed to load ${domainName} slice: ${response.status} ${detail.error || ''}`.trim());
+    }
+    return response.json();
+}
+
 /**
  * Load multiple domains in parallel
  * @param {string[]} domainNames - Array of domain names to load
@@ -278,6 +720,9 @@ export async function resolveReference(reference) {
  */
 export function clearDomainCache() {
     domainCache.clear();
+    domainVersions.clear();
+    pyramidManifestCache.clear();
+    pyramidLevelCache.clear();
 }
 
 /**
@@ -812,12 +1257,14 @@ export async function loadOffshoreTabData(legacyData) {
                     }
                 },
                 chart2_xccy_diy: offshore.xccy_basis_ref || null,
-                thresholds: legacyData?.offshore_liquidity?.thresholds || {
+                thresholds: offshore.thresholds || legacyData?.offshore_liquidity?.thresholds || {
                     obfr_effr: { normal: 3, elevated: 6, stressed: 10, critical: 15 },
                     cb_swaps: { active: 0.1, elevated: 10, stressed: 50, crisis: 100 },
                     xccy: { normal: -10, elevated: -20, stressed: -35, crisis: -50 }
                 },
-                analysis: legacyData?.offshore_liquidity?.analysis || {}
+                analysis: offshore.analysis || legacyData?.offshore_liquidity?.analysis || {},
+                // Rolling percentile / z-score / p10-p90 per date: {spread, swaps, xccy}
+                stats_history: offshore.stats_history || legacyData?.offshore_liquidity?.stats_history || {}
             },
             dates: dates
         };
@@ -1206,6 +1653,14 @@ export async function loadTreasuryTabData(legacyData) {
 
 export default {
     loadDomain,
+    loadDomainBinary,
+    loadDomainPyramid,
+    loadDomainLevel,
+    loadDomainSlice,
+    applyDomainDelta,
+    refreshDomains,
+    subscribeDomainUpdates,
+    decodeDateAxis,
     loadDomains,
     getSharedDates,
     resolveReference,
@@ -0,0 +1,102 @@
+/**
+ * Resolution Pyramid
+ *
+ * With DOMAIN_OUTPUT_FORMATS including "pyramid", the backend writes each
+ * domain at several resolutions next to <domain>.json (backend/domains/pyramid.py):
+ *
+ *   { "format": "domain-pyramid", "start": "2002-12-01", "end": "2026-10-16",
+ *     "levels": [ { "id": "monthly", "kind": "calendar", "points": 287, "file": "pyramid/gli.monthly.json" },
+ *                 { "id": "lttb_500", "kind": "lttb", "budget": 500, "points": 502, ... },
+ *                 ...,
+ *                 { "id": "daily", "kind": "calendar", "points": 8721, "file": "gli.json" } ] }
+ *
+ * chooseLevel() picks the coarsest level that still has enough points in
+ * the visible range; loadDomainLevel() in domainLoader.js fetches it.
+ * Calendar levels keep the domain structure with a coarser `dates` array;
+ * LTTB levels replace each series with { $points: { index, values } }
+ * (indices into the daily axis), which toChartData() understands.
+ */
+
+const DAY_MS = 86400000;
+const POINTS_KEY = '$points';
+
+/**
+ * Convert a chart time (ISO string, UTC seconds, or {year, month, day}) to ms.
+ * @param {string|number|Object} time
+ * @returns {number} Milliseconds since epoch
+ */
+function toMs(time) {
+    if (typeof time === 'number') return time * 1000;
+    if (typeof time === 'string') return Date.parse(`${time.slice(0, 10)}T00:00:00Z`);
+    if (time && typeof time === 'object') return Date.UTC(time.year, time.month - 1, time.day);
+    return NaN;
+}
+
+/**
+ * Estimated number of points a level has inside [from, to].
+ * Levels are evenly spread over the manifest span, so this is proportional.
+ * @param {Object} manifest - Pyramid manifest
+ * @param {Object} level - Entry of manifest.levels
+ * @param {*} from - Visible range start (chart time)
+ * @param {*} to - Visible range end (chart time)
+ * @returns {number}
+ */
+export function pointsInRange(manifest, level, from, to) {
+    const start = toMs(manifest.start);
+    const end = toMs(manifest.end);
+    const span = Math.max(end - start, DAY_MS);
+    const lo = Math.max(start, Number.isFinite(toMs(from)) ? toMs(from) : start);
+    const hi = Math.min(end, Number.isFinite(toMs(to)) ? toMs(to) : end);
+    if (hi < lo) return 0;
+    return level.points * Math.max(hi - lo, DAY_MS) / span;
+}
+
+/**
+ * Pick the coarsest level with at least `targetPoints` points in the visible range.
+ * Falls back to the finest level when none is dense enough.
+ * @param {Object} manifest - Pyramid manifest
+ * @param {Object} [options]
+ * @param {*} [options.from] - Visible range start (default: manifest start)
+ * @param {*} [options.to] - Visible range end (default: manifest end)
+ * @param {number} [options.targetPoints=1000] - Points wanted, e.g. chart width in px
+ * @returns {Object} Selected entry of manifest.levels
+ */
+export function chooseLevel(manifest, { from = null, to = null, targetPoints = 1000 } = {}) {
+    const levels = [...(manifest?.levels || [])].sort((a, b) => a.points - b.points);
+    if (levels.length === 0) throw new Error('Pyramid manifest has no levels');
+
+    for (const level of levels) {
+        if (pointsInRange(manifest, level, from, to) >= targetPoints) return level;
+    }
+    return levels[levels.length - 1];
+}
+
+/**
+ * Turn one series of a loaded level into lightweight-charts data.
+ * @param {Array|Object} series - Plain value array or { $points: { index, values } }
+ * @param {string[]} dates - The level's dates (calendar levels) or the daily axis (LTTB levels)
+ * @returns {Array<{time: string, value: number}>} Points with missing values dropped
+ */
+export function toChartData(series, dates) {
+    const out = [];
+    if (series && series[POINTS_KEY]) {
+        const { index, values } = series[POINTS_KEY];
+        for (let i = 0; i < index.length; i++) {
+            if (values[i] !== null) out.push({ time: dates[index[i]], value: values[i] });
+        }
+        return out;
+    }
+    for (let i = 0; i < (series?.length || 0); i++) {
+        const value = series[i];
+        if (value !== null && value !== undefined && !Number.isNaN(value)) {
+            out.push({ time: dates[i], value });
+        }
+    }
+    return out;
+}
+
+export default {
+    pointsInRange,
+    chooseLevel,
+    toChartData,
+};
@@ -1,4 +1,5 @@
-import { writable, derived } from 'svelte/store';
+import { writable, derived, readable } from 'svelte/store';
+import { subscribeDomainUpdates } from '../lib/utils/domainLoader.js';
 
 export const dashboardData = writable({
     dates: [],
@@ -223,8 +224,18 @@ export const selectedSource = writable('tv'); // 'tv' or 'fred'
 // NOTE: Set to false while migrating tabs individually
 export const USE_DOMAIN_LOADING = writable(false);
 
+// Domains whose cached data (domainLoader.js) changed through delta updates:
+// { domains: [...names], at: timestamp }. Updates run while anything is
+// subscribed and only with USE_DOMAIN_DELTAS enabled in domainLoader.js.
+export const domainUpdates = readable({ domains: [], at: null }, (set) =>
+    subscribeDomainUpdates((domains) => {
+        if (domains.length) set({ domains, at: Date.now() });
+    })
+);
+
 // Import domain adapter
 import { fetchWithDomainAdapter } from './domainAdapter.js';
+import { expandDateAxes } from '../lib/utils/dateAxis.js';
 
 export async function fetchData() {
     isLoading.set(true);
@@ -247,10 +258,10 @@ export async function fetchData() {
                 // Fallback to generic if specific not found
                 const fallback = await fetch('/dashboard_data.json');
                 if (!fallback.ok) throw new Error('Failed to fetch data');
-                const data = await fallback.json();
+                const data = expandDateAxes(await fallback.json());
                 dashboardData.set(data);
             } else {
-                const data = await response.json();
+                const data = expandDateAxes(await response.json());
                 dashboardData.set(data);
             }
         }
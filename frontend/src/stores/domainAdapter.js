@@ -10,6 +10,8 @@
  * - Fallback to monolithic dashboard_data.json if domains fail
  */
 
+import { expandDateAxes } from '../lib/utils/dateAxis.js';
+
 // Domain configuration: name -> file path
 const DOMAIN_CONFIG = {
     shared: '/domains/shared.json',
@@ -40,7 +42,7 @@ export async function loadAllDomains() {
             if (!response.ok) {
                 throw new Error(`Failed to load ${name}: ${response.status}`);
             }
-            const data = await response.json();
+            const data = expandDateAxes(await response.json());
             return { name, data };
         })
     );
@@ -278,7 +280,7 @@ export async function fetchWithDomainAdapter(useDomains = true) {
         // Use legacy loading
         const response = await fetch('/dashboard_data.json');
         if (!response.ok) throw new Error('Failed to fetch legacy data');
-        return response.json();
+        return expandDateAxes(await response.json());
     }
 
     try {
@@ -291,6 +293,6 @@ export async function fetchWithDomainAdapter(useDomains = true) {
         // Fallback to legacy
         const response = await fetch('/dashboard_data.json');
         if (!response.ok) throw new Error('Failed to fetch fallback data');
-        return response.json();
+        return expandDateAxes(await response.json());
     }
 }
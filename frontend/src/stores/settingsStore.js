@@ -904,6 +904,7 @@ const translations = {
         ms_infl_5y5y_high: "⚠️ Long-term inflation expectations elevated (>2.5%)",
         ms_infl_risk_high: "⚠️ Elevated inflation risk premium",
         ms_infl_roc_high: "🔴 Rapid rise in inflation expectations (>20% 3M)",
+        ms_infl_roc_elevated: "🔶 Inflation expectations rising (>10% 3M)",
         ms_liq_sofr_high: "🔴 SOFR trading above IORB - funding stress",
         ms_liq_sofr_elevated: "🔶 SOFR slightly above IORB",
         ms_liq_sofr_normal: "✅ SOFR-IORB spread normal",
@@ -912,6 +913,7 @@ const translations = {
         ms_liq_reserves_adequate: "✅ Bank reserves adequate",
         ms_liq_rrp_depleted: "⚠️ RRP nearly depleted",
         ms_liq_net_contracting: "⚠️ Net liquidity contracting",
+        ms_liq_reserves_falling: "⚠️ Bank reserves falling (>5% in 3M)",
         ms_cred_hy_high: "🔴 HY spreads elevated",
         ms_cred_hy_elevated: "🔶 HY spreads above average",
         ms_cred_hy_tight: "🟢 HY spreads tight",
@@ -920,6 +922,7 @@ const translations = {
         ms_cred_nfci_tight: "🔴 NFCI signals tight conditions",
         ms_cred_nfci_elevated: "🔶 NFCI slightly tight",
         ms_cred_nfci_normal: "✅ NFCI neutral/loose",
+        ms_cred_hy_z_high: "⚠️ HY spread Z-score elevated",
         ms_vol_vix_high: "🔴 VIX elevated - high fear",
         ms_vol_vix_elevated: "🔶 VIX above average",
         ms_vol_vix_complacency: "⚠️ VIX very low - complacency",
@@ -929,6 +932,8 @@ const translations = {
         ms_vol_yield_high: "🔴 10Y yield volatility HIGH",
         ms_vol_yield_elevated: "🔶 10Y yield volatility elevated",
         ms_vol_yield_normal: "✅ 10Y yield volatility normal",
+        ms_vol_move_z_high: "🔴 MOVE Z-score elevated - bond market stress",
+        ms_vol_vix_rising: "🔶 VIX rising",
         ms_global_critical: "🚨 CRITICAL STRESS - Multiple systemic risk indicators elevated",
         ms_global_high: "⚠️ HIGH STRESS - Significant tensions across markets",
         ms_global_moderate: "🔶 MODERATE STRESS - Some warning signs present",
@@ -2005,6 +2010,7 @@ const translations = {
         ms_infl_5y5y_high: "⚠️ Expectativas de inflación a largo plazo elevadas (>2.5%)",
         ms_infl_risk_high: "⚠️ Prima de riesgo de inflación elevada",
         ms_infl_roc_high: "🔴 Rápido aumento de las expectativas de inflación (>20% 3M)",
+        ms_infl_roc_elevated: "🔶 Expectativas de inflación al alza (>10% 3M)",
         ms_liq_sofr_high: "🔴 SOFR cotizando por encima de IORB: estrés de financiación",
         ms_liq_sofr_elevated: "🔶 SOFR ligeramente por encima de IORB",
         ms_liq_sofr_normal: "✅ Diferencial SOFR-IORB normal",
@@ -2013,6 +2019,7 @@ const translations = {
         ms_liq_reserves_adequate: "✅ Reservas bancarias adecuadas",
         ms_liq_rrp_depleted: "⚠️ RRP casi agotado",
         ms_liq_net_contracting: "⚠️ Liquidez neta contrayéndose",
+        ms_liq_reserves_falling: "⚠️ Reservas bancarias cayendo (>5% en 3M)",
         ms_cred_hy_high: "🔴 Diferenciales HY elevados",
         ms_cred_hy_elevated: "🔶 Diferenciales HY por encima del promedio",
         ms_cred_hy_tight: "🟢 Diferenciales HY ajustados",
@@ -2021,6 +2028,7 @@ const translations = {
         ms_cred_nfci_tight: "🔴 NFCI señala condiciones ajustadas",
         ms_cred_nfci_elevated: "🔶 NFCI ligeramente ajustado",
         ms_cred_nfci_normal: "✅ NFCI neutral/laxo",
+        ms_cred_hy_z_high: "⚠️ Z-score del diferencial HY elevado",
         ms_vol_vix_high: "🔴 VIX elevado: alto miedo",
         ms_vol_vix_elevated: "🔶 VIX por encima del promedio",
         ms_vol_vix_complacency: "⚠️ VIX muy bajo: complacencia",
@@ -2030,6 +2038,8 @@ const translations = {
         ms_vol_yield_high: "🔴 Volatilidad del rendimiento a 10 años ALTA",
         ms_vol_yield_elevated: "🔶 Volatilidad del rendimiento a 10 años elevada",
         ms_vol_yield_normal: "✅ Volatilidad del rendimiento a 10 años normal",
+        ms_vol_move_z_high: "🔴 Z-score del MOVE elevado: estrés en el mercado de bonos",
+        ms_vol_vix_rising: "🔶 VIX al alza",
         ms_global_critical: "🚨 ESTRÉS CRÍTICO: Múltiples indicadores de riesgo sistémico elevados",
         ms_global_high: "⚠️ ESTRÉS ALTO: Tensiones significativas en los mercados",
         ms_global_moderate: "🔶 ESTRÉS MODERADO: Algunas señales de advertencia presentes",
@@ -6,6 +6,7 @@
  */
 
 import { writable, get } from 'svelte/store';
+import { expandDateAxes } from '../lib/utils/dateAxis.js';
 
 // Cache for loaded domain data
 const domainCache = {};
@@ -27,7 +28,7 @@ export async function loadDomain(domainName) {
             console.warn(`[TabLoader] Failed to load ${domainName}: ${response.status}`);
             return null;
         }
-        const data = await response.json();
+        const data = expandDateAxes(await response.json());
         domainCache[domainName] = data;
         return data;
     } catch (error) {